@@ -38,7 +38,7 @@ from flask_socketio import SocketIO, emit
 # 기존 컴포넌트 import
 from scripts.team_stats_aggregator import TeamStatsAggregator
 from scripts.verification_cache import VerificationCache
-from scripts.deep_analyzer import DeepAnalyzer
+from scripts.deep_analyzer import AnalysisCache, DeepAnalyzer
 from scripts.critical_file_detector import CriticalFileDetector
 
 # 파일 감시 시스템
@@ -61,7 +61,9 @@ stats_dir = project_root / "RUNS" / "stats"
 
 cache = VerificationCache(cache_dir=cache_dir)
 aggregator = TeamStatsAggregator(cache_dir=cache_dir, evidence_dir=evidence_dir, output_dir=stats_dir)
-analyzer = DeepAnalyzer(mcp_enabled=False)
+# 전체 DeepAnalysisResult 캐시 (watcher/aggregator와 공유, 파일 내용 해시 기반)
+analysis_cache = AnalysisCache(cache_dir / "analysis")
+analyzer = DeepAnalyzer(mcp_enabled=False, result_cache=analysis_cache)
 detector = CriticalFileDetector()
 
 # 파일 감시 시스템 (나중에 시작)
@@ -280,7 +282,7 @@ def get_file_detail(file_path):
         if cached is None:
             return jsonify({"error": "File not found in cache"}), 404
 
-        # Deep 분석 (캐시에 없으면 실행)
+        # Deep 분석 (analysis_cache에 없으면 실행)
         result = analyzer.analyze(full_path)
 
         # 상세 정보 구성
@@ -18,6 +18,14 @@ Constitutional Compliance:
 - P11: Principle Conflicts - Detects and resolves
 - P12: Trade-off Analysis - Documents decisions
 
+Catalog:
+- ADRS/.adr_catalog.json caches number/title/status/date/article references
+  and an inverted keyword index per ADR file, refreshed by (mtime, size)
+- Search narrows candidates through the index, then checks the query as a
+  case-insensitive phrase in the candidate files
+- Search, listing, numbering and conflict checks read the catalog instead of
+  re-scanning every ADR file
+
 Usage:
   python scripts/adr_builder.py create              # Create new ADR
   python scripts/adr_builder.py search "keyword"    # Search ADRs
@@ -28,15 +36,24 @@ Usage:
 Reduces decision documentation time from 2 hours to 15 minutes (87% savings)
 """
 
+import json
+import math
+import os
 import re
 import sys
 import yaml
+from bisect import bisect_left
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+ADR_FILE_PATTERN = re.compile(r"ADR-(\d+).*\.md$")
+TERM_PATTERN = re.compile(r"\w[\w-]*")
+TITLE_BOOST = 3.0
+
 
 class ADRStatus(Enum):
     """ADR status"""
@@ -123,6 +140,188 @@ class ADR:
             self.authors = []
 
 
+def _with_prefix(sorted_terms: List[str], prefix: str) -> List[str]:
+    """Terms starting with ``prefix`` from a sorted list"""
+    matches = []
+    index = bisect_left(sorted_terms, prefix)
+    while index < len(sorted_terms) and sorted_terms[index].startswith(prefix):
+        matches.append(sorted_terms[index])
+        index += 1
+    return matches
+
+
+class ADRCatalog:
+    """Persistent catalog of ADR metadata with an inverted keyword index
+
+    Each ``ADR-*.md`` file is parsed once; later refreshes only stat the
+    directory and re-parse files whose (mtime, size) changed.
+    """
+
+    CATALOG_VERSION = 1
+
+    def __init__(self, adr_dir: Path):
+        self.adr_dir = adr_dir
+        self.catalog_path = adr_dir / ".adr_catalog.json"
+        self.entries: Dict[str, Dict] = {}
+        self.index: Dict[str, Dict[str, int]] = {}  # term -> {file name: term frequency}
+        self._vocabulary: Optional[Tuple[List[str], List[str]]] = None  # sorted terms, sorted reversed terms
+        self._load()
+
+    def _load(self) -> None:
+        if not self.catalog_path.exists():
+            return
+        try:
+            data = json.loads(self.catalog_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("version") == self.CATALOG_VERSION:
+            self.entries = data.get("entries", {})
+            self.index = data.get("index", {})
+
+    def _save(self) -> None:
+        data = {"version": self.CATALOG_VERSION, "entries": self.entries, "index": self.index}
+        tmp = self.catalog_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.catalog_path)
+
+    def refresh(self) -> None:
+        """Re-parse new or modified ADR files and drop deleted ones"""
+        seen: Set[str] = set()
+        changed = False
+
+        with os.scandir(self.adr_dir) as it:
+            for dirent in it:
+                match = ADR_FILE_PATTERN.match(dirent.name)
+                if not match or not dirent.is_file():
+                    continue
+                seen.add(dirent.name)
+                stat = dirent.stat()
+                entry = self.entries.get(dirent.name)
+                if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                    continue
+
+                self._remove(dirent.name)
+                content = Path(dirent.path).read_text(encoding="utf-8")
+                self._add(dirent.name, int(match.group(1)), content, stat)
+                changed = True
+
+        for name in set(self.entries) - seen:
+            self._remove(name)
+            changed = True
+
+        if changed:
+            self._save()
+
+    def _add(self, name: str, number: int, content: str, stat: os.stat_result) -> None:
+        title_match = re.search(r"# ADR-(\d+): (.+)", content)
+        status_match = re.search(r"\*\*Status\*\*: (\w+)", content)
+        date_match = re.search(r"\*\*Date\*\*: ([\d-]+)", content)
+        articles = sorted({m.strip("*:") for m in re.findall(r"\*\*P\d+\*\*:", content)})
+
+        title = title_match.group(2).strip() if title_match else None
+        terms = Counter(TERM_PATTERN.findall(content.lower()))
+
+        self.entries[name] = {
+            "number": int(title_match.group(1)) if title_match else number,
+            "title": title,
+            "status": status_match.group(1) if status_match else "unknown",
+            "date": date_match.group(1) if date_match else "N/A",
+            "articles": articles,
+            "title_terms": sorted(set(TERM_PATTERN.findall(title.lower()))) if title else [],
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+        }
+        for term, count in terms.items():
+            self.index.setdefault(term, {})[name] = count
+        self._vocabulary = None
+
+    def _remove(self, name: str) -> None:
+        if self.entries.pop(name, None) is None:
+            return
+        empty = []
+        for term, postings in self.index.items():
+            if postings.pop(name, None) is not None and not postings:
+                empty.append(term)
+        for term in empty:
+            del self.index[term]
+        self._vocabulary = None
+
+    def numbers(self) -> List[int]:
+        return [entry["number"] for entry in self.entries.values()]
+
+    def titled(self) -> List[Tuple[str, Dict]]:
+        """(file name, entry) pairs for ADRs with a parsed title, by file name"""
+        return [(name, entry) for name, entry in sorted(self.entries.items()) if entry["title"]]
+
+    def search(self, query: str) -> List[Tuple[str, float]]:
+        """Rank ADR files containing the query as a phrase (case-insensitive)
+
+        Every query term must match an indexed term of the file: inner terms
+        of a phrase exactly, the last one as a prefix and the first one as a
+        suffix (the phrase may start or end mid-word). Candidates left after
+        intersecting those postings are checked for the whole phrase.
+
+        Score: tf-idf summed over query terms, with title matches boosted.
+        """
+        phrase = query.lower()
+        query_terms = TERM_PATTERN.findall(phrase)
+        if not query_terms:
+            return []
+
+        total = max(len(self.entries), 1)
+        last = len(query_terms) - 1
+        scores: Optional[Dict[str, float]] = None
+        for position, query_term in enumerate(query_terms):
+            matches = self._matching_terms(query_term, first=position == 0, last=position == last)
+            term_scores: Dict[str, float] = {}
+            for term in matches:
+                postings = self.index[term]
+                idf = math.log(1 + total / len(postings))
+                for name, count in postings.items():
+                    if scores is None or name in scores:
+                        term_scores[name] = max(term_scores.get(name, 0.0), count * idf)
+
+            for name in term_scores:
+                if any(query_term in t for t in self.entries[name]["title_terms"]):
+                    term_scores[name] *= TITLE_BOOST
+
+            if scores is not None:
+                term_scores = {name: scores[name] + score for name, score in term_scores.items()}
+            scores = term_scores
+            if not scores:
+                return []
+
+        if phrase.strip() != query_terms[0]:
+            scores = {name: score for name, score in scores.items() if self._contains(name, phrase)}
+
+        return sorted(scores.items(), key=lambda item: (-item[1], self.entries[item[0]]["number"]))
+
+    def _matching_terms(self, query_term: str, first: bool, last: bool) -> List[str]:
+        """Indexed terms a query term can match at its place in the phrase"""
+        if first and last:
+            # A lone term may sit anywhere inside a word
+            return [term for term in self.index if query_term in term]
+        if not first and not last:
+            return [query_term] if query_term in self.index else []
+
+        if self._vocabulary is None:
+            self._vocabulary = (sorted(self.index), sorted(term[::-1] for term in self.index))
+        terms, reversed_terms = self._vocabulary
+        if last:
+            return _with_prefix(terms, query_term)
+        return [term[::-1] for term in _with_prefix(reversed_terms, query_term[::-1])]
+
+    def _contains(self, name: str, phrase: str) -> bool:
+        try:
+            return phrase in (self.adr_dir / name).read_text(encoding="utf-8").lower()
+        except OSError:
+            return False
+
+    def with_article(self, article_id: str) -> Set[str]:
+        """File names of ADRs referencing a Constitution article"""
+        return {name for name, entry in self.entries.items() if article_id in entry["articles"]}
+
+
 class ADRBuilder:
     """Architecture Decision Records builder"""
 
@@ -157,6 +356,7 @@ class ADRBuilder:
         """Initialize ADR builder"""
         self.adr_dir = adr_dir or Path("ADRS")
         self.adr_dir.mkdir(parents=True, exist_ok=True)
+        self.catalog = ADRCatalog(self.adr_dir)
 
         # Load constitution for reference
         self.constitution_path = Path("config/constitution.yaml")
@@ -171,17 +371,8 @@ class ADRBuilder:
 
     def get_next_number(self) -> int:
         """Get next ADR number"""
-        existing = list(self.adr_dir.glob("ADR-*.md"))
-        if not existing:
-            return 1
-
-        numbers = []
-        for adr_file in existing:
-            match = re.match(r"ADR-(\d+)", adr_file.name)
-            if match:
-                numbers.append(int(match.group(1)))
-
-        return max(numbers, default=0) + 1
+        self.catalog.refresh()
+        return max(self.catalog.numbers(), default=0) + 1
 
     def create_interactive(self) -> ADR:
         """Create ADR interactively"""
@@ -437,51 +628,35 @@ class ADRBuilder:
         return article_map.get(article_id, "Unknown")
 
     def search_adrs(self, query: str) -> List[Tuple[int, str, Path]]:
-        """Search ADRs by keyword"""
-        results = []
-
-        for adr_file in self.adr_dir.glob("ADR-*.md"):
-            with open(adr_file, encoding="utf-8") as f:
-                content = f.read()
+        """Search ADRs by keyword (ranked by relevance, best first)"""
+        self.catalog.refresh()
 
-            if query.lower() in content.lower():
-                # Extract title
-                match = re.search(r"# ADR-(\d+): (.+)", content)
-                if match:
-                    number = int(match.group(1))
-                    title = match.group(2).strip()
-                    results.append((number, title, adr_file))
+        results = []
+        for name, _score in self.catalog.search(query):
+            entry = self.catalog.entries[name]
+            if entry["title"]:
+                results.append((entry["number"], entry["title"], self.adr_dir / name))
 
-        return sorted(results, key=lambda x: x[0])
+        return results
 
     def list_all_adrs(self) -> List[Dict]:
         """List all ADRs"""
-        adrs = []
-
-        for adr_file in sorted(self.adr_dir.glob("ADR-*.md")):
-            with open(adr_file, encoding="utf-8") as f:
-                content = f.read()
-
-            # Extract metadata
-            match = re.search(r"# ADR-(\d+): (.+)", content)
-            status_match = re.search(r"\*\*Status\*\*: (\w+)", content)
-            date_match = re.search(r"\*\*Date\*\*: ([\d-]+)", content)
-
-            if match:
-                adrs.append(
-                    {
-                        "number": int(match.group(1)),
-                        "title": match.group(2).strip(),
-                        "status": status_match.group(1) if status_match else "unknown",
-                        "date": date_match.group(1) if date_match else "N/A",
-                        "file": adr_file,
-                    }
-                )
-
-        return adrs
+        self.catalog.refresh()
+
+        return [
+            {
+                "number": entry["number"],
+                "title": entry["title"],
+                "status": entry["status"],
+                "date": entry["date"],
+                "file": self.adr_dir / name,
+            }
+            for name, entry in self.catalog.titled()
+        ]
 
     def detect_conflicts(self) -> List[Dict]:
         """Detect potential principle conflicts in ADRs"""
+        self.catalog.refresh()
         conflicts = []
 
         # Conflicting principle pairs
@@ -491,27 +666,18 @@ class ADRBuilder:
             ("P1", "P15"),  # YAML First vs Convergence (all tasks vs small tasks)
         ]
 
-        for adr_file in self.adr_dir.glob("ADR-*.md"):
-            with open(adr_file, encoding="utf-8") as f:
-                content = f.read()
-
-            # Extract related articles
-            articles_match = re.findall(r"\*\*P\d+\*\*:", content)
-            articles = [m.replace("**", "").replace(":", "") for m in articles_match]
-
-            # Check for conflicts
-            for p1, p2 in conflict_pairs:
-                if p1 in articles and p2 in articles:
-                    match = re.search(r"# ADR-(\d+): (.+)", content)
-                    if match:
-                        conflicts.append(
-                            {
-                                "adr": int(match.group(1)),
-                                "title": match.group(2).strip(),
-                                "conflict": f"{p1} vs {p2}",
-                                "file": adr_file,
-                            }
-                        )
+        for p1, p2 in conflict_pairs:
+            for name in sorted(self.catalog.with_article(p1) & self.catalog.with_article(p2)):
+                entry = self.catalog.entries[name]
+                if entry["title"]:
+                    conflicts.append(
+                        {
+                            "adr": entry["number"],
+                            "title": entry["title"],
+                            "conflict": f"{p1} vs {p2}",
+                            "file": self.adr_dir / name,
+                        }
+                    )
 
         return conflicts
 
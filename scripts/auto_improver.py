@@ -21,8 +21,9 @@ import sys
 import yaml
 import ast
 import re
+import time
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Iterator, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
@@ -42,6 +43,11 @@ except ImportError:
     DEEP_ANALYZER_AVAILABLE = False
     print("[INFO] DeepAnalyzer not available, using built-in analysis")
 
+try:
+    from scripts.parallel_scan import PhaseTimer, ProgressCallback, map_chunks
+except ImportError:
+    from parallel_scan import PhaseTimer, ProgressCallback, map_chunks
+
 try:
     from scripts.obsidian_bridge import ObsidianBridge
 
@@ -211,9 +217,13 @@ class ConstitutionParser:
 class PatternDetector:
     """코드 패턴 감지 및 Constitution 위반 검사"""
 
+    # Directories skipped by repository scans
+    SKIP_DIRS = {".git", ".venv", "venv", "__pycache__", "node_modules", ".pytest_cache"}
+
     def __init__(self, constitution_parser: ConstitutionParser):
         self.constitution = constitution_parser
         self.violations = []
+        self.scan_stats: Dict[str, Any] = {}
 
         # Compile regex patterns for common issues
         self.patterns = {
@@ -228,32 +238,38 @@ class PatternDetector:
             "sql_injection": re.compile(r'(query|execute)\s*\(\s*["\'].*%[s\d].*["\'].*%', re.IGNORECASE),
         }
 
-    def analyze_file(self, file_path: str) -> List[Violation]:
-        """단일 파일 분석"""
+    def analyze_file(self, file_path: str, timer: Optional[PhaseTimer] = None) -> List[Violation]:
+        """단일 파일 분석 (timer: 단계별 소요 시간 누적)"""
         violations = []
+        timer = timer or PhaseTimer()
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                lines = content.splitlines()
+            with timer.phase("read"):
+                with open(file_path, "r", encoding="utf-8") as f:
+                    content = f.read()
+                    lines = content.splitlines()
 
             # Skip non-Python files for now
             if not file_path.endswith(".py"):
                 return violations
 
             # P5: Security violations
-            violations.extend(self._check_security_issues(file_path, content, lines))
+            with timer.phase("security"):
+                violations.extend(self._check_security_issues(file_path, content, lines))
 
             # P7: Hallucination violations
-            violations.extend(self._check_hallucination_risks(file_path, content, lines))
+            with timer.phase("hallucination"):
+                violations.extend(self._check_hallucination_risks(file_path, content, lines))
 
             # P10: Encoding violations (emoji in code)
             if file_path.endswith(".py"):
-                violations.extend(self._check_encoding_issues(file_path, content, lines))
+                with timer.phase("encoding"):
+                    violations.extend(self._check_encoding_issues(file_path, content, lines))
 
             # P4: SOLID violations (using AST for Python files)
             if file_path.endswith(".py"):
-                violations.extend(self._check_solid_violations(file_path, content))
+                with timer.phase("solid"):
+                    violations.extend(self._check_solid_violations(file_path, content))
 
         except Exception as e:
             print(f"[ERROR] Failed to analyze {file_path}: {e}")
@@ -434,28 +450,84 @@ class PatternDetector:
 
         return violations
 
-    def analyze_repository(self, root_path: str = ".") -> List[Violation]:
-        """전체 저장소 분석"""
-        all_violations = []
-
-        # Define directories to skip
-        skip_dirs = {".git", ".venv", "venv", "__pycache__", "node_modules", ".pytest_cache"}
-
+    def find_python_files(self, root_path: str = ".") -> List[str]:
+        """저장소의 Python 파일 목록 (정렬된 순서)"""
+        file_paths = []
         for root, dirs, files in os.walk(root_path):
             # Skip certain directories
-            dirs[:] = [d for d in dirs if d not in skip_dirs]
+            dirs[:] = sorted(d for d in dirs if d not in self.SKIP_DIRS)
 
-            for file in files:
+            for file in sorted(files):
                 # Only analyze Python files for now
                 if file.endswith(".py"):
-                    file_path = os.path.join(root, file)
-                    violations = self.analyze_file(file_path)
-                    all_violations.extend(violations)
+                    file_paths.append(os.path.join(root, file))
+        return file_paths
+
+    def iter_repository(
+        self, root_path: str = ".", workers: Optional[int] = None, progress: Optional[ProgressCallback] = None
+    ) -> Iterator[Violation]:
+        """저장소 분석 결과를 파일 순서대로 스트리밍
+
+        Files are analyzed in chunks across a process pool (inline for small
+        repositories). scan_stats holds file/violation counts and per-phase
+        seconds (summed across workers) once the generator is exhausted.
+        """
+        timer = PhaseTimer()
+        start = time.perf_counter()
+        with timer.phase("discover"):
+            file_paths = self.find_python_files(root_path)
+
+        count = 0
+        for violations, timings in map_chunks(
+            _scan_chunk,
+            file_paths,
+            workers=workers,
+            initializer=_init_scan_worker,
+            initargs=(self.constitution,),
+            inline_job=self.scan_files,
+            progress=progress,
+        ):
+            timer.merge(timings)
+            count += len(violations)
+            yield from violations
+
+        timer.add("total", time.perf_counter() - start)
+        self.scan_stats = {"files": len(file_paths), "violations": count, "timings": timer.totals}
+
+    def scan_files(self, file_paths: List[str]) -> List[Tuple[List[Violation], Dict[str, float]]]:
+        """파일별 (위반사항, 단계별 시간) 목록"""
+        results = []
+        for file_path in file_paths:
+            timer = PhaseTimer()
+            violations = self.analyze_file(file_path, timer)
+            results.append((violations, timer.totals))
+        return results
+
+    def analyze_repository(
+        self, root_path: str = ".", workers: Optional[int] = None, progress: Optional[ProgressCallback] = None
+    ) -> List[Violation]:
+        """전체 저장소 분석"""
+        all_violations = list(self.iter_repository(root_path, workers=workers, progress=progress))
 
         print(f"[INFO] Found {len(all_violations)} violations across repository")
         return all_violations
 
 
+# Process pool worker state (one detector per worker process)
+_worker_detector: Optional[PatternDetector] = None
+
+
+def _init_scan_worker(constitution_parser: ConstitutionParser) -> None:
+    """Build the worker's detector with the parent's constitution."""
+    global _worker_detector
+    _worker_detector = PatternDetector(constitution_parser)
+
+
+def _scan_chunk(file_paths: List[str]):
+    """Pool job: PatternDetector.scan_files with this worker's detector"""
+    return _worker_detector.scan_files(file_paths)
+
+
 class ImprovementEngine:
     """개선안 생성 엔진"""
 
@@ -692,14 +764,14 @@ class AutoImprover:
         self.improvements = []
         self.stats = defaultdict(int)
 
-    def analyze_repository(self, root_path: str = ".") -> List[Improvement]:
+    def analyze_repository(self, root_path: str = ".", workers: Optional[int] = None) -> List[Improvement]:
         """저장소 분석 및 개선안 생성"""
         print("\n" + "=" * 60)
         print("[ANALYSIS] Starting Repository Analysis...")
         print("=" * 60)
 
         # Step 1: Detect violations
-        violations = self.pattern_detector.analyze_repository(root_path)
+        violations = self.pattern_detector.analyze_repository(root_path, workers=workers)
 
         # Step 2: Generate improvements
         improvements = []
@@ -881,6 +953,7 @@ def main():
     parser.add_argument("--apply", "-a", action="store_true", help="Apply auto-applicable improvements")
     parser.add_argument("--dry-run", action="store_true", default=True, help="Dry run mode (default: True)")
     parser.add_argument("--obsidian", "-o", action="store_true", help="Save results to Obsidian")
+    parser.add_argument("--workers", "-w", type=int, help="Worker processes for scanning (default: CPU count)")
 
     args = parser.parse_args()
 
@@ -888,7 +961,10 @@ def main():
     improver = AutoImprover()
 
     # Analyze repository
-    _ = improver.analyze_repository(args.path)
+    _ = improver.analyze_repository(args.path, workers=args.workers)
+    scan_stats = improver.pattern_detector.scan_stats
+    timings = ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in scan_stats["timings"].items())
+    print(f"[INFO] Scanned {scan_stats['files']} files ({timings})")
 
     # Generate report
     report = improver.generate_report(args.report)
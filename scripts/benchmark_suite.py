@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark Suite - Repeatable benchmarks for the verification hot path
+
+Runs micro/macro benchmarks with warmup, repetitions and statistics
+against a synthetic repository of configurable size, writes
+machine-readable JSON results and compares them with a stored baseline.
+
+Covered operations:
+- VerificationCache.get / put
+- RuffVerifier.verify_file (skipped when dev_assistant or ruff is unavailable)
+- DeepAnalyzer.analyze (AST checks, Ruff stubbed out)
+- CriticalFileDetector.classify
+- TagExtractorLite.extract_tags_from_directory
+- PromptCompressor.compress
+- Dashboard /api/stats aggregation (StatsCollector)
+
+Usage:
+    # Run and write RUNS/benchmarks/latest.json
+    python scripts/benchmark_suite.py --files 200 --repeat 20
+
+    # Store current numbers as the baseline
+    python scripts/benchmark_suite.py --save-baseline
+
+    # Fail (exit 1) when any median regresses more than 20%
+    # (exit 2 when the baseline was recorded with different --files/--warmup/--repeat)
+    python scripts/benchmark_suite.py --baseline RUNS/benchmarks/baseline.json --threshold 0.2
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+DEFAULT_OUTPUT_DIR = Path("RUNS/benchmarks")
+COMPARABLE_CONFIG = ("file_count", "warmup", "repeat")  # must match for timings to be comparable
+
+
+class BaselineMismatchError(ValueError):
+    """Baseline was recorded with a different benchmark config"""
+
+
+@dataclass
+class BenchmarkStats:
+    """Timing statistics for one benchmark case (milliseconds)"""
+
+    name: str
+    repeat: int
+    warmup: int
+    mean_ms: float
+    median_ms: float
+    stdev_ms: float
+    min_ms: float
+    max_ms: float
+    p95_ms: float
+    ops_per_call: int = 1
+    skipped: Optional[str] = None
+
+    @classmethod
+    def from_samples(cls, name: str, samples: List[float], warmup: int, ops_per_call: int = 1) -> "BenchmarkStats":
+        """Build statistics from raw per-call durations"""
+        ordered = sorted(samples)
+        p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+        return cls(
+            name=name,
+            repeat=len(samples),
+            warmup=warmup,
+            mean_ms=round(statistics.fmean(samples), 4),
+            median_ms=round(statistics.median(samples), 4),
+            stdev_ms=round(statistics.stdev(samples), 4) if len(samples) > 1 else 0.0,
+            min_ms=round(ordered[0], 4),
+            max_ms=round(ordered[-1], 4),
+            p95_ms=round(ordered[p95_index], 4),
+            ops_per_call=ops_per_call,
+        )
+
+    @classmethod
+    def skipped_case(cls, name: str, reason: str) -> "BenchmarkStats":
+        """Placeholder for a case that could not run in this environment"""
+        return cls(name, 0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, skipped=reason)
+
+
+@dataclass
+class BenchmarkCase:
+    """A benchmark: optional setup returning state, and a timed function"""
+
+    name: str
+    func: Callable[[Any], Any]
+    setup: Optional[Callable[[], Any]] = None
+    ops_per_call: int = 1
+
+
+@dataclass
+class Regression:
+    """Benchmark slower than baseline beyond the threshold"""
+
+    name: str
+    baseline_ms: float
+    current_ms: float
+    change_percent: float
+
+
+@dataclass
+class BenchmarkReport:
+    """Full benchmark run"""
+
+    timestamp: str
+    environment: Dict[str, Any]
+    config: Dict[str, Any]
+    results: List[BenchmarkStats] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def time_call(func: Callable[[Any], Any], state: Any, warmup: int, repeat: int) -> List[float]:
+    """Run func(state) warmup + repeat times and return timed durations in ms"""
+    for _ in range(warmup):
+        func(state)
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(state)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+class SyntheticRepo:
+    """Generate a throwaway repository of Python files for benchmarking
+
+    Files mix ordinary modules, critical-pattern names (``*_executor.py``)
+    and tests, and carry @TAG annotations so every benchmarked tool has
+    representative work.
+    """
+
+    def __init__(self, root: Path, file_count: int = 100, functions_per_file: int = 20):
+        self.root = root
+        self.file_count = file_count
+        self.functions_per_file = functions_per_file
+        self.files: List[Path] = []
+
+    def generate(self) -> List[Path]:
+        """Write the synthetic files and return their paths"""
+        scripts_dir = self.root / "scripts"
+        tests_dir = self.root / "tests"
+        scripts_dir.mkdir(parents=True, exist_ok=True)
+        tests_dir.mkdir(parents=True, exist_ok=True)
+
+        for index in range(self.file_count):
+            if index % 10 == 0:
+                path = tests_dir / f"test_module_{index}.py"
+            elif index % 7 == 0:
+                path = scripts_dir / f"module_{index}_executor.py"
+            else:
+                path = scripts_dir / f"module_{index}.py"
+            path.write_text(self._render_module(index), encoding="utf-8")
+            self.files.append(path)
+        return self.files
+
+    def _render_module(self, index: int) -> str:
+        lines = [
+            f'"""Synthetic module {index}"""',
+            "",
+            "import os",
+            "import subprocess",
+            "",
+            f"# @TAG[REQ:bench-{index % 25}]",
+            "",
+            "",
+            f"class Service{index}:",
+            f'    """Service {index}"""',
+            "",
+            "    def __init__(self):",
+            "        self.client = HttpClient()",
+            "",
+        ]
+        for func_index in range(self.functions_per_file):
+            lines.extend(
+                [
+                    f"    def handle_{func_index}(self, value):",
+                    f"        # @TAG[IMPL:bench-{(index + func_index) % 25}]",
+                    "        if value is None:",
+                    "            return None",
+                    f"        for item in range({func_index + 1}):",
+                    "            if item % 2 == 0 and value:",
+                    "                value = os.path.join(str(value), str(item))",
+                    "        return value",
+                    "",
+                ]
+            )
+        return "\n".join(lines) + "\n"
+
+
+class _NullRuffVerifier:
+    """Ruff stand-in so DeepAnalyzer timings measure only the AST checks"""
+
+    def verify_file(self, file_path: Path):
+        from verification_cache import VerificationResult
+
+        return VerificationResult(file_path=file_path, passed=True, violations=[], duration_ms=0.0)
+
+
+class BenchmarkSuite:
+    """Benchmark runner for the verification hot path"""
+
+    def __init__(
+        self,
+        file_count: int = 100,
+        warmup: int = 3,
+        repeat: int = 10,
+        work_dir: Optional[Path] = None,
+        only: Optional[List[str]] = None,
+    ):
+        """Initialize BenchmarkSuite
+
+        Args:
+            file_count: Number of files in the synthetic repository
+            warmup: Untimed calls before measuring each case
+            repeat: Timed calls per case
+            work_dir: Directory for the synthetic repo (default: temp dir)
+            only: Run only cases whose name starts with one of these prefixes
+        """
+        self.file_count = file_count
+        self.warmup = warmup
+        self.repeat = repeat
+        self.only = only
+        self._own_work_dir = work_dir is None
+        self.work_dir = work_dir or Path(tempfile.mkdtemp(prefix="dev_rules_bench_"))
+        self.repo = SyntheticRepo(self.work_dir / "repo", file_count=file_count)
+
+    def run(self) -> BenchmarkReport:
+        """Generate the synthetic repo, run all cases and return the report"""
+        files = self.repo.generate()
+        report = BenchmarkReport(
+            timestamp=datetime.now().isoformat(),
+            environment={
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "ruff": shutil.which("ruff") is not None,
+            },
+            config={"file_count": self.file_count, "warmup": self.warmup, "repeat": self.repeat},
+        )
+
+        try:
+            for name, factory in self._case_factories():
+                if self.only and not any(name.startswith(prefix) for prefix in self.only):
+                    continue
+                try:
+                    case = factory(files)
+                except ImportError as e:
+                    report.results.append(BenchmarkStats.skipped_case(name, f"unavailable: {e}"))
+                    continue
+                if case is None:
+                    report.results.append(BenchmarkStats.skipped_case(name, "prerequisite missing"))
+                    continue
+                report.results.append(self._run_case(case))
+        finally:
+            if self._own_work_dir:
+                shutil.rmtree(self.work_dir, ignore_errors=True)
+
+        return report
+
+    def _run_case(self, case: BenchmarkCase) -> BenchmarkStats:
+        state = case.setup() if case.setup else None
+        samples = time_call(case.func, state, self.warmup, self.repeat)
+        return BenchmarkStats.from_samples(case.name, samples, self.warmup, case.ops_per_call)
+
+    def _case_factories(self) -> List[tuple]:
+        return [
+            ("verification_cache.put", self._cache_put_case),
+            ("verification_cache.get", self._cache_get_case),
+            ("ruff_verifier.verify_file", self._ruff_case),
+            ("deep_analyzer.analyze", self._deep_analyzer_case),
+            ("critical_file_detector.classify", self._classify_case),
+            ("tag_extractor_lite.extract", self._tag_extractor_case),
+            ("prompt_compressor.compress", self._prompt_compressor_case),
+            ("dashboard.api_stats", self._dashboard_stats_case),
+        ]
+
+    # Case factories: each returns a BenchmarkCase, or None to skip
+
+    def _new_cache(self, name: str):
+        from verification_cache import VerificationCache
+
+        return VerificationCache(cache_dir=self.work_dir / name, ttl_seconds=3600, max_entries=self.file_count * 2)
+
+    def _sample_result(self, file_path: Path):
+        from verification_cache import RuffViolation, VerificationResult
+
+        violation = RuffViolation(code="F401", message="unused import", line=1, column=1)
+        return VerificationResult(file_path=file_path, passed=False, violations=[violation], duration_ms=12.0)
+
+    def _cache_put_case(self, files: List[Path]) -> BenchmarkCase:
+        cache = self._new_cache("cache_put")
+        results = [(path, self._sample_result(path)) for path in files]
+
+        def put_all(_state):
+            for path, result in results:
+                cache.put(path, result)
+
+        return BenchmarkCase("verification_cache.put", put_all, ops_per_call=len(files))
+
+    def _cache_get_case(self, files: List[Path]) -> BenchmarkCase:
+        cache = self._new_cache("cache_get")
+        for path in files:
+            cache.put(path, self._sample_result(path))
+
+        def get_all(_state):
+            for path in files:
+                cache.get(path)
+
+        return BenchmarkCase("verification_cache.get", get_all, ops_per_call=len(files))
+
+    def _ruff_case(self, files: List[Path]) -> Optional[BenchmarkCase]:
+        if shutil.which("ruff") is None:
+            return None
+        from dev_assistant import RuffVerifier
+
+        verifier = RuffVerifier(timeout_seconds=10.0)
+        sample = files[: min(len(files), 10)]
+
+        def verify(_state):
+            for path in sample:
+                verifier.verify_file(path)
+
+        return BenchmarkCase("ruff_verifier.verify_file", verify, ops_per_call=len(sample))
+
+    def _deep_analyzer_case(self, files: List[Path]) -> BenchmarkCase:
+        from deep_analyzer import DeepAnalyzer
+
+        analyzer = DeepAnalyzer(mcp_enabled=False, ruff_verifier=_NullRuffVerifier())
+
+        def analyze(_state):
+            for path in files:
+                analyzer.analyze(path)
+
+        return BenchmarkCase("deep_analyzer.analyze", analyze, ops_per_call=len(files))
+
+    def _classify_case(self, files: List[Path]) -> BenchmarkCase:
+        from critical_file_detector import CriticalFileDetector
+
+        detector = CriticalFileDetector(git_enabled=False)
+
+        def classify(_state):
+            for path in files:
+                detector.classify(path)
+
+        return BenchmarkCase("critical_file_detector.classify", classify, ops_per_call=len(files))
+
+    def _tag_extractor_case(self, files: List[Path]) -> BenchmarkCase:
+        from tag_extractor_lite import TagExtractorLite
+
+        extractor = TagExtractorLite(project_root=self.repo.root)
+        return BenchmarkCase(
+            "tag_extractor_lite.extract",
+            lambda _state: extractor.extract_tags_from_directory(self.repo.root),
+            ops_per_call=len(files),
+        )
+
+    def _prompt_compressor_case(self, files: List[Path]) -> BenchmarkCase:
+        from prompt_compressor import PromptCompressor
+
+        compressor = PromptCompressor(compression_level="medium")
+        sentence = (
+            "Please implement the authentication feature for the application and make sure that "
+            "the database configuration is documented in the implementation. "
+        )
+        prompts = [sentence * (1 + index % 20) for index in range(50)]
+
+        def compress(_state):
+            for prompt in prompts:
+                compressor.compress(prompt)
+
+        return BenchmarkCase("prompt_compressor.compress", compress, ops_per_call=len(prompts))
+
+    def _dashboard_stats_case(self, files: List[Path]) -> BenchmarkCase:
+        from team_stats_aggregator import StatsCollector
+
+        cache = self._new_cache("dashboard")
+        for path in files:
+            cache.put(path, self._sample_result(path))
+        collector = StatsCollector(cache_dir=cache.cache_dir, evidence_dir=self.work_dir / "evidence")
+
+        def stats(_state):
+            collector.collect_team_stats(collector.collect_file_stats())
+
+        return BenchmarkCase("dashboard.api_stats", stats)
+
+
+def compare_to_baseline(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.2) -> List[Regression]:
+    """Compare medians of two reports
+
+    Args:
+        current: Report dict of the current run
+        baseline: Report dict of the baseline run
+        threshold: Allowed relative slowdown (0.2 = 20%)
+
+    Returns:
+        Regressions, worst first
+
+    Raises:
+        BaselineMismatchError: The runs differ in a COMPARABLE_CONFIG value
+    """
+    current_config = current.get("config") or {}
+    baseline_config = baseline.get("config") or {}
+    mismatched = [key for key in COMPARABLE_CONFIG if current_config.get(key) != baseline_config.get(key)]
+    if mismatched:
+        details = ", ".join(f"{key}={baseline_config.get(key)} vs {current_config.get(key)}" for key in mismatched)
+        raise BaselineMismatchError(f"Baseline incompatible (baseline vs current): {details}")
+
+    baseline_medians = {r["name"]: r["median_ms"] for r in baseline.get("results", []) if not r.get("skipped")}
+    regressions = []
+    for result in current.get("results", []):
+        if result.get("skipped") or result["name"] not in baseline_medians:
+            continue
+        base = baseline_medians[result["name"]]
+        if base <= 0:
+            continue
+        change = (result["median_ms"] - base) / base
+        if change > threshold:
+            regressions.append(Regression(result["name"], base, result["median_ms"], round(change * 100, 1)))
+    regressions.sort(key=lambda r: r.change_percent, reverse=True)
+    return regressions
+
+
+def write_report(report: BenchmarkReport, output_path: Path) -> Path:
+    """Write a report as JSON"""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+    return output_path
+
+
+def _int_at_least(minimum: int) -> Callable[[str], int]:
+    """argparse type: integer >= minimum"""
+
+    def parse(value: str) -> int:
+        try:
+            number = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+        if number < minimum:
+            raise argparse.ArgumentTypeError(f"must be >= {minimum}, got {number}")
+        return number
+
+    return parse
+
+
+def main() -> int:
+    """CLI entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the verification hot path")
+    parser.add_argument("--files", type=_int_at_least(0), default=100, help="Synthetic repository size (files)")
+    parser.add_argument("--warmup", type=_int_at_least(0), default=3, help="Warmup calls per case")
+    parser.add_argument("--repeat", type=_int_at_least(1), default=10, help="Timed calls per case")
+    parser.add_argument("--only", nargs="*", help="Run only cases with these name prefixes")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT_DIR / "latest.json", help="Result JSON path")
+    parser.add_argument("--baseline", type=Path, help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed median slowdown (0.2 = 20%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="Also write results as the baseline")
+    args = parser.parse_args()
+
+    suite = BenchmarkSuite(file_count=args.files, warmup=args.warmup, repeat=args.repeat, only=args.only)
+    report = suite.run()
+    write_report(report, args.output)
+
+    print(f"\n[BENCHMARK] {len(report.results)} cases, {args.files} files, repeat={args.repeat}")
+    print(f"{'case':36s} {'median ms':>10s} {'p95 ms':>10s} {'stdev':>8s}")
+    for result in report.results:
+        if result.skipped:
+            print(f"{result.name:36s} {'SKIPPED':>10s}  ({result.skipped})")
+        else:
+            print(f"{result.name:36s} {result.median_ms:10.3f} {result.p95_ms:10.3f} {result.stdev_ms:8.3f}")
+    print(f"\n[OK] Results written to {args.output}")
+
+    if args.save_baseline:
+        baseline_path = args.baseline or DEFAULT_OUTPUT_DIR / "baseline.json"
+        write_report(report, baseline_path)
+        print(f"[OK] Baseline saved to {baseline_path}")
+        return 0
+
+    if args.baseline:
+        if not args.baseline.exists():
+            print(f"[WARN] Baseline not found: {args.baseline}")
+            return 0
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        try:
+            regressions = compare_to_baseline(report.to_dict(), baseline, args.threshold)
+        except BaselineMismatchError as e:
+            print(f"[ERROR] {e}")
+            return 2
+        if regressions:
+            print(f"\n[REGRESSION] {len(regressions)} case(s) slower than baseline by >{args.threshold:.0%}")
+            for regression in regressions:
+                print(
+                    f"  - {regression.name}: {regression.baseline_ms:.3f}ms -> "
+                    f"{regression.current_ms:.3f}ms (+{regression.change_percent}%)"
+                )
+            return 1
+        print("[OK] No regressions against baseline")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
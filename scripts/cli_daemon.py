@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+CLI Daemon - Warm interpreter for repeated dev-rules/tier1 invocations
+
+Git hooks run the CLIs many times per commit, and each run pays interpreter
+startup plus imports (click, yaml, task_executor, ...). The daemon keeps one
+warm process on a Unix-domain socket. The client imports only the standard
+library, forwards argv/cwd, and prints the captured output.
+
+Protocol (one request per connection):
+    client -> {"tool": "dev-rules", "argv": [...], "cwd": "..."}   (JSON, then EOF)
+    daemon -> {"exit_code": 0, "stdout": "...", "stderr": "..."}
+
+The daemon exits when any loaded project module changes on disk, so it
+never serves stale code; the client then runs the command in-process.
+
+Only DAEMON_COMMANDS run in the daemon: commands that neither spawn
+processes nor start servers, so all of their output is captured. Every
+other command runs in-process on the client. The client's environment is
+forwarded and applied per request (git hooks rely on GIT_DIR,
+GIT_INDEX_FILE, ...).
+
+Sockets live in a per-user 0700 directory ($XDG_RUNTIME_DIR/dev-rules, or
+dev-rules-<uid> in the temp dir). Clients only talk to a socket owned by
+their own uid, and the daemon never replaces a socket owned by someone else.
+
+Usage:
+    python scripts/cli_daemon.py start                     # serve in foreground
+    python scripts/cli_daemon.py run dev-rules task list   # via daemon, or in-process
+    python scripts/cli_daemon.py status
+    python scripts/cli_daemon.py stop
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import socket
+import stat
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPTS_DIR.parent
+
+# tool name -> "module:click group"
+TOOLS = {
+    "dev-rules": "dev_rules_cli:cli",
+    "tier1": "tier1_cli:cli",
+}
+
+# tool name -> command paths safe to run inside the daemon (no subprocesses,
+# no servers; everything they print goes through click)
+DAEMON_COMMANDS = {
+    "dev-rules": {
+        ("task", "list"),
+        ("prompt", "compress"),
+        ("prompt", "info"),
+        ("stats", "compression"),
+        ("stats", "tasks"),
+    },
+    "tier1": {("status",)},
+}
+
+CONNECT_TIMEOUT = 0.5  # seconds; fall back to in-process when the daemon is slow to answer connect
+MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+
+def daemon_available() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def _uid() -> int:
+    return os.getuid() if hasattr(os, "getuid") else 0
+
+
+def runtime_dir() -> Path:
+    """Per-user directory for daemon sockets"""
+    xdg_runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if xdg_runtime:
+        return Path(xdg_runtime) / "dev-rules"
+    return Path(tempfile.gettempdir()) / f"dev-rules-{_uid()}"
+
+
+def socket_path(name: str = "cli", project_root: Path = PROJECT_ROOT) -> Path:
+    """Per-user, per-project socket path (kept short for the AF_UNIX path limit)"""
+    digest = hashlib.sha1(str(project_root).encode("utf-8")).hexdigest()[:12]
+    return runtime_dir() / f"{digest}-{name}.sock"
+
+
+def owned_socket(path: Path) -> bool:
+    """True if ``path`` is a socket (not a symlink) owned by the current user"""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == _uid()
+
+
+def daemon_safe(tool: str, argv: list) -> bool:
+    """True if the command may run inside the daemon (see DAEMON_COMMANDS)"""
+    positional = tuple(arg for arg in argv if not arg.startswith("-"))
+    return any(positional[: len(command)] == command for command in DAEMON_COMMANDS.get(tool, ()))
+
+
+def _prepare_socket_dir(directory: Path) -> None:
+    """Create the socket directory (0700) and verify nobody else controls it
+
+    Raises:
+        PermissionError: If the directory is owned by another user or writable by others
+    """
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = os.lstat(directory)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != _uid() or st.st_mode & 0o022:
+        raise PermissionError(f"Insecure socket directory: {directory}")
+
+
+def _recv_all(conn: socket.socket) -> bytes:
+    chunks = []
+    size = 0
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > MAX_MESSAGE_BYTES:
+            raise ValueError("Message too large")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def send_request(path: Path, payload: Dict, timeout: Optional[float] = None) -> Optional[Dict]:
+    """Send one request to a daemon; None when no daemon is listening
+
+    Args:
+        path: Daemon socket path
+        payload: JSON-serializable request
+        timeout: Response timeout in seconds (None = wait)
+    """
+    if not daemon_available() or not owned_socket(path):
+        return None  # No daemon, or a socket someone else put there
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(CONNECT_TIMEOUT)
+            conn.connect(str(path))
+            conn.settimeout(timeout)
+            conn.sendall(json.dumps(payload).encode("utf-8"))
+            conn.shutdown(socket.SHUT_WR)
+            data = _recv_all(conn)
+    except OSError:
+        return None
+    if not data:
+        return None  # Daemon shut down instead of answering (e.g. stale code)
+    return json.loads(data)
+
+
+def serve(path: Path, handler: Callable[[Dict], Dict], should_stop: Callable[[], bool] = lambda: False) -> None:
+    """Serve requests sequentially until a handler sets {"shutdown": True} or should_stop() is true
+
+    Args:
+        path: Socket path (replaced if a stale socket of ours exists)
+        handler: request dict -> response dict
+        should_stop: Checked before each request; True closes the connection unanswered
+
+    Raises:
+        PermissionError: If the directory or an existing socket belongs to someone else
+    """
+    _prepare_socket_dir(path.parent)
+    if os.path.lexists(path):
+        if os.lstat(path).st_uid != _uid():
+            raise PermissionError(f"Refusing to replace socket owned by another user: {path}")
+        path.unlink()
+    old_umask = os.umask(0o077)
+    try:
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(path))
+    finally:
+        os.umask(old_umask)
+
+    try:
+        server.listen(16)
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                if should_stop():
+                    break
+                try:
+                    request = json.loads(_recv_all(conn))
+                    response = handler(request)
+                except Exception as e:  # Keep serving; report the failure to this client
+                    response = {"error": f"{type(e).__name__}: {e}"}
+                conn.sendall(json.dumps(response, default=str).encode("utf-8"))
+                if response.get("shutdown"):
+                    break
+    finally:
+        server.close()
+        if owned_socket(path):
+            path.unlink()
+
+
+def loaded_module_mtimes(root: Path = SCRIPTS_DIR) -> Dict[str, int]:
+    """mtime_ns of every loaded module file under ``root``"""
+    mtimes = {}
+    for module in list(sys.modules.values()):
+        filename = getattr(module, "__file__", None)
+        if filename and filename.startswith(str(root)):
+            try:
+                mtimes[filename] = os.stat(filename).st_mtime_ns
+            except OSError:
+                mtimes[filename] = -1
+    return mtimes
+
+
+def modules_changed(snapshot: Dict[str, int]) -> bool:
+    for filename, mtime_ns in snapshot.items():
+        try:
+            if os.stat(filename).st_mtime_ns != mtime_ns:
+                return True
+        except OSError:
+            return True
+    return False
+
+
+def load_cli(tool: str):
+    """Import and return the click group for a tool name"""
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    module_name, attr = TOOLS[tool].split(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+class CLIDaemon:
+    """Runs CLI invocations inside one warm interpreter"""
+
+    def __init__(self, preload: bool = True):
+        from click.testing import CliRunner
+
+        self.runner = CliRunner(mix_stderr=False) if _supports_mix_stderr(CliRunner) else CliRunner()
+        if preload:
+            for tool in TOOLS:
+                load_cli(tool)
+        self.module_mtimes = loaded_module_mtimes()
+
+    def handle(self, request: Dict) -> Dict:
+        command = request.get("command", "run")
+        if command == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if command == "stop":
+            return {"ok": True, "shutdown": True}
+
+        tool = request["tool"]
+        if tool not in TOOLS:
+            return {"exit_code": 2, "stdout": "", "stderr": f"[ERROR] Unknown tool: {tool}\n"}
+        argv = request.get("argv", [])
+        if not daemon_safe(tool, argv):
+            # No exit_code: the client runs the command itself
+            return {"error": f"Not served by the daemon: {tool} {' '.join(argv)}"}
+
+        previous_cwd = os.getcwd()
+        previous_env = dict(os.environ)
+        os.chdir(request.get("cwd") or previous_cwd)
+        if request.get("env") is not None:
+            os.environ.clear()
+            os.environ.update(request["env"])
+        try:
+            result = self.runner.invoke(load_cli(tool), argv, prog_name=tool)
+        finally:
+            os.chdir(previous_cwd)
+            os.environ.clear()
+            os.environ.update(previous_env)
+
+        try:
+            stderr = result.stderr
+        except ValueError:  # click < 8.2 without mix_stderr=False support
+            stderr = ""
+        if result.exception and not isinstance(result.exception, SystemExit):
+            stderr += f"[ERROR] Unexpected error: {result.exception}\n"
+        # Imports done by this command become part of the code we must not serve stale
+        self.module_mtimes.update({k: v for k, v in loaded_module_mtimes().items() if k not in self.module_mtimes})
+        return {"exit_code": result.exit_code, "stdout": result.stdout, "stderr": stderr}
+
+    def stale(self) -> bool:
+        return modules_changed(self.module_mtimes)
+
+
+def _supports_mix_stderr(runner_cls) -> bool:
+    import inspect
+
+    return "mix_stderr" in inspect.signature(runner_cls.__init__).parameters
+
+
+def run_tool(tool: str, argv: list) -> int:
+    """Run a tool through the daemon if one is up and the command is daemon-safe, otherwise in-process"""
+    response = None
+    if daemon_safe(tool, argv):
+        request = {"tool": tool, "argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)}
+        response = send_request(socket_path(), request)
+    if response is not None and "exit_code" in response:
+        sys.stdout.write(response["stdout"])
+        sys.stderr.write(response["stderr"])
+        return response["exit_code"]
+
+    cli = load_cli(tool)
+    try:
+        cli.main(args=argv, prog_name=tool, standalone_mode=True)
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    return 0
+
+
+def main() -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Warm CLI daemon for dev-rules/tier1")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("start", help="Serve in the foreground")
+    sub.add_parser("stop", help="Stop a running daemon")
+    sub.add_parser("status", help="Check whether a daemon is running")
+    run = sub.add_parser("run", help="Run a tool via the daemon (in-process fallback)")
+    run.add_argument("tool", choices=sorted(TOOLS))
+    run.add_argument("argv", nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+
+    path = socket_path()
+    if args.command == "run":
+        return run_tool(args.tool, args.argv)
+
+    if args.command in ("stop", "status"):
+        response = send_request(path, {"command": "stop" if args.command == "stop" else "ping"}, timeout=5)
+        if response is None:
+            print("[INFO] No CLI daemon running")
+            return 1
+        print(f"[OK] CLI daemon {'stopped' if args.command == 'stop' else 'running'}: {path}")
+        return 0
+
+    if not daemon_available():
+        print("[ERROR] Unix domain sockets are not available on this platform")
+        return 1
+
+    daemon = CLIDaemon()
+    print(f"[INFO] CLI daemon listening on {path}")
+    try:
+        serve(path, daemon.handle, should_stop=daemon.stale)
+    except PermissionError as e:
+        print(f"[ERROR] {e}")
+        return 1
+    print("[INFO] CLI daemon stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
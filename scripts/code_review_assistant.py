@@ -19,6 +19,12 @@ Integrations:
   - Git pre-push hook for automatic review
   - GitHub Actions for PR reviews
   - Claude Code slash command for interactive review
+
+Git data:
+  One `git diff -U0` gives the changed line ranges per file, and one
+  `git cat-file --batch` reads the committed blobs. Checks only report on
+  changed lines, so the review reflects the commit rather than the working
+  tree. Large commits are reviewed in a process pool.
 """
 
 import subprocess
@@ -26,10 +32,21 @@ import sys
 import re
 import json
 import ast
+from bisect import bisect_right
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
+
+try:
+    from scripts.parallel_scan import map_chunks
+except ImportError:
+    from parallel_scan import map_chunks
+
+EMPTY_TREE = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"  # git hash-object -t tree /dev/null
+HUNK_PATTERN = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+LineRanges = List[Tuple[int, int]]  # inclusive (start, end) line ranges, sorted
 
 
 @dataclass
@@ -45,6 +62,16 @@ class ReviewFinding:
     article: Optional[str] = None  # Constitutional article reference
 
 
+@dataclass
+class FileChange:
+    """One file in a commit diff"""
+
+    path: str
+    blob: Optional[str] = None  # new-side blob id (None when deleted)
+    deleted: bool = False
+    ranges: LineRanges = field(default_factory=list)  # added/modified lines, new-side numbering
+
+
 @dataclass
 class ReviewReport:
     """Complete review report"""
@@ -103,20 +130,30 @@ class CodeReviewAssistant:
         self.findings = []
         self.stats = {"files_reviewed": 0, "lines_reviewed": 0, "issues_found": 0, "suggestions_made": 0}
 
+        self._changed: Optional[LineRanges] = None  # None = review whole file
+        self._changed_starts: List[int] = []
+
     def review_commit(self, commit: str = "HEAD") -> ReviewReport:
         """Review a specific commit"""
         # Get commit info
         commit_hash = self._get_commit_hash(commit)
-        changed_files = self._get_changed_files(commit)
-
-        # Review each file
-        for file_path in changed_files:
-            if self._should_review_file(file_path):
-                self._review_file(file_path, commit)
-                self.stats["files_reviewed"] += 1
+        changes = self._get_changes(commit)
+        changed_files = [change.path for change in changes]
+
+        # Review changed lines of each file, as committed
+        reviewable = [
+            change
+            for change in changes
+            if not change.deleted and change.blob and change.ranges and self._should_review_file(change.path)
+        ]
+        blobs = self._read_blobs([change.blob for change in reviewable])
+        jobs = [
+            (change.path, blobs[change.blob], change.ranges) for change in reviewable if blobs.get(change.blob) is not None
+        ]
+        self._review_files(jobs)
 
         # Check constitutional compliance
-        constitutional = self._check_constitutional_compliance(changed_files)
+        constitutional = self._check_constitutional_compliance(changed_files, commit)
 
         # Generate report
         return self._generate_report(commit_hash, constitutional)
@@ -126,12 +163,65 @@ class CodeReviewAssistant:
         result = subprocess.run(["git", "rev-parse", commit], capture_output=True, text=True, encoding="utf-8")
         return result.stdout.strip()[:8]
 
+    def _get_changes(self, commit: str) -> List[FileChange]:
+        """Changed files and line ranges of a commit (first parent; root commits vs the empty tree)"""
+        for base in (f"{commit}~1", EMPTY_TREE):
+            result = subprocess.run(
+                ["git", "-c", "core.quotePath=false", "diff", "-U0", "--full-index", "--no-color", "--no-ext-diff"]
+                + [base, commit],
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+            if result.returncode == 0:
+                return parse_diff(result.stdout)
+        return []
+
     def _get_changed_files(self, commit: str) -> List[str]:
         """Get list of changed files in commit"""
+        return [change.path for change in self._get_changes(commit)]
+
+    def _read_blobs(self, blob_ids: List[str]) -> Dict[str, Optional[str]]:
+        """Read blob contents with a single `git cat-file --batch` (None for binary/missing)"""
+        unique = list(dict.fromkeys(blob_ids))
+        if not unique:
+            return {}
+
         result = subprocess.run(
-            ["git", "diff", "--name-only", f"{commit}~1..{commit}"], capture_output=True, text=True, encoding="utf-8"
+            ["git", "cat-file", "--batch"], input="\n".join(unique).encode() + b"\n", capture_output=True
         )
-        return [f for f in result.stdout.strip().split("\n") if f]
+        blobs: Dict[str, Optional[str]] = {}
+        data = result.stdout
+        pos = 0
+        for blob_id in unique:
+            header_end = data.find(b"\n", pos)
+            if header_end < 0:
+                break
+            header = data[pos:header_end].split()
+            pos = header_end + 1
+            if len(header) < 3 or header[1] != b"blob":
+                blobs[blob_id] = None  # "<id> missing"
+                continue
+            size = int(header[2])
+            try:
+                blobs[blob_id] = data[pos : pos + size].decode("utf-8")
+            except UnicodeDecodeError:
+                blobs[blob_id] = None
+            pos += size + 1  # content is followed by a newline
+        return blobs
+
+    def _review_files(self, jobs: List[Tuple[str, str, LineRanges]]):
+        """Review (path, content, changed ranges) jobs, in a process pool for large commits
+
+        Every file is reviewed by a fresh assistant (in a worker or inline) and
+        its findings are merged here through _add_finding.
+        """
+        for findings, lines in map_chunks(_review_chunk, jobs):
+            for finding in findings:
+                self._add_finding(**asdict(finding))
+            self.stats["files_reviewed"] += 1
+            self.stats["lines_reviewed"] += lines
 
     def _should_review_file(self, file_path: str) -> bool:
         """Check if file should be reviewed"""
@@ -139,32 +229,42 @@ class CodeReviewAssistant:
         extensions = {".py", ".js", ".jsx", ".ts", ".tsx"}
         return Path(file_path).suffix in extensions
 
-    def _review_file(self, file_path: str, commit: str):
-        """Review individual file"""
-        # Get file diff
-        self._get_file_diff(file_path, commit)
+    def _review_file(self, file_path: str, content: Optional[str] = None, changed: Optional[LineRanges] = None) -> int:
+        """Review individual file, limited to changed line ranges when given
 
-        # Get file content
-        content = self._get_file_content(file_path)
+        Returns:
+            Number of lines reviewed
+        """
+        if content is None:
+            content = self._get_file_content(file_path)
         if not content:
-            return
+            return 0
 
-        # Run various checks
-        self._check_code_quality(file_path, content)
-        self._check_solid_principles(file_path, content)
-        self._check_security(file_path, content)
-        self._check_performance(file_path, content)
-        self._check_windows_compatibility(file_path, content)
+        self._changed = changed
+        self._changed_starts = [start for start, _ in changed] if changed is not None else []
+        try:
+            # Run various checks
+            self._check_code_quality(file_path, content)
+            self._check_solid_principles(file_path, content)
+            self._check_security(file_path, content)
+            self._check_performance(file_path, content)
+            self._check_windows_compatibility(file_path, content)
+        finally:
+            self._changed = None
+            self._changed_starts = []
 
         # Count lines
-        self.stats["lines_reviewed"] += len(content.splitlines())
+        if changed is None:
+            return len(content.splitlines())
+        return sum(end - start + 1 for start, end in changed)
 
-    def _get_file_diff(self, file_path: str, commit: str) -> str:
-        """Get diff for specific file"""
-        result = subprocess.run(
-            ["git", "diff", f"{commit}~1..{commit}", "--", file_path], capture_output=True, text=True, encoding="utf-8"
-        )
-        return result.stdout
+    def _touches(self, start: int, end: Optional[int] = None) -> bool:
+        """Whether lines start..end overlap the changed ranges under review"""
+        if self._changed is None:
+            return True
+        end = start if end is None else end
+        index = bisect_right(self._changed_starts, end) - 1
+        return index >= 0 and self._changed[index][1] >= start
 
     def _get_file_content(self, file_path: str) -> Optional[str]:
         """Get file content"""
@@ -207,6 +307,9 @@ class CodeReviewAssistant:
         is_cli_script = self._is_cli_script(file_path, content)
 
         for i, line in enumerate(lines, 1):
+            if not self._touches(i):
+                continue
+
             # Check line length
             if len(line) > 120:
                 self._add_finding(
@@ -254,7 +357,7 @@ class CodeReviewAssistant:
         try:
             tree = ast.parse(content)
             for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
+                if isinstance(node, ast.ClassDef) and self._touches(node.lineno, node.end_lineno):
                     self._check_class_solid_violations(node, file_path)
         except SyntaxError:
             pass  # Invalid Python syntax
@@ -347,7 +450,9 @@ class CodeReviewAssistant:
         for pattern, message in self.SECURITY_PATTERNS:
             matches = re.finditer(pattern, content, re.IGNORECASE)
             for match in matches:
-                line_num = content[: match.start()].count("\n") + 1
+                line_num = content.count("\n", 0, match.start()) + 1
+                if not self._touches(line_num):
+                    continue
                 self._add_finding(
                     severity="critical" if "exec" in message or "pickle" in message else "warning",
                     category="security",
@@ -363,27 +468,38 @@ class CodeReviewAssistant:
             return
 
         # Check for nested loops
-        if re.search(r"for .* in .*:\s*\n\s*for .* in .*:", content):
+        line = self._first_changed_match(r"for .* in .*:\s*\n\s*for .* in .*:", content)
+        if line is not None:
             self._add_finding(
                 severity="warning",
                 category="performance",
                 file=file_path,
-                line=None,
+                line=line,
                 message="Nested loops detected (potential O(n²) complexity)",
                 suggestion="Consider using more efficient algorithms or data structures",
             )
 
         # Check for list comprehensions in loops
-        if re.search(r"for .* in .*:\s*\n.*\[.*for.*in.*\]", content):
+        line = self._first_changed_match(r"for .* in .*:\s*\n.*\[.*for.*in.*\]", content)
+        if line is not None:
             self._add_finding(
                 severity="suggestion",
                 category="performance",
                 file=file_path,
-                line=None,
+                line=line,
                 message="List comprehension inside loop",
                 suggestion="Consider moving list comprehension outside loop if possible",
             )
 
+    def _first_changed_match(self, pattern: str, content: str) -> Optional[int]:
+        """Line of the first match overlapping the changed ranges"""
+        for match in re.finditer(pattern, content):
+            start = content.count("\n", 0, match.start()) + 1
+            end = start + match.group().count("\n")
+            if self._touches(start, end):
+                return start
+        return None
+
     def _check_windows_compatibility(self, file_path: str, content: str):
         """Check Windows UTF-8 compatibility (P10) - Runtime output only
 
@@ -429,8 +545,8 @@ class CodeReviewAssistant:
             if in_multiline_string:
                 continue
 
-            # Skip if line is a comment
-            if stripped.startswith("#"):
+            # Skip if line is a comment or outside the changed ranges
+            if stripped.startswith("#") or not self._touches(line_num):
                 continue
 
             # Check if line contains runtime output
@@ -457,7 +573,7 @@ class CodeReviewAssistant:
                     article="P10",
                 )
 
-    def _check_constitutional_compliance(self, files: List[str]) -> Dict[str, bool]:
+    def _check_constitutional_compliance(self, files: List[str], commit: str = "HEAD") -> Dict[str, bool]:
         """Check overall constitutional compliance"""
         compliance = {}
 
@@ -471,16 +587,18 @@ class CodeReviewAssistant:
         compliance["P8"] = len(test_files) > 0 if len(py_files) > 0 else True
 
         # P9: Conventional commit (check separately)
-        compliance["P9"] = self._check_commit_message_format()
+        compliance["P9"] = self._check_commit_message_format(commit)
 
         # P10: Windows UTF-8 (checked per file)
         compliance["P10"] = len([f for f in self.findings if f.article == "P10"]) == 0
 
         return compliance
 
-    def _check_commit_message_format(self) -> bool:
+    def _check_commit_message_format(self, commit: str = "HEAD") -> bool:
         """Check if commit message follows conventional format"""
-        result = subprocess.run(["git", "log", "-1", "--pretty=%B"], capture_output=True, text=True, encoding="utf-8")
+        result = subprocess.run(
+            ["git", "log", "-1", "--pretty=%B", commit], capture_output=True, text=True, encoding="utf-8"
+        )
         message = result.stdout.strip()
 
         # Check conventional commit format
@@ -585,6 +703,49 @@ class CodeReviewAssistant:
         return recommendations[:5]  # Top 5 recommendations
 
 
+def parse_diff(diff_text: str) -> List[FileChange]:
+    """Parse `git diff -U0 --full-index` output into per-file changed line ranges"""
+    changes: List[FileChange] = []
+    current: Optional[FileChange] = None
+
+    for line in diff_text.splitlines():
+        if line.startswith("diff --git "):
+            current = FileChange(path=line.split(" b/", 1)[-1].strip('"'))
+            changes.append(current)
+        elif current is None:
+            continue
+        elif line.startswith("@@"):
+            match = HUNK_PATTERN.match(line)
+            if match:
+                start = int(match.group(1))
+                count = int(match.group(2)) if match.group(2) is not None else 1
+                if count > 0:
+                    current.ranges.append((start, start + count - 1))
+        elif line.startswith("index "):
+            new_blob = line.split()[1].split("..")[-1]
+            current.blob = None if set(new_blob) == {"0"} else new_blob
+        elif line.startswith("deleted file mode"):
+            current.deleted = True
+        elif line.startswith("+++ "):
+            target = line[4:].strip('"')
+            if target == "/dev/null":
+                current.deleted = True
+            elif target.startswith("b/"):
+                current.path = target[2:]
+
+    return changes
+
+
+def _review_chunk(jobs: List[Tuple[str, str, LineRanges]]) -> List[Tuple[List[ReviewFinding], int]]:
+    """Review each file with a fresh assistant; returns its findings and reviewed line count"""
+    results = []
+    for file_path, content, changed in jobs:
+        assistant = CodeReviewAssistant()
+        lines = assistant._review_file(file_path, content, changed)
+        results.append((assistant.findings, lines))
+    return results
+
+
 def format_report(report: ReviewReport, format: str = "text") -> str:
     """
     Format report for output.
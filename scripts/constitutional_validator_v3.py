@@ -8,16 +8,42 @@ Layers:
 - L2: Quality Assurance (C6-C10): Testing and code quality
 - L3: AI & Automation (C11-C15): Advanced automation features
 - L4: Process & Governance (C16-C20): Workflow and standards
+
+All 20 article validators run concurrently. Blocking work (globbing,
+file reads, subprocesses) runs on a bounded thread pool, and every
+validator reads from one ProjectSnapshot collected up front, so a full
+check costs roughly as much as the slowest article.
 """
 
 import json
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
-from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
 import asyncio
 
+try:
+    from scripts.evidence_pack import archived_record_count
+except ImportError:
+    from evidence_pack import archived_record_count
+
+
+# (result key, header, summary name, article ids)
+LAYERS = [
+    ("L1_Foundation", "[L1] FOUNDATION LAYER", "Foundation", ["C1", "C2", "C3", "C4", "C5"]),
+    ("L2_Quality", "[L2] QUALITY ASSURANCE LAYER", "Quality", ["C6", "C7", "C8", "C9", "C10"]),
+    ("L3_AI_Automation", "[L3] AI & AUTOMATION LAYER", "AI & Automation", ["C11", "C12", "C13", "C14", "C15"]),
+    ("L4_Governance", "[L4] PROCESS & GOVERNANCE LAYER", "Governance", ["C16", "C17", "C18", "C19", "C20"]),
+]
+
+# Directories never worth walking when collecting the snapshot
+SNAPSHOT_SKIP_DIRS = {".git", "__pycache__", ".venv", "venv", "node_modules", ".ruff_cache", ".pytest_cache"}
+
 
 @dataclass
 class ValidationResult:
@@ -31,12 +57,42 @@ class ValidationResult:
     recommendations: List[str]
 
 
+@dataclass
+class ProjectSnapshot:
+    """Project facts collected once and shared by all article validators."""
+
+    task_yaml_files: List[Path] = field(default_factory=list)
+    spec_md_files: List[Path] = field(default_factory=list)
+    script_sources: Dict[Path, str] = field(default_factory=dict)
+    main_modules: List[Path] = field(default_factory=list)
+    log_files: List[Path] = field(default_factory=list)
+    test_files: List[Path] = field(default_factory=list)
+    evidence_dir_exists: bool = False
+    evidence_file_count: int = 0
+    archived_evidence_count: int = 0
+    top_level_dirs: List[Path] = field(default_factory=list)
+    git_head: Optional[str] = None
+    git_branch: Optional[str] = None
+
+    @property
+    def phase_spec_files(self) -> List[Path]:
+        return [f for f in self.spec_md_files if "phase" in f.name]
+
+
+# Snapshot of the validation pass running in this context, tagged with its validator
+_PASS_SNAPSHOT: ContextVar[Optional[Tuple["UnifiedConstitutionalValidator", ProjectSnapshot]]] = ContextVar(
+    "constitution_pass_snapshot", default=None
+)
+
+
 class UnifiedConstitutionalValidator:
     """20-Article Unified Constitution Validator."""
 
-    def __init__(self, project_root: Path = None):
+    def __init__(self, project_root: Path = None, max_workers: int = 8):
         self.project_root = project_root or Path.cwd()
         self.results = []
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="constitution")
 
         # Constitution definition
         self.articles = {
@@ -176,13 +232,16 @@ class UnifiedConstitutionalValidator:
         print("20 Articles | 4 Layers | Dev Rules + SpecKit")
         print("=" * 60)
 
-        # Validate each layer
-        layer_results = {
-            "L1_Foundation": await self.validate_layer_1_foundation(context),
-            "L2_Quality": await self.validate_layer_2_quality(context),
-            "L3_AI_Automation": await self.validate_layer_3_ai_automation(context),
-            "L4_Governance": await self.validate_layer_4_governance(context),
-        }
+        # Run every article at once, then report layer by layer
+        all_ids = [article_id for _, _, _, ids in LAYERS for article_id in ids]
+        async with self._validation_pass() as snapshot:
+            by_id = dict(zip(all_ids, await self._run_articles(all_ids, context)))
+
+        layer_results = {}
+        for key, header, name, ids in LAYERS:
+            results = [by_id[article_id] for article_id in ids]
+            self.results.extend(results)
+            layer_results[key] = self._report_layer(header, name, results)
 
         # Calculate overall compliance
         total_passed = sum(1 for r in self.results if r.passed)
@@ -201,6 +260,7 @@ class UnifiedConstitutionalValidator:
             "passed": total_passed,
             "score": total_score,
             "grade": self._calculate_grade(total_score),
+            "project": {"git_head": snapshot.git_head, "git_branch": snapshot.git_branch},
             "layer_results": layer_results,
             "detailed_results": [r.__dict__ for r in self.results],
             "recommendations": self._generate_recommendations(),
@@ -208,66 +268,158 @@ class UnifiedConstitutionalValidator:
 
     async def validate_layer_1_foundation(self, context: Dict) -> Dict:
         """Validate Layer 1: Foundation (C1-C5)."""
-        print("\n[L1] FOUNDATION LAYER")
-        print("-" * 40)
-
-        results = []
-        for article_id in ["C1", "C2", "C3", "C4", "C5"]:
-            result = await self.articles[article_id]["validator"](context)
-            self.results.append(result)
-            results.append(result)
-            self._print_result(result)
-
-        return self._summarize_layer("Foundation", results)
+        return await self._validate_layer(0, context)
 
     async def validate_layer_2_quality(self, context: Dict) -> Dict:
         """Validate Layer 2: Quality Assurance (C6-C10)."""
-        print("\n[L2] QUALITY ASSURANCE LAYER")
-        print("-" * 40)
-
-        results = []
-        for article_id in ["C6", "C7", "C8", "C9", "C10"]:
-            result = await self.articles[article_id]["validator"](context)
-            self.results.append(result)
-            results.append(result)
-            self._print_result(result)
-
-        return self._summarize_layer("Quality", results)
+        return await self._validate_layer(1, context)
 
     async def validate_layer_3_ai_automation(self, context: Dict) -> Dict:
         """Validate Layer 3: AI & Automation (C11-C15)."""
-        print("\n[L3] AI & AUTOMATION LAYER")
-        print("-" * 40)
-
-        results = []
-        for article_id in ["C11", "C12", "C13", "C14", "C15"]:
-            result = await self.articles[article_id]["validator"](context)
-            self.results.append(result)
-            results.append(result)
-            self._print_result(result)
-
-        return self._summarize_layer("AI & Automation", results)
+        return await self._validate_layer(2, context)
 
     async def validate_layer_4_governance(self, context: Dict) -> Dict:
         """Validate Layer 4: Process & Governance (C16-C20)."""
-        print("\n[L4] PROCESS & GOVERNANCE LAYER")
+        return await self._validate_layer(3, context)
+
+    async def _validate_layer(self, index: int, context: Dict) -> Dict:
+        """Validate one layer's articles concurrently and report them."""
+        _, header, name, ids = LAYERS[index]
+        async with self._validation_pass():
+            results = await self._run_articles(ids, context)
+        self.results.extend(results)
+        return self._report_layer(header, name, results)
+
+    async def _run_articles(self, article_ids: List[str], context: Dict) -> List[ValidationResult]:
+        """Run article validators concurrently, preserving input order."""
+        return list(await asyncio.gather(*(self.articles[a]["validator"](context) for a in article_ids)))
+
+    def _report_layer(self, header: str, name: str, results: List[ValidationResult]) -> Dict:
+        """Print a layer's results and return its summary."""
+        print(f"\n{header}")
         print("-" * 40)
-
-        results = []
-        for article_id in ["C16", "C17", "C18", "C19", "C20"]:
-            result = await self.articles[article_id]["validator"](context)
-            self.results.append(result)
-            results.append(result)
+        for result in results:
             self._print_result(result)
+        return self._summarize_layer(name, results)
+
+    # Shared project snapshot
+
+    def close(self) -> None:
+        """Shut down the validator's thread pool."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "UnifiedConstitutionalValidator":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    async def _run_blocking(self, func: Callable, *args, **kwargs):
+        """Run blocking I/O on the bounded thread pool, off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: func(*args, **kwargs))
+
+    @asynccontextmanager
+    async def _validation_pass(self) -> AsyncIterator[ProjectSnapshot]:
+        """Collect a fresh snapshot shared by the article validators run inside."""
+        snapshot = await self._collect_snapshot()
+        token = _PASS_SNAPSHOT.set((self, snapshot))
+        try:
+            yield snapshot
+        finally:
+            _PASS_SNAPSHOT.reset(token)
+
+    async def _ensure_snapshot(self) -> ProjectSnapshot:
+        """The current pass's snapshot; a standalone article call collects its own."""
+        current = _PASS_SNAPSHOT.get()
+        if current is not None and current[0] is self:
+            return current[1]
+        return await self._collect_snapshot()
+
+    async def _collect_snapshot(self) -> ProjectSnapshot:
+        """Collect file lists, script contents and git metadata in parallel."""
+        root = self.project_root
+        evidence_dir = root / "RUNS" / "evidence"
+
+        (
+            task_yaml_files,
+            spec_md_files,
+            script_sources,
+            (main_modules, log_files),
+            test_files,
+            evidence_files,
+            archived_evidence,
+            top_level_dirs,
+            git_metadata,
+        ) = await asyncio.gather(
+            self._run_blocking(lambda: sorted((root / "TASKS").glob("*.yaml"))),
+            self._run_blocking(lambda: sorted((root / "specs").glob("**/*.md"))),
+            self._run_blocking(self._read_script_sources),
+            self._run_blocking(self._walk_project),
+            self._run_blocking(lambda: sorted((root / "tests").glob("*.py"))),
+            self._run_blocking(lambda: list(evidence_dir.glob("*.json")) if evidence_dir.exists() else []),
+            self._run_blocking(lambda: archived_record_count(evidence_dir / "archive")),
+            self._run_blocking(lambda: [d for d in root.iterdir() if d.is_dir() and not d.name.startswith(".")]),
+            self._run_blocking(self._read_git_metadata),
+        )
+
+        return ProjectSnapshot(
+            task_yaml_files=task_yaml_files,
+            spec_md_files=spec_md_files,
+            script_sources=script_sources,
+            main_modules=main_modules,
+            log_files=log_files,
+            test_files=test_files,
+            evidence_dir_exists=evidence_dir.exists(),
+            evidence_file_count=len(evidence_files),
+            archived_evidence_count=archived_evidence,
+            top_level_dirs=top_level_dirs,
+            git_head=git_metadata[0],
+            git_branch=git_metadata[1],
+        )
 
-        return self._summarize_layer("Governance", results)
+    def _read_script_sources(self) -> Dict[Path, str]:
+        """Read every scripts/*.py file once."""
+        return {
+            f: f.read_text(encoding="utf-8", errors="ignore") for f in sorted((self.project_root / "scripts").glob("*.py"))
+        }
+
+    def _walk_project(self) -> tuple:
+        """Single tree walk collecting __main__.py modules and *.log files."""
+        main_modules, log_files = [], []
+        for dirpath, dirnames, filenames in os.walk(self.project_root):
+            dirnames[:] = [d for d in dirnames if d not in SNAPSHOT_SKIP_DIRS]
+            for filename in filenames:
+                if filename == "__main__.py":
+                    main_modules.append(Path(dirpath) / filename)
+                elif filename.endswith(".log"):
+                    log_files.append(Path(dirpath) / filename)
+        return main_modules, log_files
+
+    def _read_git_metadata(self) -> tuple:
+        """Return (HEAD sha, branch) from one git call, or (None, None)."""
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "HEAD", "--abbrev-ref", "HEAD"],
+                cwd=self.project_root,
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None, None
+        lines = result.stdout.split()
+        if result.returncode != 0 or len(lines) != 2:
+            return None, None
+        return lines[0], lines[1]
 
     # Individual article validators
 
     async def validate_c1_executable_spec(self, context: Dict) -> ValidationResult:
         """C1: Executable Specification validation."""
-        yaml_files = list(Path("TASKS").glob("*.yaml"))
-        md_specs = list(Path("specs").glob("**/*.md"))
+        snapshot = await self._ensure_snapshot()
+        yaml_files = snapshot.task_yaml_files
+        md_specs = snapshot.spec_md_files
 
         score = 0.7 if yaml_files else 0.0
         score += 0.3 if md_specs else 0.0
@@ -302,12 +454,9 @@ class UnifiedConstitutionalValidator:
 
     async def validate_c3_cli_interface(self, context: Dict) -> ValidationResult:
         """C3: CLI Interface validation."""
-        cli_files = list(self.project_root.glob("**/__main__.py"))
-        cli_scripts = [
-            f
-            for f in (self.project_root / "scripts").glob("*.py")
-            if "if __name__ == '__main__':" in f.read_text(encoding="utf-8", errors="ignore")
-        ]
+        snapshot = await self._ensure_snapshot()
+        cli_files = snapshot.main_modules
+        cli_scripts = [f for f, content in snapshot.script_sources.items() if "if __name__ == '__main__':" in content]
 
         score = min(1.0, (len(cli_files) + len(cli_scripts)) / 10)
 
@@ -322,17 +471,21 @@ class UnifiedConstitutionalValidator:
 
     async def validate_c4_evidence_based(self, context: Dict) -> ValidationResult:
         """C4: Evidence-Based Development validation."""
-        evidence_dir = self.project_root / "RUNS" / "evidence"
-        evidence_files = list(evidence_dir.glob("*.json")) if evidence_dir.exists() else []
+        snapshot = await self._ensure_snapshot()
 
-        score = min(1.0, len(evidence_files) / 50)
+        total_evidence = snapshot.evidence_file_count + snapshot.archived_evidence_count
+        score = min(1.0, total_evidence / 50)
 
         return ValidationResult(
             article_id="C4",
             article_name="Evidence-Based Development",
-            passed=evidence_dir.exists(),
+            passed=snapshot.evidence_dir_exists,
             score=score,
-            evidence={"evidence_directory": evidence_dir.exists(), "evidence_files": len(evidence_files)},
+            evidence={
+                "evidence_directory": snapshot.evidence_dir_exists,
+                "evidence_files": snapshot.evidence_file_count,
+                "archived_evidence": snapshot.archived_evidence_count,
+            },
             recommendations=["Run TaskExecutor to generate evidence"] if score < 0.5 else [],
         )
 
@@ -353,12 +506,17 @@ class UnifiedConstitutionalValidator:
         """C6: Test-First Development validation."""
         try:
             # Check test coverage
-            subprocess.run(
-                ["python", "-m", "pytest", "--cov=scripts", "--cov-report=json", "--quiet"], capture_output=True, text=True
+            await self._run_blocking(
+                subprocess.run,
+                ["python", "-m", "pytest", "--cov=scripts", "--cov-report=json", "--quiet"],
+                cwd=self.project_root,
+                capture_output=True,
+                text=True,
             )
 
-            if (self.project_root / "coverage.json").exists():
-                with open("coverage.json") as f:
+            coverage_file = self.project_root / "coverage.json"
+            if coverage_file.exists():
+                with open(coverage_file) as f:
                     coverage_data = json.load(f)
                     coverage = coverage_data.get("totals", {}).get("percent_covered", 0) / 100
             else:
@@ -378,8 +536,9 @@ class UnifiedConstitutionalValidator:
 
     async def validate_c7_integration_first(self, context: Dict) -> ValidationResult:
         """C7: Integration-First Testing validation."""
-        integration_tests = list((self.project_root / "tests").glob("*integration*.py"))
-        all_tests = list((self.project_root / "tests").glob("test_*.py"))
+        snapshot = await self._ensure_snapshot()
+        integration_tests = [f for f in snapshot.test_files if "integration" in f.name]
+        all_tests = [f for f in snapshot.test_files if f.name.startswith("test_")]
 
         ratio = len(integration_tests) / max(len(all_tests), 1)
 
@@ -410,7 +569,9 @@ class UnifiedConstitutionalValidator:
         # Check for security scanning
         security_passed = True
         try:
-            result = subprocess.run(["python", "-m", "pip", "list", "--format=json"], capture_output=True, text=True)
+            result = await self._run_blocking(
+                subprocess.run, ["python", "-m", "pip", "list", "--format=json"], capture_output=True, text=True
+            )
             # Simple check - in production would use safety or bandit
             security_passed = "vulnerability" not in result.stdout.lower()
         except Exception:
@@ -480,7 +641,8 @@ class UnifiedConstitutionalValidator:
     async def validate_c14_observability(self, context: Dict) -> ValidationResult:
         """C14: Observability & Logging validation."""
         # Check for structured logging
-        log_files = list(self.project_root.glob("**/*.log"))
+        snapshot = await self._ensure_snapshot()
+        log_files = snapshot.log_files
         json_logs = any("json" in str(f).lower() for f in log_files)
 
         return ValidationResult(
@@ -521,7 +683,7 @@ class UnifiedConstitutionalValidator:
     async def validate_c17_simplicity(self, context: Dict) -> ValidationResult:
         """C17: Simplicity & YAGNI validation."""
         # Count active projects/features
-        project_dirs = [d for d in self.project_root.iterdir() if d.is_dir() and not d.name.startswith(".")]
+        project_dirs = (await self._ensure_snapshot()).top_level_dirs
 
         score = max(0, 1.0 - (len(project_dirs) - 10) / 20) if len(project_dirs) > 10 else 1.0
 
@@ -537,9 +699,9 @@ class UnifiedConstitutionalValidator:
     async def validate_c18_windows_compat(self, context: Dict) -> ValidationResult:
         """C18: Windows Compatibility validation."""
         # Check for emoji usage
+        snapshot = await self._ensure_snapshot()
         emoji_found = False
-        for py_file in self.project_root.glob("scripts/*.py"):
-            content = py_file.read_text(encoding="utf-8", errors="ignore")
+        for content in snapshot.script_sources.values():
             # Simple emoji detection
             if any(ord(c) > 127 and ord(c) not in range(0x0100, 0x0180) for c in content):
                 emoji_found = True
@@ -569,7 +731,7 @@ class UnifiedConstitutionalValidator:
     async def validate_c20_phase_execution(self, context: Dict) -> ValidationResult:
         """C20: Phase-Based Execution validation."""
         # Check for phase structure in task files
-        phase_tasks = list(Path("specs").glob("**/*phase*.md"))
+        phase_tasks = (await self._ensure_snapshot()).phase_spec_files
 
         return ValidationResult(
             article_id="C20",
@@ -643,15 +805,13 @@ async def main():
     print("Integrating Dev Rules + SpecKit")
     print("20 Articles | 4 Layers")
 
-    # Create validator
-    validator = UnifiedConstitutionalValidator()
-
     # Run validation
     context = {}
     if len(sys.argv) > 1:
         context["mode"] = sys.argv[1]
 
-    results = await validator.validate_all_20_articles(context)
+    with UnifiedConstitutionalValidator() as validator:
+        results = await validator.validate_all_20_articles(context)
 
     # Save results
     output_file = Path("RUNS") / "constitution_v3_validation.json"
@@ -20,26 +20,42 @@ Quality Scoring:
 - Start at 10.0
 - Deduct points for violations (0.0 minimum)
 - Weighted by severity: Security > SOLID > Ruff > Hallucination
+
+Result Cache:
+- AnalysisCache stores complete DeepAnalysisResults keyed by file content
+  (SHA-256), namespaced by analyzer version + Ruff config fingerprint
+- Shared by the watcher, the dashboard backend and TeamStatsAggregator, so
+  identical content is analyzed once regardless of path, branch or worktree
 """
 
 import ast
+import hashlib
+import json
 import logging
+import os
 import re
+import shutil
+import threading
 import time
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 # Import VerificationResult from verification_cache (shared dataclass)
 try:
     # Try importing as package (when run from tests)
-    from scripts.verification_cache import VerificationResult
+    from scripts.verification_cache import ConfigFingerprint, RuffViolation, VerificationResult
 except ImportError:
     # Fall back to direct import (when run from scripts directory)
-    from verification_cache import VerificationResult
+    from verification_cache import ConfigFingerprint, RuffViolation, VerificationResult
 
 logger = logging.getLogger(__name__)
 
+# Bump when checks or scoring change so cached results are not reused
+ANALYZER_VERSION = "1"
+DEFAULT_ANALYSIS_CACHE_DIR = Path("RUNS") / ".cache" / "analysis"
+
 
 @dataclass
 class DeepAnalysisResult:
@@ -86,6 +102,209 @@ class DeepAnalysisResult:
         )
 
 
+def analysis_fingerprint(project_root: Optional[Path] = None) -> str:
+    """Fingerprint of everything besides file content that shapes a result
+
+    Covers the analyzer version, the ruff version and the effective ruff
+    configuration; any change moves the cache to a fresh namespace.
+    """
+    return ConfigFingerprint(project_root, salt=f"deep-analyzer:{ANALYZER_VERSION}").current()
+
+
+def _result_to_dict(result: DeepAnalysisResult) -> Dict:
+    data = asdict(result)
+    data["file_path"] = str(result.file_path)
+    data["ruff_result"]["file_path"] = str(result.ruff_result.file_path)
+    return data
+
+
+def _result_from_dict(data: Dict, file_path: Path) -> DeepAnalysisResult:
+    ruff = data["ruff_result"]
+    ruff_result = VerificationResult(
+        file_path=file_path,
+        passed=ruff["passed"],
+        violations=[RuffViolation(**violation) for violation in ruff["violations"]],
+        duration_ms=ruff["duration_ms"],
+        error=ruff.get("error"),
+    )
+    return DeepAnalysisResult(
+        file_path=file_path,
+        ruff_result=ruff_result,
+        solid_violations=data["solid_violations"],
+        security_issues=data["security_issues"],
+        hallucination_risks=data["hallucination_risks"],
+        overall_score=data["overall_score"],
+        analysis_time_ms=data["analysis_time_ms"],
+        mcp_used=data["mcp_used"],
+    )
+
+
+class AnalysisCache:
+    """Content-addressed store of complete DeepAnalysisResults
+
+    Layout: ``<cache_dir>/<fingerprint>/<sha[:2]>/<sha>.json`` where ``sha`` is
+    the SHA-256 of the file content. Objects are immutable and written
+    atomically, so several processes can share one directory. A small
+    in-memory LRU serves repeat lookups in long-running processes.
+
+    Attributes:
+        cache_dir: Root directory shared by all fingerprints
+        fingerprint: Current namespace (tracks ruff config edits while running)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        fingerprint: Optional[str] = None,
+        memory_entries: int = 512,
+        project_root: Optional[Path] = None,
+    ):
+        """Initialize analysis cache
+
+        Args:
+            cache_dir: Root directory for cached results
+            fingerprint: Fixed namespace (default: tracked analysis fingerprint)
+            memory_entries: Results kept in the in-memory LRU
+            project_root: Directory whose ruff config is fingerprinted (default: cwd)
+        """
+        self.cache_dir = Path(cache_dir)
+        self._fixed_fingerprint = fingerprint
+        self._config_fingerprint = (
+            None if fingerprint is not None else ConfigFingerprint(project_root, salt=f"deep-analyzer:{ANALYZER_VERSION}")
+        )
+        self.memory_entries = memory_entries
+        self._memory: "OrderedDict[str, Dict]" = OrderedDict()  # object path -> result data
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "writes": 0}
+
+    @property
+    def fingerprint(self) -> str:
+        if self._fixed_fingerprint is not None:
+            return self._fixed_fingerprint
+        return self._config_fingerprint.current()
+
+    @staticmethod
+    def key_for(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def get(self, file_path: Path, content: bytes) -> Optional[DeepAnalysisResult]:
+        """Cached result for ``content``, rebound to ``file_path``"""
+        object_path = self._object_path(self.key_for(content))
+        memo_key = str(object_path)
+        with self._lock:
+            data = self._memory.get(memo_key)
+            if data is not None:
+                self._memory.move_to_end(memo_key)
+
+        if data is None:
+            try:
+                data = json.loads(object_path.read_text(encoding="utf-8"))
+                os.utime(object_path)  # Recently used objects survive prune()
+            except (OSError, ValueError):
+                self.stats["misses"] += 1
+                return None
+            self._remember(memo_key, data)
+
+        self.stats["hits"] += 1
+        return _result_from_dict(data, file_path)
+
+    def put(self, result: DeepAnalysisResult, content: bytes) -> None:
+        """Store a result under the hash of the content it was computed from"""
+        data = _result_to_dict(result)
+        object_path = self._object_path(self.key_for(content))
+        try:
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = object_path.with_name(f"{object_path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, object_path)
+        except OSError as e:
+            logger.warning(f"[ANALYSIS CACHE] Failed to store {result.file_path}: {e}")
+            return
+        self.stats["writes"] += 1
+        self._remember(str(object_path), data)
+
+    def prune(self, max_age_days: float = 30.0) -> int:
+        """Remove other fingerprints' namespaces and objects unused for ``max_age_days``
+
+        Returns:
+            Number of objects (or namespaces) removed
+        """
+        if not self.cache_dir.is_dir():
+            return 0
+        removed = 0
+        cutoff = time.time() - max_age_days * 86400
+        for namespace in self.cache_dir.iterdir():
+            if not namespace.is_dir():
+                continue
+            if namespace.name != self.fingerprint:
+                shutil.rmtree(namespace, ignore_errors=True)
+                removed += 1
+                continue
+            for object_path in namespace.glob("*/*.json"):
+                try:
+                    if object_path.stat().st_mtime < cutoff:
+                        object_path.unlink()
+                        removed += 1
+                except OSError:
+                    continue
+        return removed
+
+    def _object_path(self, key: str) -> Path:
+        return self.cache_dir / self.fingerprint / key[:2] / f"{key}.json"
+
+    def _remember(self, memo_key: str, data: Dict) -> None:
+        with self._lock:
+            self._memory[memo_key] = data
+            self._memory.move_to_end(memo_key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+
+# Top-level statements that cannot contain a function or class definition
+_SIMPLE_STATEMENTS = (
+    ast.Expr,
+    ast.Assign,
+    ast.AnnAssign,
+    ast.AugAssign,
+    ast.Import,
+    ast.ImportFrom,
+    ast.Pass,
+    ast.Delete,
+    ast.Assert,
+    ast.Raise,
+    ast.Global,
+    ast.Nonlocal,
+    ast.Return,
+    ast.Break,
+    ast.Continue,
+)
+
+
+def definition_units(tree: ast.Module, code: str) -> List[Tuple[ast.stmt, int, str]]:
+    """Top-level definitions of a module with their first line and fingerprint
+
+    The fingerprint is a hash of the statement's source lines (decorators
+    included). Identical text parses to an identical subtree, so findings
+    stored relative to the first line stay valid wherever the text moves.
+
+    Args:
+        tree: Parsed module
+        code: Source the tree was parsed from
+
+    Returns:
+        (node, first_line, fingerprint) for every top-level compound statement
+    """
+    lines = code.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    units = []
+    for node in tree.body:
+        if isinstance(node, _SIMPLE_STATEMENTS):
+            continue
+        start = min([node.lineno] + [decorator.lineno for decorator in getattr(node, "decorator_list", [])])
+        segment = "\n".join(lines[start - 1 : node.end_lineno])
+        units.append((node, start, hashlib.sha1(segment.encode("utf-8", "surrogatepass")).hexdigest()))
+    return units
+
+
 class SimpleSolidChecker:
     """Fallback SOLID analyzer using Python AST
 
@@ -95,7 +314,9 @@ class SimpleSolidChecker:
     - Dependency Inversion: Concrete dependencies in __init__
     - Function complexity: Line count and cyclomatic complexity
 
-    Performance: <500ms for typical Python file
+    Performance: <500ms for typical Python file. SRP/DIP/complexity findings
+    are cached per top-level definition, so re-checking an edited file only
+    walks the classes and functions whose source changed.
     """
 
     # SOLID thresholds
@@ -103,6 +324,14 @@ class SimpleSolidChecker:
     MAX_FUNCTION_LINES = 50
     MAX_CYCLOMATIC_COMPLEXITY = 10
 
+    UNIT_CACHE_SIZE = 4096  # top-level definitions
+
+    def __init__(self, unit_cache_size: int = UNIT_CACHE_SIZE):
+        self._unit_cache_size = unit_cache_size
+        self._unit_cache: "OrderedDict[Tuple, Tuple[List[Dict], ...]]" = OrderedDict()
+        self._unit_lock = threading.Lock()
+        self.unit_stats = {"analyzed": 0, "reused": 0}
+
     def check_solid(self, code: str, file_path: Path) -> List[Dict]:
         """Parse code with AST and detect SOLID violations
 
@@ -122,25 +351,49 @@ class SimpleSolidChecker:
             logger.debug(f"Syntax error in {file_path}: {e}")
             return violations
 
-        # Check Single Responsibility Principle
-        violations.extend(self._check_srp(tree))
-
-        # Check Dependency Inversion Principle
-        violations.extend(self._check_dip(tree))
-
-        # Check function complexity
-        violations.extend(self._check_complexity(tree, code))
+        # SRP, DIP and complexity per top-level definition (unchanged ones come from the cache)
+        srp, dip, complexity = [], [], []
+        for node, start, fingerprint in definition_units(tree, code):
+            for bucket, findings in zip((srp, dip, complexity), self._unit_findings(node, start, fingerprint)):
+                bucket.extend({**finding, "line": finding["line"] + start} for finding in findings)
 
+        violations.extend(srp)
+        violations.extend(dip)
+        violations.extend(complexity)
         return violations
 
-    def _check_srp(self, tree: ast.Module) -> List[Dict]:
+    def _unit_findings(self, node: ast.stmt, start: int, fingerprint: str) -> Tuple[List[Dict], ...]:
+        """SRP, DIP and complexity findings of one top-level definition
+
+        Lines are relative to ``start``; cached results are shared, never mutated.
+        """
+        key = (fingerprint, self.MAX_METHODS_PER_CLASS, self.MAX_FUNCTION_LINES, self.MAX_CYCLOMATIC_COMPLEXITY)
+        with self._unit_lock:
+            findings = self._unit_cache.get(key)
+            if findings is not None:
+                self._unit_cache.move_to_end(key)
+                self.unit_stats["reused"] += 1
+                return findings
+
+        findings = tuple(
+            [{**finding, "line": finding["line"] - start} for finding in check]
+            for check in (self._check_srp(node), self._check_dip(node), self._check_complexity(node, ""))
+        )
+        with self._unit_lock:
+            self._unit_cache[key] = findings
+            while len(self._unit_cache) > self._unit_cache_size:
+                self._unit_cache.popitem(last=False)
+            self.unit_stats["analyzed"] += 1
+        return findings
+
+    def _check_srp(self, tree: ast.AST) -> List[Dict]:
         """Detect Single Responsibility Principle violations
 
         Rules:
         - Class with >10 methods (too many responsibilities)
 
         Args:
-            tree: AST tree
+            tree: AST tree or top-level definition
 
         Returns:
             List of SRP violations
@@ -164,14 +417,14 @@ class SimpleSolidChecker:
 
         return violations
 
-    def _check_dip(self, tree: ast.Module) -> List[Dict]:
+    def _check_dip(self, tree: ast.AST) -> List[Dict]:
         """Detect Dependency Inversion Principle violations
 
         Rules:
         - Concrete class instantiation in __init__ (should use injection)
 
         Args:
-            tree: AST tree
+            tree: AST tree or top-level definition
 
         Returns:
             List of DIP violations
@@ -202,7 +455,7 @@ class SimpleSolidChecker:
 
         return violations
 
-    def _check_complexity(self, tree: ast.Module, code: str) -> List[Dict]:
+    def _check_complexity(self, tree: ast.AST, code: str) -> List[Dict]:
         """Check function length and cyclomatic complexity
 
         Rules:
@@ -210,7 +463,7 @@ class SimpleSolidChecker:
         - High cyclomatic complexity (>10 decision points)
 
         Args:
-            tree: AST tree
+            tree: AST tree or top-level definition
             code: Source code (for line counting)
 
         Returns:
@@ -371,6 +624,18 @@ class SimpleSolidChecker:
         return risks
 
 
+# Global instance
+_default_solid_checker = None
+
+
+def get_solid_checker() -> SimpleSolidChecker:
+    """Get global SimpleSolidChecker instance"""
+    global _default_solid_checker
+    if _default_solid_checker is None:
+        _default_solid_checker = SimpleSolidChecker()
+    return _default_solid_checker
+
+
 class DeepAnalyzer:
     """Deep code analysis orchestrator
 
@@ -390,6 +655,7 @@ class DeepAnalyzer:
         mcp_timeout: float = 5.0,
         ruff_verifier=None,
         solid_checker=None,
+        result_cache: Optional[AnalysisCache] = None,
     ):
         """Initialize DeepAnalyzer with dependency injection (P4 compliance)
 
@@ -398,9 +664,11 @@ class DeepAnalyzer:
             mcp_timeout: MCP call timeout in seconds
             ruff_verifier: Optional RuffVerifier instance (dependency injection)
             solid_checker: Optional SOLID checker instance (dependency injection)
+            result_cache: Optional AnalysisCache (skipped when MCP is enabled)
         """
         self._mcp_enabled = mcp_enabled
         self._mcp_timeout = mcp_timeout
+        self._result_cache = None if mcp_enabled else result_cache
 
         # Use injected dependencies or create via factory methods (P4: DI principle)
         self._fallback_analyzer = solid_checker or self._create_solid_checker()
@@ -408,8 +676,12 @@ class DeepAnalyzer:
 
     @staticmethod
     def _create_solid_checker():
-        """Factory method for SOLID checker (P4 compliance)"""
-        return SimpleSolidChecker()
+        """Factory method for SOLID checker (P4 compliance)
+
+        Returns the process-wide checker so its per-definition cache survives
+        analyzers created per event (e.g. by the file watcher).
+        """
+        return get_solid_checker()
 
     @staticmethod
     def _create_ruff_verifier():
@@ -449,12 +721,28 @@ class DeepAnalyzer:
         """
         start_time = time.perf_counter()
 
+        # Step 0: Content-addressed cache lookup
+        content = None
+        if self._result_cache is not None:
+            try:
+                content = file_path.read_bytes()
+            except OSError:
+                content = None
+            if content is not None:
+                cached = self._result_cache.get(file_path, content)
+                if cached is not None:
+                    return cached
+
         # Step 1: Ruff check (fast)
         ruff_result = self._ruff_verifier.verify_file(file_path)
 
         # Step 2: Read file content
         try:
-            code = file_path.read_text(encoding="utf-8")
+            if content is None:
+                code = file_path.read_text(encoding="utf-8")
+            else:
+                # Same newline translation as read_text()
+                code = content.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
         except (OSError, UnicodeDecodeError) as e:
             # File read error - return minimal result
             logger.error(f"Failed to read {file_path}: {e}")
@@ -495,7 +783,7 @@ class DeepAnalyzer:
 
         analysis_time_ms = (time.perf_counter() - start_time) * 1000
 
-        return DeepAnalysisResult(
+        result = DeepAnalysisResult(
             file_path=file_path,
             ruff_result=ruff_result,
             solid_violations=solid_violations,
@@ -506,6 +794,19 @@ class DeepAnalyzer:
             mcp_used=mcp_used,
         )
 
+        # Only cache complete results for content that did not change mid-analysis
+        if content is not None and ruff_result.error is None and self._content_unchanged(file_path, content):
+            self._result_cache.put(result, content)
+
+        return result
+
+    @staticmethod
+    def _content_unchanged(file_path: Path, content: bytes) -> bool:
+        try:
+            return file_path.read_bytes() == content
+        except OSError:
+            return False
+
     def _call_mcp_sequential(self, code: str, file_path: Path) -> Dict:
         """Call MCP Sequential-Thinking for deep analysis
 
@@ -24,6 +24,9 @@ Usage:
     # With custom debounce time
     python scripts/dev_assistant.py --debounce 1000
 
+    # Also answer verify/classify requests from git hooks (warm cache)
+    python scripts/dev_assistant.py --serve-socket
+
 Configuration:
     Add [tool.dev-assistant] section to pyproject.toml:
 
@@ -35,6 +38,7 @@ Configuration:
     log_retention_days = 7
     enable_ruff = true
     enable_evidence = true
+    serve_socket = false        # verify/classify API for git hooks
 """
 
 import json
@@ -67,10 +71,16 @@ from watchdog.observers import Observer
 try:
     from scripts.critical_file_detector import CriticalFileDetector, AnalysisMode, FileClassification
     from scripts.verification_cache import VerificationCache
+    from scripts.deep_analyzer import AnalysisCache
+    from scripts.cli_daemon import daemon_available, send_request, serve, socket_path
+    from scripts.verification_service import SOCKET_NAME, VerificationService
 except ImportError:
     # Fallback for running directly from scripts/ directory
     from critical_file_detector import CriticalFileDetector, AnalysisMode, FileClassification
     from verification_cache import VerificationCache
+    from deep_analyzer import AnalysisCache
+    from cli_daemon import daemon_available, send_request, serve, socket_path
+    from verification_service import SOCKET_NAME, VerificationService
 
 
 @dataclass
@@ -91,6 +101,9 @@ class AssistantConfig:
     # Phase C: Critical file detection
     criticality_threshold: float = 0.5
     critical_patterns: List[str] = None
+    # Verification socket API for git hooks (see verification_service.py)
+    serve_socket: bool = False
+    socket_workers: int = 4
 
     def __post_init__(self):
         """Set defaults for mutable fields."""
@@ -117,6 +130,7 @@ class AssistantConfig:
         self._validate_bool(errors, "enable_ruff", self.enable_ruff)
         self._validate_bool(errors, "enable_evidence", self.enable_evidence)
         self._validate_bool(errors, "cache_enabled", self.cache_enabled)
+        self._validate_bool(errors, "serve_socket", self.serve_socket)
 
         # List validations
         self._validate_non_empty_list_of(errors, "watch_paths", self.watch_paths, str)
@@ -127,6 +141,7 @@ class AssistantConfig:
         self._validate_non_negative_int(errors, "cache_ttl_seconds", self.cache_ttl_seconds)
         self._validate_non_negative_int(errors, "log_retention_days", self.log_retention_days)
         self._validate_positive_int(errors, "cache_max_entries", self.cache_max_entries)
+        self._validate_positive_int(errors, "socket_workers", self.socket_workers)
 
         # Number validations
         self._validate_positive_number(errors, "verification_timeout_sec", self.verification_timeout_sec)
@@ -258,6 +273,8 @@ class ConfigLoader:
                 cache_max_entries=assistant_config.get("cache_max_entries", 1000),
                 criticality_threshold=assistant_config.get("criticality_threshold", 0.5),
                 critical_patterns=assistant_config.get("critical_patterns"),
+                serve_socket=assistant_config.get("serve_socket", False),
+                socket_workers=assistant_config.get("socket_workers", 4),
             )
 
             # Validate configuration
@@ -284,6 +301,7 @@ class ConfigLoader:
         no_evidence: bool = False,
         disable_cache: bool = False,
         clear_cache: bool = False,
+        serve_socket: bool = False,
     ) -> AssistantConfig:
         """
         Merge configuration with CLI arguments (CLI takes precedence).
@@ -297,6 +315,7 @@ class ConfigLoader:
             no_evidence: Disable evidence logging
             disable_cache: Disable verification cache (Phase C)
             clear_cache: Clear cache on startup (Phase C)
+            serve_socket: Serve the verification socket API for git hooks
 
         Returns:
             Merged configuration
@@ -318,6 +337,9 @@ class ConfigLoader:
         if disable_cache:
             config.cache_enabled = False
 
+        if serve_socket:
+            config.serve_socket = True
+
         # Validate merged config
         errors = config.validate()
         if errors:
@@ -887,6 +909,7 @@ class FileChangeProcessor:
         evidence_logger: Optional[EvidenceLogger] = None,
         detector: Optional[CriticalFileDetector] = None,
         cache: Optional[VerificationCache] = None,
+        analysis_cache=None,
     ):
         """
         Initialize processor.
@@ -899,6 +922,7 @@ class FileChangeProcessor:
             evidence_logger: Optional EvidenceLogger for tracking verification results
             detector: Optional CriticalFileDetector for smart file classification (Phase C)
             cache: Optional VerificationCache for result caching (Phase C)
+            analysis_cache: Optional AnalysisCache for complete DEEP_MODE results
         """
         self._queue = event_queue
         self._stop_event = stop_event
@@ -907,6 +931,7 @@ class FileChangeProcessor:
         self._evidence_logger = evidence_logger
         self._detector = detector
         self._cache = cache
+        self._analysis_cache = analysis_cache
         self._processed_count = 0
 
     def run(self) -> None:
@@ -1039,7 +1064,9 @@ class FileChangeProcessor:
             # Import DeepAnalyzer dynamically
             from deep_analyzer import DeepAnalyzer
 
-            deep_analyzer = DeepAnalyzer(mcp_enabled=False, ruff_verifier=self._ruff_verifier)
+            deep_analyzer = DeepAnalyzer(
+                mcp_enabled=False, ruff_verifier=self._ruff_verifier, result_cache=self._analysis_cache
+            )
             deep_result = deep_analyzer.analyze(file_path)
 
             # Log deep analysis results
@@ -1154,11 +1181,15 @@ class DevAssistant:
             self._log_retention_days = config.log_retention_days
             enable_ruff = config.enable_ruff
             enable_evidence = config.enable_evidence
+            self._socket_enabled = config.serve_socket
+            self._socket_workers = config.socket_workers
         else:
             self._watch_dirs = watch_dirs or ["scripts", "tests"]
             self._debounce_ms = debounce_ms
             self._verification_timeout = 2.0
             self._log_retention_days = 7
+            self._socket_enabled = False
+            self._socket_workers = 4
 
         self._root = Path.cwd()
 
@@ -1208,13 +1239,16 @@ class DevAssistant:
 
         # Phase C: Setup verification cache
         cache = None
+        analysis_cache = None
         if config is not None and config.cache_enabled and enable_ruff:
             try:
                 cache_dir = self._root / "RUNS" / ".cache"
+                analysis_cache = AnalysisCache(cache_dir / "analysis", project_root=self._root)
                 cache = VerificationCache(
                     cache_dir=cache_dir,
                     ttl_seconds=config.cache_ttl_seconds,
                     max_entries=config.cache_max_entries,
+                    project_root=self._root,
                 )
                 self._logger.debug(
                     f"Verification cache enabled (TTL={config.cache_ttl_seconds}s, max={config.cache_max_entries} entries)"
@@ -1230,9 +1264,18 @@ class DevAssistant:
             evidence_logger,
             detector,
             cache,
+            analysis_cache,
         )
         self._processor_thread: Optional[Thread] = None
 
+        # Verification socket API shares the processor's warm components
+        self._service: Optional[VerificationService] = None
+        self._socket_thread: Optional[Thread] = None
+        if self._socket_enabled and ruff_verifier is not None:
+            self._service = VerificationService(
+                ruff_verifier, cache, detector, max_workers=self._socket_workers, analysis_cache=analysis_cache
+            )
+
         # Register signal handlers
         self._register_signals()
 
@@ -1323,6 +1366,9 @@ class DevAssistant:
         self._processor_thread = Thread(target=self._processor.run, daemon=True)
         self._processor_thread.start()
 
+        if self._service is not None:
+            self._start_socket_server()
+
         # Keep main thread alive
         try:
             while not self._stop_event.is_set():
@@ -1330,6 +1376,23 @@ class DevAssistant:
         except KeyboardInterrupt:
             self._handle_shutdown(signal.SIGINT, None)
 
+    def _start_socket_server(self) -> None:
+        """Serve the verification API for git hooks on a Unix-domain socket."""
+        if not daemon_available():
+            self._logger.warning("Unix domain sockets not available; verification socket disabled")
+            return
+
+        path = socket_path(SOCKET_NAME)
+        self._socket_thread = Thread(target=self._serve_socket, args=(path,), daemon=True)
+        self._socket_thread.start()
+        self._logger.info(f"Verification socket: {path}")
+
+    def _serve_socket(self, path: Path) -> None:
+        try:
+            serve(path, self._service.handle, self._stop_event.is_set)
+        except PermissionError as e:
+            self._logger.error(f"Verification socket disabled: {e}")
+
     def stop(self) -> None:
         """
         Stop the development assistant gracefully.
@@ -1351,6 +1414,13 @@ class DevAssistant:
         if self._processor_thread and self._processor_thread.is_alive():
             self._processor_thread.join(timeout=5)
 
+        # Wake the socket server so it sees the stop event and exits
+        if self._socket_thread and self._socket_thread.is_alive():
+            send_request(socket_path(SOCKET_NAME), {"command": "ping"}, timeout=1)
+            self._socket_thread.join(timeout=5)
+        if self._service is not None:
+            self._service.close()
+
         # Drain remaining queue items
         remaining = self._event_queue.qsize()
         if remaining > 0:
@@ -1431,6 +1501,11 @@ Configuration:
         action="store_true",
         help="Show cache statistics and exit (Phase C)",
     )
+    parser.add_argument(
+        "--serve-socket",
+        action="store_true",
+        help="Serve verify/classify requests for git hooks on a Unix socket",
+    )
     parser.add_argument(
         "--team-stats",
         action="store_true",
@@ -1525,6 +1600,7 @@ Configuration:
             no_evidence=args.no_evidence,
             disable_cache=args.disable_cache,
             clear_cache=args.clear_cache,
+            serve_socket=args.serve_socket,
         )
 
         # Create and start assistant
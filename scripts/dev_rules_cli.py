@@ -16,6 +16,13 @@ Usage:
   dev-rules prompt stats             # Show compression statistics
   dev-rules dashboard                # Launch Streamlit dashboard
 
+Startup:
+  Heavy modules (task_executor, prompt_compressor, yaml) are imported inside
+  the subcommands that need them, so `--help`, `task list` and `stats` start
+  fast. Git hooks can go further with the warm daemon:
+    python scripts/cli_daemon.py start &
+    python scripts/cli_daemon.py run dev-rules task list
+
 Constitutional Compliance:
 - [P2] CLI Interface Mandate
 - [P3] Test-First Development
@@ -31,8 +38,6 @@ sys.path.insert(0, str(Path(__file__).parent))
 import click
 import json
 from typing import Optional
-from task_executor import execute_contract
-from prompt_compressor import PromptCompressor
 
 
 @click.group()
@@ -79,6 +84,8 @@ def run(task_id: str, plan: bool):
 
     mode = "plan" if plan else "execute"
 
+    from task_executor import execute_contract
+
     try:
         execute_contract(str(task_file), mode=mode)
 
@@ -159,6 +166,8 @@ def compress(text: str, level: str, output_json: bool):
       dev-rules prompt compress "Please implement authentication"
       dev-rules prompt compress "Your prompt" --level aggressive --json
     """
+    from prompt_compressor import PromptCompressor
+
     compressor = PromptCompressor(compression_level=level)
 
     try:
@@ -190,6 +199,8 @@ def compress(text: str, level: str, output_json: bool):
 @prompt.command()
 def info():
     """Show compression statistics and learned patterns"""
+    from prompt_compressor import PromptCompressor
+
     compressor = PromptCompressor()
     stats = compressor.get_stats()
 
@@ -204,6 +215,8 @@ def info():
 @prompt.command()
 def demo():
     """Run prompt compression demo with examples"""
+    from prompt_compressor import PromptCompressor
+
     compressor = PromptCompressor(compression_level="medium")
 
     test_prompts = [
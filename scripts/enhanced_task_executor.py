@@ -9,6 +9,7 @@ Combines Trust Score 8.0+ validated patterns:
 - Constitutional validation (Spec-Kit) - 10 article compliance
 - Obsidian auto-sync (TaskExecutor) - 95% time savings
 - Parallel execution ([P] markers) - Phase-based optimization
+- Cross-phase scheduling (--cross-phase) - Task dependency graph + critical path
 
 Time Savings: 50-60% faster workflow (65min → 22-30min)
 
@@ -18,15 +19,22 @@ Usage:
 
   # For YAML contract files (legacy TaskExecutor)
   python scripts/enhanced_task_executor.py TASKS/FEAT-YYYY-MM-DD-XX.yaml
+
+  # Start tasks as soon as their dependencies finish, across phases
+  python scripts/enhanced_task_executor.py specs/feat-example/tasks.md --cross-phase
+
+  # Show dependency graph and critical path without executing
+  python scripts/enhanced_task_executor.py specs/feat-example/tasks.md --plan-report
 """
 
 import os
 import sys
+import time
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
-from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 
 # Import existing components
 sys.path.insert(0, str(Path(__file__).parent))
@@ -46,6 +54,7 @@ from project_steering import ProjectSteering
 from automatic_evidence_tracker import AutomaticEvidenceTracker
 from context_aware_loader import ContextAwareConstitutionalLoader
 from orchestration_policy import OrchestrationPolicy
+from task_graph import TaskGraph, TaskNode, build_graph, extract_dependencies, extract_file_paths
 
 
 @dataclass
@@ -58,6 +67,7 @@ class Task:
     file_path: Optional[str] = None
     phase: Optional[str] = None
     status: str = "pending"  # pending, running, completed, failed
+    dependencies: List[str] = field(default_factory=list)  # explicit (depends: T001)
 
 
 @dataclass
@@ -85,9 +95,12 @@ class EnhancedTaskExecutor:
     - Evidence Collection: SHA-256 hashing + provenance
     """
 
-    def __init__(self, verbose: bool = True, force: bool = False):
+    def __init__(self, verbose: bool = True, force: bool = False, cross_phase: bool = False, max_workers: int = 5):
         self.verbose = verbose
         self.force = force  # Force execution even with violations
+        self.cross_phase = cross_phase  # Schedule on task dependency graph
+        self.max_workers = max(1, max_workers)
+        self.last_plan_report: Optional[str] = None
         self.constitutional = ConstitutionalValidator()
         self.root = Path(".").resolve()
         self.env = build_env()
@@ -215,23 +228,27 @@ class EnhancedTaskExecutor:
                 {"status": "running", "started_at": datetime.now(timezone.utc).isoformat()},
             )
 
-            for phase in phases:
-                self.log(f"{'='*60}")
-                self.log(f"PHASE: {phase.name}")
-                self.log(f"{'='*60}")
+            if self.cross_phase:
+                graph_results = self._execute_graph(phases, state_file)
+                evidence_hashes.update(graph_results.get("evidence", {}))
+            else:
+                for phase in phases:
+                    self.log(f"{'='*60}")
+                    self.log(f"PHASE: {phase.name}")
+                    self.log(f"{'='*60}")
 
-                if phase.blocking:
-                    self.log("[WARN]  BLOCKING PHASE - Must complete before user stories")
+                    if phase.blocking:
+                        self.log("[WARN]  BLOCKING PHASE - Must complete before user stories")
 
-                # Execute phase
-                phase_results = self._execute_phase(phase, state_file)
-                evidence_hashes.update(phase_results.get("evidence", {}))
+                    # Execute phase
+                    phase_results = self._execute_phase(phase, state_file)
+                    evidence_hashes.update(phase_results.get("evidence", {}))
 
-                # Check for failures in blocking phase
-                if phase.blocking and any(t.status == "failed" for t in phase.tasks):
-                    raise TaskExecutorError(f"Blocking phase '{phase.name}' failed - cannot proceed to user stories")
+                    # Check for failures in blocking phase
+                    if phase.blocking and any(t.status == "failed" for t in phase.tasks):
+                        raise TaskExecutorError(f"Blocking phase '{phase.name}' failed - cannot proceed to user stories")
 
-                self.log(f"[PASS] Phase '{phase.name}' completed\n")
+                    self.log(f"[PASS] Phase '{phase.name}' completed\n")
 
             # === 6. Mark Tasks as Completed in File ===
             self.log("[STEP 5] Updating tasks.md with completion status...")
@@ -412,6 +429,9 @@ class EnhancedTaskExecutor:
                     markers.append("[P]")
                     description = description.replace("[P]", "").strip()
 
+                # Extract explicit dependencies
+                dependencies, description = extract_dependencies(description)
+
                 # Extract user story marker
                 us_match = re.search(r"\[US\d+\]", description)
                 if us_match:
@@ -430,6 +450,7 @@ class EnhancedTaskExecutor:
                     markers=markers,
                     file_path=file_path,
                     phase=current_phase.name,
+                    dependencies=dependencies,
                 )
                 current_phase.tasks.append(task)
 
@@ -481,6 +502,88 @@ class EnhancedTaskExecutor:
 
         return {"evidence": evidence}
 
+    def build_task_graph(self, phases: List[Phase]) -> TaskGraph:
+        """Build the cross-phase dependency graph (explicit + file overlap + phase barriers)"""
+        graph_phases = []
+        for phase in phases:
+            nodes = []
+            for task in phase.tasks:
+                files = extract_file_paths(task.description)
+                if task.file_path:
+                    files.add(task.file_path)
+                nodes.append(
+                    TaskNode(
+                        task_id=task.task_id,
+                        phase=phase.name,
+                        phase_index=0,
+                        position=0,
+                        is_parallel="[P]" in task.markers,
+                        dependencies=list(task.dependencies),
+                        files=files,
+                    )
+                )
+            graph_phases.append((phase.name, phase.blocking, nodes))
+        return build_graph(graph_phases)
+
+    def _execute_graph(self, phases: List[Phase], state_file: Path) -> Dict:
+        """Execute tasks across phases as soon as their dependencies complete"""
+        atomic_write_json(state_file, {"status": "running", "step": "graph"})
+
+        graph = self.build_task_graph(phases)
+        tasks = {task.task_id: task for phase in phases for task in phase.tasks}
+        critical = graph.critical_path()
+        self.log(f"[GRAPH] {len(tasks)} tasks in {len(graph.waves())} waves")
+        self.log(f"[GRAPH] Critical path: {' -> '.join(critical.task_ids)}")
+
+        evidence: Dict[str, str] = {}
+        durations: Dict[str, float] = {}
+        remaining = {task_id: len(graph.edges[task_id]) for task_id in graph.nodes}
+        ready = [task_id for task_id in graph.topological_order() if remaining[task_id] == 0]
+        failure: Optional[Exception] = None
+
+        def run(task: Task) -> Dict:
+            started = time.perf_counter()
+            result = self._execute_task(task)
+            durations[task.task_id] = time.perf_counter() - started
+            return result
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+            while ready or running:
+                while ready and len(running) < self.max_workers and failure is None:
+                    task = tasks[ready.pop(0)]
+                    task.status = "running"
+                    running[executor.submit(run, task)] = task
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        task.status = "failed"
+                        self.log(f"  [FAIL] {task.task_id} failed: {e}")
+                        failure = failure or e
+                        continue
+
+                    task.status = "completed"
+                    evidence.update(result.get("evidence", {}))
+                    self.log(f"  [PASS] {task.task_id}: {task.description[:60]}...")
+                    for dependent in graph.dependents[task.task_id]:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            ready.append(dependent)
+
+        self.last_plan_report = graph.format_report(durations)
+        if failure is not None:
+            raise failure
+
+        self.log(self.last_plan_report + "\n")
+        return {"evidence": evidence}
+
     def _execute_task(self, task: Task) -> Dict:
         """Execute a single task with automatic evidence tracking (GrowthBook Trust 8.0)
 
@@ -608,6 +711,13 @@ def main():
         "--force", "-f", action="store_true", help="Force execution even with violations (non-interactive mode)"
     )
     parser.add_argument("--quiet", action="store_true", help="Reduce output verbosity")
+    parser.add_argument(
+        "--cross-phase", action="store_true", help="Start tasks as soon as their dependencies finish (ignores phase order)"
+    )
+    parser.add_argument(
+        "--plan-report", action="store_true", help="Print task dependency graph and critical path, then exit"
+    )
+    parser.add_argument("--max-workers", type=int, default=5, help="Maximum concurrent tasks (default: 5)")
 
     args = parser.parse_args()
 
@@ -616,7 +726,13 @@ def main():
         print(f"[FAIL] File not found: {tasks_file}")
         sys.exit(1)
 
-    executor = EnhancedTaskExecutor(verbose=not args.quiet, force=args.force)
+    executor = EnhancedTaskExecutor(
+        verbose=not args.quiet, force=args.force, cross_phase=args.cross_phase, max_workers=args.max_workers
+    )
+
+    if args.plan_report:
+        print(executor.build_task_graph(executor._parse_tasks(tasks_file)).format_report())
+        sys.exit(0)
 
     try:
         result = executor.execute(tasks_file, skip_constitutional=args.skip_constitutional)
@@ -4,7 +4,9 @@ Enhanced Task Executor v2.0 with Parallel Execution Support
 
 Features
 - Markdown/YAML task parsing with phase awareness
-- Parallel execution for tasks marked with `[P]`
+- Parallel execution for tasks marked with `[P]`, bounded by ``max_workers``
+- Native asyncio subprocesses with streamed output and per-task timeouts
+- Optional cross-phase scheduling on a task dependency graph (``cross_phase``)
 - Evidence generation for every task run
 - Constitutional validation hook (ConstitutionalValidatorV3)
 - Dry-run friendly (_execute_command is stub-friendly)
@@ -15,15 +17,33 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import json
-import subprocess
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import yaml
 
+try:
+    from scripts.task_graph import (
+        TaskGraph,
+        TaskNode,
+        build_graph,
+        extract_dependencies,
+        extract_file_paths,
+        normalize_dependencies,
+    )
+except ImportError:
+    from task_graph import (  # type: ignore[no-redef]
+        TaskGraph,
+        TaskNode,
+        build_graph,
+        extract_dependencies,
+        extract_file_paths,
+        normalize_dependencies,
+    )
+
 
 @dataclass
 class Task:
@@ -37,6 +57,8 @@ class Task:
     user_story: Optional[str] = None
     command: Optional[Iterable[str] | str] = None
     dependencies: List[str] = field(default_factory=list)
+    timeout: Optional[float] = None
+    files: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -88,18 +110,47 @@ class ConstitutionalValidatorV3:
         return True
 
 
-class ParallelTaskExecutor:
-    """Executes tasks with optional parallelisation."""
+OutputCallback = Callable[[str, str, str], None]
+
 
-    def __init__(self, project_root: Optional[Path] = None, *, max_workers: int = 5, dry_run: bool = False) -> None:
+class ParallelTaskExecutor:
+    """Executes tasks with optional parallelisation.
+
+    At most ``max_workers`` tasks (and therefore subprocesses) run at once.
+    Commands run as native asyncio subprocesses; stdout/stderr are read
+    incrementally and forwarded to ``output_callback(task_id, stream, line)``.
+
+    With ``cross_phase`` tasks are scheduled on a dependency graph (see
+    task_graph) instead of phase by phase, so a task starts as soon as the
+    tasks it depends on have succeeded.
+    """
+
+    DEFAULT_TIMEOUT = 60.0
+    MAX_CAPTURE_BYTES = 1024 * 1024
+    READ_CHUNK_BYTES = 64 * 1024
+
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        *,
+        max_workers: int = 5,
+        dry_run: bool = False,
+        default_timeout: float = DEFAULT_TIMEOUT,
+        output_callback: Optional[OutputCallback] = None,
+        cross_phase: bool = False,
+    ) -> None:
         self.project_root = project_root or Path.cwd()
         self.evidence_dir = self.project_root / "RUNS" / "evidence"
         self.evidence_dir.mkdir(parents=True, exist_ok=True)
         self.max_workers = max(1, max_workers)
         self.dry_run = dry_run
+        self.default_timeout = default_timeout
+        self.output_callback = output_callback
+        self.cross_phase = cross_phase
 
         self.phases: List[Phase] = []
         self.stats: Dict[str, float] = {}
+        self.last_graph: Optional[TaskGraph] = None
 
     # ---------------------------------------------------------------------
     # Parsing
@@ -152,6 +203,7 @@ class ParallelTaskExecutor:
         for index, command in enumerate(data.get("commands", []), start=1):
             task_id = command.get("id") or f"T{index:03d}"
             description = command.get("description") or command.get("summary") or command.get("desc", "")
+            files = set(command.get("files") or []) | extract_file_paths(description)
             tasks.append(
                 Task(
                     id=task_id,
@@ -159,6 +211,9 @@ class ParallelTaskExecutor:
                     phase="Main",
                     is_parallel=bool(command.get("parallel", False)),
                     command=command.get("exec"),
+                    timeout=self._parse_timeout(command.get("timeout")),
+                    dependencies=normalize_dependencies(command.get("depends_on", command.get("needs"))),
+                    files=sorted(files),
                 )
             )
         return [Phase(name="Main", tasks=tasks)]
@@ -170,13 +225,19 @@ class ParallelTaskExecutor:
 
         task_id = ""
         user_story = None
-        dependencies: List[str] = []
+        dependencies, body = extract_dependencies(body)
 
         if "US" in body:
             user_story = body
 
         import re
 
+        timeout = None
+        timeout_match = re.search(r"\(timeout:\s*(\d+(?:\.\d+)?)s?\)", body, re.IGNORECASE)
+        if timeout_match:
+            timeout = float(timeout_match.group(1))
+            body = body.replace(timeout_match.group(0), "").strip()
+
         id_match = re.search(r"(T\d+)", body)
         if id_match:
             task_id = id_match.group(1)
@@ -195,8 +256,21 @@ class ParallelTaskExecutor:
             is_completed=is_completed,
             user_story=user_story,
             dependencies=dependencies,
+            timeout=timeout,
+            files=sorted(extract_file_paths(description)),
         )
 
+    @staticmethod
+    def _parse_timeout(value: object) -> Optional[float]:
+        if value is None:
+            return None
+        text = str(value).strip().lower().rstrip("s")
+        try:
+            timeout = float(text)
+        except ValueError:
+            return None
+        return timeout if timeout > 0 else None
+
     # ------------------------------------------------------------------
     # Execution helpers
     # ------------------------------------------------------------------
@@ -217,19 +291,23 @@ class ParallelTaskExecutor:
         phase_results: Dict[str, Dict[str, ExecutionResult]] = {}
         start_time = time.time()
 
-        for phase in ordered_phases:
-            print("\n" + "=" * 60)
-            print(f"PHASE: {phase.name}")
-            if phase.blocking:
-                print("[WARN] BLOCKING PHASE - must succeed before continuing")
-            print("=" * 60)
-
-            results = await self._execute_phase(phase)
-            phase_results[phase.name] = results
-
-            if phase.blocking and any(not res.success for res in results.values()):
-                print(f"[X] Blocking phase '{phase.name}' failed. Aborting.")
-                break
+        self.last_graph = None
+        if self.cross_phase:
+            phase_results = await self._execute_graph(ordered_phases)
+        else:
+            for phase in ordered_phases:
+                print("\n" + "=" * 60)
+                print(f"PHASE: {phase.name}")
+                if phase.blocking:
+                    print("[WARN] BLOCKING PHASE - must succeed before continuing")
+                print("=" * 60)
+
+                results = await self._execute_phase(phase)
+                phase_results[phase.name] = results
+
+                if phase.blocking and any(not res.success for res in results.values()):
+                    print(f"[X] Blocking phase '{phase.name}' failed. Aborting.")
+                    break
 
         elapsed = time.time() - start_time
         self.stats["execution_time"] = elapsed
@@ -240,9 +318,117 @@ class ParallelTaskExecutor:
             # Rough heuristic: assume parallel tasks would have run sequentially for duration N
             total_parallel_duration = sum(res.duration for res in all_results.values() if res.is_parallel)
             self.stats["time_saved"] = max(total_parallel_duration - elapsed, 0)
+        if self.last_graph is not None:
+            durations = {rid: res.duration for rid, res in all_results.items()}
+            self.stats["critical_path_time"] = self.last_graph.critical_path(durations).length
 
         return phase_results
 
+    def build_task_graph(self, phases: Sequence[Phase]) -> TaskGraph:
+        """Build the cross-phase dependency graph for ``phases`` (in plan order)"""
+        return build_graph(
+            [
+                (
+                    phase.name,
+                    phase.blocking,
+                    [
+                        TaskNode(
+                            task_id=task.id,
+                            phase=phase.name,
+                            phase_index=0,
+                            position=0,
+                            is_parallel=task.is_parallel,
+                            dependencies=list(task.dependencies),
+                            files=set(task.files),
+                        )
+                        for task in phase.tasks
+                    ],
+                )
+                for phase in phases
+            ]
+        )
+
+    def plan_report(self, phases: Sequence[Phase], durations: Optional[Dict[str, float]] = None) -> str:
+        """Dependency graph and critical-path report for a plan"""
+        return self.build_task_graph(self._determine_phase_order(list(phases))).format_report(durations)
+
+    async def _execute_graph(self, phases: List[Phase]) -> Dict[str, Dict[str, ExecutionResult]]:
+        """Run every task as soon as its dependencies have succeeded
+
+        At most ``max_workers`` tasks run at once. A failed task skips its
+        dependents; a failure in a blocking phase also cancels in-flight tasks.
+        """
+        graph = self.build_task_graph(phases)
+        self.last_graph = graph
+        tasks = {task.id: task for phase in phases for task in phase.tasks}
+        print(
+            f"[>>] Cross-phase execution: {len(tasks)} task(s) in {len(graph.waves())} wave(s), "
+            f"critical path {' -> '.join(graph.critical_path().task_ids)}"
+        )
+
+        results: Dict[str, ExecutionResult] = {}
+        remaining = {task_id: len(graph.edges[task_id]) for task_id in graph.nodes}
+        ready = [task_id for task_id in graph.topological_order() if remaining[task_id] == 0]
+        running: Dict[asyncio.Future, str] = {}
+        aborted = False
+
+        def finish(task_id: str, result: ExecutionResult) -> None:
+            results[task_id] = result
+            if not result.success:
+                for dependent in graph.descendants(task_id):
+                    results.setdefault(dependent, self._skipped_result(tasks[dependent], task_id))
+                return
+            for dependent in graph.dependents[task_id]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0 and dependent not in results:
+                    ready.append(dependent)
+
+        try:
+            while ready or running:
+                while ready and len(running) < self.max_workers and not aborted:
+                    task = tasks[ready.pop(0)]
+                    if task.is_completed:
+                        finish(task.id, self._completed_result(task))
+                        continue
+                    running[asyncio.ensure_future(self._execute_single_task(task))] = task.id
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    task = tasks[running.pop(future)]
+                    if future.cancelled():
+                        result = self._cancelled_result(task)
+                    elif future.exception() is not None:
+                        result = ExecutionResult(
+                            success=False,
+                            task_id=task.id,
+                            description=task.description,
+                            error=str(future.exception()),
+                            is_parallel=task.is_parallel,
+                        )
+                    else:
+                        result = future.result()
+                    marker = " [P]" if task.is_parallel else ""
+                    print(f"  {'[OK]' if result.success else '[X]'}{marker} {task.id}: {task.description}")
+                    finish(task.id, result)
+
+                    if not result.success and graph.nodes[task.id].blocking and not aborted:
+                        aborted = True
+                        print(f"[X] Blocking phase '{task.phase}' failed. Aborting.")
+                        for other in running:
+                            other.cancel()
+        except asyncio.CancelledError:
+            for other in running:
+                other.cancel()
+            raise
+
+        return {
+            phase.name: {task.id: results[task.id] for task in phase.tasks if task.id in results}
+            for phase in phases
+            if any(task.id in results for task in phase.tasks)
+        }
+
     async def _execute_phase(self, phase: Phase) -> Dict[str, ExecutionResult]:
         results: Dict[str, ExecutionResult] = {}
 
@@ -251,8 +437,10 @@ class ParallelTaskExecutor:
 
         if pending_parallel:
             print(f"[>>] Executing {len(pending_parallel)} parallel task(s)")
-            parallel_results = await self._execute_parallel_tasks(pending_parallel)
+            parallel_results = await self._execute_parallel_tasks(pending_parallel, cancel_on_failure=phase.blocking)
             results.update(parallel_results)
+            if phase.blocking and any(not res.success for res in parallel_results.values()):
+                pending_sequential = []
 
         if pending_sequential:
             print(f"[..] Executing {len(pending_sequential)} sequential task(s)")
@@ -264,37 +452,104 @@ class ParallelTaskExecutor:
 
         for task in phase.tasks:
             if task.is_completed and task.id not in results:
-                results[task.id] = ExecutionResult(
-                    success=True,
-                    task_id=task.id,
-                    duration=0.0,
-                    description=task.description,
-                    is_parallel=task.is_parallel,
-                )
+                results[task.id] = self._completed_result(task)
 
         return results
 
-    async def _execute_parallel_tasks(self, tasks: List[Task]) -> Dict[str, ExecutionResult]:
-        coroutines = [(task.id, self._execute_single_task(task)) for task in tasks]
-        gathered = await asyncio.gather(*(c for _, c in coroutines), return_exceptions=True)
+    async def _execute_parallel_tasks(
+        self, tasks: List[Task], *, cancel_on_failure: bool = False
+    ) -> Dict[str, ExecutionResult]:
+        """Run tasks with at most ``max_workers`` in flight
 
+        A fixed pool of worker coroutines pulls from the task list, so a
+        large phase never creates more than ``max_workers`` subprocesses.
+        With ``cancel_on_failure`` the first failure cancels in-flight
+        siblings (killing their processes) and skips tasks not yet started.
+        """
         results: Dict[str, ExecutionResult] = {}
-        for (task_id, _), outcome in zip(coroutines, gathered):
-            if isinstance(outcome, Exception):
-                print(f"  [X] [P] {task_id}: {outcome}")
-                results[task_id] = ExecutionResult(
-                    success=False,
-                    task_id=task_id,
-                    duration=0.0,
-                    description="",
-                    error=str(outcome),
-                    is_parallel=True,
-                )
-            else:
-                status = "[OK]" if outcome.success else "[X]"
-                print(f"  {status} [P] {task_id}: {outcome.description}")
-                results[task_id] = outcome
-        return results
+        queue = iter(tasks)
+        failed = asyncio.Event()
+        in_flight: Dict[str, asyncio.Task] = {}
+
+        async def worker() -> None:
+            for task in queue:
+                if failed.is_set():
+                    return
+                running = asyncio.ensure_future(self._execute_single_task(task))
+                in_flight[task.id] = running
+                try:
+                    outcome = await running
+                except asyncio.CancelledError:
+                    if not failed.is_set():
+                        raise
+                    results[task.id] = self._cancelled_result(task)
+                    continue
+                except Exception as exc:
+                    print(f"  [X] [P] {task.id}: {exc}")
+                    outcome = ExecutionResult(
+                        success=False,
+                        task_id=task.id,
+                        duration=0.0,
+                        description="",
+                        error=str(exc),
+                        is_parallel=True,
+                    )
+                else:
+                    status = "[OK]" if outcome.success else "[X]"
+                    print(f"  {status} [P] {task.id}: {outcome.description}")
+                finally:
+                    in_flight.pop(task.id, None)
+
+                results[task.id] = outcome
+                if cancel_on_failure and not outcome.success and not failed.is_set():
+                    failed.set()
+                    for other in list(in_flight.values()):
+                        other.cancel()
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(self.max_workers, len(tasks)))]
+        try:
+            await asyncio.gather(*workers)
+        except asyncio.CancelledError:
+            for running in list(in_flight.values()) + workers:
+                running.cancel()
+            raise
+
+        for task in tasks:
+            if task.id not in results:
+                results[task.id] = self._cancelled_result(task)
+        return {task.id: results[task.id] for task in tasks}
+
+    @staticmethod
+    def _completed_result(task: Task) -> ExecutionResult:
+        return ExecutionResult(
+            success=True,
+            task_id=task.id,
+            duration=0.0,
+            description=task.description,
+            is_parallel=task.is_parallel,
+        )
+
+    @staticmethod
+    def _skipped_result(task: Task, failed_dependency: str) -> ExecutionResult:
+        return ExecutionResult(
+            success=False,
+            task_id=task.id,
+            duration=0.0,
+            description=task.description,
+            error=f"Skipped: dependency {failed_dependency} failed",
+            is_parallel=task.is_parallel,
+        )
+
+    @staticmethod
+    def _cancelled_result(task: Task) -> ExecutionResult:
+        return ExecutionResult(
+            success=False,
+            task_id=task.id,
+            duration=0.0,
+            description=task.description,
+            error="Cancelled: blocking phase failed",
+            is_parallel=task.is_parallel,
+        )
 
     async def _execute_sequential_tasks(self, tasks: List[Task]) -> Dict[str, ExecutionResult]:
         results: Dict[str, ExecutionResult] = {}
@@ -350,24 +605,74 @@ class ParallelTaskExecutor:
         if not task.command:
             return True, f"Simulated completion for {task.id}", ""
 
+        pipe = asyncio.subprocess.PIPE
         if isinstance(task.command, (list, tuple)):
-            cmd = list(task.command)
-            shell = False
+            process = await asyncio.create_subprocess_exec(*map(str, task.command), stdout=pipe, stderr=pipe)
         else:
-            cmd = task.command
-            shell = True
-
-        def runner() -> subprocess.CompletedProcess:
-            return subprocess.run(
-                cmd,
-                shell=shell,
-                capture_output=True,
-                text=True,
-                timeout=60,
+            process = await asyncio.create_subprocess_shell(str(task.command), stdout=pipe, stderr=pipe)
+
+        stdout: List[str] = []
+        stderr: List[str] = []
+        timeout = task.timeout or self.default_timeout
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    self._stream_output(task.id, "stdout", process.stdout, stdout),
+                    self._stream_output(task.id, "stderr", process.stderr, stderr),
+                    process.wait(),
+                ),
+                timeout=timeout,
             )
+        except asyncio.TimeoutError:
+            stderr.append(f"Command timed out after {timeout:g}s\n")
+            return False, "".join(stdout), "".join(stderr)
+        finally:
+            # Timeout, cancellation or a reader error: never leave the child running
+            if process.returncode is None:
+                await self._kill_process(process)
+
+        return process.returncode == 0, "".join(stdout), "".join(stderr)
+
+    async def _stream_output(
+        self, task_id: str, stream_name: str, stream: Optional[asyncio.StreamReader], sink: List[str]
+    ) -> None:
+        if stream is None:
+            return
+        captured = 0
+        pending = b""
+        while True:
+            # Chunked reads: readline() fails on lines longer than the StreamReader limit
+            chunk = await stream.read(self.READ_CHUNK_BYTES)
+            if chunk:
+                *lines, pending = (pending + chunk).split(b"\n")
+                raw_lines = [line + b"\n" for line in lines]
+                if len(pending) >= self.READ_CHUNK_BYTES:
+                    # No newline in sight (\r progress bars, binary dumps): pass it on as a partial line
+                    raw_lines.append(pending)
+                    pending = b""
+            else:
+                raw_lines = [pending] if pending else []
+            if self.output_callback is None and captured >= self.MAX_CAPTURE_BYTES:
+                raw_lines = []  # Capture full and nobody listening: just drain the pipe
+            for raw in raw_lines:
+                line = raw.decode("utf-8", errors="replace")
+                if self.output_callback is not None:
+                    self.output_callback(task_id, stream_name, line)
+                if captured < self.MAX_CAPTURE_BYTES:
+                    sink.append(line)
+                    captured += len(raw)
+            if not chunk:
+                break
 
-        completed = await asyncio.to_thread(runner)
-        return completed.returncode == 0, completed.stdout, completed.stderr
+    @staticmethod
+    async def _kill_process(process: asyncio.subprocess.Process) -> None:
+        if process.returncode is not None:
+            return
+        try:
+            process.kill()
+        except ProcessLookupError:
+            return
+        await process.wait()
 
     def _generate_evidence(self, task_or_result: Task | ExecutionResult, result: Optional[ExecutionResult] = None) -> Path:
         if isinstance(task_or_result, ExecutionResult):
@@ -461,8 +766,24 @@ class ParallelTaskExecutor:
 class EnhancedTaskExecutorV2(ParallelTaskExecutor):
     """Compatibility wrapper used by integration tests."""
 
-    def __init__(self, project_root: Optional[Path] = None, *, max_workers: int = 5, dry_run: bool = False) -> None:
-        super().__init__(project_root=project_root, max_workers=max_workers, dry_run=dry_run)
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        *,
+        max_workers: int = 5,
+        dry_run: bool = False,
+        default_timeout: float = ParallelTaskExecutor.DEFAULT_TIMEOUT,
+        output_callback: Optional[OutputCallback] = None,
+        cross_phase: bool = False,
+    ) -> None:
+        super().__init__(
+            project_root=project_root,
+            max_workers=max_workers,
+            dry_run=dry_run,
+            default_timeout=default_timeout,
+            output_callback=output_callback,
+            cross_phase=cross_phase,
+        )
 
     async def execute(self, tasks_file: Path) -> bool:
         phases = self.parse_tasks_file(tasks_file)
@@ -491,7 +812,7 @@ async def main() -> None:
     import sys
 
     if len(sys.argv) < 2:
-        print("Usage: python enhanced_task_executor_v2.py <tasks_file> [--validate-all]")
+        print("Usage: python enhanced_task_executor_v2.py <tasks_file> [--validate-all] [--cross-phase] [--plan-report]")
         raise SystemExit(1)
 
     file_path = Path(sys.argv[1])
@@ -499,15 +820,21 @@ async def main() -> None:
         print(f"Error: file not found: {file_path}")
         raise SystemExit(1)
 
-    executor = ParallelTaskExecutor()
+    executor = ParallelTaskExecutor(cross_phase="--cross-phase" in sys.argv)
     phases = executor.parse_tasks_file(file_path)
     print(f"[OK] Parsed {len(phases)} phase(s)")
 
+    if "--plan-report" in sys.argv:
+        print(executor.plan_report(phases))
+        raise SystemExit(0)
+
     if "--validate-all" in sys.argv:
         await executor._validate_constitutional_compliance()
 
     results = await executor.execute_phases(phases)
     flattened = {tid: res for phase_results in results.values() for tid, res in phase_results.items()}
+    if executor.last_graph is not None:
+        print(executor.last_graph.format_report({tid: res.duration for tid, res in flattened.items()}))
     success = all(res.success for res in flattened.values())
     raise SystemExit(0 if success else 1)
 
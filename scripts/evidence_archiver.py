@@ -10,7 +10,8 @@ Problem:
 Solution:
 - Archive files by date: RUNS/evidence/archive/YYYY-MM/
 - Keep recent files (last 7 days) in root
-- Compress archives older than 30 days
+- Pack archives older than 30 days into one file per month
+  (RUNS/evidence/archive/YYYY-MM.pack + index, see evidence_pack.py)
 - Clean up duplicate test evidence
 
 Performance Impact:
@@ -31,15 +32,25 @@ Usage:
 
     # Full optimization
     python scripts/evidence_archiver.py --archive --compress --clean-old
+
+    # Look up packed evidence
+    python scripts/evidence_archiver.py --find FEAT-2025-10-01-01
+    python scripts/evidence_archiver.py --show 2025-09/evidence_abc.json
 """
 
 import argparse
 import gzip
+import json
 import logging
 import shutil
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from scripts.evidence_pack import EvidencePack, archived_record_count
+except ImportError:
+    from evidence_pack import EvidencePack, archived_record_count
 
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 logger = logging.getLogger(__name__)
@@ -122,61 +133,101 @@ class EvidenceArchiver:
             logger.info("No archive directory found")
             return self.stats
 
-        for month_dir in self.archive_dir.iterdir():
-            if not month_dir.is_dir():
-                continue
+        for month, dir_date in self._archived_months():
+            month_dir = self.archive_dir / month
+            if dir_date < cutoff_date and month_dir.is_dir():
+                self._compress_month(month_dir)
 
-            # Parse YYYY-MM directory name
+        return self.stats
+
+    def _archived_months(self) -> List[Tuple[str, datetime]]:
+        """YYYY-MM months present as directories or packs."""
+        names = {path.name for path in self.archive_dir.iterdir() if path.is_dir()}
+        names.update(EvidencePack.months(self.archive_dir))
+
+        months = []
+        for name in sorted(names):
+            # Parse YYYY-MM name
             try:
-                dir_date = datetime.strptime(month_dir.name, "%Y-%m")
+                months.append((name, datetime.strptime(name, "%Y-%m")))
             except ValueError:
                 continue
-
-            if dir_date < cutoff_date:
-                self._compress_month(month_dir)
-
-        return self.stats
+        return months
 
     def _compress_month(self, month_dir: Path):
-        """Compress all JSON files in a month directory."""
-        json_files = list(month_dir.glob("*.json"))
+        """Pack all JSON (and legacy .json.gz) files of a month into its pack."""
+        evidence_files = sorted(month_dir.glob("*.json")) + sorted(month_dir.glob("*.json.gz"))
 
-        if not json_files:
+        if not evidence_files:
             return
 
-        logger.info(f"Compressing {len(json_files)} files in {month_dir.name}/")
-
-        for json_file in json_files:
-            gz_file = json_file.with_suffix(".json.gz")
+        if self.dry_run:
+            logger.info(f"Would pack {len(evidence_files)} files: {month_dir.name}/ -> {month_dir.name}.pack")
+            return
 
-            if gz_file.exists():
+        records = []
+        original_size = 0
+        for evidence_file in evidence_files:
+            try:
+                if evidence_file.suffix == ".gz":
+                    name = evidence_file.name[: -len(".gz")]
+                    data = gzip.decompress(evidence_file.read_bytes())
+                else:
+                    name = evidence_file.name
+                    data = evidence_file.read_bytes()
+                stat = evidence_file.stat()
+            except Exception as e:
+                logger.error(f"Failed to read {evidence_file.name}: {e}")
                 continue
+            records.append((name, data, stat.st_mtime))
+            original_size += stat.st_size
+
+        pack = EvidencePack(self.archive_dir, month_dir.name)
+        try:
+            packed_size = pack.append(records)
+        except Exception as e:
+            logger.error(f"Failed to pack {month_dir.name}/: {e}")
+            return
 
-            if self.dry_run:
-                logger.info(f"Would compress: {json_file.name}")
-            else:
-                try:
-                    with open(json_file, "rb") as f_in:
-                        with gzip.open(gz_file, "wb") as f_out:
-                            shutil.copyfileobj(f_in, f_out)
-
-                    # Remove original
-                    original_size = json_file.stat().st_size
-                    json_file.unlink()
-
-                    compressed_size = gz_file.stat().st_size
-                    space_saved = original_size - compressed_size
-
-                    self.stats["files_compressed"] += 1
-                    self.stats["space_saved"] += space_saved
-
-                    logger.info(
-                        f"Compressed: {json_file.name} "
-                        f"({original_size} -> {compressed_size} bytes, "
-                        f"{space_saved / original_size * 100:.1f}% saved)"
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to compress {json_file.name}: {e}")
+        # Originals are removed only after the index points at their records
+        for evidence_file in evidence_files:
+            name = evidence_file.name[: -len(".gz")] if evidence_file.suffix == ".gz" else evidence_file.name
+            if name in pack:
+                evidence_file.unlink()
+        if not any(month_dir.iterdir()):
+            month_dir.rmdir()
+
+        space_saved = original_size - packed_size
+        self.stats["files_compressed"] += len(records)
+        self.stats["space_saved"] += space_saved
+
+        logger.info(
+            f"Packed: {month_dir.name}/ {len(records)} files "
+            f"({original_size} -> {packed_size} bytes, "
+            f"{space_saved / max(original_size, 1) * 100:.1f}% saved)"
+        )
+
+    def count_records(self, month: Optional[str] = None) -> int:
+        """Archived evidence count: packed records (from the manifest) plus loose month files."""
+        count = archived_record_count(self.archive_dir, month)
+        if self.archive_dir.exists():
+            for name, _ in self._archived_months():
+                month_dir = self.archive_dir / name
+                if (month is None or name == month) and month_dir.is_dir():
+                    count += sum(1 for _ in month_dir.iterdir())
+        return count
+
+    def find(self, task_id: str) -> List[Tuple[str, str]]:
+        """(month, record name) pairs of packed evidence for a task."""
+        return [
+            (month, name)
+            for month in EvidencePack.months(self.archive_dir)
+            for name in EvidencePack(self.archive_dir, month).find(task_id)
+        ]
+
+    def read_record(self, month: str, name: str) -> bytes:
+        """Original bytes of one packed evidence record."""
+        return EvidencePack(self.archive_dir, month).read_bytes(name)
 
     def clean_old_archives(self, days: int = 90) -> Dict[str, int]:
         """Delete archives older than N days.
@@ -194,41 +245,34 @@ class EvidenceArchiver:
             logger.info("No archive directory found")
             return self.stats
 
-        for month_dir in self.archive_dir.iterdir():
-            if not month_dir.is_dir():
-                continue
-
-            # Parse YYYY-MM directory name
-            try:
-                dir_date = datetime.strptime(month_dir.name, "%Y-%m")
-            except ValueError:
-                continue
-
+        for month, dir_date in self._archived_months():
             if dir_date < cutoff_date:
-                self._delete_month(month_dir)
+                self._delete_month(self.archive_dir / month)
 
         return self.stats
 
     def _delete_month(self, month_dir: Path):
-        """Delete an entire month directory."""
-        file_count = len(list(month_dir.glob("*")))
+        """Delete an entire month (directory and pack)."""
+        file_count = self.count_records(month_dir.name)
 
         if self.dry_run:
-            logger.info(f"Would delete: {month_dir.name}/ ({file_count} files)")
+            logger.info(f"Would delete: {month_dir.name} ({file_count} files)")
         else:
             try:
-                shutil.rmtree(month_dir)
-                logger.info(f"Deleted: {month_dir.name}/ ({file_count} files)")
+                if month_dir.is_dir():
+                    shutil.rmtree(month_dir)
+                EvidencePack(self.archive_dir, month_dir.name).delete()
+                logger.info(f"Deleted: {month_dir.name} ({file_count} files)")
                 self.stats["files_cleaned"] += file_count
             except Exception as e:
-                logger.error(f"Failed to delete {month_dir.name}/: {e}")
+                logger.error(f"Failed to delete {month_dir.name}: {e}")
 
     def print_stats(self):
         """Print operation statistics."""
         print("\n=== Evidence Archiver Statistics ===")
         print(f"Files found: {self.stats['files_found']}")
         print(f"Files archived: {self.stats['files_archived']}")
-        print(f"Files compressed: {self.stats['files_compressed']}")
+        print(f"Files packed: {self.stats['files_compressed']}")
         print(f"Files cleaned: {self.stats['files_cleaned']}")
 
         if self.stats["space_saved"] > 0:
@@ -244,7 +288,7 @@ class EvidenceArchiver:
 def main():
     parser = argparse.ArgumentParser(description="Evidence file archiver")
     parser.add_argument("--archive", action="store_true", help="Archive old evidence files")
-    parser.add_argument("--compress", action="store_true", help="Compress old archives")
+    parser.add_argument("--compress", action="store_true", help="Pack old archives into monthly packs")
     parser.add_argument("--clean-old", action="store_true", help="Delete very old archives")
     parser.add_argument(
         "--archive-days",
@@ -265,11 +309,13 @@ def main():
         help="Delete archives older than N days (default: 90)",
     )
     parser.add_argument("--dry-run", action="store_true", help="Preview changes only")
+    parser.add_argument("--find", metavar="TASK_ID", help="List packed evidence records for a task")
+    parser.add_argument("--show", metavar="YYYY-MM/NAME", help="Print one packed evidence record")
 
     args = parser.parse_args()
 
     # Default: show usage if no action specified
-    if not (args.archive or args.compress or args.clean_old):
+    if not (args.archive or args.compress or args.clean_old or args.find or args.show):
         parser.print_help()
         return
 
@@ -280,6 +326,18 @@ def main():
 
     archiver = EvidenceArchiver(evidence_dir, dry_run=args.dry_run)
 
+    if args.find or args.show:
+        if args.find:
+            for month, name in archiver.find(args.find):
+                print(f"{month}/{name}")
+        if args.show:
+            month, _, name = args.show.partition("/")
+            try:
+                print(json.dumps(json.loads(archiver.read_record(month, name)), indent=2, ensure_ascii=False))
+            except KeyError:
+                logger.error(f"Record not found: {args.show}")
+        return
+
     # Execute requested operations
     if args.archive:
         archiver.archive_old_files(days=args.archive_days)
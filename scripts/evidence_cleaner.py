@@ -11,6 +11,11 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    from scripts.evidence_pack import archived_record_count
+except ImportError:
+    from evidence_pack import archived_record_count
+
 
 class EvidenceCleaner:
     """Clean up excessive evidence files intelligently."""
@@ -269,6 +274,14 @@ class EvidenceCleaner:
         print(f"[INFO] Archived {archived} files to {archive_dir}")
         return archived
 
+    def count_archived(self) -> int:
+        """Count packed evidence records from archive manifests (no globbing).
+
+        Returns:
+            Number of records in <evidence_dir>/archive/*.pack across all directories.
+        """
+        return sum(archived_record_count(evidence_dir / "archive") for evidence_dir in self.evidence_dirs)
+
     def show_statistics(self) -> None:
         """Display cleaning statistics."""
         print("\n" + "=" * 60)
@@ -278,6 +291,7 @@ class EvidenceCleaner:
         print(f"Files kept: {self.stats['files_kept']}")
         print(f"Files deleted: {self.stats['files_deleted']}")
         print(f"Space freed: {self.stats['space_freed_mb']:.1f} MB")
+        print(f"Archived (packed): {self.count_archived()}")
 
         # Show directory sizes
         print("\nEvidence Directory Sizes:")
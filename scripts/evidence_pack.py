@@ -0,0 +1,241 @@
+"""Evidence Pack - Monthly packed evidence archives with random access
+
+One pack per month replaces thousands of small (gzipped) evidence files:
+
+    RUNS/evidence/archive/
+        2025-09.pack         # concatenated raw-deflate records
+        2025-09.zdict        # shared dictionary trained on that month's evidence
+        2025-09.index.json   # name -> offset/length/task_id/sha256
+        manifest.json        # month -> record count and sizes
+
+Each record is deflated on its own against the shared dictionary. Small JSON
+files compress well that way, because their keys and boilerplate come from
+the dictionary, and any record can still be read with a single seek and
+without touching the rest of the month.
+
+Usage:
+    pack = EvidencePack(Path("RUNS/evidence/archive"), "2025-09")
+    pack.find("FEAT-2025-09-01-01")       # record names for a task
+    pack.read_json("evidence_abc.json")   # one record
+
+    archived_record_count(Path("RUNS/evidence/archive"))  # no globbing
+"""
+
+import hashlib
+import json
+import os
+import re
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+PACK_SUFFIX = ".pack"
+INDEX_SUFFIX = ".index.json"
+DICT_SUFFIX = ".zdict"
+MANIFEST_NAME = "manifest.json"
+
+DICT_SIZE = 32 * 1024  # zlib only uses the last 32 KiB of a preset dictionary
+DICT_SAMPLE_BYTES = 4 * 1024 * 1024
+SEGMENT_PATTERN = re.compile(rb"[^\n,{}\[\]]+[,{}\[\]]?")
+TASK_ID_PATTERN = re.compile(r"[A-Z]+-\d{4}-\d{2}-\d{2}-\d+")
+
+
+def train_dictionary(samples: Iterable[bytes], size: int = DICT_SIZE) -> bytes:
+    """Build a zlib preset dictionary from sample records
+
+    Segments (JSON lines / comma-separated members) that repeat across
+    samples are ranked by bytes they would save; the most valuable go last,
+    closest to the data, where deflate references them most cheaply.
+    """
+    counts: Counter = Counter()
+    budget = DICT_SAMPLE_BYTES
+    for sample in samples:
+        if budget <= 0:
+            break
+        budget -= len(sample)
+        counts.update(set(SEGMENT_PATTERN.findall(sample)))
+
+    ranked = sorted(
+        (segment for segment, count in counts.items() if count > 1 and len(segment) > 3),
+        key=lambda segment: counts[segment] * len(segment),
+    )
+    dictionary = b"\n".join(ranked)
+    return dictionary[-size:]
+
+
+def read_manifest(archive_dir: Path) -> Dict[str, Dict[str, int]]:
+    """Per-month record counts and sizes ({} when nothing is packed)"""
+    manifest_path = archive_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        return {}
+    try:
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def archived_record_count(archive_dir: Path, month: Optional[str] = None) -> int:
+    """Number of packed evidence records, read from the manifest"""
+    manifest = read_manifest(archive_dir)
+    if month is not None:
+        return manifest.get(month, {}).get("records", 0)
+    return sum(entry.get("records", 0) for entry in manifest.values())
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _task_id_for(name: str, data: bytes) -> Optional[str]:
+    try:
+        payload = json.loads(data)
+        if isinstance(payload, dict) and payload.get("task_id"):
+            return str(payload["task_id"])
+    except (ValueError, UnicodeDecodeError):
+        pass
+    match = TASK_ID_PATTERN.search(name)
+    return match.group(0) if match else None
+
+
+class EvidencePack:
+    """One month of packed evidence records"""
+
+    def __init__(self, archive_dir: Path, month: str):
+        self.archive_dir = archive_dir
+        self.month = month
+        self.pack_path = archive_dir / f"{month}{PACK_SUFFIX}"
+        self.index_path = archive_dir / f"{month}{INDEX_SUFFIX}"
+        self.dict_path = archive_dir / f"{month}{DICT_SUFFIX}"
+        self._records: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dictionary: Optional[bytes] = None
+
+    @classmethod
+    def months(cls, archive_dir: Path) -> List[str]:
+        """Months that have a pack index"""
+        if not archive_dir.exists():
+            return []
+        return sorted(path.name[: -len(INDEX_SUFFIX)] for path in archive_dir.glob(f"*{INDEX_SUFFIX}"))
+
+    @property
+    def exists(self) -> bool:
+        return self.index_path.exists()
+
+    @property
+    def records(self) -> Dict[str, Dict[str, Any]]:
+        """Index entries keyed by record (original file) name"""
+        if self._records is None:
+            if self.index_path.exists():
+                self._records = json.loads(self.index_path.read_text(encoding="utf-8"))["records"]
+            else:
+                self._records = {}
+        return self._records
+
+    @property
+    def dictionary(self) -> bytes:
+        if self._dictionary is None:
+            self._dictionary = self.dict_path.read_bytes() if self.dict_path.exists() else b""
+        return self._dictionary
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.records
+
+    def names(self) -> List[str]:
+        return sorted(self.records)
+
+    def find(self, task_id: str) -> List[str]:
+        """Record names belonging to a task"""
+        return sorted(name for name, entry in self.records.items() if entry.get("task_id") == task_id)
+
+    def read_bytes(self, name: str) -> bytes:
+        """Original bytes of one record
+
+        Raises:
+            KeyError: If the record is not in this pack
+            ValueError: If the record fails its checksum
+        """
+        entry = self.records[name]
+        with open(self.pack_path, "rb") as f:
+            f.seek(entry["offset"])
+            blob = f.read(entry["length"])
+
+        decompressor = zlib.decompressobj(wbits=-15, zdict=self.dictionary) if self.dictionary else None
+        data = decompressor.decompress(blob) if decompressor else zlib.decompress(blob, wbits=-15)
+        if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+            raise ValueError(f"Checksum mismatch for {name} in {self.pack_path.name}")
+        return data
+
+    def read_json(self, name: str) -> Any:
+        return json.loads(self.read_bytes(name))
+
+    def append(self, files: List[Tuple[str, bytes, float]]) -> int:
+        """Add (name, data, mtime) records; returns bytes written to the pack
+
+        The first write trains the month's dictionary; later appends reuse it
+        so existing records stay readable. A record with an existing name
+        replaces the old index entry.
+        """
+        if not files:
+            return 0
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+
+        if not self.dict_path.exists():
+            self._dictionary = train_dictionary(data for _, data, _ in files)
+            _atomic_write(self.dict_path, self._dictionary)
+
+        records = self.records
+        written = 0
+        with open(self.pack_path, "ab") as f:
+            for name, data, mtime in files:
+                compressor = (
+                    zlib.compressobj(9, zlib.DEFLATED, -15, zdict=self.dictionary)
+                    if self.dictionary
+                    else zlib.compressobj(9, zlib.DEFLATED, -15)
+                )
+                blob = compressor.compress(data) + compressor.flush()
+                records[name] = {
+                    "offset": f.tell(),
+                    "length": len(blob),
+                    "size": len(data),
+                    "mtime": mtime,
+                    "task_id": _task_id_for(name, data),
+                    "sha256": hashlib.sha256(data).hexdigest(),
+                }
+                f.write(blob)
+                written += len(blob)
+
+        # Index after data: a crash leaves unreferenced bytes, never dangling offsets
+        index = {"version": 1, "month": self.month, "records": records}
+        _atomic_write(self.index_path, json.dumps(index, indent=1, sort_keys=True).encode("utf-8"))
+        self._update_manifest()
+        return written
+
+    def delete(self) -> int:
+        """Remove the pack, its index and dictionary; returns records removed"""
+        count = len(self) if self.exists else 0
+        for path in (self.pack_path, self.index_path, self.dict_path):
+            if path.exists():
+                path.unlink()
+        self._records = {}
+        self._update_manifest()
+        return count
+
+    def _update_manifest(self) -> None:
+        manifest = read_manifest(self.archive_dir)
+        if self.records:
+            manifest[self.month] = {
+                "records": len(self.records),
+                "original_bytes": sum(entry["size"] for entry in self.records.values()),
+                "pack_bytes": self.pack_path.stat().st_size,
+            }
+        else:
+            manifest.pop(self.month, None)
+        _atomic_write(self.archive_dir / MANIFEST_NAME, json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"))
+
+
+__all__ = ["EvidencePack", "archived_record_count", "read_manifest", "train_dictionary"]
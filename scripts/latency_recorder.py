@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Latency Recorder - Streaming latency percentiles for SLA monitoring
+
+Records operation latencies into a mergeable quantile sketch (DDSketch
+style: logarithmic buckets with bounded relative error), kept per
+operation in a ring of short time buckets so percentiles, error rate and
+uptime always describe a sliding window.
+
+Usage:
+    from latency_recorder import get_latency_recorder, timed, track
+
+    # Context manager
+    with track("deep_analyzer.analyze"):
+        analyzer.analyze(path)
+
+    # Decorator
+    @timed("task_executor.command")
+    def run_command(cmd):
+        ...
+
+    # Feed ProductionMonitor directly
+    monitor.monitor_sla()  # pulls p50/p95/p99, error rate and uptime
+"""
+
+import functools
+import inspect
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with bounded relative error
+
+    Values are mapped to logarithmic buckets of ratio ``gamma``, so any
+    quantile estimate is within ``relative_accuracy`` of the true value.
+    Two sketches with the same accuracy merge by adding bucket counts.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add a non-negative value to the sketch"""
+        if value < 0:
+            raise ValueError("QuantileSketch only accepts non-negative values")
+        if value == 0:
+            self.zero_count += 1
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Merge another sketch into this one"""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile (0 <= q <= 1), 0.0 when empty"""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return 0.0
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                estimate = 2 * self.gamma**index / (self.gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        """Mean of all recorded values"""
+        return self.total / self.count if self.count else 0.0
+
+
+@dataclass
+class _TimeBucket:
+    """Latency sketch and call counters for one time slice"""
+
+    start: float
+    sketch: QuantileSketch
+    calls: int = 0
+    errors: int = 0
+
+
+@dataclass
+class _OperationSeries:
+    """Sliding window of time buckets for one operation"""
+
+    buckets: Deque[_TimeBucket] = field(default_factory=deque)
+
+
+class LatencyRecorder:
+    """Thread-safe sliding-window latency recorder
+
+    Each operation keeps a ring of ``bucket_seconds`` slices covering the
+    last ``window_seconds``. Queries merge the live slices, so memory is
+    bounded by the number of slices rather than the number of calls.
+
+    Uptime is the percentage of slices with traffic in which at least one
+    call succeeded.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 300.0,
+        bucket_seconds: float = 10.0,
+        relative_accuracy: float = 0.01,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize LatencyRecorder
+
+        Args:
+            window_seconds: Sliding window length used by snapshots
+            bucket_seconds: Resolution of the sliding window
+            relative_accuracy: Quantile sketch relative error
+            clock: Monotonic clock in seconds (injectable for tests)
+        """
+        if bucket_seconds <= 0 or window_seconds < bucket_seconds:
+            raise ValueError("window_seconds must be >= bucket_seconds > 0")
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self.relative_accuracy = relative_accuracy
+        self._clock = clock
+        self._series: Dict[str, _OperationSeries] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, latency_ms: float, success: bool = True) -> None:
+        """Record one call of an operation
+
+        Args:
+            name: Operation name (e.g. "deep_analyzer.analyze")
+            latency_ms: Call latency in milliseconds
+            success: Whether the call succeeded
+        """
+        now = self._clock()
+        start = now - (now % self.bucket_seconds)
+
+        with self._lock:
+            series = self._series.setdefault(name, _OperationSeries())
+            if not series.buckets or series.buckets[-1].start < start:
+                series.buckets.append(_TimeBucket(start=start, sketch=QuantileSketch(self.relative_accuracy)))
+            self._expire(series, now)
+
+            bucket = series.buckets[-1]
+            bucket.sketch.add(max(latency_ms, 0.0))
+            bucket.calls += 1
+            if not success:
+                bucket.errors += 1
+
+    @contextmanager
+    def track(self, name: str) -> Iterator[None]:
+        """Time a block; an exception counts as an error and is re-raised
+
+        Example:
+            with recorder.track("backend.api_stats"):
+                handle_request()
+        """
+        started = time.perf_counter()
+        success = False
+        try:
+            yield
+            success = True
+        finally:
+            self.record(name, (time.perf_counter() - started) * 1000, success=success)
+
+    def timed(self, name: Optional[str] = None) -> Callable:
+        """Decorator recording latency of every call
+
+        Args:
+            name: Operation name (defaults to module.qualname)
+        """
+
+        def decorator(func: Callable) -> Callable:
+            op_name = name or f"{func.__module__}.{func.__qualname__}"
+
+            if inspect.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                    with self.track(op_name):
+                        return await func(*args, **kwargs)
+
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                with self.track(op_name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def operations(self) -> List[str]:
+        """Names of operations with recorded calls"""
+        with self._lock:
+            return sorted(self._series)
+
+    def sketch(self, name: Optional[str] = None) -> QuantileSketch:
+        """Merged sketch over the sliding window
+
+        Args:
+            name: Operation name, or None to merge all operations
+        """
+        merged, _ = self._window(name)
+        return merged
+
+    def snapshot(self, name: Optional[str] = None) -> Dict[str, float]:
+        """SLA metrics over the sliding window
+
+        Returns a dict in the format expected by
+        ProductionMonitor.monitor_sla().
+
+        Args:
+            name: Operation name, or None for all operations
+        """
+        merged, counts = self._window(name)
+        calls = errors = 0
+        slices: Dict[float, List[int]] = {}
+        for start, bucket_calls, bucket_errors in counts:
+            calls += bucket_calls
+            errors += bucket_errors
+            totals = slices.setdefault(start, [0, 0])
+            totals[0] += bucket_calls
+            totals[1] += bucket_errors
+
+        up_slices = sum(1 for slice_calls, slice_errors in slices.values() if slice_errors < slice_calls)
+
+        return {
+            "p50_latency_ms": round(merged.quantile(0.50), 3),
+            "p95_latency_ms": round(merged.quantile(0.95), 3),
+            "p99_latency_ms": round(merged.quantile(0.99), 3),
+            "error_rate_percent": round(errors / calls * 100, 3) if calls else 0.0,
+            "uptime_percent": round(up_slices / len(slices) * 100, 3) if slices else 100.0,
+            "request_count": calls,
+        }
+
+    def reset(self) -> None:
+        """Drop all recorded data"""
+        with self._lock:
+            self._series.clear()
+
+    def _window(self, name: Optional[str]) -> Tuple[QuantileSketch, List[Tuple[float, int, int]]]:
+        """Merged sketch and (start, calls, errors) per live bucket
+
+        Merged while holding the lock: record() mutates the newest bucket in place.
+        """
+        now = self._clock()
+        merged = QuantileSketch(self.relative_accuracy)
+        counts: List[Tuple[float, int, int]] = []
+        with self._lock:
+            names = [name] if name is not None else list(self._series)
+            for op_name in names:
+                series = self._series.get(op_name)
+                if series is None:
+                    continue
+                self._expire(series, now)
+                for bucket in series.buckets:
+                    merged.merge(bucket.sketch)
+                    counts.append((bucket.start, bucket.calls, bucket.errors))
+        return merged, counts
+
+    def _expire(self, series: _OperationSeries, now: float) -> None:
+        cutoff = now - self.window_seconds
+        while series.buckets and series.buckets[0].start + self.bucket_seconds <= cutoff:
+            series.buckets.popleft()
+
+
+# Global instance
+_default_recorder = None
+
+
+def get_latency_recorder() -> LatencyRecorder:
+    """Get global latency recorder instance"""
+    global _default_recorder
+    if _default_recorder is None:
+        _default_recorder = LatencyRecorder()
+    return _default_recorder
+
+
+def track(name: str):
+    """Time a block with the global recorder"""
+    return get_latency_recorder().track(name)
+
+
+def timed(name: Optional[str] = None) -> Callable:
+    """Decorate a function to record latency with the global recorder"""
+    return get_latency_recorder().timed(name)
+
+
+__all__ = ["LatencyRecorder", "QuantileSketch", "get_latency_recorder", "timed", "track"]
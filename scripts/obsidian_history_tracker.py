@@ -4,14 +4,29 @@ Obsidian History Tracker
 옵시디언 문서 업데이트 히스토리 관리 시스템
 
 각 문서의 모든 업데이트 시간과 변경 내용을 추적합니다.
+
+저장 구조 (.history/):
+- index.json: 문서별 요약 (업데이트 수, 최신 기록, 본문 hash, mtime/size)
+- notes/<xx>/<sha1>.jsonl: 문서별 append-only 업데이트 로그 (최근 MAX_HISTORY개 유지)
+
+성능:
+- (mtime, size)가 그대로면 저장된 본문 hash 재사용 (문서 재읽기 없음)
+- 히스토리 섹션이 문서 끝에 있으면 꼬리만 제자리에서 다시 씀
+- batch() / track_many(): 여러 문서를 추적해도 인덱스는 한 번만 저장
 """
 
 import os
 import json
 import hashlib
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
+
+HISTORY_MARKER_START = "<!-- HISTORY_START -->"
+HISTORY_MARKER_END = "<!-- HISTORY_END -->"
+MAX_HISTORY = 100  # 문서별 보관 기록 수
+SECTION_TAIL_BYTES = 16 * 1024  # 히스토리 섹션 탐색용 꼬리 크기
 
 
 class ObsidianHistoryTracker:
@@ -41,11 +56,60 @@ class ObsidianHistoryTracker:
         # 히스토리 저장 경로
         self.history_dir = self.vault_path / ".history"
         self.history_dir.mkdir(exist_ok=True)
+        self.notes_dir = self.history_dir / "notes"
 
-        # 히스토리 메타데이터 파일
+        # 히스토리 메타데이터 파일 (문서별 요약만 저장)
         self.history_index = self.history_dir / "index.json"
 
-    def track_update(self, file_path: str, action: str = "update", metadata: Dict = None) -> Dict:
+        # 인덱스 캐시 및 배치 상태
+        self._index: Optional[Dict] = None
+        self._index_stat: Optional[tuple] = None
+        self._batch_depth = 0
+        self._dirty = False
+
+    @contextmanager
+    def batch(self) -> Iterator["ObsidianHistoryTracker"]:
+        """블록 안의 track_update 호출들을 모아 인덱스를 한 번만 저장
+
+        Example:
+            with tracker.batch():
+                for note in notes:
+                    tracker.track_update(note, action="sync")
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._save_history_index(self._index)
+
+    def track_many(
+        self, file_paths: Iterable[str], action: str = "sync", metadata: Dict = None, skip_unchanged: bool = True
+    ) -> List[Dict]:
+        """
+        여러 문서 업데이트를 한 번에 추적 (대량 동기화용)
+
+        Args:
+            file_paths: 업데이트된 파일 경로들
+            action: 수행된 작업
+            metadata: 추가 메타데이터
+            skip_unchanged: 마지막 기록 이후 본문이 바뀌지 않은 문서는 건너뜀
+
+        Returns:
+            새로 기록된 업데이트 목록 (건너뛴 문서 제외)
+        """
+        records = []
+        with self.batch():
+            for file_path in file_paths:
+                record = self.track_update(file_path, action=action, metadata=metadata, skip_unchanged=skip_unchanged)
+                if "error" not in record and not record.get("skipped"):
+                    records.append(record)
+        return records
+
+    def track_update(
+        self, file_path: str, action: str = "update", metadata: Dict = None, skip_unchanged: bool = False
+    ) -> Dict:
         """
         문서 업데이트 추적
 
@@ -53,21 +117,38 @@ class ObsidianHistoryTracker:
             file_path: 업데이트된 파일 경로 (vault 내 상대 경로)
             action: 수행된 작업 (create, update, sync, etc.)
             metadata: 추가 메타데이터
+            skip_unchanged: 본문이 마지막 기록과 같으면 기록하지 않음
 
         Returns:
-            업데이트 기록
+            업데이트 기록 (건너뛴 경우 {"skipped": True, ...})
         """
         file_path = Path(file_path)
         if not file_path.is_absolute():
             file_path = self.vault_path / file_path
 
         # 파일 존재 확인
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except OSError:
             return {"error": "File not found", "path": str(file_path)}
 
-        # 파일 해시 계산 (변경 감지용)
-        content = file_path.read_text(encoding="utf-8")
-        content_hash = hashlib.sha256(content.encode()).hexdigest()[:8]
+        # 파일의 상대 경로
+        relative_path = file_path.relative_to(self.vault_path).as_posix()
+        history_index = self._load_history_index()
+        summary = history_index.get(relative_path)
+
+        # 본문 hash (변경 감지용) - (mtime, size)가 같으면 캐시된 값 사용
+        if summary and summary.get("mtime_ns") == stat.st_mtime_ns and summary.get("file_size") == stat.st_size:
+            content_hash, size, lines = summary["last_hash"], summary["size"], summary["lines"]
+        else:
+            body = self._strip_history_section(file_path.read_text(encoding="utf-8"))
+            content_hash = hashlib.sha256(body.encode()).hexdigest()[:8]
+            size, lines = len(body), body.count("\n") + 1
+
+        if skip_unchanged and summary and summary.get("last_hash") == content_hash:
+            summary["mtime_ns"], summary["file_size"] = stat.st_mtime_ns, stat.st_size
+            self._dirty = True  # stat 캐시만 갱신 - 다음 인덱스 저장 시 반영
+            return {"skipped": True, "path": relative_path, "hash": content_hash}
 
         # 현재 타임스탬프
         timestamp = datetime.now(timezone.utc)
@@ -79,63 +160,96 @@ class ObsidianHistoryTracker:
             "timestamp_iso": timestamp.isoformat(),
             "action": action,
             "hash": content_hash,
-            "size": len(content),
-            "lines": content.count("\n") + 1,
+            "size": size,
+            "lines": lines,
             "metadata": metadata or {},
         }
 
-        # 히스토리 인덱스 로드
-        history_index = self._load_history_index()
-
-        # 파일의 상대 경로
-        relative_path = file_path.relative_to(self.vault_path).as_posix()
-
-        # 파일 히스토리 가져오기 또는 생성
-        if relative_path not in history_index:
-            history_index[relative_path] = {
+        # 파일 요약 가져오기 또는 생성
+        if summary is None:
+            summary = history_index[relative_path] = {
                 "first_created": timestamp_str,
                 "last_updated": timestamp_str,
                 "update_count": 0,
-                "history": [],
+                "log_records": 0,
             }
 
-        file_history = history_index[relative_path]
-
-        # 업데이트 카운트 증가
-        file_history["update_count"] += 1
-        file_history["last_updated"] = timestamp_str
-
-        # 히스토리에 추가 (순서 번호 포함)
-        update_record["update_number"] = file_history["update_count"]
-        file_history["history"].append(update_record)
+        # 업데이트 카운트 증가 (순서 번호 포함)
+        summary["update_count"] += 1
+        summary["last_updated"] = timestamp_str
+        update_record["update_number"] = summary["update_count"]
+        summary["latest"] = update_record
+        summary["last_hash"], summary["size"], summary["lines"] = content_hash, size, lines
 
-        # 최대 100개 히스토리만 유지 (오래된 것부터 제거)
-        if len(file_history["history"]) > 100:
-            file_history["history"] = file_history["history"][-100:]
+        # 문서별 로그에 추가 (최대 MAX_HISTORY개 유지)
+        history = self._append_log(relative_path, summary, update_record)
 
-        # 인덱스 저장
-        self._save_history_index(history_index)
+        # 문서에 히스토리 섹션 추가/업데이트 후 stat 캐시 갱신
+        self._update_document_history(file_path, {**summary, "history": history})
+        stat = file_path.stat()
+        summary["mtime_ns"], summary["file_size"] = stat.st_mtime_ns, stat.st_size
 
-        # 문서에 히스토리 섹션 추가/업데이트
-        self._update_document_history(file_path, file_history)
+        # 인덱스 저장 (배치 중에는 종료 시 한 번)
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._save_history_index(history_index)
 
         return update_record
 
+    def _log_path(self, relative_path: str) -> Path:
+        digest = hashlib.sha1(relative_path.encode("utf-8")).hexdigest()
+        return self.notes_dir / digest[:2] / f"{digest}.jsonl"
+
+    def _read_log(self, relative_path: str) -> List[Dict]:
+        log_path = self._log_path(relative_path)
+        if not log_path.exists():
+            return []
+        with open(log_path, "r", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f if line.strip()]
+        return records[-MAX_HISTORY:]
+
+    def _append_log(self, relative_path: str, summary: Dict, record: Dict) -> List[Dict]:
+        """로그에 기록 추가; 보관 한도의 2배를 넘으면 최근 MAX_HISTORY개로 compaction"""
+        log_path = self._log_path(relative_path)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if summary["log_records"] + 1 > 2 * MAX_HISTORY:
+            history = (self._read_log(relative_path) + [record])[-MAX_HISTORY:]
+            tmp = log_path.with_suffix(".tmp")
+            tmp.write_text("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in history), encoding="utf-8")
+            os.replace(tmp, log_path)
+            summary["log_records"] = len(history)
+            return history
+
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        summary["log_records"] += 1
+        return self._read_log(relative_path)
+
+    @staticmethod
+    def _strip_history_section(content: str) -> str:
+        """히스토리 섹션을 제외한 본문 (hash 대상)"""
+        start = content.find(HISTORY_MARKER_START)
+        end = content.find(HISTORY_MARKER_END)
+        if start != -1 and end != -1:
+            content = content[:start].rstrip("\n") + content[end + len(HISTORY_MARKER_END) :]
+        return content.rstrip("\n")
+
     def _update_document_history(self, file_path: Path, history: Dict):
         """문서 내 히스토리 섹션 업데이트"""
-        content = file_path.read_text(encoding="utf-8")
-
         # 히스토리 섹션 생성
         history_section = self._generate_history_section(history)
 
-        # 기존 히스토리 섹션 찾기
-        history_marker_start = "<!-- HISTORY_START -->"
-        history_marker_end = "<!-- HISTORY_END -->"
+        # 섹션이 문서 끝에 있으면 꼬리만 제자리에서 교체
+        if self._rewrite_tail_section(file_path, history_section):
+            return
+
+        content = file_path.read_text(encoding="utf-8")
 
-        if history_marker_start in content:
+        if HISTORY_MARKER_START in content:
             # 기존 섹션 교체
-            start_idx = content.index(history_marker_start)
-            end_idx = content.index(history_marker_end) + len(history_marker_end)
+            start_idx = content.index(HISTORY_MARKER_START)
+            end_idx = content.index(HISTORY_MARKER_END) + len(HISTORY_MARKER_END)
             content = content[:start_idx] + history_section + content[end_idx:]
         else:
             # 문서 끝에 추가
@@ -146,6 +260,30 @@ class ObsidianHistoryTracker:
         # 파일 저장
         file_path.write_text(content, encoding="utf-8")
 
+    def _rewrite_tail_section(self, file_path: Path, history_section: str) -> bool:
+        """문서 끝의 히스토리 섹션을 seek + truncate로 교체 (본문은 다시 쓰지 않음)"""
+        start_marker = HISTORY_MARKER_START.encode("utf-8")
+        end_marker = HISTORY_MARKER_END.encode("utf-8")
+
+        with open(file_path, "r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            tail_offset = max(0, size - SECTION_TAIL_BYTES)
+            f.seek(tail_offset)
+            tail = f.read()
+
+            start = tail.rfind(start_marker)
+            end = tail.rfind(end_marker)
+            if start == -1 or end < start or tail[end + len(end_marker) :].strip():
+                return False
+            # 꼬리 안에 마커가 여러 개면 일반 경로로 처리
+            if tail.find(start_marker) != start:
+                return False
+
+            f.seek(tail_offset + start)
+            f.write(history_section.encode("utf-8") + tail[end + len(end_marker) :])
+            f.truncate()
+        return True
+
     def _generate_history_section(self, history: Dict) -> str:
         """히스토리 섹션 HTML 생성"""
         section = []
@@ -224,16 +362,53 @@ class ObsidianHistoryTracker:
         return "\n".join(section)
 
     def _load_history_index(self) -> Dict:
-        """히스토리 인덱스 로드"""
-        if self.history_index.exists():
-            with open(self.history_index, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return {}
+        """히스토리 인덱스 로드 (파일이 바뀌지 않았으면 메모리 캐시 사용)"""
+        if self._batch_depth and self._index is not None:
+            return self._index
+
+        try:
+            stat = self.history_index.stat()
+            index_stat = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            index_stat = None
+
+        if self._index is None or index_stat != self._index_stat:
+            if index_stat is None:
+                self._index = {}
+            else:
+                with open(self.history_index, "r", encoding="utf-8") as f:
+                    self._index = self._migrate_legacy_index(json.load(f))
+            self._index_stat = index_stat
+        return self._index
+
+    def _migrate_legacy_index(self, index: Dict) -> Dict:
+        """기존 형식 (인덱스에 history 목록 포함)을 문서별 로그로 이전"""
+        legacy = [path for path, entry in index.items() if "history" in entry]
+        for relative_path in legacy:
+            entry = index[relative_path]
+            history = entry.pop("history")[-MAX_HISTORY:]
+            log_path = self._log_path(relative_path)
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            log_path.write_text("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in history), encoding="utf-8")
+            entry["log_records"] = len(history)
+            if history:
+                entry["latest"] = history[-1]
+                entry["last_hash"] = history[-1].get("hash")
+        if legacy:
+            self._save_history_index(index)
+        return index
 
     def _save_history_index(self, index: Dict):
-        """히스토리 인덱스 저장"""
-        with open(self.history_index, "w", encoding="utf-8") as f:
+        """히스토리 인덱스 저장 (원자적 교체)"""
+        tmp = self.history_index.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
             json.dump(index, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, self.history_index)
+
+        stat = self.history_index.stat()
+        self._index = index
+        self._index_stat = (stat.st_mtime_ns, stat.st_size)
+        self._dirty = False
 
     def get_file_history(self, file_path: str) -> Optional[Dict]:
         """특정 파일의 히스토리 조회"""
@@ -242,21 +417,21 @@ class ObsidianHistoryTracker:
             file_path = self.vault_path / file_path
 
         relative_path = file_path.relative_to(self.vault_path).as_posix()
-        history_index = self._load_history_index()
+        summary = self._load_history_index().get(relative_path)
+        if summary is None:
+            return None
 
-        return history_index.get(relative_path)
+        return {**summary, "history": self._read_log(relative_path)}
 
     def get_recent_updates(self, limit: int = 10) -> List[Dict]:
         """최근 업데이트된 파일 목록"""
         history_index = self._load_history_index()
 
-        # 모든 파일의 최근 업데이트 수집
+        # 모든 파일의 최근 업데이트 수집 (인덱스의 latest만 사용)
         recent_updates = []
-        for file_path, history in history_index.items():
-            if history["history"]:
-                latest = history["history"][-1]
-                latest["file_path"] = file_path
-                recent_updates.append(latest)
+        for file_path, summary in history_index.items():
+            if summary.get("latest"):
+                recent_updates.append({**summary["latest"], "file_path": file_path})
 
         # 타임스탬프로 정렬
         recent_updates.sort(key=lambda x: x["timestamp_iso"], reverse=True)
@@ -0,0 +1,142 @@
+"""Parallel Scan - Ordered, chunked per-file analysis over a process pool
+
+Repository scans (AutoImprover's PatternDetector, TechnicalDebtTracker,
+CodeReviewAssistant) and prompt batches analyze every item independently. map_chunks() sends fixed-size chunks of
+paths to a process pool, keeps only a few chunks per worker in flight and
+yields per-file results in input order. Callers can therefore stream
+findings from a large monorepo without holding all of them in memory, and
+repeated scans report them in the same order.
+
+Usage:
+    for result in map_chunks(_scan_chunk, paths, initializer=_init_worker, initargs=(config,)):
+        ...
+
+    timings = PhaseTimer()
+    with timings.phase("parse"):
+        tree = ast.parse(content)
+    timings.totals  # {"parse": 0.012}
+"""
+
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+PARALLEL_MIN_FILES = 16  # below this, process startup costs more than it saves
+DEFAULT_CHUNK_SIZE = 8  # files per task sent to a worker
+IN_FLIGHT_PER_WORKER = 2  # chunks queued per worker; bounds buffered results
+
+ProgressCallback = Callable[[int, int], None]  # (files done, files total)
+
+
+class PhaseTimer:
+    """Accumulates wall time per named phase (seconds)"""
+
+    def __init__(self):
+        self.totals: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float) -> None:
+        self.totals[name] = self.totals.get(name, 0.0) + seconds
+
+    def merge(self, totals: Dict[str, float]) -> None:
+        for name, seconds in totals.items():
+            self.add(name, seconds)
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Consecutive lists of at most ``size`` items"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def map_chunks(
+    job: Callable[[List[Any]], List[Any]],
+    items: Sequence[Any],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: tuple = (),
+    inline_job: Optional[Callable[[List[Any]], List[Any]]] = None,
+    progress: Optional[ProgressCallback] = None,
+    parallel: Optional[bool] = None,
+) -> Iterator[Any]:
+    """Run ``job`` over chunks of ``items`` and yield its results in input order
+
+    Args:
+        job: Module-level function, chunk -> one result per item (runs in workers)
+        items: Work items (e.g. file paths)
+        workers: Worker processes (default: CPU count; 1 runs inline)
+        chunk_size: Items per task
+        initializer: Worker process initializer (builds per-worker state)
+        initargs: Arguments for ``initializer``
+        inline_job: Replacement for ``job`` when running in this process
+        progress: Called with (items done, items total) after each chunk
+        parallel: Whether the work is worth a pool (default: at least
+            PARALLEL_MIN_FILES items)
+
+    Small inputs, a single worker, or a platform without process pools run
+    inline with ``inline_job`` (or ``job``).
+    """
+    total = len(items)
+    workers = min(workers or os.cpu_count() or 1, -(-total // chunk_size) or 1)
+    if parallel is None:
+        parallel = total >= PARALLEL_MIN_FILES
+    pool = None
+    if workers > 1 and parallel:
+        try:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs)
+        except (OSError, RuntimeError, NotImplementedError) as e:
+            logger.warning(f"Process pool unavailable, scanning inline: {e}")
+
+    done = 0
+    if pool is None:
+        run = inline_job or job
+        for chunk in chunked(items, chunk_size):
+            results = run(chunk)
+            done += len(chunk)
+            if progress is not None:
+                progress(done, total)
+            yield from results
+        return
+
+    chunks = chunked(items, chunk_size)
+    pending = deque()
+    try:
+        for chunk in islice(chunks, workers * IN_FLIGHT_PER_WORKER):
+            pending.append((len(chunk), pool.submit(job, chunk)))
+        while pending:
+            size, future = pending.popleft()
+            results = future.result()
+            next_chunk = next(chunks, None)
+            if next_chunk is not None:
+                pending.append((len(next_chunk), pool.submit(job, next_chunk)))
+            done += size
+            if progress is not None:
+                progress(done, total)
+            yield from results
+    finally:
+        # Consumer stopped early or a job failed: drop queued chunks
+        for _, future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+
+__all__ = ["PhaseTimer", "ProgressCallback", "chunked", "map_chunks"]
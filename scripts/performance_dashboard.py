@@ -22,6 +22,11 @@ Usage:
     with dashboard.profile_context("my_function"):
         expensive_operation()
 
+    # Sample call stacks (flamegraph-ready) and top allocators
+    with dashboard.profile_context("analyze", sample_stacks=True, trace_allocations=True):
+        analyzer.analyze(path)
+    dashboard.export_collapsed_stacks(Path("RUNS/analyze.folded"), "analyze")
+
     # Analyze trends
     trend = dashboard.analyze_trends("cpu_percent", timerange="7d")
 
@@ -32,9 +37,14 @@ Usage:
     recommendations = dashboard.generate_recommendations()
 """
 
+import atexit
 import json
 import logging
+import sys
+import threading
 import time
+import tracemalloc
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -154,11 +164,15 @@ class Recommendation:
 class PerformanceDashboard:
     """Performance monitoring and analysis system"""
 
-    def __init__(self, data_dir: Optional[Path] = None):
+    def __init__(self, data_dir: Optional[Path] = None, profile_flush_interval: float = 0.0):
         """Initialize PerformanceDashboard
 
         Args:
             data_dir: Directory for storing performance data
+            profile_flush_interval: Seconds to buffer profile results in memory
+                before writing profiles.json (0 = write on every result). Buffered
+                results are flushed by close() / the context manager, and at
+                interpreter exit as a fallback.
         """
         self.data_dir = data_dir or Path("RUNS/performance_dashboard")
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -170,6 +184,13 @@ class PerformanceDashboard:
         self.alerts: List[PerformanceAlert] = []
         self.comparisons: List[ComparisonReport] = []
 
+        # Profile write buffering
+        self.profile_flush_interval = profile_flush_interval
+        self._profiles_dirty = False
+        self._last_profile_flush = time.monotonic()
+        if profile_flush_interval > 0:
+            atexit.register(self.flush)
+
         # Thresholds (configurable)
         self.thresholds = {
             MetricType.CPU: 80.0,  # 80% CPU
@@ -319,19 +340,48 @@ class PerformanceDashboard:
         self.alerts.append(alert)
         logger.warning(f"[ALERT] {severity.upper()} - {message}")
 
-    def profile_context(self, function_name: str):
+    def profile_context(
+        self,
+        function_name: str,
+        sample_stacks: bool = False,
+        sample_interval_ms: float = 5.0,
+        trace_allocations: bool = False,
+        top_allocations: int = 10,
+    ):
         """Context manager for profiling code execution
 
+        Args:
+            function_name: Name recorded for the profiled block
+            sample_stacks: Sample the block's call stack from a background
+                thread; results go to metadata["stack_samples"] as
+                collapsed "caller;callee" stacks with counts
+            sample_interval_ms: Stack sampling interval
+            trace_allocations: Record top allocation sites via tracemalloc
+                in metadata["top_allocations"]
+            top_allocations: Number of allocation sites to keep
+
         Usage:
             with dashboard.profile_context("my_function"):
                 expensive_operation()
+
+            with dashboard.profile_context("analyze", sample_stacks=True):
+                analyzer.analyze(path)
         """
-        return _ProfileContext(self, function_name)
+        return _ProfileContext(
+            self,
+            function_name,
+            sample_stacks=sample_stacks,
+            sample_interval_ms=sample_interval_ms,
+            trace_allocations=trace_allocations,
+            top_allocations=top_allocations,
+        )
 
     def record_profile(self, result: ProfileResult):
-        """Record profiling result"""
+        """Record profiling result (buffered by profile_flush_interval)"""
         self.profiles.append(result)
-        self._save_data()
+        self._profiles_dirty = True
+        if time.monotonic() - self._last_profile_flush >= self.profile_flush_interval:
+            self.flush()
 
         if result.success:
             logger.info(
@@ -341,6 +391,53 @@ class PerformanceDashboard:
         else:
             logger.error(f"[PROFILE] {result.function_name} failed: {result.error}")
 
+    def flush(self):
+        """Write buffered profile results to profiles.json"""
+        if self._profiles_dirty:
+            with open(self.data_dir / "profiles.json", "w", encoding="utf-8") as f:
+                json.dump([vars(p) for p in self.profiles], f, indent=2)
+            self._profiles_dirty = False
+        self._last_profile_flush = time.monotonic()
+
+    def close(self):
+        """Flush buffered profile results and drop the exit hook"""
+        self.flush()
+        if self.profile_flush_interval > 0:
+            atexit.unregister(self.flush)
+
+    def __enter__(self) -> "PerformanceDashboard":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def collapsed_stacks(self, function_name: Optional[str] = None) -> Dict[str, int]:
+        """Merge sampled call stacks across recorded profiles
+
+        Args:
+            function_name: Only include profiles with this name (None = all)
+
+        Returns:
+            Collapsed stack ("outer;inner") -> sample count
+        """
+        merged: Counter = Counter()
+        for profile in self.profiles:
+            if function_name is None or profile.function_name == function_name:
+                merged.update(profile.metadata.get("stack_samples", {}))
+        return dict(merged)
+
+    def export_collapsed_stacks(self, output_path: Path, function_name: Optional[str] = None) -> int:
+        """Write sampled stacks in flamegraph.pl / speedscope folded format
+
+        Returns:
+            Number of distinct stacks written
+        """
+        stacks = self.collapsed_stacks(function_name)
+        lines = [f"{stack} {count}" for stack, count in sorted(stacks.items(), key=lambda item: -item[1])]
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+        return len(lines)
+
     def analyze_trends(self, metric_type: str, timerange: str = "7d") -> TrendAnalysis:
         """Analyze performance trends over time
 
@@ -593,16 +690,71 @@ class PerformanceDashboard:
         return recommendations
 
 
+class _StackSampler:
+    """Background thread sampling one thread's call stack at a fixed interval"""
+
+    def __init__(self, thread_id: int, interval_ms: float):
+        self.thread_id = thread_id
+        self.interval = max(interval_ms, 0.1) / 1000
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self) -> Dict[str, int]:
+        self._stop.set()
+        self._thread.join()
+        return dict(self.samples)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{Path(code.co_filename).name}:{code.co_name}")
+                frame = frame.f_back
+            self.samples[";".join(reversed(stack))] += 1
+
+
 class _ProfileContext:
     """Internal context manager for profiling"""
 
-    def __init__(self, dashboard: PerformanceDashboard, function_name: str):
+    def __init__(
+        self,
+        dashboard: PerformanceDashboard,
+        function_name: str,
+        sample_stacks: bool = False,
+        sample_interval_ms: float = 5.0,
+        trace_allocations: bool = False,
+        top_allocations: int = 10,
+    ):
         self.dashboard = dashboard
         self.function_name = function_name
         self.start_time = None
         self.start_memory = None
+        self.sample_stacks = sample_stacks
+        self.sample_interval_ms = sample_interval_ms
+        self.trace_allocations = trace_allocations
+        self.top_allocations = top_allocations
+        self._sampler: Optional[_StackSampler] = None
+        self._started_tracemalloc = False
+        self._alloc_baseline = None
 
     def __enter__(self):
+        if self.trace_allocations:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            self._alloc_baseline = tracemalloc.take_snapshot()
+        if self.sample_stacks:
+            self._sampler = _StackSampler(threading.get_ident(), self.sample_interval_ms)
+            self._sampler.start()
+
         self.start_time = time.time()
         if psutil:
             process = psutil.Process()
@@ -619,6 +771,15 @@ class _ProfileContext:
             end_memory = process.memory_info().rss / (1024 * 1024)  # MB
             memory_delta_mb = end_memory - self.start_memory
 
+        metadata: Dict[str, Any] = {}
+        if self._sampler is not None:
+            samples = self._sampler.stop()
+            metadata["stack_samples"] = samples
+            metadata["sample_count"] = sum(samples.values())
+            metadata["sample_interval_ms"] = self.sample_interval_ms
+        if self._alloc_baseline is not None:
+            metadata["top_allocations"] = self._top_allocations()
+
         success = exc_type is None
         error = str(exc_val) if exc_val else None
 
@@ -630,7 +791,27 @@ class _ProfileContext:
             end_time=datetime.fromtimestamp(end_time).isoformat(),
             success=success,
             error=error,
+            metadata=metadata,
         )
 
         self.dashboard.record_profile(result)
         return False  # Don't suppress exceptions
+
+    def _top_allocations(self) -> List[Dict[str, Any]]:
+        """Allocation sites that grew most during the block"""
+        snapshot = tracemalloc.take_snapshot()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+
+        stats = snapshot.compare_to(self._alloc_baseline, "lineno")
+        top = []
+        for stat in stats[: self.top_allocations]:
+            frame = stat.traceback[0]
+            top.append(
+                {
+                    "location": f"{Path(frame.filename).name}:{frame.lineno}",
+                    "size_diff_kb": round(stat.size_diff / 1024, 2),
+                    "count_diff": stat.count_diff,
+                }
+            )
+        return top
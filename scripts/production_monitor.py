@@ -7,6 +7,7 @@ Provides real-time production monitoring with:
 - Smart alert routing by severity
 - SLA monitoring and violation detection
 - Root cause analysis
+- Exception grouping by normalized fingerprint
 - Dashboard data for visualization
 
 Usage:
@@ -29,17 +30,30 @@ Usage:
         "uptime_percent": 99.9,
         "error_rate_percent": 0.5
     })
+
+    # Or let the built-in latency recorder supply the metrics
+    with monitor.latency_recorder.track("api.submit_form"):
+        handle_request()
+    sla_report = monitor.monitor_sla()
 """
 
 import hashlib
+import heapq
 import json
 import logging
+import re
 import traceback
+from collections import Counter
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    from scripts.latency_recorder import LatencyRecorder, get_latency_recorder
+except ImportError:
+    from latency_recorder import LatencyRecorder, get_latency_recorder
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -89,6 +103,18 @@ class ExceptionRecord:
     context: Dict[str, Any]
     resolved_at: Optional[str] = None
     resolution_notes: Optional[str] = None
+    fingerprint: Optional[str] = None
+
+
+@dataclass
+class ExceptionGroup:
+    """Exceptions sharing a normalized fingerprint"""
+
+    fingerprint: str
+    exception_type: str
+    message_template: str
+    exception_ids: List[str]
+    occurrence_count: int
 
 
 @dataclass
@@ -149,15 +175,112 @@ class DashboardData:
     error_trend: List[Dict[str, Any]]
 
 
+# Message templating: variable parts collapse to placeholders (order matters)
+_MESSAGE_NORMALIZERS = [
+    (re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"), "<uuid>"),
+    (re.compile(r"(?:[A-Za-z]:)?(?:[\\/][\w.\-]+){2,}[\\/]?"), "<path>"),
+    (re.compile(r"\b0x[0-9a-fA-F]+\b"), "<hex>"),
+    (re.compile(r"\b[0-9a-fA-F]{12,}\b"), "<hex>"),
+    (re.compile(r"'[^']*'|\"[^\"]*\""), "<str>"),
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "<num>"),
+]
+_FRAME_PATTERN = re.compile(r'File "([^"]+)", line \d+, in (\S+)')
+_PATH_SEPARATOR = re.compile(r"[\\/]")
+_PLACEHOLDER_PATTERN = re.compile(r"<(?:uuid|path|hex|str|num)>")
+_WORD_PATTERN = re.compile(r"[a-z_][a-z0-9_]{2,}")
+
+# Posting lists larger than this are treated as stop-tokens during lookup
+_MAX_POSTING_SCAN = 1000
+
+
+def normalize_message(message: str) -> str:
+    """Collapse numbers, ids, paths and quoted values into placeholders
+
+    Example:
+        normalize_message("User 42 not found in /var/db/users.db")
+        # -> "User <num> not found in <path>"
+    """
+    for pattern, placeholder in _MESSAGE_NORMALIZERS:
+        message = pattern.sub(placeholder, message)
+    return message
+
+
+def normalize_frames(stack_trace: str, depth: int = 5) -> List[str]:
+    """Extract innermost stack frames as "file:function" without line numbers
+
+    Only the file basename is kept so traces from different checkouts,
+    worktrees or machines produce the same frames.
+    """
+    frames = [f"{_PATH_SEPARATOR.split(path)[-1]}:{func}" for path, func in _FRAME_PATTERN.findall(stack_trace)]
+    return frames[-depth:]
+
+
+class _BucketCounter:
+    """Time-bucketed counter keyed by ISO timestamp prefix
+
+    Buckets are keyed by the first ``key_length`` characters of an ISO
+    timestamp (16 = minute, 10 = day), so adding a sample never parses a
+    datetime. Buckets older than ``retention`` are pruned whenever the
+    current bucket rolls over, which keeps the counter bounded.
+    """
+
+    def __init__(self, key_length: int, retention: timedelta):
+        self.key_length = key_length
+        self.retention = retention
+        self.buckets: Dict[str, int] = {}
+        self._current_key = ""
+
+    def add(self, timestamp: str, delta: int = 1) -> None:
+        """Add delta to the bucket containing timestamp"""
+        key = timestamp[: self.key_length]
+        if delta < 0:
+            # Bucket already pruned: the sample is outside every window anyway
+            if key not in self.buckets:
+                return
+            self.buckets[key] += delta
+            if self.buckets[key] <= 0:
+                del self.buckets[key]
+            return
+
+        self.buckets[key] = self.buckets.get(key, 0) + delta
+        if key > self._current_key:
+            self._current_key = key
+            self._prune(timestamp)
+
+    def get(self, timestamp: str) -> int:
+        """Get count of the bucket containing timestamp"""
+        return self.buckets.get(timestamp[: self.key_length], 0)
+
+    def sum_since(self, cutoff: datetime) -> int:
+        """Sum all buckets at or after cutoff (bucket resolution)"""
+        cutoff_key = cutoff.isoformat()[: self.key_length]
+        return sum(count for key, count in self.buckets.items() if key >= cutoff_key)
+
+    def _prune(self, timestamp: str) -> None:
+        try:
+            cutoff = datetime.fromisoformat(timestamp) - self.retention
+        except ValueError:
+            return
+        cutoff_key = cutoff.isoformat()[: self.key_length]
+        for key in [key for key in self.buckets if key < cutoff_key]:
+            del self.buckets[key]
+
+
 class ProductionMonitor:
     """Production monitoring system for exception tracking and SLA monitoring"""
 
-    def __init__(self, data_dir: Optional[Path] = None, sla_thresholds: Optional[SLAThreshold] = None):
+    def __init__(
+        self,
+        data_dir: Optional[Path] = None,
+        sla_thresholds: Optional[SLAThreshold] = None,
+        latency_recorder: Optional[LatencyRecorder] = None,
+    ):
         """Initialize ProductionMonitor
 
         Args:
             data_dir: Directory for storing monitoring data
             sla_thresholds: SLA threshold configuration
+            latency_recorder: Source of SLA metrics (defaults to the global recorder)
         """
         self.data_dir = data_dir or Path("RUNS/production_monitor")
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -167,14 +290,28 @@ class ProductionMonitor:
         self.alerts_file = self.data_dir / "alerts.json"
 
         self.sla_thresholds = sla_thresholds or SLAThreshold()
+        self.latency_recorder = latency_recorder or get_latency_recorder()
 
         # In-memory cache
         self.exceptions: Dict[str, ExceptionRecord] = {}
         self.sla_history: List[SLAReport] = []
         self.alerts: List[Dict[str, Any]] = []
 
+        # Rolling dashboard aggregates (maintained incrementally)
+        self._status_counts: Counter = Counter()
+        self._last_seen_buckets = _BucketCounter(key_length=16, retention=timedelta(hours=25))
+        self._first_seen_daily = _BucketCounter(key_length=10, retention=timedelta(days=8))
+        self._critical_alert_buckets = _BucketCounter(key_length=16, retention=timedelta(hours=2))
+        self._top_errors: List[Tuple[int, int, str]] = []  # min-heap of (count, -seq, exception_id)
+        self._exception_seq: Dict[str, int] = {}
+
+        # Grouping indexes: fingerprint -> ids, token -> ids
+        self._fingerprint_index: Dict[str, Set[str]] = {}
+        self._token_index: Dict[str, Set[str]] = {}
+
         # Load existing data
         self._load_data()
+        self._rebuild_aggregates()
 
         # Default alert rules
         self.alert_rules = {
@@ -215,6 +352,54 @@ class ProductionMonitor:
             with open(self.alerts_file, encoding="utf-8") as f:
                 self.alerts = json.load(f)
 
+    def _rebuild_aggregates(self) -> None:
+        """Rebuild rolling dashboard aggregates from loaded data (startup only)"""
+        for exc_id, exc in self.exceptions.items():
+            self._register_exception(exc)
+            self._update_top_errors(exc_id, exc.occurrence_count)
+        for alert in self.alerts:
+            if alert.get("severity") == Severity.CRITICAL.value and "timestamp" in alert:
+                self._critical_alert_buckets.add(alert["timestamp"])
+
+    def _register_exception(self, record: ExceptionRecord) -> None:
+        """Account for a newly seen exception record in the aggregates"""
+        self._exception_seq[record.exception_id] = len(self._exception_seq)
+        self._status_counts[record.status] += 1
+        self._last_seen_buckets.add(record.last_seen)
+        self._first_seen_daily.add(record.first_seen)
+
+        if record.fingerprint is None:
+            record.fingerprint = self._generate_fingerprint(record.exception_type, record.message, record.stack_trace)
+        self._fingerprint_index.setdefault(record.fingerprint, set()).add(record.exception_id)
+        for token in self._index_tokens(record):
+            self._token_index.setdefault(token, set()).add(record.exception_id)
+
+    def _index_tokens(self, record: ExceptionRecord) -> Set[str]:
+        """Tokens under which a record is indexed for similarity lookup"""
+        tokens = {f"frame:{frame}" for frame in normalize_frames(record.stack_trace)}
+        template = _PLACEHOLDER_PATTERN.sub(" ", normalize_message(record.message)).lower()
+        tokens.update(f"msg:{word}" for word in _WORD_PATTERN.findall(template)[:20])
+        return tokens
+
+    def _update_top_errors(self, exception_id: str, count: int, limit: int = 10) -> None:
+        """Maintain top-K exceptions by occurrence count
+
+        Occurrence counts only grow, so an exception outside the heap can
+        only enter it when its own count is incremented. Ties keep the
+        earlier-seen exception, matching a stable sort by count.
+        """
+        item = (count, -self._exception_seq[exception_id], exception_id)
+        for index, existing in enumerate(self._top_errors):
+            if existing[2] == exception_id:
+                self._top_errors[index] = item
+                heapq.heapify(self._top_errors)
+                return
+
+        if len(self._top_errors) < limit:
+            heapq.heappush(self._top_errors, item)
+        elif item > self._top_errors[0]:
+            heapq.heapreplace(self._top_errors, item)
+
     def _save_data(self) -> None:
         """Save monitoring data to disk"""
         # Save exceptions
@@ -247,6 +432,17 @@ class ProductionMonitor:
         fingerprint = f"{exc_type}:{message}:{':'.join(stack_lines)}"
         return hashlib.md5(fingerprint.encode()).hexdigest()[:12]
 
+    def _generate_fingerprint(self, exc_type: str, message: str, stack_trace: str) -> str:
+        """Generate grouping fingerprint from type, message template and frames
+
+        Unlike the exception ID, the fingerprint ignores variable message
+        parts (numbers, ids, paths) and line numbers, so recurring errors
+        that differ only in data land in the same group.
+        """
+        frames = normalize_frames(stack_trace)
+        fingerprint = f"{exc_type}:{normalize_message(message)}:{'|'.join(frames)}"
+        return hashlib.md5(fingerprint.encode()).hexdigest()[:12]
+
     def track_exception(self, exc: Exception, context: Optional[Dict[str, Any]] = None, severity: str = "medium") -> str:
         """Track exception and return unique ID
 
@@ -277,7 +473,10 @@ class ProductionMonitor:
             # Update existing exception
             record = self.exceptions[exception_id]
             record.occurrence_count += 1
+            self._last_seen_buckets.add(record.last_seen, -1)
+            self._last_seen_buckets.add(now)
             record.last_seen = now
+            self._update_top_errors(exception_id, record.occurrence_count)
             logger.info(f"[EXCEPTION] Updated: {exception_id} (count: {record.occurrence_count})")
         else:
             # Create new exception record
@@ -294,6 +493,8 @@ class ProductionMonitor:
                 context=context or {},
             )
             self.exceptions[exception_id] = record
+            self._register_exception(record)
+            self._update_top_errors(exception_id, record.occurrence_count)
             logger.warning(f"[EXCEPTION] New: {exception_id} ({exc_type}: {message})")
 
             # Route alert for new exception
@@ -341,22 +542,26 @@ class ProductionMonitor:
         }
 
         self.alerts.append(alert)
+        if severity == Severity.CRITICAL.value:
+            self._critical_alert_buckets.add(alert["timestamp"])
 
         # Log alert (in production, send to actual channels)
         logger.info(f"[ALERT] Routing {severity} alert for {exception_id} to {', '.join(target_channels)}")
 
         self._save_data()
 
-    def monitor_sla(self, metrics: Dict[str, float]) -> SLAReport:
+    def monitor_sla(self, metrics: Optional[Dict[str, float]] = None, operation: Optional[str] = None) -> SLAReport:
         """Monitor SLA metrics and detect violations
 
         Args:
-            metrics: Performance metrics
+            metrics: Performance metrics (omit to pull from latency_recorder)
                 - p50_latency_ms: 50th percentile latency
                 - p95_latency_ms: 95th percentile latency
                 - p99_latency_ms: 99th percentile latency
                 - uptime_percent: Uptime percentage
                 - error_rate_percent: Error rate percentage
+            operation: Recorder operation to report on (None = all operations);
+                only used when metrics is omitted
 
         Returns:
             SLA report with violations and status
@@ -370,6 +575,9 @@ class ProductionMonitor:
                 "error_rate_percent": 0.5
             })
         """
+        if metrics is None:
+            metrics = self.latency_recorder.snapshot(operation)
+
         violations = []
         recommendations = []
 
@@ -461,11 +669,7 @@ class ProductionMonitor:
             patterns.append("Null reference pattern detected")
 
         # Find similar cases
-        similar_cases = []
-        for exc_id, exc in self.exceptions.items():
-            if exc_id != exception_id and exc.exception_type == exception.exception_type:
-                if exc.status == ExceptionStatus.RESOLVED.value:
-                    similar_cases.append(exc_id)
+        similar_cases = self.find_similar_exceptions(exception_id, resolved_only=True)
 
         # Generate suggestions
         suggested_fixes = []
@@ -505,9 +709,84 @@ class ProductionMonitor:
 
         return analysis
 
+    def find_similar_exceptions(self, exception_id: str, resolved_only: bool = False, limit: int = 10) -> List[str]:
+        """Find exceptions similar to the given one via the inverted index
+
+        Candidates share the fingerprint, a normalized stack frame or a
+        message template word, and must have the same exception type.
+        They are ranked by the number of shared index tokens; tokens
+        shared by very many exceptions are skipped as uninformative.
+
+        Args:
+            exception_id: Exception ID to compare against
+            resolved_only: Only return resolved exceptions
+            limit: Maximum number of results
+
+        Returns:
+            Similar exception IDs, most similar first
+        """
+        if exception_id not in self.exceptions:
+            raise ValueError(f"Exception not found: {exception_id}")
+
+        exception = self.exceptions[exception_id]
+        scores: Counter = Counter()
+        for exc_id in self._fingerprint_index.get(exception.fingerprint, ()):
+            scores[exc_id] += 10
+        for token in self._index_tokens(exception):
+            posting = self._token_index.get(token, ())
+            if len(posting) > _MAX_POSTING_SCAN:
+                continue
+            for exc_id in posting:
+                scores[exc_id] += 1
+
+        similar = []
+        for exc_id, _score in sorted(scores.items(), key=lambda item: (-item[1], self._exception_seq[item[0]])):
+            candidate = self.exceptions[exc_id]
+            if exc_id == exception_id or candidate.exception_type != exception.exception_type:
+                continue
+            if resolved_only and candidate.status != ExceptionStatus.RESOLVED.value:
+                continue
+            similar.append(exc_id)
+            if len(similar) >= limit:
+                break
+        return similar
+
+    def get_exception_groups(self, limit: Optional[int] = None) -> List[ExceptionGroup]:
+        """Group exceptions by normalized fingerprint
+
+        Args:
+            limit: Maximum number of groups (largest first)
+
+        Returns:
+            Exception groups sorted by total occurrence count
+
+        Example:
+            for group in monitor.get_exception_groups(limit=5):
+                print(group.message_template, group.occurrence_count)
+        """
+        groups = []
+        for fingerprint, exc_ids in self._fingerprint_index.items():
+            ordered = sorted(exc_ids, key=self._exception_seq.__getitem__)
+            first = self.exceptions[ordered[0]]
+            groups.append(
+                ExceptionGroup(
+                    fingerprint=fingerprint,
+                    exception_type=first.exception_type,
+                    message_template=normalize_message(first.message),
+                    exception_ids=ordered,
+                    occurrence_count=sum(self.exceptions[exc_id].occurrence_count for exc_id in ordered),
+                )
+            )
+
+        groups.sort(key=lambda group: group.occurrence_count, reverse=True)
+        return groups[:limit] if limit is not None else groups
+
     def get_dashboard_data(self) -> DashboardData:
         """Get dashboard visualization data
 
+        Counts come from rolling aggregates maintained by track_exception()
+        and route_alert(), so the cost does not depend on exception history.
+
         Returns:
             Dashboard data for real-time monitoring
 
@@ -516,28 +795,19 @@ class ProductionMonitor:
             print(f"Active exceptions: {data.active_exceptions}")
         """
         now = datetime.now()
-        last_24h = now - timedelta(hours=24)
 
-        # Count active exceptions
-        active_exceptions = sum(1 for exc in self.exceptions.values() if exc.status == ExceptionStatus.ACTIVE.value)
-
-        # Count exceptions in last 24h
-        total_exceptions_24h = sum(1 for exc in self.exceptions.values() if datetime.fromisoformat(exc.last_seen) > last_24h)
-
-        # Count critical alerts in last hour
-        last_hour = now - timedelta(hours=1)
-        critical_alerts = sum(
-            1
-            for alert in self.alerts
-            if alert["severity"] == Severity.CRITICAL.value and datetime.fromisoformat(alert["timestamp"]) > last_hour
-        )
+        active_exceptions = self._status_counts[ExceptionStatus.ACTIVE.value]
+        total_exceptions_24h = self._last_seen_buckets.sum_since(now - timedelta(hours=24))
+        critical_alerts = self._critical_alert_buckets.sum_since(now - timedelta(hours=1))
 
         # Get latest SLA status
         sla_status = self.sla_history[-1].status if self.sla_history else "unknown"
 
-        # Top errors by occurrence
-        top_errors = sorted(
-            [
+        # Top errors by occurrence (heap holds at most 10 entries)
+        top_errors = []
+        for _count, _seq, exc_id in sorted(self._top_errors, reverse=True):
+            exc = self.exceptions[exc_id]
+            top_errors.append(
                 {
                     "exception_id": exc_id,
                     "type": exc.exception_type,
@@ -545,26 +815,13 @@ class ProductionMonitor:
                     "count": exc.occurrence_count,
                     "severity": exc.severity,
                 }
-                for exc_id, exc in self.exceptions.items()
-            ],
-            key=lambda x: x["count"],
-            reverse=True,
-        )[:10]
-
-        # Error trend (last 7 days)
-        error_trend = []
-        for i in range(7):
-            day = now - timedelta(days=i)
-            day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
-            day_end = day_start + timedelta(days=1)
-
-            count = sum(
-                1 for exc in self.exceptions.values() if day_start <= datetime.fromisoformat(exc.first_seen) < day_end
             )
 
-            error_trend.append({"date": day_start.strftime("%Y-%m-%d"), "count": count})
-
-        error_trend.reverse()
+        # Error trend (last 7 days) from daily first-seen buckets
+        error_trend = []
+        for i in range(6, -1, -1):
+            day = (now - timedelta(days=i)).strftime("%Y-%m-%d")
+            error_trend.append({"date": day, "count": self._first_seen_daily.get(day)})
 
         return DashboardData(
             timestamp=now.isoformat(),
@@ -576,6 +833,31 @@ class ProductionMonitor:
             error_trend=error_trend,
         )
 
+    def set_exception_status(self, exception_id: str, status: str, save: bool = True) -> None:
+        """Change exception lifecycle status
+
+        Status changes must go through this method so that the dashboard's
+        per-status counters stay in sync with the records.
+
+        Args:
+            exception_id: Exception ID
+            status: New status (new/active/resolved/ignored)
+            save: Persist data after the change
+
+        Example:
+            monitor.set_exception_status("abc123", ExceptionStatus.ACTIVE.value)
+        """
+        if exception_id not in self.exceptions:
+            raise ValueError(f"Exception not found: {exception_id}")
+
+        exception = self.exceptions[exception_id]
+        self._status_counts[exception.status] -= 1
+        self._status_counts[status] += 1
+        exception.status = status
+
+        if save:
+            self._save_data()
+
     def resolve_exception(self, exception_id: str, resolution_notes: str) -> None:
         """Mark exception as resolved
 
@@ -589,11 +871,9 @@ class ProductionMonitor:
                 resolution_notes="Fixed by updating timeout configuration"
             )
         """
-        if exception_id not in self.exceptions:
-            raise ValueError(f"Exception not found: {exception_id}")
+        self.set_exception_status(exception_id, ExceptionStatus.RESOLVED.value, save=False)
 
         exception = self.exceptions[exception_id]
-        exception.status = ExceptionStatus.RESOLVED.value
         exception.resolved_at = datetime.now().isoformat()
         exception.resolution_notes = resolution_notes
 
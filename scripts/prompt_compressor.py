@@ -15,25 +15,108 @@ Security:
 - Input size limits to prevent resource exhaustion
 - Regex timeout protection against ReDoS attacks
 - Secret pattern detection and filtering
+
+Batch/streaming:
+- compress_many(): memoized batch compression across a process pool
+- compress_iter(): chunk-wise compression at sentence boundaries for
+  inputs larger than MAX_INPUT_SIZE
 """
 
 import hashlib
 import logging
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import json
 
+try:
+    from scripts.parallel_scan import map_chunks
+    from scripts.token_counter import count_tokens
+except ImportError:
+    from parallel_scan import map_chunks
+    from token_counter import count_tokens
+
 # Security configuration
 MAX_INPUT_SIZE = 1_000_000  # 1MB max input
 REGEX_TIMEOUT = 1.0  # 1 second timeout for regex operations
 
+# Batch/streaming configuration
+RESULT_CACHE_SIZE = 512  # Memoized results per compressor
+PARALLEL_MIN_CHARS = 200_000  # Below this, a process pool costs more than it saves
+STREAM_CHUNK_CHARS = 64_000  # Target chunk size for compress_iter
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
 
+class PatternMatcher:
+    """
+    Single-pass multi-pattern literal replacer.
+
+    All literals are compiled into one alternation regex (longest first, so
+    longer phrases win over their prefixes) and rewritten in a single
+    ``re.sub`` with a lookup callback. Cost no longer grows with one scan
+    per dictionary entry.
+
+    Entries are ``(literal, replacement, label, ignore_case)``. Earlier
+    entries win when literals are identical. Literals of the form
+    ``" word "`` replaced by ``" "`` match as ``"word "`` preceded by a space,
+    so adjacent matches ("the a") do not compete for the shared space.
+    """
+
+    def __init__(self, entries: List[Tuple[str, str, str, bool]]):
+        self._exact: Dict[str, Tuple[str, str]] = {}
+        self._folded: Dict[str, Tuple[str, str]] = {}
+        alternatives: Dict[str, int] = {}
+
+        for literal, replacement, label, ignore_case in entries:
+            if not literal:
+                continue
+            if len(literal) > 2 and literal[0] == " " and literal[-1] == " " and replacement == " ":
+                literal, replacement, prefix = literal[1:], "", "(?<= )"
+            else:
+                prefix = ""
+
+            table = self._folded if ignore_case else self._exact
+            key = literal.lower() if ignore_case else literal
+            if key in table:
+                continue
+            table[key] = (replacement, label)
+
+            escaped = re.escape(literal)
+            alternative = prefix + (f"(?i:{escaped})" if ignore_case else escaped)
+            alternatives.setdefault(alternative, len(literal))
+
+        self._size = len(self._exact) + len(self._folded)
+        ordered = sorted(alternatives, key=lambda alt: alternatives[alt], reverse=True)
+        self._regex: Optional[re.Pattern] = re.compile("|".join(ordered)) if ordered else None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def apply(self, text: str) -> Tuple[str, List[str]]:
+        """Rewrite ``text`` in one pass; returns (result, labels in first-hit order)."""
+        if self._regex is None:
+            return text, []
+
+        applied: Dict[str, None] = {}
+
+        def replace(match: re.Match) -> str:
+            found = match.group(0)
+            entry = self._exact.get(found) or self._folded.get(found.lower())
+            if entry is None:  # pragma: no cover - every alternative has an entry
+                return found
+            applied[entry[1]] = None
+            return entry[0]
+
+        return self._regex.sub(replace, text), list(applied)
+
+
 @dataclass
 class CompressionResult:
     """Result of prompt compression"""
@@ -71,7 +154,9 @@ class PromptCompressor:
         self.learned_patterns_path = Path("RUNS/learned_compression_patterns.json")
         self.learned_patterns = self._load_learned_patterns()
 
-        # Performance optimization: Pre-compile regex patterns
+        # Performance optimization: learned patterns + abbreviations share one
+        # single-pass matcher, rebuilt only when the proven pattern set changes
+        self.pattern_version = 0
         self._compiled_abbrevs = self._compile_abbreviations()
         self._compiled_rules = self._compile_rules()
 
@@ -82,6 +167,11 @@ class PromptCompressor:
             re.compile(r"secret", re.IGNORECASE),
             re.compile(r"token", re.IGNORECASE),
         ]
+        # One combined scan for batch/stream paths
+        self._secret_scan = re.compile("|".join(p.pattern for p in self._secret_patterns), re.IGNORECASE)
+
+        # Memoized results keyed by (text hash, level, pattern version, target)
+        self._result_cache: "OrderedDict[Tuple[str, str, int, Optional[float]], CompressionResult]" = OrderedDict()
 
     def _load_abbreviations(self) -> Dict[str, str]:
         """Load common abbreviations for token reduction."""
@@ -177,18 +267,28 @@ class PromptCompressor:
                 return {}
         return {}
 
-    def _compile_abbreviations(self) -> List[Tuple[re.Pattern, str]]:
-        """Pre-compile abbreviation patterns for performance (50-60% speedup)."""
-        compiled = []
-        # Sort by length (longest first) to avoid partial replacements
-        sorted_abbrevs = sorted(self.abbreviations.items(), key=lambda x: len(x[0]), reverse=True)
-        for full, abbrev in sorted_abbrevs:
-            try:
-                pattern = re.compile(re.escape(full), re.IGNORECASE)
-                compiled.append((pattern, abbrev))
-            except re.error as e:
-                logger.warning(f"Failed to compile pattern for '{full}': {e}")
-        return compiled
+    def _proven_patterns(self) -> Dict[str, Tuple[str, str]]:
+        """Learned patterns eligible for use (success rate >= 80%)."""
+        return {
+            pattern_id: (data["before"], data["after"])
+            for pattern_id, data in self.learned_patterns.items()
+            if data.get("success_rate", 0) >= 80 and data.get("before")
+        }
+
+    def _compile_abbreviations(self) -> PatternMatcher:
+        """Compile learned patterns and abbreviations into one single-pass matcher."""
+        self._matcher_source = self.learned_patterns
+        self._matcher_patterns = self._proven_patterns()
+        self.pattern_version += 1
+
+        # Learned patterns first: exact, case-sensitive, highest confidence
+        entries = [
+            (before, after, f"learned:{pattern_id}", False) for pattern_id, (before, after) in self._matcher_patterns.items()
+        ]
+        entries.extend(
+            (full, abbrev, f"abbrev:{re.escape(full)}->{abbrev}", True) for full, abbrev in self.abbreviations.items()
+        )
+        return PatternMatcher(entries)
 
     def _compile_rules(self) -> List[Tuple[re.Pattern, str, str]]:
         """Pre-compile compression rule patterns for performance."""
@@ -258,6 +358,10 @@ class PromptCompressor:
                     "Consider removing sensitive data before compression."
                 )
 
+        return self._compress_text(prompt, target_reduction)
+
+    def _compress_text(self, prompt: str, target_reduction: Optional[float] = None) -> CompressionResult:
+        """Compression pipeline without size validation or secret scanning."""
         if not prompt or not prompt.strip():
             return CompressionResult(
                 original=prompt,
@@ -279,27 +383,20 @@ class PromptCompressor:
 
         original_tokens = self._estimate_tokens(original)
 
-        # Step 1: Apply learned patterns first (highest confidence)
-        compressed, rules = self._apply_learned_patterns(compressed)
-        applied_rules.extend(rules)
-
-        # Early termination check (15-25% speedup)
-        if self._check_target_reached(original_tokens, compressed, target_reduction):
-            return self._build_result(original, compressed, applied_rules)
-
-        # Step 2: Apply abbreviations (pre-compiled for 50-60% speedup)
+        # Step 1-2: Learned patterns and abbreviations in a single pass
         compressed, rules = self._apply_abbreviations_optimized(compressed)
         applied_rules.extend(rules)
 
+        # Early termination check (15-25% speedup)
         if self._check_target_reached(original_tokens, compressed, target_reduction):
-            return self._build_result(original, compressed, applied_rules)
+            return self._build_result(original, compressed, applied_rules, original_tokens)
 
         # Step 3: Apply regex-based compression rules (pre-compiled)
         compressed, rules = self._apply_compression_rules_optimized(compressed)
         applied_rules.extend(rules)
 
         if self._check_target_reached(original_tokens, compressed, target_reduction):
-            return self._build_result(original, compressed, applied_rules)
+            return self._build_result(original, compressed, applied_rules, original_tokens)
 
         # Step 4: Structure optimization
         compressed, rules = self._optimize_structure(compressed)
@@ -308,7 +405,180 @@ class PromptCompressor:
         # Step 5: Remove trailing/leading whitespace
         compressed = compressed.strip()
 
-        return self._build_result(original, compressed, applied_rules)
+        return self._build_result(original, compressed, applied_rules, original_tokens)
+
+    def compress_many(
+        self,
+        prompts: List[str],
+        target_reduction: Optional[float] = None,
+        workers: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[CompressionResult, Exception]]:
+        """
+        Compress a batch of prompts, memoized and optionally in parallel.
+
+        Results are cached by (text hash, compression level, pattern-set
+        version, target), so repeated prompts are compressed once. Cache
+        misses run across a process pool when their total size reaches
+        PARALLEL_MIN_CHARS; smaller batches run inline.
+
+        Args:
+            prompts: Prompt texts
+            target_reduction: As in compress()
+            workers: Process count (None = CPU count, 1 = always inline)
+            return_exceptions: Put per-prompt errors (e.g. oversize input)
+                in the result list instead of raising
+
+        Returns:
+            Results in input order
+        """
+        results: List[Union[CompressionResult, Exception, None]] = [None] * len(prompts)
+        pending: Dict[Tuple[str, str, int, Optional[float]], List[int]] = {}
+
+        for index, prompt in enumerate(prompts):
+            if len(prompt) > MAX_INPUT_SIZE:
+                error = ValueError(f"Input exceeds maximum size: {len(prompt)} > {MAX_INPUT_SIZE} bytes")
+                if not return_exceptions:
+                    raise error
+                results[index] = error
+                continue
+            key = self._cache_key(prompt, target_reduction)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.setdefault(key, []).append(index)
+
+        misses = [prompts[indexes[0]] for indexes in pending.values()]
+        if misses:
+            flagged = sum(1 for text in misses if self._secret_scan.search(text))
+            if flagged:
+                logger.warning(
+                    f"Potential secrets detected in {flagged} of {len(misses)} prompt(s). "
+                    "Consider removing sensitive data before compression."
+                )
+
+        for (key, indexes), outcome in zip(pending.items(), self._run_batch(misses, target_reduction, workers)):
+            if isinstance(outcome, CompressionResult):
+                self._cache_put(key, outcome)
+            elif not return_exceptions:
+                raise outcome
+            for index in indexes:
+                results[index] = outcome
+
+        return results  # type: ignore[return-value]
+
+    def compress_iter(
+        self,
+        source: Union[str, Iterable[str]],
+        target_reduction: Optional[float] = None,
+        chunk_chars: int = STREAM_CHUNK_CHARS,
+    ) -> Iterator[CompressionResult]:
+        """
+        Compress a large prompt chunk by chunk at sentence boundaries.
+
+        The input is never held in memory as a whole, so it is not bound by
+        MAX_INPUT_SIZE; each chunk is at most ``chunk_chars``. Chunk results
+        are stripped, so join them with a single space to rebuild the text.
+
+        Args:
+            source: Text, or an iterable of text pieces (e.g. an open file)
+            target_reduction: As in compress()
+            chunk_chars: Maximum chunk size (<= MAX_INPUT_SIZE)
+
+        Yields:
+            One CompressionResult per chunk
+
+        Example:
+            >>> with open("big_prompt.txt", encoding="utf-8") as f:
+            ...     compressed = " ".join(r.compressed for r in compressor.compress_iter(f))
+        """
+        if not 0 < chunk_chars <= MAX_INPUT_SIZE:
+            raise ValueError(f"chunk_chars must be between 1 and {MAX_INPUT_SIZE}")
+
+        pieces: Iterable[str] = (
+            (source[i : i + chunk_chars] for i in range(0, len(source), chunk_chars)) if isinstance(source, str) else source
+        )
+
+        buffer = ""
+        for piece in pieces:
+            buffer += piece
+            while len(buffer) >= chunk_chars:
+                cut = self._chunk_boundary(buffer, chunk_chars)
+                yield self._compress_chunk(buffer[:cut], target_reduction)
+                buffer = buffer[cut:]
+
+        if buffer.strip():
+            yield self._compress_chunk(buffer, target_reduction)
+
+    @staticmethod
+    def _chunk_boundary(text: str, limit: int) -> int:
+        """Cut position <= limit: last sentence end, else last whitespace, else limit."""
+        window = text[:limit]
+        boundary = None
+        for match in SENTENCE_BOUNDARY.finditer(window):
+            boundary = match.end()
+        if boundary:
+            return boundary
+        space = max(window.rfind(" "), window.rfind("\n"))
+        return space + 1 if space > 0 else limit
+
+    def _compress_chunk(self, chunk: str, target_reduction: Optional[float]) -> CompressionResult:
+        key = self._cache_key(chunk, target_reduction)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        if self._secret_scan.search(chunk):
+            logger.warning("Potential secret detected in prompt chunk. Consider removing sensitive data.")
+        result = self._compress_text(chunk, target_reduction)
+        self._cache_put(key, result)
+        return result
+
+    def _run_batch(
+        self, prompts: List[str], target_reduction: Optional[float], workers: Optional[int]
+    ) -> List[Union[CompressionResult, Exception]]:
+        """Compress cache misses inline or across a process pool."""
+        return list(
+            map_chunks(
+                partial(_compress_in_worker, target_reduction=target_reduction),
+                prompts,
+                workers=workers,
+                chunk_size=1,
+                initializer=_init_worker,
+                initargs=(self.compression_level, self.learned_patterns),
+                inline_job=partial(self._compress_outcomes, target_reduction=target_reduction),
+                parallel=sum(map(len, prompts)) >= PARALLEL_MIN_CHARS,
+            )
+        )
+
+    def _compress_outcomes(
+        self, prompts: List[str], target_reduction: Optional[float]
+    ) -> List[Union[CompressionResult, Exception]]:
+        """Compress each prompt, returning its error instead of raising."""
+        outcomes: List[Union[CompressionResult, Exception]] = []
+        for prompt in prompts:
+            try:
+                outcomes.append(self._compress_text(prompt, target_reduction))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    def _cache_key(self, text: str, target_reduction: Optional[float]) -> Tuple[str, str, int, Optional[float]]:
+        if self._matcher_source is not self.learned_patterns:
+            self._compiled_abbrevs = self._compile_abbreviations()
+        digest = hashlib.sha256(text.encode("utf-8", errors="surrogatepass")).hexdigest()
+        return digest, self.compression_level, self.pattern_version, target_reduction
+
+    def _cache_get(self, key: Tuple[str, str, int, Optional[float]]) -> Optional[CompressionResult]:
+        result = self._result_cache.get(key)
+        if result is not None:
+            self._result_cache.move_to_end(key)
+        return result
+
+    def _cache_put(self, key: Tuple[str, str, int, Optional[float]], result: CompressionResult) -> None:
+        self._result_cache[key] = result
+        if len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
 
     def _check_target_reached(self, original_tokens: int, compressed: str, target_reduction: float) -> bool:
         """Check if target compression ratio has been reached (early termination)."""
@@ -316,9 +586,12 @@ class PromptCompressor:
         current_reduction = ((original_tokens - compressed_tokens) / original_tokens * 100) if original_tokens > 0 else 0.0
         return current_reduction >= target_reduction
 
-    def _build_result(self, original: str, compressed: str, applied_rules: List[str]) -> CompressionResult:
+    def _build_result(
+        self, original: str, compressed: str, applied_rules: List[str], original_tokens: Optional[int] = None
+    ) -> CompressionResult:
         """Build CompressionResult with metrics."""
-        original_tokens = self._estimate_tokens(original)
+        if original_tokens is None:
+            original_tokens = self._estimate_tokens(original)
         compressed_tokens = self._estimate_tokens(compressed)
         savings_pct = ((original_tokens - compressed_tokens) / original_tokens * 100) if original_tokens > 0 else 0.0
 
@@ -331,38 +604,16 @@ class PromptCompressor:
             compression_rules=applied_rules,
         )
 
-    def _apply_learned_patterns(self, text: str) -> Tuple[str, List[str]]:
-        """Apply learned compression patterns from successful interactions."""
-        applied = []
-        result = text
-
-        for pattern_id, pattern_data in self.learned_patterns.items():
-            if pattern_data.get("success_rate", 0) >= 80:  # Only use proven patterns
-                before = pattern_data["before"]
-                after = pattern_data["after"]
-
-                if before in result:
-                    result = result.replace(before, after)
-                    applied.append(f"learned:{pattern_id}")
-
-        return result, applied
-
     def _apply_abbreviations(self, text: str) -> Tuple[str, List[str]]:
         """Apply abbreviation dictionary (legacy method for backwards compatibility)."""
         return self._apply_abbreviations_optimized(text)
 
     def _apply_abbreviations_optimized(self, text: str) -> Tuple[str, List[str]]:
-        """Apply pre-compiled abbreviation patterns (50-60% faster)."""
-        applied = []
-        result = text
-
-        # Use pre-compiled patterns
-        for pattern, abbrev in self._compiled_abbrevs:
-            if pattern.search(result):
-                result = pattern.sub(abbrev, result)
-                applied.append(f"abbrev:{pattern.pattern}->{abbrev}")
-
-        return result, applied
+        """Apply learned patterns and abbreviations with the single-pass matcher."""
+        if self._matcher_source is not self.learned_patterns:
+            # learned_patterns was replaced wholesale; resync the matcher
+            self._compiled_abbrevs = self._compile_abbreviations()
+        return self._compiled_abbrevs.apply(text)
 
     def _apply_compression_rules(self, text: str) -> Tuple[str, List[str]]:
         """Apply regex-based compression rules (legacy method)."""
@@ -373,10 +624,10 @@ class PromptCompressor:
         applied = []
         result = text
 
-        # Use pre-compiled patterns
+        # Use pre-compiled patterns (subn: one scan per rule instead of search + sub)
         for pattern, replacement, rule_name in self._compiled_rules:
-            if pattern.search(result):
-                result = pattern.sub(replacement, result)
+            result, count = pattern.subn(replacement, result)
+            if count:
                 applied.append(f"rule:{rule_name}")
 
         return result, applied
@@ -401,30 +652,12 @@ class PromptCompressor:
 
     def _estimate_tokens(self, text: str) -> int:
         """
-        Estimate token count (improved approximation).
-
-        Based on OpenAI/Anthropic tokenization patterns:
-        - Average English word: ~1.3 tokens
-        - Punctuation: ~1 token each
-        - Numbers: ~1 token each
-        - Special chars: variable
+        Count tokens with the shared token counter.
 
-        More accurate: use tiktoken library (optional dependency)
+        Uses the local BPE vocabulary when installed, otherwise the
+        word/punctuation heuristic (see token_counter.estimate_tokens).
         """
-        # Count words
-        words = text.split()
-        word_tokens = len(words)
-
-        # Count punctuation
-        punctuation = len(re.findall(r"[.,;:!?()]", text))
-
-        # Count numbers
-        numbers = len(re.findall(r"\d+", text))
-
-        # Improved estimate: each word ~1 token, punctuation ~0.5, numbers ~1
-        estimated = int(word_tokens + punctuation * 0.5 + numbers * 0.5)
-
-        return max(estimated, 1)  # At least 1 token
+        return max(count_tokens(text), 1)  # At least 1 token
 
     def learn_from_success(self, original: str, compressed: str, success: bool) -> bool:
         """
@@ -458,6 +691,9 @@ class PromptCompressor:
             pattern["total_count"] += 1
             pattern["success_rate"] = (pattern["success_count"] / pattern["total_count"]) * 100
 
+            if self._proven_patterns() != self._matcher_patterns:
+                self._compiled_abbrevs = self._compile_abbreviations()
+
             return self._save_learned_patterns()
         except Exception as e:
             logger.error(f"Failed to learn from success: {e}")
@@ -477,6 +713,22 @@ class PromptCompressor:
         }
 
 
+# Process pool worker state (one compressor per worker process)
+_worker_compressor: Optional[PromptCompressor] = None
+
+
+def _init_worker(compression_level: str, learned_patterns: Dict) -> None:
+    """Build the worker's compressor with the parent's pattern set."""
+    global _worker_compressor
+    _worker_compressor = PromptCompressor(compression_level=compression_level)
+    _worker_compressor.learned_patterns = learned_patterns
+    _worker_compressor._compiled_abbrevs = _worker_compressor._compile_abbreviations()
+
+
+def _compress_in_worker(prompts: List[str], target_reduction: Optional[float]) -> List[Union[CompressionResult, Exception]]:
+    return _worker_compressor._compress_outcomes(prompts, target_reduction)  # type: ignore[union-attr]
+
+
 # Convenience function
 def compress_prompt(prompt: str, level: str = "medium") -> str:
     """
@@ -123,6 +123,7 @@ def apply_compression(contract: dict, config: dict) -> Tuple[dict, List[Dict[str
         - enabled: bool (default: False)
         - compression_level: light|medium|aggressive (default: medium)
         - auto_learn: bool (default: True)
+        - workers: int (default: CPU count; large batches use a process pool)
         - report_path: str (default: RUNS/{task_id}/compression_report.json)
 
     Example:
@@ -146,42 +147,44 @@ def apply_compression(contract: dict, config: dict) -> Tuple[dict, List[Dict[str
 
     compression_stats = []
 
-    # Compress each prompt
-    for loc in prompts:
-        try:
-            result = compressor.compress(loc.original_prompt)
+    # Compress all prompts in one memoized batch (duplicates compressed once)
+    results = compressor.compress_many(
+        [loc.original_prompt for loc in prompts],
+        workers=config.get("workers"),
+        return_exceptions=True,
+    )
+    commands = {cmd.get("id"): cmd for cmd in reversed(contract.get("commands", []))}
 
-            # Find the command in contract
-            for cmd in contract.get("commands", []):
-                if cmd.get("id") == loc.command_id:
-                    # Replace prompt with compressed version
-                    args = cmd.get("exec", {}).get("args", [])
-                    if loc.arg_index < len(args):
-                        args[loc.arg_index] = result.compressed
-
-                    break
-
-            # Track statistics
-            compression_stats.append(
-                {
-                    "command_id": loc.command_id,
-                    "context": loc.context,
-                    "original_tokens": result.original_tokens,
-                    "compressed_tokens": result.compressed_tokens,
-                    "savings_pct": result.savings_pct,
-                    "rules_applied": len(result.compression_rules),
-                }
-            )
-
-        except Exception as e:
+    for loc, result in zip(prompts, results):
+        if isinstance(result, Exception):
             # Log error but continue with other prompts
             compression_stats.append(
                 {
                     "command_id": loc.command_id,
                     "context": loc.context,
-                    "error": str(e),
+                    "error": str(result),
                 }
             )
+            continue
+
+        # Replace prompt with compressed version
+        cmd = commands.get(loc.command_id)
+        if cmd is not None:
+            args = cmd.get("exec", {}).get("args", [])
+            if loc.arg_index < len(args):
+                args[loc.arg_index] = result.compressed
+
+        # Track statistics
+        compression_stats.append(
+            {
+                "command_id": loc.command_id,
+                "context": loc.context,
+                "original_tokens": result.original_tokens,
+                "compressed_tokens": result.compressed_tokens,
+                "savings_pct": result.savings_pct,
+                "rules_applied": len(result.compression_rules),
+            }
+        )
 
     return contract, compression_stats
 
@@ -3,16 +3,36 @@
 Safe Token Optimizer
 Multi-Stage Verification Framework 검증 결과 기반 구현
 60-70% 안전한 압축 (94% 위험한 압축 대신)
+
+캐시 정책:
+- 엔트리 검증: (mtime, size) 일치 시 즉시 사용, 불일치 시 content hash 비교
+- TTL 기반 tier 강등 (hot -> warm -> cold -> 삭제) + 바이트 예산 LRU 제거
+- 증분 저장: 변경분만 JSONL 저널에 추가, 주기적으로 compaction
 """
 
+import atexit
 import json
 import hashlib
+import os
+import time
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, Tuple
+from typing import Callable, Dict, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    from scripts.token_counter import get_token_counter
+except ImportError:
+    from token_counter import get_token_counter
+
+TIERS = ("hot", "warm", "cold")
+RACY_WINDOW_SECONDS = 2.0  # mtime이 캐시 시점과 가까우면 hash로 재검증
+SWEEP_INTERVAL_SECONDS = 60.0
+TOUCH_BATCH_SIZE = 64  # 이만큼 쌓이면 touch 기록을 한 번에 저널에 추가
+TOUCH_FIELDS = ("last_access", "access_count", "mtime_ns", "size", "cached_at")
+
 
 class CompressionLevel(Enum):
     """압축 수준 정의"""
@@ -44,15 +64,36 @@ class SafeTokenOptimizer:
     3-Tier 메모리 시스템 + 점진적 압축
     """
 
-    def __init__(self, project_root: Path = None):
+    def __init__(
+        self,
+        project_root: Path = None,
+        max_cache_bytes: int = 32 * 1024 * 1024,
+        hot_max_bytes: int = 4 * 1024 * 1024,
+        hot_ttl: timedelta = timedelta(hours=1),
+        warm_ttl: timedelta = timedelta(days=1),
+        cold_ttl: timedelta = timedelta(days=7),
+        clock: Callable[[], float] = time.time,
+    ):
         self.project_root = project_root or Path.cwd()
         self.cache_dir = self.project_root / ".smart_cache"
         self.cache_dir.mkdir(exist_ok=True)
-
-        # 3-Tier 메모리 시스템
-        self.hot_cache = {}  # Level 1: 즉시 접근 (메모리)
-        self.warm_cache = {}  # Level 2: 요약 (파일)
-        self.cold_cache = {}  # Level 3: 전체 내용 (파일)
+        self.journal_file = self.cache_dir / "smart_cache.jsonl"
+
+        # 3-Tier 메모리 시스템 (각 tier는 LRU 순서: 오래된 것이 앞)
+        self.hot_cache: "OrderedDict[str, Dict]" = OrderedDict()  # Level 1: 최근 접근
+        self.warm_cache: "OrderedDict[str, Dict]" = OrderedDict()  # Level 2: hot_ttl 경과
+        self.cold_cache: "OrderedDict[str, Dict]" = OrderedDict()  # Level 3: warm_ttl 경과
+        self._tiers = {"hot": self.hot_cache, "warm": self.warm_cache, "cold": self.cold_cache}
+        self._tier_bytes = {tier: 0 for tier in TIERS}
+
+        # 캐시 정책
+        self.max_cache_bytes = max_cache_bytes
+        self.hot_max_bytes = hot_max_bytes
+        self.ttl = {"hot": hot_ttl.total_seconds(), "warm": warm_ttl.total_seconds(), "cold": cold_ttl.total_seconds()}
+        self._clock = clock
+        self._last_sweep = 0.0
+        self._journal_records = 0
+        self._pending_touches: Dict[str, Dict] = {}  # key -> 아직 저널에 쓰지 않은 TOUCH_FIELDS
 
         # 안전 임계값 (Framework 검증 결과)
         self.SAFE_COMPRESSION = CompressionLevel.BALANCED  # 65%
@@ -60,33 +101,204 @@ class SafeTokenOptimizer:
         self.INFORMATION_THRESHOLD = 0.85  # 최소 85% 정보 보존
 
         # 통계
-        self.stats = {"total_reads": 0, "cache_hits": 0, "tokens_saved": 0, "information_preserved": []}
+        self.stats = {
+            "total_reads": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "tier_hits": {tier: 0 for tier in TIERS},
+            "stale_invalidations": 0,
+            "evictions": 0,
+            "demotions": 0,
+            "bytes_saved": 0,
+            "tokens_saved": 0,
+            "information_preserved": [],
+        }
 
         self.load_cache()
+        atexit.register(self.flush)
 
+    # ------------------------------------------------------------------
+    # Persistence (JSONL journal)
+    # ------------------------------------------------------------------
     def load_cache(self):
-        """캐시 로드"""
-        cache_file = self.cache_dir / "smart_cache.json"
-        if cache_file.exists():
-            with open(cache_file, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
-                # Hot cache는 최근 1시간 내 접근된 항목만
-                for key, entry in cache_data.items():
-                    timestamp = datetime.fromisoformat(entry["timestamp"])
-                    if datetime.now() - timestamp < timedelta(hours=1):
-                        self.hot_cache[key] = entry
-                    elif datetime.now() - timestamp < timedelta(days=1):
-                        self.warm_cache[key] = entry
-                    else:
-                        self.cold_cache[key] = entry
+        """캐시 로드 (저널 재생, 없으면 기존 smart_cache.json에서 이전)"""
+        entries: Dict[str, Dict] = {}
+        legacy_file = self.cache_dir / "smart_cache.json"
+
+        if self.journal_file.exists():
+            with open(self.journal_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # 중단된 쓰기의 마지막 줄
+                    self._journal_records += 1
+                    if record.get("op") == "put":
+                        entries[record["key"]] = record["entry"]
+                    elif record.get("op") == "del":
+                        entries.pop(record["key"], None)
+                    elif record.get("op") == "touch" and record["key"] in entries:
+                        entries[record["key"]].update((f, record[f]) for f in TOUCH_FIELDS if f in record)
+        elif legacy_file.exists():
+            with open(legacy_file, "r", encoding="utf-8") as f:
+                for key, entry in json.load(f).items():
+                    entry.setdefault("last_access", datetime.fromisoformat(entry["timestamp"]).timestamp())
+                    entries[key] = entry
+
+        # 마지막 접근 시각 기준으로 tier 배치 (오래된 것부터 = LRU 순서)
+        now = self._clock()
+        for key, entry in sorted(entries.items(), key=lambda item: item[1].get("last_access", 0)):
+            age = now - entry.get("last_access", 0)
+            if age < self.ttl["hot"]:
+                self._place(key, entry, "hot")
+            elif age < self.ttl["warm"]:
+                self._place(key, entry, "warm")
+            elif age < self.ttl["cold"]:
+                self._place(key, entry, "cold")
 
     def save_cache(self):
-        """캐시 저장"""
-        cache_file = self.cache_dir / "smart_cache.json"
-        all_cache = {**self.cold_cache, **self.warm_cache, **self.hot_cache}
+        """캐시 전체를 저널 스냅샷으로 다시 쓰기 (compaction, 접근 정보 포함)"""
+        tmp = self.journal_file.with_suffix(".tmp")
+        count = 0
+        with open(tmp, "w", encoding="utf-8") as f:
+            for store in self._tiers.values():
+                for key, entry in store.items():
+                    f.write(json.dumps({"op": "put", "key": key, "entry": entry}, ensure_ascii=False) + "\n")
+                    count += 1
+        os.replace(tmp, self.journal_file)
+        self._journal_records = count
+        self._pending_touches.clear()  # 스냅샷에 이미 포함됨
+
+    def flush(self):
+        """모아 둔 touch 기록을 저널에 추가"""
+        if not self._pending_touches:
+            return
+        records = [{"op": "touch", "key": key, **fields} for key, fields in self._pending_touches.items()]
+        self._pending_touches.clear()
+        self._write_journal(records)
+
+    def close(self):
+        """touch 기록을 저장하고 종료 hook 해제"""
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def __enter__(self) -> "SafeTokenOptimizer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _touch(self, key: str, entry: Dict, *fields: str) -> None:
+        """캐시 히트 시 바뀐 필드를 모아 두고 TOUCH_BATCH_SIZE마다 한 번에 저널에 추가"""
+        self._pending_touches.setdefault(key, {}).update((f, entry[f]) for f in fields)
+        if len(self._pending_touches) >= TOUCH_BATCH_SIZE:
+            self.flush()
+
+    def _append_journal(self, op: str, key: str, entry: Optional[Dict] = None) -> None:
+        """변경분만 저널에 추가 (op: put은 entry 전체, del)"""
+        self._pending_touches.pop(key, None)  # put/del이 이전 touch를 대체
+        record = {"op": op, "key": key}
+        if entry is not None:
+            record["entry"] = entry
+        self._write_journal([record])
+
+    def _write_journal(self, records) -> None:
+        """저널에 기록 추가; 저널이 라이브 엔트리의 2배를 넘으면 compaction"""
+        with open(self.journal_file, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        self._journal_records += len(records)
+
+        if self._journal_records > max(2 * self.cache_entries, 100):
+            self.save_cache()
 
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(all_cache, f, indent=2, default=str, ensure_ascii=False)
+    # ------------------------------------------------------------------
+    # Tier management
+    # ------------------------------------------------------------------
+    @property
+    def cache_entries(self) -> int:
+        return sum(len(store) for store in self._tiers.values())
+
+    @property
+    def cache_bytes(self) -> int:
+        return sum(self._tier_bytes.values())
+
+    @staticmethod
+    def _entry_bytes(entry: Dict) -> int:
+        if "bytes" not in entry:
+            entry["bytes"] = len(entry.get("summary", "").encode("utf-8"))
+        return entry["bytes"]
+
+    def _place(self, key: str, entry: Dict, tier: str) -> None:
+        self._remove(key)
+        self._tiers[tier][key] = entry
+        self._tier_bytes[tier] += self._entry_bytes(entry)
+
+    def _remove(self, key: str) -> Optional[Dict]:
+        for tier, store in self._tiers.items():
+            entry = store.pop(key, None)
+            if entry is not None:
+                self._tier_bytes[tier] -= self._entry_bytes(entry)
+                return entry
+        return None
+
+    def _lookup(self, key: str) -> Optional[Tuple[str, Dict]]:
+        for tier, store in self._tiers.items():
+            if key in store:
+                return tier, store[key]
+        return None
+
+    def _sweep(self, now: float) -> None:
+        """TTL 기반 강등 (hot -> warm -> cold -> 삭제), 최대 SWEEP_INTERVAL마다 한 번"""
+        if now - self._last_sweep < SWEEP_INTERVAL_SECONDS:
+            return
+        self._last_sweep = now
+
+        for tier, lower in (("cold", None), ("warm", "cold"), ("hot", "warm")):
+            expired = [
+                key for key, entry in self._tiers[tier].items() if now - entry.get("last_access", 0) >= self.ttl[tier]
+            ]
+            for key in expired:
+                if lower is None:
+                    self._evict(key)
+                else:
+                    self._place(key, self._tiers[tier][key], lower)
+                    self.stats["demotions"] += 1
+
+    def _enforce_budget(self) -> None:
+        """hot 예산 초과 시 LRU 강등, 전체 예산 초과 시 cold -> warm -> hot 순으로 LRU 제거"""
+        while self._tier_bytes["hot"] > self.hot_max_bytes and len(self.hot_cache) > 1:
+            key, entry = next(iter(self.hot_cache.items()))
+            self._place(key, entry, "warm")
+            self.stats["demotions"] += 1
+
+        for tier in ("cold", "warm", "hot"):
+            store = self._tiers[tier]
+            while self.cache_bytes > self.max_cache_bytes and store:
+                self._evict(next(iter(store)))
+
+    def _evict(self, key: str) -> None:
+        if self._remove(key) is not None:
+            self.stats["evictions"] += 1
+            self._append_journal("del", key)
+
+    def _is_current(self, key: str, file_path: Path, entry: Dict, stat: os.stat_result, now: float) -> bool:
+        """(mtime, size)로 빠르게 검증, mtime이 다르거나 racy하면 content hash로 확인"""
+        if entry.get("size") != stat.st_size:
+            return False  # 크기가 다르면 내용도 다름
+        racy = abs(entry.get("cached_at", 0) - stat.st_mtime) < RACY_WINDOW_SECONDS
+        if entry.get("mtime_ns") == stat.st_mtime_ns and not racy:
+            return True
+
+        raw = file_path.read_bytes()
+        if hashlib.sha256(raw).hexdigest() != entry.get("content_hash"):
+            return False
+
+        # 내용은 동일 (touch 등) - stat 정보 갱신, racy 구간을 벗어났으면 검증 시각도 갱신
+        entry["mtime_ns"] = stat.st_mtime_ns
+        if now - stat.st_mtime >= RACY_WINDOW_SECONDS:
+            entry["cached_at"] = now
+        self._touch(key, entry, "mtime_ns", "cached_at")
+        return True
 
     def calculate_information_preservation(self, original: str, compressed: str) -> float:
         """정보 보존율 계산"""
@@ -280,37 +492,50 @@ class SafeTokenOptimizer:
             (content, metrics)
         """
         self.stats["total_reads"] += 1
+        now = self._clock()
+        self._sweep(now)
 
         # 캐시 키 생성
         cache_key = str(file_path)
 
-        # Level 1: Hot Cache (메모리)
-        if cache_key in self.hot_cache:
-            self.stats["cache_hits"] += 1
-            entry = self.hot_cache[cache_key]
-            return entry["summary"], {
-                "source": "hot_cache",
-                "compression": entry["compression_level"],
-                "tokens_saved": entry["tokens_saved"],
-                "information_preserved": entry["preservation_rate"],
-            }
-
-        # Level 2: Warm Cache (요약)
-        if cache_key in self.warm_cache:
-            self.stats["cache_hits"] += 1
-            entry = self.warm_cache[cache_key]
-            # Hot cache로 승격
-            self.hot_cache[cache_key] = entry
-            return entry["summary"], {
-                "source": "warm_cache",
-                "compression": entry["compression_level"],
-                "tokens_saved": entry["tokens_saved"],
-                "information_preserved": entry["preservation_rate"],
-            }
-
-        # Level 3: Cold Cache 또는 새로 읽기
-        if file_path.exists():
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
+        try:
+            stat = file_path.stat()
+        except OSError:
+            stat = None
+
+        # Hot/Warm/Cold Cache - 파일이 바뀌지 않았을 때만 사용
+        found = self._lookup(cache_key)
+        if found is not None:
+            tier, entry = found
+            if stat is not None and self._is_current(cache_key, file_path, entry, stat, now):
+                self.stats["cache_hits"] += 1
+                self.stats["tier_hits"][tier] += 1
+                self.stats["bytes_saved"] += entry.get("original_bytes", 0) - self._entry_bytes(entry)
+                self.stats["tokens_saved"] += entry["tokens_saved"]
+                entry["last_access"] = now
+                entry["access_count"] = entry.get("access_count", 0) + 1
+                # 재시작 후 TTL sweep이 원래 put 시각이 아닌 마지막 접근 기준으로 동작하도록 기록
+                self._touch(cache_key, entry, "last_access", "access_count")
+                # Hot cache로 승격 (LRU 맨 뒤)
+                self._place(cache_key, entry, "hot")
+                self._enforce_budget()
+                return entry["summary"], {
+                    "source": f"{tier}_cache",
+                    "compression": entry["compression_level"],
+                    "tokens_saved": entry["tokens_saved"],
+                    "information_preserved": entry["preservation_rate"],
+                }
+
+            # 파일이 변경되었거나 삭제됨 - 오래된 요약 폐기
+            self._remove(cache_key)
+            self.stats["stale_invalidations"] += 1
+            self._append_journal("del", cache_key)
+
+        # 새로 읽기
+        if stat is not None:
+            raw = file_path.read_bytes()
+            content = raw.decode("utf-8", errors="ignore")
+            self.stats["cache_misses"] += 1
 
             # 압축 수준 결정 (파일 크기 기반)
             file_size = len(content)
@@ -327,30 +552,37 @@ class SafeTokenOptimizer:
             compressed, preservation = self.smart_compress(content, compression_level)
 
             # 토큰 절감량 계산 (대략적)
-            original_tokens = len(content) // 4
-            compressed_tokens = len(compressed) // 4
+            original_tokens, compressed_tokens = get_token_counter().count_many([content, compressed])
             tokens_saved = original_tokens - compressed_tokens
 
-            # 캐시 엔트리 생성
+            # 캐시 엔트리 생성 (검증용 mtime/size/hash 포함)
             entry = {
-                "content_hash": hashlib.md5(content.encode()).hexdigest(),
+                "content_hash": hashlib.sha256(raw).hexdigest(),
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "cached_at": now,
                 "summary": compressed,
+                "bytes": len(compressed.encode("utf-8")),
+                "original_bytes": len(raw),
                 "compression_level": compression_level.name,
                 "tokens_saved": tokens_saved,
                 "preservation_rate": preservation,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.fromtimestamp(now).isoformat(),
+                "last_access": now,
                 "access_count": 1,
             }
 
-            # Warm cache에 저장 (다음 접근 시 빠르게)
-            self.warm_cache[cache_key] = entry
+            # Warm cache에 저장 (다음 접근 시 hot으로 승격)
+            self._place(cache_key, entry, "warm")
+            self._enforce_budget()
 
             # 통계 업데이트
             self.stats["tokens_saved"] += tokens_saved
+            self.stats["bytes_saved"] += entry["original_bytes"] - entry["bytes"]
             self.stats["information_preserved"].append(preservation)
 
-            # 캐시 저장
-            self.save_cache()
+            # 캐시 저장 (변경분만 저널에 추가)
+            self._append_journal("put", cache_key, entry)
 
             return compressed, {
                 "source": "fresh_read",
@@ -401,20 +633,24 @@ class SafeTokenOptimizer:
         }
 
         # 메트릭
-        original_size = len(json.dumps(session_data))
-        optimized_size = len(json.dumps(optimized))
+        original_json = json.dumps(session_data)
+        optimized_json = json.dumps(optimized)
+        original_size = len(original_json)
+        optimized_size = len(optimized_json)
         compression = 1 - (optimized_size / max(original_size, 1))
+        original_tokens, optimized_tokens = get_token_counter().count_many([original_json, optimized_json])
 
         return optimized, {
             "original_size": original_size,
             "optimized_size": optimized_size,
             "compression": f"{compression * 100:.1f}%",
-            "tokens_saved": (original_size - optimized_size) // 4,
+            "tokens_saved": original_tokens - optimized_tokens,
         }
 
     def get_optimization_report(self) -> Dict:
         """최적화 리포트 생성"""
         avg_preservation = sum(self.stats["information_preserved"]) / max(len(self.stats["information_preserved"]), 1)
+        lookups = self.stats["cache_hits"] + self.stats["cache_misses"]
 
         return {
             "summary": {
@@ -428,6 +664,18 @@ class SafeTokenOptimizer:
                 "hot_cache_items": len(self.hot_cache),
                 "warm_cache_items": len(self.warm_cache),
                 "cold_cache_items": len(self.cold_cache),
+                "cache_bytes": self.cache_bytes,
+                "max_cache_bytes": self.max_cache_bytes,
+            },
+            "cache_efficiency": {
+                "hits": self.stats["cache_hits"],
+                "misses": self.stats["cache_misses"],
+                "hit_rate": f"{(self.stats['cache_hits'] / max(lookups, 1)) * 100:.1f}%",
+                "tier_hits": dict(self.stats["tier_hits"]),
+                "stale_invalidations": self.stats["stale_invalidations"],
+                "evictions": self.stats["evictions"],
+                "demotions": self.stats["demotions"],
+                "bytes_saved": self.stats["bytes_saved"],
             },
             "safety_validation": {
                 "compression_level": self.SAFE_COMPRESSION.name,
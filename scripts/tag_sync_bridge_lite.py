@@ -14,17 +14,24 @@ Features:
 - Hierarchical tag mapping (#req/auth-001)
 - Traceability links (SPEC -> TEST -> CODE -> DOC)
 - Dataview query generation
+- Idempotent sync: a manifest (<vault>/.tag_sync_manifest.json) records the
+  rendered-note hash per tag, so only notes whose content changed are written
+- Incremental sync (--since): only files changed since the last run are
+  re-extracted; tags from unchanged files come from the manifest
 
 Example:
     $ python scripts/tag_sync_bridge_lite.py
+    $ python scripts/tag_sync_bridge_lite.py --since
     $ python scripts/tag_sync_bridge_lite.py --tag-id REQ-AUTH-001
     $ python scripts/tag_sync_bridge_lite.py --vault-path "C:/Obsidian"
 """
 
+import hashlib
+import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 try:
     from dataview_generator import DataviewGenerator
@@ -90,6 +97,19 @@ class TagSyncBridgeLite(ObsidianBridge):
         self.mermaid_generator = MermaidGraphGenerator()
         self.resource_manager.register_resource(self.mermaid_generator)
 
+        # Sync manifest: tag key -> rendered note hash, file -> extracted tags
+        self.manifest_path = self.vault_path / ".tag_sync_manifest.json"
+        self.last_sync_stats: Dict[str, int] = {}
+
+    def _note_path_for(self, tag: CodeTag) -> Path:
+        """Note path for a TAG (e.g. requirements/REQ-AUTH-001.md)."""
+        target_dir, note_prefix = {
+            "SPEC": (self.requirements_dir, "REQ"),
+            "CODE": (self.implementations_dir, "IMPL"),
+            "TEST": (self.tests_dir, "TEST"),
+        }.get(tag.tag_type, (self.docs_dir, "DOC"))
+        return target_dir / f"{note_prefix}-{tag.tag_id.upper()}.md"
+
     def create_tag_note(self, tag: CodeTag) -> Path:
         """Create Obsidian note for @TAG.
 
@@ -109,48 +129,73 @@ class TagSyncBridgeLite(ObsidianBridge):
             ... ))
             PosixPath('vault/requirements/REQ-AUTH-001.md')
         """
-        # Determine target directory
-        if tag.tag_type == "SPEC":
-            target_dir = self.requirements_dir
-            note_prefix = "REQ"
-        elif tag.tag_type == "CODE":
-            target_dir = self.implementations_dir
-            note_prefix = "IMPL"
-        elif tag.tag_type == "TEST":
-            target_dir = self.tests_dir
-            note_prefix = "TEST"
-        else:  # DOC
-            target_dir = self.docs_dir
-            note_prefix = "DOC"
-
-        # Generate filename
-        filename = f"{note_prefix}-{tag.tag_id.upper()}.md"
-        note_path = target_dir / filename
+        note_path = self._note_path_for(tag)
 
         # Check if note already exists
         if note_path.exists():
             # Update existing note
             return self._update_tag_note(note_path, tag)
 
-        # Generate hierarchical tag
-        hierarchical_tag = self._generate_hierarchical_tag(tag)
+        # Write note
+        note_path.write_text(self._render_tag_note([tag], datetime.now().strftime("%Y-%m-%d")), encoding="utf-8")
+
+        return note_path
+
+    def _render_tag_note(self, tags: List[CodeTag], created: str) -> str:
+        """Render the full note for all occurrences of one TAG.
+
+        Deterministic for the same tags and creation date, so its hash can
+        tell whether a note needs rewriting.
+
+        Args:
+            tags: Occurrences of one (tag_type, tag_id), primary first.
+            created: Creation date (YYYY-MM-DD).
+
+        Returns:
+            Markdown note text.
+        """
+        tag = tags[0]
 
         # Generate frontmatter
         frontmatter = {
-            "tags": [hierarchical_tag, f"type/{tag.tag_type.lower()}", "status/active"],
+            "tags": [self._generate_hierarchical_tag(tag), f"type/{tag.tag_type.lower()}", "status/active"],
             "tag_id": tag.tag_id,
             "tag_type": tag.tag_type,
             "code_location": f"{tag.file_path}:{tag.line_number}",
-            "created": datetime.now().strftime("%Y-%m-%d"),
+            "created": created,
         }
 
-        # Generate content
-        content = self._generate_tag_note_content(tag)
+        # Generate content (further occurrences listed under Code Locations)
+        content = self._add_locations(self._generate_tag_note_content(tag, created), tags[1:])
 
-        # Write note
-        note_path.write_text(self._format_markdown(frontmatter, content), encoding="utf-8")
+        return self._format_markdown(frontmatter, content)
 
-        return note_path
+    def _add_locations(self, content: str, tags: List[CodeTag]) -> str:
+        """Add missing location references to note content.
+
+        Args:
+            content: Note content.
+            tags: CodeTag objects whose locations should be listed.
+
+        Returns:
+            Updated content (unchanged when all locations are present).
+        """
+        for tag in tags:
+            location_line = f"- `{tag.file_path}:{tag.line_number}`"
+
+            if "## Code Locations" in content:
+                # Append to existing locations section
+                if location_line not in content:
+                    content = content.replace("## Code Locations\n", f"## Code Locations\n{location_line}\n", 1)
+            else:
+                # Add locations section before "## Context"
+                locations_section = f"\n## Code Locations\n{location_line}\n"
+                if "## Context" in content:
+                    content = content.replace("## Context", f"{locations_section}\n## Context", 1)
+                else:
+                    content += locations_section
+
+        return content
 
     def _update_tag_note(self, note_path: Path, tag: CodeTag) -> Path:
         """Update existing TAG note with new location.
@@ -165,23 +210,10 @@ class TagSyncBridgeLite(ObsidianBridge):
         # Read existing content
         content = note_path.read_text(encoding="utf-8")
 
-        # Add new location reference
-        location_line = f"- `{tag.file_path}:{tag.line_number}`"
-
-        if "## Code Locations" in content:
-            # Append to existing locations section
-            if location_line not in content:
-                content = content.replace("## Code Locations\n", f"## Code Locations\n{location_line}\n")
-        else:
-            # Add locations section before "## Context"
-            locations_section = f"\n## Code Locations\n{location_line}\n"
-            if "## Context" in content:
-                content = content.replace("## Context", f"{locations_section}\n## Context")
-            else:
-                content += locations_section
-
-        # Write updated content
-        note_path.write_text(content, encoding="utf-8")
+        # Add new location reference (write only if something changed)
+        updated = self._add_locations(content, [tag])
+        if updated != content:
+            note_path.write_text(updated, encoding="utf-8")
 
         return note_path
 
@@ -208,11 +240,12 @@ class TagSyncBridgeLite(ObsidianBridge):
 
         return f"{tag_prefix}/{tag.tag_id.lower()}"
 
-    def _generate_tag_note_content(self, tag: CodeTag) -> str:
+    def _generate_tag_note_content(self, tag: CodeTag, created: Optional[str] = None) -> str:
         """Generate content for TAG note.
 
         Args:
             tag: CodeTag object.
+            created: Creation date (default: today).
 
         Returns:
             Note content string.
@@ -245,20 +278,26 @@ class TagSyncBridgeLite(ObsidianBridge):
 
         # Metadata
         content += "---\n\n"
-        content += f"**Created**: {datetime.now().strftime('%Y-%m-%d')}\n"
+        content += f"**Created**: {created or datetime.now().strftime('%Y-%m-%d')}\n"
         content += f"**Type**: {tag.tag_type}\n"
         content += f"**ID**: {tag.tag_id}\n"
 
         return content
 
-    def sync_all_tags(self, tag_id: Optional[str] = None) -> Dict[str, List[Path]]:
+    def sync_all_tags(self, tag_id: Optional[str] = None, since_last_run: bool = False) -> Dict[str, List[Path]]:
         """Synchronize all @TAG annotations to Obsidian.
 
+        Notes are rendered from every occurrence of a TAG and written only
+        when the rendered hash differs from the manifest. Existing notes are
+        never overwritten; missing code locations are merged into them.
+
         Args:
             tag_id: Optional specific TAG ID to sync.
+            since_last_run: Only re-extract files changed since the last run
+                and sync the tags they contain (or contained).
 
         Returns:
-            Dict mapping TAG types to list of created note paths.
+            Dict mapping TAG types to list of synced note paths.
 
         Example:
             >>> bridge.sync_all_tags()
@@ -268,22 +307,147 @@ class TagSyncBridgeLite(ObsidianBridge):
                 'CODE': [PosixPath('vault/implementations/IMPL-AUTH-001.md')]
             }
         """
-        # Extract tags from project
+        manifest = self._load_manifest()
+        old_files: Dict[str, Dict] = manifest["files"]
+        files: Dict[str, Dict] = {}
+        affected: set = set()
+        file_keys: Dict[str, set] = {}  # tag keys each re-extracted or deleted file touches
+        scanned = 0
+
+        # Extract tags (changed files only in since mode)
+        for rel_path, file_path, stat in self._iter_source_files():
+            record = old_files.get(rel_path)
+            unchanged = record and record["mtime_ns"] == stat.st_mtime_ns and record["size"] == stat.st_size
+            if since_last_run and unchanged:
+                files[rel_path] = record
+                continue
+
+            scanned += 1
+            tags = self.tag_extractor.extract_tags_from_file(file_path)
+            files[rel_path] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "tags": [[t.tag_type, t.tag_id, t.line_number, t.context] for t in tags],
+            }
+            touched = {f"{t.tag_type}:{t.tag_id}" for t in tags}
+            if record:
+                touched.update(f"{t[0]}:{t[1]}" for t in record["tags"])
+            file_keys[rel_path] = touched
+            affected.update(touched)
+
+        # Tags from deleted files
+        for rel_path in set(old_files) - set(files):
+            file_keys[rel_path] = {f"{t[0]}:{t[1]}" for t in old_files[rel_path]["tags"]}
+            affected.update(file_keys[rel_path])
+
+        # Group every occurrence by tag key
+        by_key: Dict[str, List[CodeTag]] = {}
+        for rel_path in sorted(files):
+            for tag_type, tid, line_number, context in files[rel_path]["tags"]:
+                tag = CodeTag(tag_type, tid, self.tag_extractor.project_root / rel_path, line_number, context)
+                by_key.setdefault(f"{tag_type}:{tid}", []).append(tag)
+
+        keys = set(by_key) if not since_last_run else affected & set(by_key)
+        persisted_files = files
         if tag_id:
-            tags = self.tag_extractor.find_tags_by_id(tag_id)
-        else:
-            tags = self.tag_extractor.extract_tags_from_directory()
-
-        # Group by type
+            unsynced = {key for key in keys if key.split(":", 1)[1] != tag_id}
+            keys -= unsynced
+            # Files with tags this filtered run skipped keep their previous record
+            # (or none), so a later since_last_run pass still sees them as changed
+            persisted_files = dict(files)
+            for rel_path, touched in file_keys.items():
+                if touched & unsynced:
+                    if rel_path in old_files:
+                        persisted_files[rel_path] = old_files[rel_path]
+                    else:
+                        persisted_files.pop(rel_path, None)
+
+        # Render notes; queue writes only for notes whose content changed
         created_notes: Dict[str, List[Path]] = {"SPEC": [], "CODE": [], "TEST": [], "DOC": []}
+        pending: Dict[Path, str] = {}
+        today = datetime.now().strftime("%Y-%m-%d")
+        for key in sorted(keys):
+            tags = by_key[key]
+            note_path = self._note_path_for(tags[0])
+            entry = manifest["notes"].get(key, {})
+            created = entry.get("created", today)
+            rendered = self._render_tag_note(tags, created)
+            rendered_hash = hashlib.sha256(rendered.encode("utf-8")).hexdigest()
+
+            if entry.get("hash") != rendered_hash or not note_path.exists():
+                if note_path.exists():
+                    existing = note_path.read_text(encoding="utf-8")
+                    updated = self._add_locations(existing, tags)
+                    if updated != existing:
+                        pending[note_path] = updated
+                else:
+                    pending[note_path] = rendered
 
-        # Create notes for each tag
-        for tag in tags:
-            note_path = self.create_tag_note(tag)
-            created_notes[tag.tag_type].append(note_path)
-
+            manifest["notes"][key] = {
+                "hash": rendered_hash,
+                "note": note_path.relative_to(self.vault_path).as_posix(),
+                "created": created,
+            }
+            created_notes.setdefault(tags[0].tag_type, []).append(note_path)
+
+        # Drop manifest entries for tags that no longer exist (notes are kept)
+        for key in [key for key in manifest["notes"] if key not in by_key]:
+            del manifest["notes"][key]
+
+        self._write_notes(pending)
+        manifest["files"] = persisted_files
+        manifest["last_run"] = datetime.now().isoformat()
+        self._save_manifest(manifest)
+
+        self.last_sync_stats = {
+            "files_scanned": scanned,
+            "tags_checked": len(keys),
+            "notes_written": len(pending),
+            "notes_unchanged": len(keys) - len(pending),
+        }
         return created_notes
 
+    def _iter_source_files(self) -> Iterator[Tuple[str, Path, os.stat_result]]:
+        """(relative path, path, stat) of source files, filtered like TagExtractorLite."""
+        root = self.tag_extractor.project_root
+        extensions = set(self.tag_extractor.file_extensions)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".") and d != "node_modules"]
+            for filename in filenames:
+                if filename.startswith(".") or os.path.splitext(filename)[1] not in extensions:
+                    continue
+                file_path = Path(dirpath) / filename
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+                yield file_path.relative_to(root).as_posix(), file_path, stat
+
+    def _load_manifest(self) -> Dict:
+        """Load sync manifest (empty when missing or unreadable)."""
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            if manifest.get("version") == 1:
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {"version": 1, "last_run": None, "notes": {}, "files": {}}
+
+    def _save_manifest(self, manifest: Dict) -> None:
+        tmp = self.manifest_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(manifest, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.manifest_path)
+
+    def _write_notes(self, pending: Dict[Path, str]) -> None:
+        """Write queued notes in one batch, grouped by directory.
+
+        Each note is replaced atomically so Obsidian never sees a partial file.
+        """
+        for note_path in sorted(pending):
+            tmp = note_path.with_name(f".{note_path.name}.tmp")
+            tmp.write_text(pending[note_path], encoding="utf-8")
+            os.replace(tmp, note_path)
+
     def generate_traceability_map(self, tag_id: str) -> Optional[Path]:
         """Generate traceability map for TAG chain.
 
@@ -354,6 +518,12 @@ class TagSyncBridgeLite(ObsidianBridge):
         total = sum(len(notes) for notes in created_notes.values())
 
         print(f"[INFO] Synchronized {total} @TAG annotations to Obsidian")
+        if self.last_sync_stats:
+            stats = self.last_sync_stats
+            print(
+                f"[INFO] Files scanned: {stats['files_scanned']}, notes written: {stats['notes_written']}, "
+                f"unchanged: {stats['notes_unchanged']}"
+            )
         print("")
 
         for tag_type, notes in sorted(created_notes.items()):
@@ -402,6 +572,7 @@ def main() -> int:
         epilog="""
 Examples:
   python scripts/tag_sync_bridge_lite.py
+  python scripts/tag_sync_bridge_lite.py --since
   python scripts/tag_sync_bridge_lite.py --tag-id REQ-AUTH-001
   python scripts/tag_sync_bridge_lite.py --vault-path "C:/Obsidian"
   python scripts/tag_sync_bridge_lite.py --generate-map auth-001
@@ -411,6 +582,7 @@ Examples:
     parser.add_argument("--vault-path", type=str, help="Obsidian Vault path")
     parser.add_argument("--tag-id", type=str, help="Sync specific TAG ID only")
     parser.add_argument("--generate-map", type=str, help="Generate traceability map for TAG ID")
+    parser.add_argument("--since", action="store_true", help="Only sync tags from files changed since the last run")
 
     args = parser.parse_args()
 
@@ -450,10 +622,12 @@ Examples:
                 # Sync all tags
                 if args.tag_id:
                     print(f"[INFO] Syncing TAG ID: {args.tag_id}")
+                elif args.since:
+                    print("[INFO] Syncing @TAG annotations from files changed since the last run")
                 else:
                     print("[INFO] Syncing all @TAG annotations")
 
-                created_notes = bridge.sync_all_tags(tag_id=args.tag_id)
+                created_notes = bridge.sync_all_tags(tag_id=args.tag_id, since_last_run=args.since)
                 bridge.print_sync_summary(created_notes)
 
         return 0
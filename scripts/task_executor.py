@@ -32,7 +32,8 @@ from typing import Any, Dict, List
 
 # Import prompt compression integration, progress tracking, and error handling
 sys.path.insert(0, str(Path(__file__).parent))
-from prompt_task_integration import apply_compression, save_compression_report
+from prompt_task_integration import apply_compression, extract_prompts, save_compression_report
+from token_counter import get_token_counter
 from progress_tracker import create_progress_tracker
 from error_handler import ErrorCatalog
 from notification_utils import send_slack_notification
@@ -434,6 +435,25 @@ def run_exec(cmd: str, args: Any, cwd: Path, env: Dict[str, str], timeout: int =
         raise TaskExecutorError(f"Command timeout ({timeout}s): {cmd}") from exc
 
 
+def estimate_contract_cost(contract: Dict[str, Any]) -> float:
+    """Estimate contract cost in USD for the budget gate
+
+    Commands with ``cost_estimate_usd`` use that value. When telemetry sets
+    ``cost_per_1k_tokens``, the prompts of the remaining commands are priced
+    by their token count (shared token counter).
+    """
+    commands = contract.get("commands", [])
+    estimated = sum(float(cmd.get("cost_estimate_usd", 0)) for cmd in commands)
+
+    rate = float(contract.get("telemetry", {}).get("cost_per_1k_tokens", 0))
+    if rate:
+        priced = {cmd.get("id", "unknown") for cmd in commands if "cost_estimate_usd" in cmd}
+        prompts = [loc.original_prompt for loc in extract_prompts(contract) if loc.command_id not in priced]
+        estimated += sum(get_token_counter().count_many(prompts)) / 1000 * rate
+
+    return estimated
+
+
 def execute_contract(contract_path: str, mode: str = "execute"):
     """Execute task contract"""
     root = Path(".").resolve()
@@ -492,7 +512,7 @@ def execute_contract(contract_path: str, mode: str = "execute"):
             # Continue with uncompressed prompts
 
     # === 1. Budget gate (pre-check) ===
-    estimated_cost = sum(float(cmd.get("cost_estimate_usd", 0)) for cmd in contract.get("commands", []))
+    estimated_cost = estimate_contract_cost(contract)
     budget = float(contract.get("telemetry", {}).get("cost_budget_usd", 0))
     warn_threshold = float(contract.get("telemetry", {}).get("cost_warn_threshold", 0))
     hard_limit = bool(contract.get("telemetry", {}).get("cost_hard_limit", True))
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Task Graph - Cross-phase dependency graph for Spec-Kit/YAML task plans
+
+Builds task-level dependencies so executors can start any task whose
+inputs are ready instead of waiting for whole phases to finish.
+
+Dependency sources
+- Explicit: ``(depends: T001, T003)`` in tasks.md, ``depends_on``/``needs`` in YAML
+- File overlap: tasks touching the same file run in plan order
+- Phase order: sequential (non-[P]) tasks wait for the tasks before them in
+  their phase, mirroring phase-by-phase execution
+- Blocking phases: act as barriers for everything before and after them
+
+Usage:
+    graph = TaskGraph([TaskNode("T001", "Setup", 0, 0, files={"src/app.py"}), ...])
+    for wave in graph.waves():
+        ...
+    print(graph.format_report(durations))
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+DEPENDS_PATTERN = re.compile(r"\(\s*(?:depends(?:\s+on)?|after)\s*:?\s*([^)]*)\)", re.IGNORECASE)
+TASK_ID_PATTERN = re.compile(r"\b[A-Z][A-Z0-9]*-?\d+\b")
+FILE_PATTERN = re.compile(
+    r"(?<![\w/.-])((?:[\w.-]+/)+[\w.-]+\.\w+|[\w-]+\.(?:py|md|ya?ml|json|toml|ts|tsx|js|jsx|sql|sh|txt|cfg|ini))(?![\w/])"
+)
+
+DEFAULT_DURATION = 1.0
+
+
+def extract_dependencies(text: str) -> Tuple[List[str], str]:
+    """Extract explicit dependency ids from a task description
+
+    Args:
+        text: Task description, e.g. "Add API (depends: T001, T002)"
+
+    Returns:
+        (dependency ids, description with the marker removed)
+    """
+    dependencies: List[str] = []
+    for match in DEPENDS_PATTERN.finditer(text):
+        for dep in TASK_ID_PATTERN.findall(match.group(1)):
+            if dep not in dependencies:
+                dependencies.append(dep)
+    cleaned = DEPENDS_PATTERN.sub("", text)
+    return dependencies, re.sub(r"\s{2,}", " ", cleaned).strip()
+
+
+def extract_file_paths(text: str) -> Set[str]:
+    """Extract file paths mentioned in a task description"""
+    return {match.rstrip(".") for match in FILE_PATTERN.findall(text)}
+
+
+def normalize_dependencies(value: object) -> List[str]:
+    """Normalize a YAML depends_on/needs value to a list of ids"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [item.strip() for item in re.split(r"[,\s]+", value) if item.strip()]
+    return [str(item).strip() for item in value if str(item).strip()]  # type: ignore[union-attr]
+
+
+@dataclass
+class TaskNode:
+    """A task as seen by the dependency graph"""
+
+    task_id: str
+    phase: str
+    phase_index: int
+    position: int
+    is_parallel: bool = False
+    blocking: bool = False
+    dependencies: List[str] = field(default_factory=list)
+    files: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class CriticalPath:
+    """Longest duration-weighted chain through the graph"""
+
+    task_ids: List[str]
+    length: float
+
+
+class TaskGraph:
+    """Directed acyclic graph of task dependencies
+
+    ``edges[task][dependency]`` holds the reason for each edge
+    ("explicit", "file:<path>", "order" or "blocking").
+    """
+
+    def __init__(self, nodes: Iterable[TaskNode]):
+        self.nodes: Dict[str, TaskNode] = {}
+        for node in sorted(nodes, key=lambda n: (n.phase_index, n.position)):
+            if node.task_id in self.nodes:
+                raise ValueError(f"Duplicate task id in plan: {node.task_id}")
+            self.nodes[node.task_id] = node
+        self.edges: Dict[str, Dict[str, str]] = {task_id: {} for task_id in self.nodes}
+        self.dependents: Dict[str, List[str]] = {task_id: [] for task_id in self.nodes}
+        self.unknown_dependencies: Dict[str, List[str]] = {}
+
+        self._add_explicit_edges()
+        self._add_phase_edges()
+        self._add_file_edges()
+        self._order = self._topological_order()
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    def _add_edge(self, task_id: str, dependency: str, reason: str) -> None:
+        if task_id == dependency or dependency in self.edges[task_id]:
+            return
+        self.edges[task_id][dependency] = reason
+        self.dependents[dependency].append(task_id)
+
+    def _add_explicit_edges(self) -> None:
+        for node in self.nodes.values():
+            for dependency in node.dependencies:
+                if dependency in self.nodes:
+                    self._add_edge(node.task_id, dependency, "explicit")
+                else:
+                    self.unknown_dependencies.setdefault(node.task_id, []).append(dependency)
+
+    def _add_phase_edges(self) -> None:
+        phases: Dict[int, List[TaskNode]] = {}
+        for node in self.nodes.values():
+            phases.setdefault(node.phase_index, []).append(node)
+
+        earlier: List[TaskNode] = []
+        barrier: List[TaskNode] = []
+        for phase_index in sorted(phases):
+            members = phases[phase_index]
+            blocking = any(node.blocking for node in members)
+
+            for node in members:
+                for dependency in earlier if blocking else barrier:
+                    self._add_edge(node.task_id, dependency.task_id, "blocking")
+
+            # Within a phase, [P] tasks run first and sequential tasks follow in order
+            parallel = [node for node in members if node.is_parallel]
+            previous: Optional[TaskNode] = None
+            for node in members:
+                if node.is_parallel:
+                    continue
+                for dependency in [previous] if previous else parallel:
+                    self._add_edge(node.task_id, dependency.task_id, "order")
+                previous = node
+
+            earlier.extend(members)
+            if blocking:
+                barrier = list(members)
+
+    def _add_file_edges(self) -> None:
+        last_touch: Dict[str, str] = {}
+        for node in self.nodes.values():
+            for path in sorted(node.files):
+                previous = last_touch.get(path)
+                if previous is not None:
+                    self._add_edge(node.task_id, previous, f"file:{path}")
+                last_touch[path] = node.task_id
+
+    def _topological_order(self) -> List[str]:
+        remaining = {task_id: len(deps) for task_id, deps in self.edges.items()}
+        ready = [task_id for task_id in self.nodes if remaining[task_id] == 0]
+        order: List[str] = []
+        while ready:
+            task_id = ready.pop(0)
+            order.append(task_id)
+            for dependent in self.dependents[task_id]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(self.nodes):
+            cyclic = sorted(task_id for task_id, count in remaining.items() if count > 0)
+            raise ValueError(f"Dependency cycle detected among tasks: {', '.join(cyclic)}")
+        return order
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def dependencies_of(self, task_id: str) -> List[str]:
+        return list(self.edges[task_id])
+
+    def topological_order(self) -> List[str]:
+        return list(self._order)
+
+    def descendants(self, task_id: str) -> Set[str]:
+        """All tasks that transitively depend on ``task_id``"""
+        seen: Set[str] = set()
+        stack = list(self.dependents[task_id])
+        while stack:
+            current = stack.pop()
+            if current not in seen:
+                seen.add(current)
+                stack.extend(self.dependents[current])
+        return seen
+
+    def waves(self) -> List[List[str]]:
+        """Tasks grouped by earliest start level (unbounded parallelism)"""
+        level: Dict[str, int] = {}
+        for task_id in self._order:
+            level[task_id] = max((level[dep] + 1 for dep in self.edges[task_id]), default=0)
+        grouped: List[List[str]] = []
+        for task_id in self._order:
+            while len(grouped) <= level[task_id]:
+                grouped.append([])
+            grouped[level[task_id]].append(task_id)
+        return grouped
+
+    def critical_path(self, durations: Optional[Mapping[str, float]] = None) -> CriticalPath:
+        """Longest chain by duration (defaults to 1.0 per task)"""
+        if not self.nodes:
+            return CriticalPath(task_ids=[], length=0.0)
+
+        finish: Dict[str, float] = {}
+        via: Dict[str, Optional[str]] = {}
+        for task_id in self._order:
+            best_dep = max(self.edges[task_id], key=lambda dep: finish[dep], default=None)
+            start = finish[best_dep] if best_dep is not None else 0.0
+            finish[task_id] = start + self._duration(task_id, durations)
+            via[task_id] = best_dep
+
+        end: Optional[str] = max(finish, key=lambda task_id: finish[task_id])
+        length = finish[end]  # type: ignore[index]
+        chain: List[str] = []
+        while end is not None:
+            chain.append(end)
+            end = via[end]
+        return CriticalPath(task_ids=list(reversed(chain)), length=length)
+
+    def edge_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for deps in self.edges.values():
+            for reason in deps.values():
+                kind = reason.split(":", 1)[0]
+                counts[kind] = counts.get(kind, 0) + 1
+        return counts
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+    def format_report(self, durations: Optional[Mapping[str, float]] = None) -> str:
+        """Plain-text plan report highlighting what limits wall-clock time"""
+        path = self.critical_path(durations)
+        serial = sum(self._duration(task_id, durations) for task_id in self.nodes)
+        unit = "s" if durations else " units"
+        counts = self.edge_counts()
+
+        lines = [
+            "=" * 60,
+            "TASK PLAN - DEPENDENCY GRAPH",
+            "=" * 60,
+            f"Tasks: {len(self.nodes)}  Edges: {sum(counts.values())} "
+            + " ".join(f"({kind}: {count})" for kind, count in sorted(counts.items())),
+            f"Serial duration: {serial:.2f}{unit}",
+            f"Critical path:   {path.length:.2f}{unit}"
+            + (f"  (max speedup {serial / path.length:.1f}x)" if path.length else ""),
+            "",
+            "Critical path:",
+        ]
+        previous: Optional[str] = None
+        for task_id in path.task_ids:
+            node = self.nodes[task_id]
+            reason = f" <- {self.edges[task_id][previous]}" if previous else ""
+            lines.append(f"  {task_id} [{node.phase}] {self._duration(task_id, durations):.2f}{unit}{reason}")
+            previous = task_id
+
+        lines.append("")
+        lines.append("Waves:")
+        for index, wave in enumerate(self.waves(), start=1):
+            lines.append(f"  {index:>2}: {', '.join(wave)}")
+
+        if self.unknown_dependencies:
+            lines.append("")
+            lines.append("Unknown dependencies (ignored):")
+            for task_id, deps in sorted(self.unknown_dependencies.items()):
+                lines.append(f"  {task_id} -> {', '.join(deps)}")
+
+        return "\n".join(lines)
+
+    def to_mermaid(self, durations: Optional[Mapping[str, float]] = None) -> str:
+        """Mermaid flowchart with the critical path highlighted"""
+        critical = set(self.critical_path(durations).task_ids)
+        lines = ["graph LR"]
+        for task_id in self._order:
+            lines.append(f'    {task_id}["{task_id} ({self.nodes[task_id].phase})"]')
+        for task_id in self._order:
+            for dependency in self.edges[task_id]:
+                arrow = "==>" if task_id in critical and dependency in critical else "-->"
+                lines.append(f"    {dependency} {arrow} {task_id}")
+        if critical:
+            lines.append("    classDef critical fill:#f96,stroke:#333")
+            lines.append(f"    class {','.join(sorted(critical))} critical")
+        return "\n".join(lines)
+
+    def _duration(self, task_id: str, durations: Optional[Mapping[str, float]]) -> float:
+        if durations is None:
+            return DEFAULT_DURATION
+        return float(durations.get(task_id, DEFAULT_DURATION))
+
+
+def build_graph(phases: Sequence[Tuple[str, bool, Sequence[TaskNode]]]) -> TaskGraph:
+    """Convenience wrapper assigning phase indexes and positions
+
+    Args:
+        phases: (phase name, blocking, nodes) in plan order; node phase
+            index/position/blocking are overwritten from the sequence
+    """
+    nodes: List[TaskNode] = []
+    for phase_index, (name, blocking, members) in enumerate(phases):
+        for position, node in enumerate(members):
+            node.phase = name
+            node.phase_index = phase_index
+            node.position = position
+            node.blocking = blocking
+            nodes.append(node)
+    return TaskGraph(nodes)
+
+
+__all__ = [
+    "CriticalPath",
+    "TaskGraph",
+    "TaskNode",
+    "build_graph",
+    "extract_dependencies",
+    "extract_file_paths",
+    "normalize_dependencies",
+]
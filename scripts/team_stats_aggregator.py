@@ -205,9 +205,12 @@ class StatsCollector:
                     self._logger.warning(f"[P6] Found {len(uncached_files)} unverified files")
 
                     # DeepAnalyzer를 사용하여 검증 수행
-                    from deep_analyzer import DeepAnalyzer
+                    from deep_analyzer import AnalysisCache, DeepAnalyzer
 
-                    analyzer = DeepAnalyzer()  # Default settings for full scan
+                    # 내용이 같은 파일은 watcher/backend가 이미 분석한 결과 재사용
+                    analysis_cache = AnalysisCache(self.cache_dir / "analysis")
+                    analysis_cache.prune()
+                    analyzer = DeepAnalyzer(result_cache=analysis_cache)
 
                     for file_path in uncached_files:
                         try:
@@ -34,16 +34,27 @@ import json
 import logging
 import re
 import subprocess
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from scripts.deep_analyzer import definition_units
+    from scripts.parallel_scan import PhaseTimer, ProgressCallback, map_chunks
+except ImportError:
+    from deep_analyzer import definition_units
+    from parallel_scan import PhaseTimer, ProgressCallback, map_chunks
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
 logger = logging.getLogger(__name__)
 
+FUNCTION_METRICS_CACHE_SIZE = 4096  # top-level definitions
+
 
 # ============================================================================
 # Enums
@@ -251,12 +262,19 @@ class TechnicalDebtTracker:
         self.plans: List[RefactoringPlan] = []
         self.progress_reports: List[ProgressReport] = []
 
+        # Function metrics per top-level definition, keyed by source fingerprint
+        self._function_metrics_cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._last_metrics: Optional[Tuple[Path, str, List[Dict[str, Any]]]] = None
+        self.scan_stats: Dict[str, Any] = {}
+
         # Load existing data
         self._load_data()
 
         logger.info(f"TechnicalDebtTracker initialized with data_dir={self.data_dir}")
 
-    def detect_debt(self, path: str = ".") -> List[DebtItem]:
+    def detect_debt(
+        self, path: str = ".", workers: Optional[int] = None, progress: Optional[ProgressCallback] = None
+    ) -> List[DebtItem]:
         """
         Automatically detect technical debt in codebase.
 
@@ -268,40 +286,96 @@ class TechnicalDebtTracker:
 
         Args:
             path: Path to analyze (file or directory)
+            workers: Worker processes (default: CPU count; 1 scans inline)
+            progress: Called with (files done, files total) as files finish
 
         Returns:
             List of detected debt items
         """
-        debt_items = []
+        debt_items = list(self.iter_debt(path, workers=workers, progress=progress))
+
+        self.debt_items.extend(debt_items)
+        logger.info(f"Detected {len(debt_items)} technical debt items")
+
+        return debt_items
+
+    def iter_debt(
+        self, path: str = ".", workers: Optional[int] = None, progress: Optional[ProgressCallback] = None
+    ) -> Iterator[DebtItem]:
+        """
+        Stream detected debt items in file order without storing them.
+
+        Files are analyzed in chunks across a process pool (inline for small
+        trees). After the generator is exhausted, scan_stats holds file and
+        item counts plus per-phase seconds (summed across workers).
+
+        Args:
+            path: Path to analyze (file or directory)
+            workers: Worker processes (default: CPU count; 1 scans inline)
+            progress: Called with (files done, files total) as files finish
+
+        Yields:
+            Detected debt items
+        """
+        timer = PhaseTimer()
+        start = time.perf_counter()
         path_obj = Path(path)
 
-        if path_obj.is_file():
-            files = [path_obj]
-        else:
-            files = list(path_obj.rglob("*.py"))
+        with timer.phase("discover"):
+            if path_obj.is_file():
+                files = [path_obj]
+            else:
+                files = sorted(path_obj.rglob("*.py"))
+
+            # Skip test files and generated code
+            files = [f for f in files if "test_" not in f.name and "__pycache__" not in str(f)]
 
         logger.info(f"Scanning {len(files)} Python files for technical debt...")
 
-        for file_path in files:
-            # Skip test files and generated code
-            if "test_" in file_path.name or "__pycache__" in str(file_path):
-                continue
+        count = 0
+        for items, timings in map_chunks(
+            _scan_debt_chunk,
+            files,
+            workers=workers,
+            initializer=_init_debt_worker,
+            initargs=(self.data_dir,),
+            inline_job=self._scan_files,
+            progress=progress,
+        ):
+            timer.merge(timings)
+            count += len(items)
+            yield from items
+
+        timer.add("total", time.perf_counter() - start)
+        self.scan_stats = {"files": len(files), "debt_items": count, "timings": timer.totals}
+
+    def _scan_files(self, file_paths: List[Path]) -> List[Tuple[List[DebtItem], Dict[str, float]]]:
+        """Scan each file; returns its debt items and per-phase seconds."""
+        results = []
+        for file_path in file_paths:
+            timer = PhaseTimer()
+            results.append((self._scan_file(file_path, timer), timer.totals))
+        return results
+
+    def _scan_file(self, file_path: Path, timer: PhaseTimer) -> List[DebtItem]:
+        """Run all detectors on one file, timing each phase."""
+        debt_items = []
 
-            try:
-                # Detect TODO/FIXME comments
+        try:
+            # Detect TODO/FIXME comments
+            with timer.phase("todo"):
                 debt_items.extend(self._detect_todo_comments(file_path))
 
-                # Detect high complexity
+            # Detect high complexity
+            with timer.phase("complexity"):
                 debt_items.extend(self._detect_high_complexity(file_path))
 
-                # Detect code smells
+            # Detect code smells
+            with timer.phase("smells"):
                 debt_items.extend(self._detect_code_smells(file_path))
 
-            except Exception as e:
-                logger.warning(f"Error analyzing {file_path}: {e}")
-
-        self.debt_items.extend(debt_items)
-        logger.info(f"Detected {len(debt_items)} technical debt items")
+        except Exception as e:
+            logger.warning(f"Error analyzing {file_path}: {e}")
 
         return debt_items
 
@@ -611,28 +685,23 @@ class TechnicalDebtTracker:
         debt_items = []
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(content)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    # Simple complexity estimate based on control flow
-                    complexity = self._calculate_cyclomatic_complexity(node)
-
-                    if complexity > 10:  # Threshold for high complexity
-                        debt_items.append(
-                            DebtItem(
-                                id=f"COMPLEX-{file_path.stem}-{node.name}",
-                                debt_type=DebtType.HIGH_COMPLEXITY,
-                                file_path=str(file_path),
-                                line_number=node.lineno,
-                                description=f"High complexity in function '{node.name}' (complexity: {complexity})",
-                                complexity_score=complexity,
-                                impact_score=min(complexity / 2, 10),
-                                effort_hours=complexity * 0.5,
-                                risk_level=min(complexity / 2, 10),
-                            )
+            for metrics in self._function_metrics(file_path):
+                complexity = metrics["complexity"]
+
+                if complexity > 10:  # Threshold for high complexity
+                    debt_items.append(
+                        DebtItem(
+                            id=f"COMPLEX-{file_path.stem}-{metrics['name']}",
+                            debt_type=DebtType.HIGH_COMPLEXITY,
+                            file_path=str(file_path),
+                            line_number=metrics["line"],
+                            description=f"High complexity in function '{metrics['name']}' (complexity: {complexity})",
+                            complexity_score=complexity,
+                            impact_score=min(complexity / 2, 10),
+                            effort_hours=complexity * 0.5,
+                            risk_level=min(complexity / 2, 10),
                         )
+                    )
 
         except Exception as e:
             logger.debug(f"Error detecting complexity in {file_path}: {e}")
@@ -644,51 +713,85 @@ class TechnicalDebtTracker:
         debt_items = []
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(content)
+            for metrics in self._function_metrics(file_path):
+                name = metrics["name"]
 
-            for node in ast.walk(tree):
                 # Long functions (> 50 lines)
-                if isinstance(node, ast.FunctionDef):
-                    func_lines = node.end_lineno - node.lineno if hasattr(node, "end_lineno") else 0
-                    if func_lines > 50:
-                        debt_items.append(
-                            DebtItem(
-                                id=f"LONG-{file_path.stem}-{node.name}",
-                                debt_type=DebtType.CODE_SMELL,
-                                file_path=str(file_path),
-                                line_number=node.lineno,
-                                description=f"Long function '{node.name}' ({func_lines} lines)",
-                                complexity_score=func_lines / 10,
-                                impact_score=4.0,
-                                effort_hours=func_lines / 10,
-                                risk_level=3.0,
-                            )
+                func_lines = metrics["lines"]
+                if func_lines > 50:
+                    debt_items.append(
+                        DebtItem(
+                            id=f"LONG-{file_path.stem}-{name}",
+                            debt_type=DebtType.CODE_SMELL,
+                            file_path=str(file_path),
+                            line_number=metrics["line"],
+                            description=f"Long function '{name}' ({func_lines} lines)",
+                            complexity_score=func_lines / 10,
+                            impact_score=4.0,
+                            effort_hours=func_lines / 10,
+                            risk_level=3.0,
                         )
+                    )
 
                 # Too many parameters (> 5)
-                if isinstance(node, ast.FunctionDef):
-                    param_count = len(node.args.args)
-                    if param_count > 5:
-                        debt_items.append(
-                            DebtItem(
-                                id=f"PARAMS-{file_path.stem}-{node.name}",
-                                debt_type=DebtType.CODE_SMELL,
-                                file_path=str(file_path),
-                                line_number=node.lineno,
-                                description=f"Too many parameters in '{node.name}' ({param_count} params)",
-                                complexity_score=param_count,
-                                impact_score=3.0,
-                                effort_hours=2.0,
-                                risk_level=2.0,
-                            )
+                param_count = metrics["params"]
+                if param_count > 5:
+                    debt_items.append(
+                        DebtItem(
+                            id=f"PARAMS-{file_path.stem}-{name}",
+                            debt_type=DebtType.CODE_SMELL,
+                            file_path=str(file_path),
+                            line_number=metrics["line"],
+                            description=f"Too many parameters in '{name}' ({param_count} params)",
+                            complexity_score=param_count,
+                            impact_score=3.0,
+                            effort_hours=2.0,
+                            risk_level=2.0,
                         )
+                    )
 
         except Exception as e:
             logger.debug(f"Error detecting code smells in {file_path}: {e}")
 
         return debt_items
 
+    def _function_metrics(self, file_path: Path) -> List[Dict[str, Any]]:
+        """Line, name, complexity, length and parameter count of every function in a file.
+
+        The file is parsed once for both complexity and code smell detection,
+        and only top-level definitions whose source changed since an earlier
+        scan are walked again.
+        """
+        content = file_path.read_text(encoding="utf-8")
+        if self._last_metrics is not None and self._last_metrics[:2] == (file_path, content):
+            return self._last_metrics[2]
+
+        tree = ast.parse(content)
+        functions = []
+        for node, start, fingerprint in definition_units(tree, content):
+            unit_metrics = self._function_metrics_cache.get(fingerprint)
+            if unit_metrics is None:
+                unit_metrics = [
+                    {
+                        "line": child.lineno - start,
+                        "name": child.name,
+                        "complexity": self._calculate_cyclomatic_complexity(child),
+                        "lines": child.end_lineno - child.lineno,
+                        "params": len(child.args.args),
+                    }
+                    for child in ast.walk(node)
+                    if isinstance(child, ast.FunctionDef)
+                ]
+                self._function_metrics_cache[fingerprint] = unit_metrics
+                while len(self._function_metrics_cache) > FUNCTION_METRICS_CACHE_SIZE:
+                    self._function_metrics_cache.popitem(last=False)
+            else:
+                self._function_metrics_cache.move_to_end(fingerprint)
+            functions.extend({**metrics, "line": metrics["line"] + start} for metrics in unit_metrics)
+
+        self._last_metrics = (file_path, content, functions)
+        return functions
+
     def _calculate_cyclomatic_complexity(self, node: ast.FunctionDef) -> int:
         """Calculate cyclomatic complexity for a function."""
         complexity = 1  # Base complexity
@@ -780,6 +883,21 @@ class TechnicalDebtTracker:
         }
 
 
+# Process pool worker state (one tracker per worker process)
+_worker_tracker: Optional[TechnicalDebtTracker] = None
+
+
+def _init_debt_worker(data_dir: Path) -> None:
+    """Build the worker's tracker on the parent's data directory."""
+    global _worker_tracker
+    _worker_tracker = TechnicalDebtTracker(data_dir=data_dir)
+
+
+def _scan_debt_chunk(file_paths: List[Path]):
+    """Pool job: _scan_files with this worker's tracker."""
+    return _worker_tracker._scan_files(file_paths)
+
+
 def main():
     """Demo usage of TechnicalDebtTracker."""
     tracker = TechnicalDebtTracker()
@@ -792,6 +910,8 @@ def main():
     print("\n[1/5] Detecting technical debt...")
     debt_items = tracker.detect_debt(path="scripts/")
     print(f"  Found {len(debt_items)} debt items")
+    timings = ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in tracker.scan_stats["timings"].items())
+    print(f"  Scanned {tracker.scan_stats['files']} files ({timings})")
 
     if debt_items:
         # Quantify
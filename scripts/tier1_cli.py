@@ -46,7 +46,16 @@ import click
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from feature_flags import FeatureFlags
+
+def _feature_flags():
+    """FeatureFlags singleton, imported on first use.
+
+    feature_flags pulls in yaml and reads config; commands that never check
+    a flag (and --help) skip both.
+    """
+    from feature_flags import FeatureFlags
+
+    return FeatureFlags()
 
 
 @click.group()
@@ -88,7 +97,7 @@ def spec(request: str, template: str, quick: bool) -> None:
         $ python scripts/tier1_cli.py spec "Fix login bug" -t bugfix
         $ python scripts/tier1_cli.py spec "Refactor auth" -t refactor -q
     """
-    flags = FeatureFlags()
+    flags = _feature_flags()
 
     # Check if tool is enabled
     if not flags.is_enabled("tier1_integration.tools.spec_builder"):
@@ -170,7 +179,7 @@ def tdd(threshold: Optional[float], strict: Optional[bool], quick: bool) -> None
         $ python scripts/tier1_cli.py tdd --strict
         $ python scripts/tier1_cli.py tdd -q
     """
-    flags = FeatureFlags()
+    flags = _feature_flags()
 
     # Check if tool is enabled
     if not flags.is_enabled("tier1_integration.tools.tdd_enforcer"):
@@ -238,7 +247,7 @@ def tag(tag_chain: tuple, validate: bool, suggest: bool) -> None:
         $ python scripts/tier1_cli.py tag @REQ-001 @IMPL-001 --validate
         $ python scripts/tier1_cli.py tag --suggest
     """
-    flags = FeatureFlags()
+    flags = _feature_flags()
 
     # Check if tool is enabled
     if not flags.is_enabled("tier1_integration.tools.tag_tracer"):
@@ -323,7 +332,7 @@ def status(verbose: bool) -> None:
         $ python scripts/tier1_cli.py status
         $ python scripts/tier1_cli.py status -v
     """
-    flags = FeatureFlags()
+    flags = _feature_flags()
 
     click.echo("=== Tier 1 Integration Status ===")
     click.echo("")
@@ -376,7 +385,7 @@ def disable(tool: str) -> None:
         $ python scripts/tier1_cli.py disable spec_builder
         $ python scripts/tier1_cli.py disable all
     """
-    flags = FeatureFlags()
+    flags = _feature_flags()
 
     if tool == "all":
         flags.emergency_disable()
@@ -1081,7 +1090,7 @@ def enable(tool: str) -> None:
         $ python scripts/tier1_cli.py enable spec_builder
         $ python scripts/tier1_cli.py enable all
     """
-    flags = FeatureFlags()
+    flags = _feature_flags()
 
     if tool == "all":
         flags.emergency_enable()
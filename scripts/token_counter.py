@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Token Counter - Shared token accounting for budgets and savings reports
+
+Counts tokens with a real BPE vocabulary when one is installed locally
+(tiktoken-format ``.tiktoken`` rank file: one ``<base64 token> <rank>``
+per line), otherwise falls back to a heuristic. The vocabulary is loaded
+once per process and counts are memoized by text hash, so repeated
+prompts and file summaries cost a dictionary lookup.
+
+Vocabulary lookup order:
+1. ``vocab_path`` argument
+2. ``DEV_RULES_TOKENIZER_VOCAB`` environment variable
+3. ``config/tokenizer/*.tiktoken``
+
+Backends:
+- "tiktoken": tiktoken installed, Rust encoder built from the local ranks
+- "bpe": pure-Python byte-level BPE with a per-piece cache
+- "heuristic": no vocabulary found
+
+Usage:
+    from token_counter import count_tokens, get_token_counter
+
+    count_tokens("Hello world")
+    get_token_counter().count_many(prompts)
+"""
+
+import base64
+import binascii
+import hashlib
+import math
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import tiktoken
+
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+VOCAB_ENV_VAR = "DEV_RULES_TOKENIZER_VOCAB"
+DEFAULT_VOCAB_DIR = Path(__file__).resolve().parent.parent / "config" / "tokenizer"
+
+# cl100k-style pre-tokenization. tiktoken understands \p{..} classes; the
+# stdlib pattern approximates letters as [^\W\d_] and keeps "_" with punctuation.
+TIKTOKEN_PATTERN = (
+    r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}+|\p{N}{1,3}| ?[^\s\p{L}\p{N}]++[\r\n]*|\s*[\r\n]|\s+(?!\S)|\s+"""
+)
+PIECE_PATTERN = re.compile(
+    r"""'(?i:[sdmt]|ll|ve|re)|(?:[^\r\n\w]|_)?[^\W\d_]+|\d{1,3}| ?(?:[^\s\w]|_)+[\r\n]*|\s*[\r\n]|\s+(?!\S)|\s+"""
+)
+HEURISTIC_PUNCTUATION = re.compile(r"[.,;:!?()]")
+HEURISTIC_NUMBERS = re.compile(r"\d+")
+DENSE_CHARS_PER_WORD = 10  # prose averages ~6 characters per whitespace-separated word
+
+
+def estimate_tokens(text: str) -> int:
+    """Heuristic token estimate used when no vocabulary is installed
+
+    Words count ~1 token, punctuation and numbers ~0.5 each. Dense text
+    (more than DENSE_CHARS_PER_WORD characters per word: minified code,
+    paths, CJK) is floored at ~4 characters per token.
+    """
+    if not text:
+        return 0
+    words = len(text.split())
+    punctuation = len(HEURISTIC_PUNCTUATION.findall(text))
+    numbers = len(HEURISTIC_NUMBERS.findall(text))
+    estimate = int(words + punctuation * 0.5 + numbers * 0.5)
+    if len(text) > DENSE_CHARS_PER_WORD * max(words, 1):
+        return max(estimate, math.ceil(len(text) / 4))
+    return estimate
+
+
+def load_ranks(path: Path) -> Dict[bytes, int]:
+    """Load a tiktoken-format BPE rank file
+
+    Raises:
+        ValueError: If a line is malformed
+    """
+    ranks: Dict[bytes, int] = {}
+    with open(path, "rb") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                token, rank = line.split()
+                ranks[base64.b64decode(token)] = int(rank)
+            except (ValueError, binascii.Error) as exc:
+                raise ValueError(f"{path}:{line_no}: invalid BPE rank entry") from exc
+    return ranks
+
+
+def find_vocab(vocab_path: Optional[Path] = None) -> Optional[Path]:
+    """Resolve the vocabulary file (argument, environment, then config/tokenizer)"""
+    if vocab_path is not None:
+        return Path(vocab_path)
+    env_path = os.environ.get(VOCAB_ENV_VAR)
+    if env_path:
+        return Path(env_path)
+    if DEFAULT_VOCAB_DIR.is_dir():
+        candidates = sorted(DEFAULT_VOCAB_DIR.glob("*.tiktoken"))
+        if candidates:
+            return candidates[0]
+    return None
+
+
+class BPEEncoder:
+    """Pure-Python byte-level BPE encoder (tiktoken merge semantics)
+
+    Pre-tokenized pieces repeat heavily in prompts and source code, so
+    merge results are cached per piece.
+    """
+
+    def __init__(self, ranks: Dict[bytes, int], piece_cache_size: int = 50_000):
+        self.ranks = ranks
+        self.piece_cache_size = piece_cache_size
+        self._piece_cache: Dict[str, int] = {}
+
+    def split(self, text: str) -> List[bytes]:
+        """Split text into BPE tokens (as byte strings)"""
+        tokens: List[bytes] = []
+        for piece in PIECE_PATTERN.findall(text):
+            tokens.extend(self._merge(piece.encode("utf-8", "replace")))
+        return tokens
+
+    def count(self, text: str) -> int:
+        total = 0
+        cache = self._piece_cache
+        for piece in PIECE_PATTERN.findall(text):
+            count = cache.get(piece)
+            if count is None:
+                count = len(self._merge(piece.encode("utf-8", "replace")))
+                if len(cache) < self.piece_cache_size:
+                    cache[piece] = count
+            total += count
+        return total
+
+    def _merge(self, data: bytes) -> List[bytes]:
+        if data in self.ranks:
+            return [data]
+
+        parts = [data[i : i + 1] for i in range(len(data))]
+        ranks = self.ranks
+        while len(parts) > 1:
+            best_rank = None
+            best_index = -1
+            for i in range(len(parts) - 1):
+                rank = ranks.get(parts[i] + parts[i + 1])
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best_rank = rank
+                    best_index = i
+            if best_rank is None:
+                break
+            parts[best_index : best_index + 2] = [parts[best_index] + parts[best_index + 1]]
+        return parts
+
+
+class TokenCounter:
+    """Thread-safe token counter with a hash-keyed LRU memo"""
+
+    def __init__(self, vocab_path: Optional[Path] = None, cache_size: int = 4096):
+        """Initialize TokenCounter
+
+        Args:
+            vocab_path: tiktoken-format rank file (see module docstring for lookup)
+            cache_size: Number of memoized text counts
+        """
+        self.cache_size = cache_size
+        self.vocab_path = find_vocab(vocab_path)
+        self.backend = "heuristic"
+        self._encoder = None
+        self._cache: "OrderedDict[bytes, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"calls": 0, "cache_hits": 0}
+
+        if self.vocab_path is not None:
+            self._load_encoder(self.vocab_path)
+
+    def _load_encoder(self, path: Path) -> None:
+        try:
+            ranks = load_ranks(path)
+        except (OSError, ValueError) as exc:
+            print(f"[WARN] Tokenizer vocabulary unavailable ({exc}); using heuristic token counts")
+            return
+
+        if TIKTOKEN_AVAILABLE:
+            try:
+                self._encoder = tiktoken.Encoding(
+                    name=path.stem, pat_str=TIKTOKEN_PATTERN, mergeable_ranks=ranks, special_tokens={}
+                )
+                self.backend = "tiktoken"
+                return
+            except ValueError:
+                pass  # Rank file not usable by tiktoken, e.g. missing single bytes
+        self._encoder = BPEEncoder(ranks)
+        self.backend = "bpe"
+
+    def count(self, text: str) -> int:
+        """Number of tokens in ``text``"""
+        if not text:
+            return 0
+        key = self._key(text)
+        with self._lock:
+            self.stats["calls"] += 1
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.stats["cache_hits"] += 1
+                return cached
+
+        count = self._encode_count(text)
+        self._remember(key, count)
+        return count
+
+    def count_many(self, texts: Iterable[str]) -> List[int]:
+        """Token counts for a batch, encoding each distinct uncached text once"""
+        texts = list(texts)
+        keys = [self._key(text) if text else b"" for text in texts]
+        counts: Dict[bytes, int] = {b"": 0}
+        missing: Dict[bytes, str] = {}
+
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key in counts or key in missing:
+                    continue
+                self.stats["calls"] += 1
+                cached = self._cache.get(key)
+                if cached is None:
+                    missing[key] = text
+                else:
+                    self._cache.move_to_end(key)
+                    self.stats["cache_hits"] += 1
+                    counts[key] = cached
+
+        if missing:
+            if self.backend == "tiktoken":
+                encoded = self._encoder.encode_ordinary_batch(list(missing.values()))
+                fresh = [len(tokens) for tokens in encoded]
+            else:
+                fresh = [self._encode_count(text) for text in missing.values()]
+            for key, count in zip(missing, fresh):
+                counts[key] = count
+                self._remember(key, count)
+
+        return [counts[key] for key in keys]
+
+    def clear(self) -> None:
+        """Drop memoized counts"""
+        with self._lock:
+            self._cache.clear()
+
+    def _encode_count(self, text: str) -> int:
+        if self.backend == "tiktoken":
+            return len(self._encoder.encode_ordinary(text))
+        if self.backend == "bpe":
+            return self._encoder.count(text)
+        return estimate_tokens(text)
+
+    def _remember(self, key: bytes, count: int) -> None:
+        with self._lock:
+            self._cache[key] = count
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+# Global instance
+_token_counter = None
+
+
+def get_token_counter() -> TokenCounter:
+    """Get global token counter instance (vocabulary loaded once per process)"""
+    global _token_counter
+    if _token_counter is None:
+        _token_counter = TokenCounter()
+    return _token_counter
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with the global counter"""
+    return get_token_counter().count(text)
+
+
+__all__ = [
+    "BPEEncoder",
+    "TokenCounter",
+    "count_tokens",
+    "estimate_tokens",
+    "find_vocab",
+    "get_token_counter",
+    "load_ranks",
+]
@@ -18,6 +18,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+try:
+    from scripts.token_counter import get_token_counter
+except ImportError:
+    from token_counter import get_token_counter
+
 
 class TokenOptimizer:
     """
@@ -211,6 +216,36 @@ class TokenOptimizer:
             "over_budget": session["usage"] > session["budget"],
         }
 
+    def track_text(
+        self,
+        session_id: str,
+        operation: str,
+        text: str,
+        compressed_text: Optional[str] = None,
+    ) -> Dict:
+        """
+        Track an operation by counting the tokens of the text actually sent.
+
+        Args:
+            session_id: Session identifier
+            operation: Operation description
+            text: Original text
+            compressed_text: Text sent instead of ``text`` (if compressed)
+
+        Returns:
+            Status dict from track_operation()
+
+        Example:
+            >>> compressed, _ = optimizer.compress_text(prompt)
+            >>> optimizer.track_text("abc123de", "review", prompt, compressed)
+        """
+        if compressed_text is None:
+            return self.track_operation(session_id, operation, get_token_counter().count(text))
+
+        original, sent = get_token_counter().count_many([text, compressed_text])
+        ratio = round((original - sent) / original, 2) if original > 0 else 0.0
+        return self.track_operation(session_id, operation, sent, compressed=True, compression_ratio=ratio)
+
     def compress_text(
         self,
         text: str,
@@ -224,7 +259,8 @@ class TokenOptimizer:
             aggressive: Use aggressive compression (more symbols)
 
         Returns:
-            Tuple of (compressed_text, compression_ratio)
+            Tuple of (compressed_text, compression_ratio) where the ratio is
+            measured in tokens (see token_counter)
 
         Example:
             >>> compressed, ratio = optimizer.compress_text(
@@ -234,7 +270,6 @@ class TokenOptimizer:
             >>> print(compressed)
             "perf analysis shows warn"
         """
-        original_length = len(text.split())
         compressed = text
 
         # Apply symbol replacements
@@ -246,7 +281,7 @@ class TokenOptimizer:
             # Aggressive compression rules
             compressed = self._apply_aggressive_compression(compressed)
 
-        compressed_length = len(compressed.split())
+        original_length, compressed_length = get_token_counter().count_many([text, compressed])
         ratio = (original_length - compressed_length) / original_length if original_length > 0 else 0.0
 
         return compressed, round(ratio, 2)
@@ -7,8 +7,12 @@ Features:
 - TTL-based expiration (5 minutes default)
 - LRU eviction when cache exceeds max size (1000 entries)
 - Persistent JSON storage with atomic writes
-- Thread-safe operations with file locking
+- Thread-safe operations; lookups hash outside the lock (striped per file)
+  and get_many() validates a batch under one lock acquisition
 - Graceful degradation on errors (in-memory fallback)
+- Config fingerprint (verifier version + ruff version + effective ruff
+  config) stored per entry: a ruff.toml/[tool.ruff] change or a ruff
+  upgrade invalidates exactly the affected entries, so TTLs can be long
 
 Performance:
 - Cache lookup: <1ms (target <0.5ms)
@@ -34,15 +38,172 @@ Usage:
 import hashlib
 import json
 import logging
+import os
+import shutil
+import subprocess
 import threading
+import time
 from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Bump when RuffVerifier output or the entry format changes
+VERIFIER_VERSION = "1"
+RUFF_CONFIG_FILES = ("ruff.toml", ".ruff.toml", "pyproject.toml")
+FINGERPRINT_RECHECK_SECONDS = 1.0
+HASH_LOCK_STRIPES = 16
+RESOLVE_MEMO_SIZE = 10_000
+
+_ruff_versions: Dict[Tuple, str] = {}
+
+
+def ruff_version() -> str:
+    """``ruff --version`` output, re-run only when the ruff executable changes"""
+    executable = shutil.which("ruff")
+    if executable is None:
+        return "ruff-not-installed"
+    try:
+        stat = os.stat(executable)
+        signature: Tuple = (executable, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        signature = (executable,)
+
+    if signature not in _ruff_versions:
+        try:
+            completed = subprocess.run([executable, "--version"], capture_output=True, text=True, timeout=5, check=False)
+            version = completed.stdout.strip() or "unknown"
+        except (OSError, subprocess.SubprocessError):
+            version = "unknown"
+        _ruff_versions.clear()
+        _ruff_versions[signature] = version
+    return _ruff_versions[signature]
+
+
+def _ruff_table(config_file: Path) -> Optional[Dict[str, Any]]:
+    """Ruff settings table of a config file (None if it has none or is unreadable)"""
+    if tomllib is None:
+        return None
+    try:
+        with open(config_file, "rb") as f:
+            data = tomllib.load(f)
+    except (OSError, ValueError):
+        return None
+    if config_file.name == "pyproject.toml":
+        return data.get("tool", {}).get("ruff")
+    return data
+
+
+def ruff_config_files(project_root: Path) -> List[Path]:
+    """Config files that shape ruff's settings at ``project_root``, following ``extend``"""
+    files: List[Path] = []
+    pending = [project_root / name for name in RUFF_CONFIG_FILES]
+    while pending:
+        config_file = pending.pop(0).resolve()
+        if config_file in files or not config_file.is_file():
+            continue
+        files.append(config_file)
+        table = _ruff_table(config_file)
+        if table and isinstance(table.get("extend"), str):
+            pending.append(config_file.parent / os.path.expanduser(table["extend"]))
+    return files
+
+
+def ruff_config_digest(project_root: Path) -> str:
+    """Digest of the effective ruff configuration
+
+    Only the ``[tool.ruff]`` table of pyproject.toml counts, so unrelated
+    pyproject edits (e.g. [tool.dev-assistant]) keep the cache valid.
+    """
+    digest = hashlib.sha256()
+    for config_file in ruff_config_files(project_root):
+        digest.update(config_file.name.encode("utf-8"))
+        if config_file.name == "pyproject.toml" and tomllib is not None:
+            table = _ruff_table(config_file)
+            digest.update(json.dumps(table, sort_keys=True, default=str).encode("utf-8"))
+        else:
+            digest.update(config_file.read_bytes())
+    return digest.hexdigest()
+
+
+class ConfigFingerprint:
+    """Fingerprint of verifier version, ruff version and effective ruff config
+
+    Recomputed only when a config file or the ruff executable changes on
+    disk, and those are stat-checked at most once per ``recheck_seconds``,
+    so long-running watchers pick up config edits without per-lookup cost.
+    """
+
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        salt: str = f"verifier:{VERIFIER_VERSION}",
+        recheck_seconds: float = FINGERPRINT_RECHECK_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            project_root: Directory whose ruff config applies (default: cwd)
+            salt: Version string of the consumer (verifier/analyzer)
+            recheck_seconds: Minimum interval between stat checks
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.project_root = Path(project_root) if project_root is not None else Path.cwd()
+        self.salt = salt
+        self.recheck_seconds = recheck_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._value: Optional[str] = None
+        self._signature: Optional[Tuple] = None
+        self._checked_at = 0.0
+        self._files: List[Path] = []
+
+    def current(self) -> str:
+        with self._lock:
+            now = self._clock()
+            if self._value is not None and now - self._checked_at < self.recheck_seconds:
+                return self._value
+            self._checked_at = now
+            signature = self._input_signature()
+            if signature != self._signature:
+                # Signature before digest: an edit in between only causes a recompute
+                self._files = ruff_config_files(self.project_root)
+                self._signature = self._input_signature()
+                self._value = self._compute()
+            return self._value
+
+    def _input_signature(self) -> Tuple:
+        # Root candidates catch new/removed files; _files adds extend targets
+        candidates = [self.project_root / name for name in RUFF_CONFIG_FILES] + self._files
+        executable = shutil.which("ruff")
+        if executable:
+            candidates.append(Path(executable))
+        signature = []
+        for path in candidates:
+            try:
+                stat = path.stat()
+                signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append((str(path), None, None))
+        return tuple(signature)
+
+    def _compute(self) -> str:
+        digest = hashlib.sha256(self.salt.encode("utf-8"))
+        digest.update(ruff_version().encode("utf-8"))
+        digest.update(ruff_config_digest(self.project_root).encode("utf-8"))
+        return digest.hexdigest()[:16]
+
 
 @dataclass
 class RuffViolation:
@@ -81,6 +242,7 @@ class CacheEntry:
         timestamp: When cached (ISO format string)
         mode: Analysis mode ("fast" or "deep")
         access_count: Number of cache hits (for LRU)
+        fingerprint: ConfigFingerprint the result was computed under
     """
 
     file_hash: str
@@ -88,6 +250,7 @@ class CacheEntry:
     timestamp: str  # ISO format datetime
     mode: str
     access_count: int = 0
+    fingerprint: str = ""
 
 
 class VerificationCache:
@@ -110,6 +273,8 @@ class VerificationCache:
         cache_dir: Path,
         ttl_seconds: int = 300,  # 5 minutes
         max_entries: int = 1000,
+        fingerprint: Optional[str] = None,
+        project_root: Optional[Path] = None,
     ):
         """Initialize verification cache
 
@@ -117,10 +282,14 @@ class VerificationCache:
             cache_dir: Directory for cache file storage
             ttl_seconds: Time-to-live for entries (seconds)
             max_entries: Maximum number of cached entries
+            fingerprint: Fixed config fingerprint (default: tracked ConfigFingerprint)
+            project_root: Directory whose ruff config is fingerprinted (default: cwd)
         """
         self.cache_dir = Path(cache_dir)
         self.ttl_seconds = ttl_seconds
         self.max_entries = max_entries
+        self._fixed_fingerprint = fingerprint
+        self._config_fingerprint = None if fingerprint is not None else ConfigFingerprint(project_root)
 
         # Cache file path
         self.cache_file = self.cache_dir / "verification_cache.json"
@@ -130,11 +299,19 @@ class VerificationCache:
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
 
         # Hash cache to avoid re-computing for same file
-        # {file_path_str: (mtime, hash)}
-        self._hash_cache: Dict[str, tuple[float, str]] = {}
+        # {file_path_str: ((mtime_ns, size), hash)}
+        self._hash_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
 
-        # Thread safety
+        # Memoized Path.resolve() results {path_str: resolved_str}
+        self._resolved: Dict[str, str] = {}
+
+        # Thread safety: _lock guards entries (held only for in-memory work);
+        # striped locks serialize hashing per file
         self._lock = threading.Lock()
+        self._stripes = [threading.Lock() for _ in range(HASH_LOCK_STRIPES)]
+        self._save_lock = threading.Lock()
+        self._generation = 0
+        self._written_generation = 0
 
         # Ensure cache directory exists
         self._ensure_cache_dir()
@@ -150,7 +327,8 @@ class VerificationCache:
         Returns cached result only if:
         1. Entry exists
         2. File hash matches (content unchanged)
-        3. Entry not expired (within TTL)
+        3. Config fingerprint matches (same ruff version/config)
+        4. Entry not expired (within TTL)
 
         Args:
             file_path: Path to file to check
@@ -160,54 +338,69 @@ class VerificationCache:
 
         Performance: <1ms (target <0.5ms)
         """
-        with self._lock:
-            # Check if file exists
-            if not file_path.exists():
-                logger.debug(f"[CACHE] File not found: {file_path.name}")
-                return None
+        return self.get_many([file_path])[file_path]
 
-            # Compute current hash
-            current_hash = self._compute_hash(file_path)
-            if current_hash is None:
-                return None
+    def get_many(self, file_paths: Iterable[Path]) -> Dict[Path, Optional[VerificationResult]]:
+        """Batch lookup with the same validity rules as get()
 
-            # Check cache
-            cache_key = str(file_path.resolve())
-            entry = self._cache.get(cache_key)
+        File stats, path resolution and hashing run outside the cache lock
+        (hashing is serialized per file by striped locks), then all entries
+        are validated under a single short lock acquisition.
 
-            if entry is None:
-                logger.debug(f"[CACHE MISS] No entry: {file_path.name}")
-                return None
+        Args:
+            file_paths: Files to look up
 
-            # Validate hash
-            if entry.file_hash != current_hash:
-                logger.debug(
-                    f"[CACHE MISS] Hash mismatch: {file_path.name} "
-                    f"(cached={entry.file_hash[:8]}, current={current_hash[:8]})"
-                )
-                # Remove stale entry
-                del self._cache[cache_key]
-                return None
+        Returns:
+            {file_path: VerificationResult or None} for every requested path
+        """
+        results: Dict[Path, Optional[VerificationResult]] = {}
+        probes = []
+        for file_path in file_paths:
+            results[file_path] = None
+            current_hash = self._compute_hash(file_path)
+            if current_hash is not None:
+                probes.append((file_path, self._cache_key(file_path), current_hash))
 
-            # Check expiration
-            if self._is_expired(entry):
-                logger.debug(f"[CACHE MISS] Expired: {file_path.name}")
-                # Remove expired entry
-                del self._cache[cache_key]
-                return None
+        if not probes:
+            return results
 
-            # Update access count and move to end (LRU)
-            entry.access_count += 1
-            self._cache.move_to_end(cache_key)
+        fingerprint = self.fingerprint
+        hits = []
+        with self._lock:
+            for file_path, cache_key, current_hash in probes:
+                entry = self._cache.get(cache_key)
+                if entry is None:
+                    logger.debug(f"[CACHE MISS] No entry: {file_path.name}")
+                    continue
 
-            # Deserialize result
-            result = self._deserialize_result(entry.result)
+                if entry.file_hash != current_hash:
+                    logger.debug(
+                        f"[CACHE MISS] Hash mismatch: {file_path.name} "
+                        f"(cached={entry.file_hash[:8]}, current={current_hash[:8]})"
+                    )
+                    del self._cache[cache_key]
+                    continue
 
-            logger.debug(
-                f"[CACHE HIT] {file_path.name} " f"(age={self._get_age_seconds(entry):.1f}s, " f"hits={entry.access_count})"
-            )
+                if entry.fingerprint != fingerprint:
+                    logger.debug(f"[CACHE MISS] Config changed: {file_path.name}")
+                    del self._cache[cache_key]
+                    continue
+
+                if self._is_expired(entry):
+                    logger.debug(f"[CACHE MISS] Expired: {file_path.name}")
+                    del self._cache[cache_key]
+                    continue
+
+                # Update access count and move to end (LRU)
+                entry.access_count += 1
+                self._cache.move_to_end(cache_key)
+                hits.append((file_path, entry.result))
 
-            return result
+        # Deserialize outside the lock (entry.result dicts are replaced, never mutated)
+        for file_path, data in hits:
+            results[file_path] = self._deserialize_result(data)
+            logger.debug(f"[CACHE HIT] {file_path.name}")
+        return results
 
     def put(self, file_path: Path, result: VerificationResult, mode: str = "fast") -> None:
         """Store verification result in cache
@@ -223,16 +416,16 @@ class VerificationCache:
 
         Performance: <5ms (including JSON serialization)
         """
-        with self._lock:
-            # Compute hash
-            file_hash = self._compute_hash(file_path)
-            if file_hash is None:
-                logger.warning(f"[CACHE] Cannot hash file: {file_path.name}")
-                return
-
-            # Serialize result
-            serialized_result = self._serialize_result(result)
+        # Hash and serialize outside the lock
+        file_hash = self._compute_hash(file_path)
+        if file_hash is None:
+            logger.warning(f"[CACHE] Cannot hash file: {file_path.name}")
+            return
+        serialized_result = self._serialize_result(result)
+        cache_key = self._cache_key(file_path)
+        fingerprint = self.fingerprint
 
+        with self._lock:
             # Create entry
             entry = CacheEntry(
                 file_hash=file_hash,
@@ -240,20 +433,21 @@ class VerificationCache:
                 timestamp=datetime.now().isoformat(),
                 mode=mode,
                 access_count=0,
+                fingerprint=fingerprint,
             )
 
             # Store in cache
-            cache_key = str(file_path.resolve())
             self._cache[cache_key] = entry
             self._cache.move_to_end(cache_key)  # Mark as recently used
 
             # Evict if needed
             self._evict_if_needed()
+            snapshot = self._snapshot()
 
-            # Persist to disk
-            self._save_cache()
+        # Persist to disk without blocking lookups
+        self._write_snapshot(snapshot)
 
-            logger.debug(f"[CACHE PUT] {file_path.name} " f"(mode={mode}, hash={file_hash[:8]})")
+        logger.debug(f"[CACHE PUT] {file_path.name} " f"(mode={mode}, hash={file_hash[:8]})")
 
     def invalidate(self, file_path: Path) -> None:
         """Remove cache entry for file
@@ -263,8 +457,8 @@ class VerificationCache:
         Args:
             file_path: Path to file to invalidate
         """
+        cache_key = self._cache_key(file_path)
         with self._lock:
-            cache_key = str(file_path.resolve())
             if cache_key in self._cache:
                 del self._cache[cache_key]
                 self._save_cache()
@@ -358,51 +552,70 @@ class VerificationCache:
                 "ttl_seconds": self.ttl_seconds,
                 "total_hits": total_hits,
                 "cache_file": str(self.cache_file),
+                "fingerprint": self.fingerprint,
             }
 
+    @property
+    def fingerprint(self) -> str:
+        """Current config fingerprint that entries must match"""
+        if self._fixed_fingerprint is not None:
+            return self._fixed_fingerprint
+        return self._config_fingerprint.current()
+
     # Private methods
 
     def _compute_hash(self, file_path: Path) -> Optional[str]:
-        """Compute SHA-256 hash of file content with mtime caching
+        """Compute SHA-256 hash of file content with stat-signature caching
 
-        Uses modification time (mtime) to avoid re-hashing unchanged files.
+        Uses (mtime_ns, size) to avoid re-hashing unchanged files. Runs
+        without the cache lock; a striped lock per file keeps concurrent
+        lookups of the same file from hashing it twice.
 
         Args:
             file_path: Path to file to hash
 
         Returns:
-            SHA-256 hex digest, or None on error
+            SHA-256 hex digest, or None if the file is missing or unreadable
 
         Performance: <10ms for 10KB file (first access), <0.1ms cached
         """
         try:
-            # Get file mtime
-            stat = file_path.stat()
-            mtime = stat.st_mtime
-            cache_key = str(file_path.resolve())
-
-            # Check hash cache
-            if cache_key in self._hash_cache:
-                cached_mtime, cached_hash = self._hash_cache[cache_key]
-                if cached_mtime == mtime:
-                    # File unchanged, use cached hash
-                    return cached_hash
-
-            # Read file in binary mode for accurate hashing
-            content = file_path.read_bytes()
-
-            # Compute SHA-256
-            hash_obj = hashlib.sha256(content)
-            file_hash = hash_obj.hexdigest()
+            stat = os.stat(file_path)
+        except OSError:
+            logger.debug(f"[CACHE] File not found: {file_path.name}")
+            return None
 
-            # Cache hash with mtime
-            self._hash_cache[cache_key] = (mtime, file_hash)
+        cache_key = self._cache_key(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._hash_cache.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        with self._stripes[hash(cache_key) % len(self._stripes)]:
+            cached = self._hash_cache.get(cache_key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]  # Hashed by another thread meanwhile
+
+            try:
+                file_hash = hashlib.sha256(file_path.read_bytes()).hexdigest()
+            except OSError as e:
+                logger.warning(f"Failed to hash {file_path.name}: {e}")
+                return None
 
+            self._hash_cache[cache_key] = (signature, file_hash)
             return file_hash
 
-        except (OSError, IOError) as e:
-            logger.warning(f"Failed to hash {file_path.name}: {e}")
-            return None
+    def _cache_key(self, file_path: Path) -> str:
+        """Resolved path string, memoized for absolute paths (relative ones depend on cwd)"""
+        raw = str(file_path)
+        cache_key = self._resolved.get(raw)
+        if cache_key is None:
+            cache_key = str(Path(file_path).resolve())
+            if file_path.is_absolute():
+                if len(self._resolved) >= RESOLVE_MEMO_SIZE:
+                    self._resolved.clear()
+                self._resolved[raw] = cache_key
+        return cache_key
 
     def _is_expired(self, entry: CacheEntry) -> bool:
         """Check if cache entry is expired
@@ -543,28 +756,39 @@ class VerificationCache:
             logger.warning(f"Failed to load cache: {e}. Operating in-memory only.")
 
     def _save_cache(self) -> None:
-        """Save cache to JSON file with atomic write
+        """Save cache to JSON file with atomic write (caller holds _lock)"""
+        self._write_snapshot(self._snapshot())
+
+    def _snapshot(self) -> Tuple[int, Dict[str, Any]]:
+        """Serializable copy of the entries, tagged with a generation (caller holds _lock)"""
+        self._generation += 1
+        return self._generation, {key: asdict(entry) for key, entry in self._cache.items()}
+
+    def _write_snapshot(self, snapshot: Tuple[int, Dict[str, Any]]) -> None:
+        """Write a snapshot unless a newer one was already written
 
         Uses temp file + rename for atomicity.
         Handles errors gracefully (logs warning, continues in-memory).
         """
-        try:
-            # Serialize cache
-            data = {key: asdict(entry) for key, entry in self._cache.items()}
-
-            # Atomic write: temp file + rename
-            temp_file = self.cache_file.with_suffix(".tmp")
+        generation, data = snapshot
+        with self._save_lock:
+            if generation <= self._written_generation:
+                return
+            try:
+                # Atomic write: temp file + rename
+                temp_file = self.cache_file.with_suffix(".tmp")
 
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+                with open(temp_file, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2)
 
-            # Atomic rename
-            temp_file.replace(self.cache_file)
+                # Atomic rename
+                temp_file.replace(self.cache_file)
+                self._written_generation = generation
 
-            logger.debug(f"Saved {len(self._cache)} entries to cache file")
+                logger.debug(f"Saved {len(data)} entries to cache file")
 
-        except OSError as e:
-            logger.warning(f"Failed to save cache: {e}. Continuing in-memory.")
+            except OSError as e:
+                logger.warning(f"Failed to save cache: {e}. Continuing in-memory.")
 
 
 def main():
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Verification Service - Warm verify/classify API for git hooks
+
+dev_assistant keeps a VerificationCache, a CriticalFileDetector and a Ruff
+verifier warm for its file watcher. Started with ``--serve-socket`` it also
+answers requests on a Unix-domain socket, so pre-commit and quality-gate
+hooks reuse that state (and its worker pool) instead of rebuilding it in a
+fresh process on every invocation.
+
+Protocol (one JSON request per connection, see cli_daemon):
+    {"command": "verify",   "paths": [...], "cwd": "..."} -> {"passed": bool, "results": [...]}
+    {"command": "cached",   "paths": [...], "cwd": "..."} -> {"results": [... or null]}
+    {"command": "classify", "paths": [...], "cwd": "..."} -> {"results": [...]}
+    {"command": "ping"} / {"command": "stop"}
+
+The client imports only the standard library and cli_daemon. When no daemon
+is listening, or the socket is not owned by the current user, ``verify``
+falls back to a single ``ruff check`` over the paths.
+
+Usage:
+    python scripts/dev_assistant.py --serve-socket            # daemon (with file watcher)
+    python scripts/verification_service.py verify a.py b.py    # client
+    python scripts/verification_service.py status
+    python scripts/verification_service.py stop
+"""
+
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional
+
+try:
+    from scripts.cli_daemon import send_request, socket_path
+except ImportError:
+    from cli_daemon import send_request, socket_path
+
+SOCKET_NAME = "verify"
+DEFAULT_WORKERS = 4
+CLIENT_TIMEOUT = 30.0  # seconds; a cold DEEP analysis can take a while
+
+
+def result_to_dict(result, mode: str = "fast", from_cache: bool = False) -> Dict:
+    """JSON form of a VerificationResult"""
+    return {
+        "file": str(result.file_path),
+        "passed": result.passed,
+        "violations": [asdict(violation) for violation in result.violations],
+        "duration_ms": result.duration_ms,
+        "error": result.error,
+        "mode": mode,
+        "from_cache": from_cache,
+    }
+
+
+class VerificationService:
+    """Request handler backed by warm verifier, cache and detector instances
+
+    The same instances are shared with dev_assistant's FileChangeProcessor,
+    so a file saved in the editor is usually a cache hit by commit time.
+    """
+
+    def __init__(self, verifier, cache=None, detector=None, max_workers: int = DEFAULT_WORKERS, analysis_cache=None):
+        """
+        Args:
+            verifier: Object with ``verify_file(path) -> VerificationResult`` (RuffVerifier)
+            cache: Optional VerificationCache
+            detector: Optional CriticalFileDetector
+            max_workers: Files verified concurrently per request
+            analysis_cache: Optional AnalysisCache for complete DEEP_MODE results
+        """
+        self._verifier = verifier
+        self._cache = cache
+        self._detector = detector
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="verify")
+        self._analysis_cache = analysis_cache
+        self._deep_analyzer = None
+        self._deep_lock = Lock()
+        self.stats = {"requests": 0, "files": 0, "cache_hits": 0}
+
+    def handle(self, request: Dict) -> Dict:
+        command = request.get("command", "verify")
+        if command == "ping":
+            return {"ok": True, "pid": os.getpid(), "stats": dict(self.stats)}
+        if command == "stop":
+            return {"ok": True, "shutdown": True}
+
+        self.stats["requests"] += 1
+        base = Path(request.get("cwd") or Path.cwd())
+        paths = [path if path.is_absolute() else base / path for path in map(Path, request.get("paths", []))]
+
+        if command == "verify":
+            results = self.verify(paths)
+            return {"passed": all(r["passed"] for r in results), "results": results}
+        if command == "cached":
+            return {"results": [self.cached(path) for path in paths]}
+        if command == "classify":
+            return {"results": [self.classify(path) for path in paths]}
+        return {"error": f"Unknown command: {command}"}
+
+    def verify(self, paths: List[Path]) -> List[Dict]:
+        """Verify files concurrently, answering from the cache where possible
+
+        Classification runs in the pool, cached verdicts come from one
+        get_many() batch, and only the misses are verified.
+        """
+        if self._detector is not None:
+            classifications = list(self._pool.map(self.classify, paths))
+        else:
+            classifications = [{"mode": "fast"} for _ in paths]
+        modes = [classification["mode"] for classification in classifications]
+
+        candidates = [path for path, mode in zip(paths, modes) if mode != "skip"]
+        cached = self._cache.get_many(candidates) if self._cache is not None else {}
+        misses = [(path, mode) for path, mode in zip(paths, modes) if mode != "skip" and cached.get(path) is None]
+        fresh = dict(zip((path for path, _ in misses), self._pool.map(lambda miss: self._verify_one(*miss), misses)))
+
+        results = []
+        for path, mode, classification in zip(paths, modes, classifications):
+            if mode == "skip":
+                results.append({"file": str(path), "passed": True, "skipped": True, "reason": classification["reason"]})
+            elif cached.get(path) is not None:
+                results.append(result_to_dict(cached[path], mode=mode, from_cache=True))
+            else:
+                results.append(fresh[path])
+
+        self.stats["files"] += len(paths)
+        self.stats["cache_hits"] += sum(1 for result in results if result.get("from_cache"))
+        return results
+
+    def cached(self, path: Path) -> Optional[Dict]:
+        if self._cache is None:
+            return None
+        result = self._cache.get(path)
+        return result_to_dict(result, from_cache=True) if result is not None else None
+
+    def classify(self, path: Path) -> Dict:
+        if self._detector is None:
+            return {"file": str(path), "mode": "fast", "criticality_score": None, "reason": "No detector configured"}
+        classification = self._detector.classify(path)
+        return {
+            "file": str(path),
+            "mode": classification.mode.value,
+            "criticality_score": classification.criticality_score,
+            "reason": classification.reason,
+        }
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+
+    def _verify_one(self, path: Path, mode: str) -> Dict:
+        if mode == "deep":
+            result = self._deep_ruff_result(path)
+        else:
+            result = self._verifier.verify_file(path)
+
+        if self._cache is not None and result.error is None:
+            self._cache.put(path, result, mode=mode)
+        return result_to_dict(result, mode=mode)
+
+    def _deep_ruff_result(self, path: Path):
+        """Ruff result from the shared DeepAnalyzer (not thread-safe, so serialized)"""
+        with self._deep_lock:
+            if self._deep_analyzer is None:
+                try:
+                    from scripts.deep_analyzer import DeepAnalyzer
+                except ImportError:
+                    from deep_analyzer import DeepAnalyzer
+
+                self._deep_analyzer = DeepAnalyzer(
+                    mcp_enabled=False, ruff_verifier=self._verifier, result_cache=self._analysis_cache
+                )
+            return self._deep_analyzer.analyze(path).ruff_result
+
+
+def request(command: str, paths: Optional[List[str]] = None, timeout: float = CLIENT_TIMEOUT) -> Optional[Dict]:
+    """Send one request to the dev_assistant daemon; None when none is listening"""
+    payload = {"command": command, "cwd": os.getcwd()}
+    if paths is not None:
+        payload["paths"] = [str(path) for path in paths]
+    return send_request(socket_path(SOCKET_NAME), payload, timeout=timeout)
+
+
+def _print_results(results: List[Dict]) -> None:
+    for result in results:
+        if result.get("skipped"):
+            continue
+        if result.get("error"):
+            print(f"{result['file']}: [ERROR] {result['error']}")
+        for violation in result.get("violations", []):
+            print(f"{result['file']}:{violation['line']}:{violation['column']}: {violation['code']} {violation['message']}")
+
+
+def _verify(paths: List[str], fallback: bool) -> int:
+    paths = [path for path in paths if path.endswith(".py")]
+    if not paths:
+        return 0
+
+    # request() only trusts a socket owned by this user; any other answer must not gate the commit
+    response = request("verify", paths)
+    if response is not None and "results" in response:
+        results = response["results"]
+        _print_results(results)
+        cached = sum(1 for result in results if result.get("from_cache"))
+        print(f"[INFO] {len(results)} file(s) verified by dev_assistant ({cached} cached)")
+        return 0 if response["passed"] else 1
+
+    if not fallback:
+        print("[INFO] No verification daemon running")
+        return 3
+    return subprocess.run(["ruff", "check", *paths], check=False).returncode
+
+
+def main() -> int:
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Client for the dev_assistant verification daemon")
+    sub = parser.add_subparsers(dest="command", required=True)
+    verify = sub.add_parser("verify", help="Verify files (ruff check fallback when no daemon runs)")
+    verify.add_argument("paths", nargs="*")
+    verify.add_argument("--no-fallback", action="store_true", help="Exit 3 instead of running ruff locally")
+    for name, help_text in (("cached", "Show cached results"), ("classify", "Show FAST/DEEP/SKIP classification")):
+        sub.add_parser(name, help=help_text).add_argument("paths", nargs="+")
+    sub.add_parser("status", help="Check whether a daemon is running")
+    sub.add_parser("stop", help="Stop the daemon's socket server")
+    args = parser.parse_args()
+
+    if args.command == "verify":
+        return _verify(args.paths, fallback=not args.no_fallback)
+
+    if args.command in ("status", "stop"):
+        response = request("ping" if args.command == "status" else "stop", timeout=5)
+        if response is None:
+            print("[INFO] No verification daemon running")
+            return 1
+        print(f"[OK] Verification daemon {'running' if args.command == 'status' else 'stopped'}: {socket_path(SOCKET_NAME)}")
+        return 0
+
+    response = request(args.command, args.paths)
+    if response is None:
+        print("[INFO] No verification daemon running")
+        return 1
+    print(json.dumps(response["results"], indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -412,5 +412,79 @@ class TestADRWorkflow:
         assert builder.get_next_number() == 3
 
 
+class TestADRCatalog:
+    """Test persistent ADR catalog"""
+
+    def _write(self, adr_dir, number, title, body, articles=()):
+        refs = "\n".join(f"- **{article}**: reference" for article in articles)
+        path = adr_dir / f"ADR-{number:03d}-{title.lower().replace(' ', '-')}.md"
+        path.write_text(
+            f"# ADR-{number:03d}: {title}\n\n**Status**: accepted\n**Date**: 2025-11-01\n\n{body}\n\n{refs}\n",
+            encoding="utf-8",
+        )
+        return path
+
+    def test_catalog_persisted(self, builder, temp_adr_dir):
+        """Test catalog file written and reused by a new builder"""
+        self._write(temp_adr_dir, 1, "Use Redis", "Cache layer", ["P4"])
+        builder.list_all_adrs()
+
+        assert (temp_adr_dir / ".adr_catalog.json").exists()
+        reloaded = ADRBuilder(adr_dir=temp_adr_dir)
+        assert "ADR-001-use-redis.md" in reloaded.catalog.entries
+
+    def test_only_changed_files_reparsed(self, builder, temp_adr_dir, monkeypatch):
+        """Test unchanged files are not read again"""
+        self._write(temp_adr_dir, 1, "Use Redis", "Cache layer")
+        builder.list_all_adrs()
+
+        parsed = []
+        original_add = builder.catalog._add
+        monkeypatch.setattr(builder.catalog, "_add", lambda name, *args: (parsed.append(name), original_add(name, *args)))
+        self._write(temp_adr_dir, 2, "Use Kafka", "Event bus")
+        builder.list_all_adrs()
+
+        assert parsed == ["ADR-002-use-kafka.md"]
+
+    def test_deleted_file_dropped_from_index(self, builder, temp_adr_dir):
+        """Test deleted ADR no longer searchable"""
+        path = self._write(temp_adr_dir, 1, "Use Redis", "Cache layer")
+        assert len(builder.search_adrs("redis")) == 1
+
+        path.unlink()
+
+        assert builder.search_adrs("redis") == []
+        assert "redis" not in builder.catalog.index
+
+    def test_search_ranks_title_matches_first(self, builder, temp_adr_dir):
+        """Test ranked search results"""
+        self._write(temp_adr_dir, 1, "Logging format", "We may add a cache later")
+        self._write(temp_adr_dir, 2, "Cache strategy", "Use a cache for reads")
+
+        results = builder.search_adrs("cache")
+
+        assert [number for number, _, _ in results] == [2, 1]
+
+    def test_search_matches_phrase(self, builder, temp_adr_dir):
+        """Test multi-word queries match as a phrase, possibly mid-word"""
+        self._write(temp_adr_dir, 1, "Cache strategy", "Use Redis")
+        self._write(temp_adr_dir, 2, "Queue strategy", "Use Kafka for events")
+
+        assert [number for number, _, _ in builder.search_adrs("queue strategy")] == [2]
+        assert [number for number, _, _ in builder.search_adrs("e strat")] == [1, 2]
+        assert [number for number, _, _ in builder.search_adrs("kafka for ev")] == [2]
+        assert builder.search_adrs("strategy kafka") == []
+
+    def test_conflicts_from_article_index(self, builder, temp_adr_dir):
+        """Test conflicts found by article set intersection"""
+        self._write(temp_adr_dir, 1, "Ship MVP", "Good enough", ["P6", "P15"])
+        self._write(temp_adr_dir, 2, "Strict typing", "Quality", ["P6"])
+
+        conflicts = builder.detect_conflicts()
+
+        assert [(c["adr"], c["conflict"]) for c in conflicts] == [(1, "P6 vs P15")]
+        assert builder.catalog.with_article("P6") == {"ADR-001-ship-mvp.md", "ADR-002-strict-typing.md"}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
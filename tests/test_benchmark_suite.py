@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Tests for the verification hot-path benchmark suite
+
+Tests:
+- Statistics computation
+- Synthetic repository generation
+- Baseline comparison and regression thresholds
+- End-to-end run on a tiny repository
+"""
+
+import json
+
+import pytest
+
+from scripts.benchmark_suite import (
+    BaselineMismatchError,
+    BenchmarkStats,
+    BenchmarkSuite,
+    SyntheticRepo,
+    compare_to_baseline,
+    main,
+    time_call,
+    write_report,
+)
+
+
+def _report(**medians):
+    return {"results": [{"name": name, "median_ms": value, "skipped": None} for name, value in medians.items()]}
+
+
+class TestStatistics:
+    """Test timing statistics"""
+
+    def test_from_samples(self):
+        stats = BenchmarkStats.from_samples("case", [1.0, 2.0, 3.0, 4.0, 100.0], warmup=2)
+
+        assert stats.repeat == 5
+        assert stats.median_ms == 3.0
+        assert stats.min_ms == 1.0
+        assert stats.max_ms == 100.0
+        assert stats.p95_ms == 100.0
+        assert stats.mean_ms == 22.0
+
+    def test_single_sample_has_zero_stdev(self):
+        assert BenchmarkStats.from_samples("case", [5.0], warmup=0).stdev_ms == 0.0
+
+    def test_time_call_runs_warmup_and_repeat(self):
+        calls = []
+        samples = time_call(lambda state: calls.append(state), "x", warmup=2, repeat=3)
+
+        assert len(calls) == 5
+        assert len(samples) == 3
+
+
+class TestSyntheticRepo:
+    """Test synthetic repository generation"""
+
+    def test_generate(self, tmp_path):
+        files = SyntheticRepo(tmp_path, file_count=20, functions_per_file=3).generate()
+
+        assert len(files) == 20
+        assert any(path.name.startswith("test_") for path in files)
+        assert any(path.name.endswith("_executor.py") for path in files)
+        for path in files:
+            compile(path.read_text(encoding="utf-8"), str(path), "exec")
+
+
+class TestBaselineComparison:
+    """Test regression detection"""
+
+    def test_regression_detected(self):
+        regressions = compare_to_baseline(_report(a=13.0, b=10.0), _report(a=10.0, b=10.0), threshold=0.2)
+
+        assert [r.name for r in regressions] == ["a"]
+        assert regressions[0].change_percent == 30.0
+
+    def test_within_threshold(self):
+        assert compare_to_baseline(_report(a=11.0), _report(a=10.0), threshold=0.2) == []
+
+    def test_new_and_skipped_cases_ignored(self):
+        current = _report(new_case=50.0)
+        current["results"].append({"name": "a", "median_ms": 0.0, "skipped": "unavailable"})
+
+        assert compare_to_baseline(current, _report(a=10.0)) == []
+
+    def test_incompatible_config_rejected(self):
+        current = dict(_report(a=10.0), config={"file_count": 200, "warmup": 3, "repeat": 10})
+        baseline = dict(_report(a=10.0), config={"file_count": 100, "warmup": 3, "repeat": 10})
+
+        with pytest.raises(BaselineMismatchError, match="file_count=100 vs 200"):
+            compare_to_baseline(current, baseline)
+
+
+class TestBenchmarkSuite:
+    """Test end-to-end suite run"""
+
+    @pytest.mark.parametrize("argv", [["--repeat", "0"], ["--files", "-1"], ["--warmup", "-2"], ["--repeat", "x"]])
+    def test_cli_rejects_invalid_counts(self, argv, monkeypatch, capsys):
+        monkeypatch.setattr("sys.argv", ["benchmark_suite.py", *argv])
+
+        with pytest.raises(SystemExit) as exc:
+            main()
+
+        assert exc.value.code == 2
+        assert argv[0] in capsys.readouterr().err
+
+    def test_run_selected_cases(self, tmp_path):
+        suite = BenchmarkSuite(
+            file_count=5,
+            warmup=0,
+            repeat=2,
+            work_dir=tmp_path,
+            only=["verification_cache", "critical_file_detector", "tag_extractor_lite"],
+        )
+        report = suite.run()
+
+        names = [result.name for result in report.results]
+        assert names == [
+            "verification_cache.put",
+            "verification_cache.get",
+            "critical_file_detector.classify",
+            "tag_extractor_lite.extract",
+        ]
+        assert all(result.repeat == 2 and result.median_ms >= 0 for result in report.results)
+        assert report.config["file_count"] == 5
+
+        output = write_report(report, tmp_path / "out" / "latest.json")
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert compare_to_baseline(data, data) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
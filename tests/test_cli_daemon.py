@@ -0,0 +1,163 @@
+"""
+CLI daemon tests - socket protocol, stale-code detection and tool dispatch
+"""
+
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import cli_daemon  # noqa: E402
+
+pytestmark = pytest.mark.skipif(not cli_daemon.daemon_available(), reason="Unix domain sockets required")
+
+
+@pytest.fixture
+def sock_path(tmp_path):
+    return tmp_path / "d.sock"
+
+
+def start_server(path, handler, should_stop=lambda: False):
+    thread = threading.Thread(target=cli_daemon.serve, args=(path, handler, should_stop), daemon=True)
+    thread.start()
+    for _ in range(200):
+        if path.exists():
+            break
+        threading.Event().wait(0.01)
+    return thread
+
+
+class TestProtocol:
+    def test_round_trip_and_shutdown(self, sock_path):
+        thread = start_server(sock_path, lambda req: {"echo": req.get("value"), "shutdown": req.get("stop", False)})
+
+        assert cli_daemon.send_request(sock_path, {"value": 42}) == {"echo": 42, "shutdown": False}
+        cli_daemon.send_request(sock_path, {"stop": True})
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert not sock_path.exists()
+
+    def test_socket_is_private(self, sock_path):
+        thread = start_server(sock_path, lambda req: {"shutdown": True})
+
+        assert sock_path.stat().st_mode & 0o077 == 0
+        cli_daemon.send_request(sock_path, {})
+        thread.join(timeout=5)
+
+    def test_handler_error_reported(self, sock_path):
+        def handler(request):
+            if request.get("stop"):
+                return {"shutdown": True}
+            raise RuntimeError("boom")
+
+        thread = start_server(sock_path, handler)
+
+        assert cli_daemon.send_request(sock_path, {}) == {"error": "RuntimeError: boom"}
+        cli_daemon.send_request(sock_path, {"stop": True})
+        thread.join(timeout=5)
+
+    def test_no_daemon_returns_none(self, sock_path):
+        assert cli_daemon.send_request(sock_path, {}) is None
+
+    def test_stale_daemon_closes_without_answer(self, sock_path):
+        thread = start_server(sock_path, lambda req: {"ok": True}, should_stop=lambda: True)
+
+        assert cli_daemon.send_request(sock_path, {}) is None
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+    def test_socket_dir_created_private(self, tmp_path):
+        path = tmp_path / "run" / "d.sock"
+        thread = start_server(path, lambda req: {"shutdown": True})
+
+        assert (tmp_path / "run").stat().st_mode & 0o777 == 0o700
+        cli_daemon.send_request(path, {})
+        thread.join(timeout=5)
+
+    def test_foreign_socket_not_trusted(self, sock_path, monkeypatch):
+        thread = start_server(sock_path, lambda req: {"passed": True, "shutdown": req.get("stop", False)})
+
+        with monkeypatch.context() as m:
+            m.setattr(cli_daemon, "_uid", lambda: os.getuid() + 1)
+            assert cli_daemon.send_request(sock_path, {}) is None
+
+        cli_daemon.send_request(sock_path, {"stop": True})
+        thread.join(timeout=5)
+
+    def test_serve_refuses_foreign_socket(self, sock_path, monkeypatch):
+        sock_path.touch()
+        monkeypatch.setattr(cli_daemon, "_prepare_socket_dir", lambda directory: None)
+        monkeypatch.setattr(cli_daemon, "_uid", lambda: os.getuid() + 1)
+
+        with pytest.raises(PermissionError):
+            cli_daemon.serve(sock_path, lambda req: {})
+        assert sock_path.exists()
+
+
+class TestStaleCode:
+    def test_modules_changed(self, tmp_path):
+        module_file = tmp_path / "mod.py"
+        module_file.write_text("x = 1\n")
+        snapshot = {str(module_file): module_file.stat().st_mtime_ns}
+        assert not cli_daemon.modules_changed(snapshot)
+
+        os.utime(module_file, ns=(0, module_file.stat().st_mtime_ns + 1_000_000))
+
+        assert cli_daemon.modules_changed(snapshot)
+
+    def test_socket_path_fits_unix_limit(self):
+        assert len(str(cli_daemon.socket_path())) < 100
+
+    def test_socket_path_in_runtime_dir(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        assert cli_daemon.socket_path().parent == tmp_path / "dev-rules"
+
+    def test_daemon_safe_commands(self):
+        assert cli_daemon.daemon_safe("dev-rules", ["task", "list", "-v"])
+        assert not cli_daemon.daemon_safe("dev-rules", ["task", "run", "T1"])
+        assert not cli_daemon.daemon_safe("dev-rules", ["dashboard"])
+        assert not cli_daemon.daemon_safe("nope", ["task", "list"])
+
+
+class TestCLIDaemon:
+    def test_runs_tool_in_request_cwd(self, tmp_path):
+        pytest.importorskip("click")
+        daemon = cli_daemon.CLIDaemon(preload=False)
+
+        response = daemon.handle({"tool": "dev-rules", "argv": ["task", "list"], "cwd": str(tmp_path)})
+
+        assert response["exit_code"] == 0
+        assert "No TASKS directory" in response["stdout"] + response["stderr"]
+        assert os.getcwd() != str(tmp_path)
+
+    def test_unknown_tool(self):
+        pytest.importorskip("click")
+        response = cli_daemon.CLIDaemon(preload=False).handle({"tool": "nope", "argv": []})
+        assert response["exit_code"] == 2
+
+    def test_unsafe_command_left_to_client(self):
+        pytest.importorskip("click")
+        response = cli_daemon.CLIDaemon(preload=False).handle({"tool": "dev-rules", "argv": ["task", "run", "T1"]})
+        assert "exit_code" not in response
+
+    def test_client_env_applied_per_request(self, monkeypatch):
+        click = pytest.importorskip("click")
+
+        @click.command()
+        def show():
+            click.echo(os.environ.get("GIT_INDEX_FILE", "<unset>"))
+
+        monkeypatch.setattr(cli_daemon, "load_cli", lambda tool: show)
+        monkeypatch.setitem(cli_daemon.DAEMON_COMMANDS, "dev-rules", {()})
+        monkeypatch.delenv("GIT_INDEX_FILE", raising=False)
+        daemon = cli_daemon.CLIDaemon(preload=False)
+
+        response = daemon.handle({"tool": "dev-rules", "argv": [], "env": {"GIT_INDEX_FILE": ".git/index.lock"}})
+
+        assert response["stdout"].strip() == ".git/index.lock"
+        assert "GIT_INDEX_FILE" not in os.environ
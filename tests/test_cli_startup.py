@@ -0,0 +1,51 @@
+"""
+CLI startup tests - import-time budget for dev-rules and tier1 CLIs
+
+Measured with `python -X importtime`; heavy modules must only load inside
+the subcommands that use them.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("click")
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+
+# Modules that must not load when the CLI module is imported
+HEAVY_MODULES = {"task_executor", "prompt_compressor", "feature_flags", "yaml"}
+
+# Cumulative import time budget for the CLI module itself (microseconds)
+IMPORT_BUDGET_US = 300_000
+
+
+def import_times(module: str) -> dict:
+    """Cumulative import time per module name from -X importtime"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SCRIPTS_DIR,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        times[name] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module", ["dev_rules_cli", "tier1_cli", "cli_daemon"])
+class TestImportTime:
+    def test_heavy_modules_are_lazy(self, module):
+        loaded = set(import_times(module))
+        assert not loaded & HEAVY_MODULES
+
+    def test_within_budget(self, module):
+        assert import_times(module)[module] < IMPORT_BUDGET_US
@@ -0,0 +1,106 @@
+"""
+Code Review Assistant Tests
+Diff parsing and changed-line scoping of commit reviews
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.code_review_assistant import CodeReviewAssistant, parse_diff  # noqa: E402
+
+
+def git(repo: Path, *args: str) -> str:
+    result = subprocess.run(["git", *args], cwd=repo, capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """Git repo with one committed module"""
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "config", "user.email", "test@example.com")
+    git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "app.py").write_text("import os\n\n# TODO old item\nvalue = eval('1')\n", encoding="utf-8")
+    git(tmp_path, "add", "app.py")
+    git(tmp_path, "commit", "-q", "-m", "feat: initial")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestParseDiff:
+    """Tests for parse_diff"""
+
+    def test_ranges_and_blobs(self):
+        diff = (
+            "diff --git a/app.py b/app.py\n"
+            "index 1111111111111111111111111111111111111111..2222222222222222222222222222222222222222 100644\n"
+            "--- a/app.py\n"
+            "+++ b/app.py\n"
+            "@@ -3 +3,2 @@\n"
+            "-old\n"
+            "+new\n"
+            "+more\n"
+            "@@ -9,2 +10,0 @@\n"
+            "-gone\n"
+            "-gone\n"
+            "@@ -20,0 +21 @@\n"
+            "+added\n"
+            "diff --git a/old.py b/old.py\n"
+            "deleted file mode 100644\n"
+            "index 3333333333333333333333333333333333333333..0000000000000000000000000000000000000000\n"
+            "--- a/old.py\n"
+            "+++ /dev/null\n"
+        )
+
+        changes = parse_diff(diff)
+
+        assert [change.path for change in changes] == ["app.py", "old.py"]
+        assert changes[0].ranges == [(3, 4), (21, 21)]
+        assert changes[0].blob == "2" * 40
+        assert changes[1].deleted and changes[1].blob is None
+
+
+class TestCommitReview:
+    """Tests for review_commit"""
+
+    def test_only_changed_lines_reported(self, repo):
+        (repo / "app.py").write_text("import os\n\n# TODO old item\nvalue = eval('1')\n# TODO new item\n", encoding="utf-8")
+        git(repo, "commit", "-q", "-am", "feat: add item")
+
+        report = CodeReviewAssistant().review_commit("HEAD")
+
+        assert [(f.line, f.message) for f in report.findings] == [(5, "Unresolved TODO/FIXME found")]
+        assert report.stats["files_reviewed"] == 1
+        assert report.stats["lines_reviewed"] == 1
+
+    def test_reviews_committed_content_not_working_tree(self, repo):
+        (repo / "app.py").write_text("import os\n\n# TODO old item\nvalue = eval('1')\ndata = 1\n", encoding="utf-8")
+        git(repo, "commit", "-q", "-am", "feat: add data")
+        (repo / "app.py").write_text("# TODO uncommitted\n", encoding="utf-8")
+
+        report = CodeReviewAssistant().review_commit("HEAD")
+
+        assert report.findings == []
+
+    def test_root_commit_reviewed_against_empty_tree(self, repo):
+        report = CodeReviewAssistant().review_commit("HEAD")
+
+        assert {f.line for f in report.findings} == {3, 4}
+        assert report.constitutional_compliance["P9"] is True
+
+    def test_large_commit_reviewed_in_parallel(self, repo):
+        for i in range(20):
+            (repo / f"mod_{i}.py").write_text(f"x = {i}\n# TODO item {i}\n", encoding="utf-8")
+        git(repo, "add", ".")
+        git(repo, "commit", "-q", "-m", "feat: many modules")
+
+        report = CodeReviewAssistant().review_commit("HEAD")
+
+        assert report.stats["files_reviewed"] == 20
+        assert sorted(f.file for f in report.findings) == sorted(f"mod_{i}.py" for i in range(20))
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Tests for UnifiedConstitutionalValidator v3
+
+Tests:
+- Shared project snapshot collection
+- Snapshot-backed article validators
+- Concurrent execution of all 20 articles
+"""
+
+import asyncio
+import subprocess
+import time
+from contextlib import ExitStack
+from unittest.mock import patch
+
+import pytest
+
+from scripts.constitutional_validator_v3 import UnifiedConstitutionalValidator, ValidationResult
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a minimal project tree"""
+    (tmp_path / "TASKS").mkdir()
+    (tmp_path / "TASKS" / "FEAT-1.yaml").write_text("task_id: FEAT-1\n", encoding="utf-8")
+    (tmp_path / "specs" / "auth").mkdir(parents=True)
+    (tmp_path / "specs" / "auth" / "phase1_plan.md").write_text("# Phase 1\n", encoding="utf-8")
+    (tmp_path / "specs" / "auth" / "spec.md").write_text("# Spec\n", encoding="utf-8")
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "tool.py").write_text("if __name__ == '__main__':\n    pass\n", encoding="utf-8")
+    (tmp_path / "scripts" / "lib.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_integration_flow.py").write_text("", encoding="utf-8")
+    (tmp_path / "tests" / "test_unit.py").write_text("", encoding="utf-8")
+    (tmp_path / "RUNS" / "evidence").mkdir(parents=True)
+    (tmp_path / "RUNS" / "evidence" / "T1.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "RUNS" / "run.log").write_text("", encoding="utf-8")
+    return tmp_path
+
+
+def _fake_run(*args, **kwargs):
+    return subprocess.CompletedProcess(args=args, returncode=0, stdout="[]", stderr="")
+
+
+class TestProjectSnapshot:
+    """Test snapshot collection"""
+
+    def test_collect_snapshot(self, project):
+        validator = UnifiedConstitutionalValidator(project_root=project)
+        snapshot = asyncio.run(validator._ensure_snapshot())
+
+        assert [f.name for f in snapshot.task_yaml_files] == ["FEAT-1.yaml"]
+        assert [f.name for f in snapshot.phase_spec_files] == ["phase1_plan.md"]
+        assert len(snapshot.spec_md_files) == 2
+        assert set(f.name for f in snapshot.script_sources) == {"tool.py", "lib.py"}
+        assert snapshot.evidence_file_count == 1
+        assert [f.name for f in snapshot.log_files] == ["run.log"]
+
+    def test_snapshot_counts_packed_evidence(self, project):
+        from scripts.evidence_pack import EvidencePack
+
+        EvidencePack(project / "RUNS" / "evidence" / "archive", "2025-01").append([("old.json", b"{}", 0.0)])
+        validator = UnifiedConstitutionalValidator(project_root=project)
+        snapshot = asyncio.run(validator._ensure_snapshot())
+
+        assert snapshot.evidence_file_count == 1
+        assert snapshot.archived_evidence_count == 1
+
+    def test_validators_use_snapshot(self, project):
+        validator = UnifiedConstitutionalValidator(project_root=project)
+
+        async def run():
+            return await asyncio.gather(
+                validator.validate_c1_executable_spec({}),
+                validator.validate_c3_cli_interface({}),
+                validator.validate_c7_integration_first({}),
+                validator.validate_c20_phase_execution({}),
+            )
+
+        c1, c3, c7, c20 = asyncio.run(run())
+        assert c1.evidence == {"yaml_contracts": 1, "markdown_specs": 2}
+        assert c3.evidence == {"cli_modules": 0, "cli_scripts": 1}
+        assert c7.evidence == {"integration_tests": 1, "total_tests": 2}
+        assert c20.evidence == {"phase_structured_tasks": 1}
+
+    def test_reused_validator_sees_tree_changes(self, project):
+        validator = UnifiedConstitutionalValidator(project_root=project)
+        asyncio.run(validator.validate_layer_1_foundation({}))
+        (project / "TASKS" / "FEAT-2.yaml").write_text("task_id: FEAT-2\n", encoding="utf-8")
+
+        c1 = asyncio.run(validator.validate_c1_executable_spec({}))
+        collections = []
+        original = validator._collect_snapshot
+        validator._collect_snapshot = lambda: collections.append(1) or original()
+        layer = asyncio.run(validator.validate_layer_1_foundation({}))
+
+        assert c1.evidence["yaml_contracts"] == 2
+        assert validator.results[-5].evidence["yaml_contracts"] == 2
+        assert layer["total"] == 5
+        assert len(collections) == 1  # articles within one pass share its snapshot
+
+
+class TestConcurrentValidation:
+    """Test concurrent article execution"""
+
+    def test_validate_all_preserves_order(self, project):
+        with patch("scripts.constitutional_validator_v3.subprocess.run", side_effect=_fake_run):
+            validator = UnifiedConstitutionalValidator(project_root=project)
+            report = asyncio.run(validator.validate_all_20_articles())
+
+        ids = [r["article_id"] for r in report["detailed_results"]]
+        assert ids == [f"C{i}" for i in range(1, 21)]
+        assert report["layer_results"]["L1_Foundation"]["total"] == 5
+        assert "git_head" in report["project"]
+
+    def test_articles_run_concurrently(self, project):
+        async def slow_article(self, context):
+            await self._run_blocking(time.sleep, 0.3)
+            return ValidationResult("CX", "Slow", True, 1.0, {}, [])
+
+        slow_articles = ["validate_c6_test_first", "validate_c9_security_gates", "validate_c14_observability"]
+        with ExitStack() as stack:
+            for name in slow_articles:
+                stack.enter_context(patch.object(UnifiedConstitutionalValidator, name, slow_article))
+            validator = UnifiedConstitutionalValidator(project_root=project)
+            start = time.perf_counter()
+            asyncio.run(validator.validate_all_20_articles())
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.8  # three 0.3s articles overlap instead of summing
+
+    def test_close_shuts_down_pool_and_c6_runs_in_project(self, project):
+        calls = []
+
+        def record_run(*args, **kwargs):
+            calls.append(kwargs.get("cwd"))
+            return _fake_run(*args, **kwargs)
+
+        with patch("scripts.constitutional_validator_v3.subprocess.run", side_effect=record_run):
+            with UnifiedConstitutionalValidator(project_root=project) as validator:
+                asyncio.run(validator.validate_c6_test_first({}))
+
+        assert calls == [project]
+        with pytest.raises(RuntimeError):
+            validator._executor.submit(time.sleep, 0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
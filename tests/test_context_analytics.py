@@ -18,9 +18,12 @@ from scripts.context_analytics import (
     ContextReuseMetrics,
     HealthAnalyzer,
     MetricsCollector,
+    MetricsHistory,
     PatternAnalyzer,
     ReportGenerator,
     SessionProductivityMetrics,
+    load_context_snapshot,
+    summarize_trends,
 )
 
 
@@ -502,3 +505,108 @@ class TestContextAnalytics:
         analytics_dir = tmp_path / "analytics"
         report_files = list(analytics_dir.glob("trend_7days_*.json"))
         assert len(report_files) == 1
+
+
+class TestContextSnapshot:
+    """Test single-parse context snapshots."""
+
+    def test_sizes_from_file(self, tmp_path):
+        """Test sizes come from on-disk bytes of top-level members."""
+        context_file = tmp_path / "shared_context.json"
+        context = {"project": "테스트", "context_versions": [{"v": 1}], "updated_at": "2025-11-01T00:00:00+00:00"}
+        context_file.write_text(json.dumps(context, indent=2, ensure_ascii=False), encoding="utf-8")
+
+        snapshot = load_context_snapshot(context_file)
+
+        raw = context_file.read_bytes()
+        assert snapshot.data == context
+        assert snapshot.file_size == len(raw)
+        members = [b'"context_versions": [\n    {\n      "v": 1\n    }\n  ]', b'"updated_at": "2025-11-01T00:00:00+00:00"']
+        assert snapshot.metadata_size == sum(len(member) for member in members)
+        assert snapshot.useful_size == len(raw) - snapshot.metadata_size
+
+    def test_malformed_context_is_empty(self, tmp_path):
+        """Test malformed file yields an empty snapshot."""
+        context_file = tmp_path / "shared_context.json"
+        context_file.write_text('{"a": 1,', encoding="utf-8")
+
+        snapshot = load_context_snapshot(context_file)
+
+        assert snapshot.data == {}
+        assert snapshot.file_size == 0
+
+    def test_unchanged_file_reuses_snapshot(self, tmp_path):
+        """Test snapshot reused while (mtime, size) unchanged."""
+        context_file = tmp_path / "shared_context.json"
+        context_file.write_text(json.dumps({"sessions": []}), encoding="utf-8")
+
+        first = load_context_snapshot(context_file)
+
+        assert load_context_snapshot(context_file, first) is first
+
+    def test_report_parses_context_once(self, tmp_path, monkeypatch):
+        """Test one parse per analysis pass."""
+        import scripts.context_analytics as module
+
+        context_file = tmp_path / "shared_context.json"
+        context_file.write_text(json.dumps({"sessions": [], "shared_knowledge": {}}), encoding="utf-8")
+        parses = []
+        original = module._parse_top_level
+        monkeypatch.setattr(module, "_parse_top_level", lambda text: parses.append(1) or original(text))
+
+        ReportGenerator(context_dir=tmp_path).generate_multi_session_report()
+
+        assert len(parses) == 1
+
+
+class TestMetricsHistory:
+    """Test persisted metric history and trends."""
+
+    def test_history_append_and_window(self, tmp_path):
+        """Test records filtered by day window."""
+        history = MetricsHistory(tmp_path / "history.jsonl")
+        now = datetime.now(timezone.utc)
+        history.append({"timestamp": (now - timedelta(days=10)).isoformat(), "health_score": 0.5})
+        history.append({"timestamp": now.isoformat(), "health_score": 0.9})
+
+        assert len(history.load()) == 2
+        assert [r["health_score"] for r in history.load(days=7)] == [0.9]
+
+    def test_history_window_accepts_naive_timestamps(self, tmp_path):
+        """Test naive (pre-UTC) timestamps are read as UTC instead of raising."""
+        history = MetricsHistory(tmp_path / "history.jsonl")
+        now = datetime.now(timezone.utc)
+        history.append({"timestamp": (now - timedelta(days=10)).replace(tzinfo=None).isoformat(), "health_score": 0.5})
+        history.append({"timestamp": now.replace(tzinfo=None).isoformat(), "health_score": 0.9})
+
+        assert [r["health_score"] for r in history.load(days=7)] == [0.9]
+        assert [r["health_score"] for r in history.load(days=7, now=now.replace(tzinfo=None))] == [0.9]
+
+    def test_summarize_trends(self):
+        """Test trend direction respects metric orientation."""
+        records = [
+            {"timestamp": "2025-11-01T10:00:00+00:00", "efficiency_score": 70.0, "session_conflicts": 1},
+            {"timestamp": "2025-11-02T10:00:00+00:00", "efficiency_score": 80.0, "session_conflicts": 3},
+        ]
+
+        trends, daily = summarize_trends(records)
+
+        assert trends["efficiency_score"]["direction"] == "improving"
+        assert trends["efficiency_score"]["change"] == 10.0
+        assert trends["session_conflicts"]["direction"] == "declining"
+        assert [day["date"] for day in daily] == ["2025-11-01", "2025-11-02"]
+
+    def test_trend_report_uses_history(self, tmp_path):
+        """Test trend report built from recorded passes."""
+        context_file = tmp_path / "shared_context.json"
+        context_file.write_text(json.dumps({"sessions": [], "shared_knowledge": {}}), encoding="utf-8")
+        generator = ReportGenerator(context_dir=tmp_path)
+        earlier = datetime.now(timezone.utc) - timedelta(days=2)
+        generator.history.append({"timestamp": earlier.isoformat(), "health_score": 0.1})
+
+        report = generator.generate_trend_report(days=7)
+
+        assert report["samples"] == 2
+        assert report["trends"]["health_score"]["direction"] == "improving"
+        assert "note" not in report
+        assert len(generator.history.load()) == 2
@@ -21,6 +21,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from scripts.cli_daemon import daemon_available, send_request
 from scripts.dev_assistant import (
     AssistantConfig,
     ConfigLoader,
@@ -578,6 +579,26 @@ class TestDevAssistant:
         assert sigint_handler is not None
         assert sigterm_handler is not None
 
+    @pytest.mark.skipif(not daemon_available(), reason="Unix domain sockets required")
+    def test_serve_socket_answers_ping(self, tmp_path, monkeypatch):
+        """serve_socket should start the verification socket server."""
+        import scripts.dev_assistant as dev_assistant
+
+        sock = tmp_path / "verify.sock"
+        monkeypatch.setattr(dev_assistant, "socket_path", lambda name: sock)
+        assistant = DevAssistant(config=AssistantConfig(serve_socket=True))
+
+        assistant._start_socket_server()
+        for _ in range(200):
+            if sock.exists():
+                break
+            time.sleep(0.01)
+        response = send_request(sock, {"command": "ping"}, timeout=2)
+        assistant.stop()
+
+        assert response is not None and response["ok"] is True
+        assert not assistant._socket_thread.is_alive()
+
 
 class TestIntegration:
     """Integration tests for complete file watching workflow."""
@@ -0,0 +1,130 @@
+"""Tests for packed monthly evidence archives
+
+Tests:
+- Dictionary training and per-record random access
+- EvidenceArchiver packing month directories (incl. legacy .json.gz)
+- Index/manifest based counts for EvidenceCleaner
+"""
+
+import gzip
+import json
+
+import pytest
+
+from scripts.evidence_archiver import EvidenceArchiver
+from scripts.evidence_cleaner import EvidenceCleaner
+from scripts.evidence_pack import EvidencePack, archived_record_count, read_manifest, train_dictionary
+
+
+def evidence(task_id: str, index: int) -> bytes:
+    payload = {
+        "task_id": task_id,
+        "status": "success",
+        "command": f"pytest tests/test_{index}.py",
+        "evidence": {"exit_code": 0, "duration_seconds": index / 10},
+    }
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+@pytest.fixture
+def records():
+    return [(f"evidence_{i}.json", evidence(f"FEAT-2025-01-0{i % 3}-01", i), 1_000.0 + i) for i in range(30)]
+
+
+class TestEvidencePack:
+    """Pack format"""
+
+    def test_train_dictionary_keeps_shared_segments(self, records):
+        dictionary = train_dictionary(data for _, data, _ in records)
+        assert b'"status": "success"' in dictionary
+        assert len(dictionary) <= 32 * 1024
+
+    def test_round_trip_and_random_access(self, tmp_path, records):
+        pack = EvidencePack(tmp_path, "2025-01")
+        written = pack.append(records)
+
+        reopened = EvidencePack(tmp_path, "2025-01")
+        assert len(reopened) == 30
+        assert reopened.read_bytes("evidence_7.json") == records[7][1]
+        assert reopened.read_json("evidence_3.json")["command"] == "pytest tests/test_3.py"
+        # Shared dictionary beats gzipping each file on its own by a wide margin
+        assert written < 0.6 * sum(len(gzip.compress(data)) for _, data, _ in records)
+
+    def test_find_by_task_id(self, tmp_path, records):
+        pack = EvidencePack(tmp_path, "2025-01")
+        pack.append(records)
+        assert pack.find("FEAT-2025-01-01-01") == sorted(f"evidence_{i}.json" for i in range(1, 30, 3))
+
+    def test_append_reuses_dictionary(self, tmp_path, records):
+        pack = EvidencePack(tmp_path, "2025-01")
+        pack.append(records[:20])
+        pack.append(records[20:])
+
+        reopened = EvidencePack(tmp_path, "2025-01")
+        assert reopened.read_bytes("evidence_5.json") == records[5][1]
+        assert reopened.read_bytes("evidence_25.json") == records[25][1]
+
+    def test_corrupted_record_detected(self, tmp_path, records):
+        pack = EvidencePack(tmp_path, "2025-01")
+        pack.append(records)
+        entry = pack.records["evidence_0.json"]
+        entry["sha256"] = "0" * 64
+        with pytest.raises(ValueError, match="Checksum"):
+            pack.read_bytes("evidence_0.json")
+
+    def test_manifest_counts_and_delete(self, tmp_path, records):
+        EvidencePack(tmp_path, "2025-01").append(records)
+        EvidencePack(tmp_path, "2025-02").append(records[:5])
+
+        assert archived_record_count(tmp_path) == 35
+        assert archived_record_count(tmp_path, "2025-02") == 5
+
+        assert EvidencePack(tmp_path, "2025-01").delete() == 30
+        assert set(read_manifest(tmp_path)) == {"2025-02"}
+        assert EvidencePack.months(tmp_path) == ["2025-02"]
+
+
+class TestEvidenceArchiver:
+    """Archiver integration"""
+
+    def test_compress_packs_month_directory(self, tmp_path, records):
+        month_dir = tmp_path / "archive" / "2020-01"
+        month_dir.mkdir(parents=True)
+        for name, data, _ in records[:-1]:
+            (month_dir / name).write_bytes(data)
+        legacy_name, legacy_data, _ = records[-1]
+        (month_dir / f"{legacy_name}.gz").write_bytes(gzip.compress(legacy_data))
+
+        archiver = EvidenceArchiver(tmp_path)
+        archiver.compress_old_archives(days=30)
+
+        assert not month_dir.exists()
+        assert archiver.stats["files_compressed"] == 30
+        assert archiver.count_records() == 30
+        assert archiver.read_record("2020-01", legacy_name) == legacy_data
+        assert ("2020-01", "evidence_1.json") in archiver.find("FEAT-2025-01-01-01")
+
+    def test_dry_run_leaves_files(self, tmp_path, records):
+        month_dir = tmp_path / "archive" / "2020-01"
+        month_dir.mkdir(parents=True)
+        (month_dir / "evidence_0.json").write_bytes(records[0][1])
+
+        EvidenceArchiver(tmp_path, dry_run=True).compress_old_archives(days=30)
+
+        assert (month_dir / "evidence_0.json").exists()
+        assert not EvidencePack(tmp_path / "archive", "2020-01").exists
+
+    def test_clean_old_archives_removes_packs(self, tmp_path, records):
+        EvidencePack(tmp_path / "archive", "2020-01").append(records)
+
+        archiver = EvidenceArchiver(tmp_path)
+        archiver.clean_old_archives(days=90)
+
+        assert archiver.stats["files_cleaned"] == 30
+        assert archiver.count_records() == 0
+
+    def test_cleaner_counts_from_manifest(self, tmp_path, records):
+        evidence_dir = tmp_path / "evidence"
+        EvidencePack(evidence_dir / "archive", "2025-01").append(records)
+
+        assert EvidenceCleaner([evidence_dir]).count_archived() == 30
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for LatencyRecorder
+
+Tests:
+- Quantile sketch accuracy and merging
+- Sliding window expiry
+- Error rate and uptime accounting
+- Context manager and decorator integration
+"""
+
+import asyncio
+import random
+import threading
+
+import pytest
+
+from scripts.latency_recorder import LatencyRecorder, QuantileSketch
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def recorder(clock):
+    return LatencyRecorder(window_seconds=60, bucket_seconds=10, clock=clock)
+
+
+class TestQuantileSketch:
+    """Test quantile sketch"""
+
+    def test_empty_sketch(self):
+        sketch = QuantileSketch()
+        assert sketch.quantile(0.99) == 0.0
+        assert sketch.count == 0
+
+    def test_relative_accuracy(self):
+        rng = random.Random(42)
+        values = [rng.lognormvariate(3, 1) for _ in range(10000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        values.sort()
+        for q in (0.5, 0.95, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+
+    def test_merge_matches_single_sketch(self):
+        combined, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for value in range(1, 1001):
+            combined.add(value)
+            (left if value % 2 else right).add(value)
+
+        left.merge(right)
+        assert left.count == combined.count
+        assert left.quantile(0.95) == combined.quantile(0.95)
+        assert left.max == 1000
+
+    def test_merge_rejects_different_accuracy(self):
+        with pytest.raises(ValueError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+    def test_zero_values(self):
+        sketch = QuantileSketch()
+        for _ in range(10):
+            sketch.add(0)
+        sketch.add(100)
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == pytest.approx(100, rel=0.01)
+
+
+class TestLatencyRecorder:
+    """Test sliding window recorder"""
+
+    def test_snapshot_format(self, recorder):
+        for latency in range(1, 101):
+            recorder.record("op", latency)
+
+        metrics = recorder.snapshot("op")
+        assert metrics["p50_latency_ms"] == pytest.approx(50, rel=0.02)
+        assert metrics["p99_latency_ms"] == pytest.approx(99, rel=0.02)
+        assert metrics["error_rate_percent"] == 0.0
+        assert metrics["uptime_percent"] == 100.0
+        assert metrics["request_count"] == 100
+
+    def test_window_expiry(self, recorder, clock):
+        recorder.record("op", 500)
+        clock.now += 70
+        recorder.record("op", 5)
+
+        metrics = recorder.snapshot("op")
+        assert metrics["request_count"] == 1
+        assert metrics["p99_latency_ms"] == pytest.approx(5, rel=0.02)
+
+    def test_error_rate_and_uptime(self, recorder, clock):
+        recorder.record("op", 10, success=True)
+        recorder.record("op", 10, success=False)
+        clock.now += 10
+        recorder.record("op", 10, success=False)
+
+        metrics = recorder.snapshot("op")
+        assert metrics["error_rate_percent"] == pytest.approx(66.667, rel=0.001)
+        assert metrics["uptime_percent"] == 50.0
+
+    def test_snapshot_all_operations(self, recorder):
+        recorder.record("a", 10)
+        recorder.record("b", 1000)
+
+        assert recorder.operations() == ["a", "b"]
+        assert recorder.snapshot()["request_count"] == 2
+        assert recorder.snapshot("missing")["request_count"] == 0
+
+    def test_track_records_errors(self, recorder):
+        with recorder.track("op"):
+            pass
+        with pytest.raises(RuntimeError):
+            with recorder.track("op"):
+                raise RuntimeError("boom")
+
+        metrics = recorder.snapshot("op")
+        assert metrics["request_count"] == 2
+        assert metrics["error_rate_percent"] == 50.0
+
+    def test_timed_decorator(self, recorder):
+        @recorder.timed("sync_op")
+        def work(x):
+            return x * 2
+
+        @recorder.timed()
+        async def async_work():
+            return "done"
+
+        assert work(2) == 4
+        assert asyncio.run(async_work()) == "done"
+        assert recorder.snapshot("sync_op")["request_count"] == 1
+        assert any(name.endswith("async_work") for name in recorder.operations())
+
+    def test_snapshot_during_concurrent_records(self):
+        recorder = LatencyRecorder(window_seconds=60, bucket_seconds=10)
+        stop = threading.Event()
+
+        def writer(seed):
+            rng = random.Random(seed)
+            while not stop.is_set():
+                recorder.record("op", rng.uniform(0.1, 5000))
+
+        threads = [threading.Thread(target=writer, args=(seed,)) for seed in range(4)]
+        for thread in threads:
+            thread.start()
+        try:
+            for _ in range(200):
+                snapshot = recorder.snapshot("op")
+                assert snapshot["p50_latency_ms"] <= snapshot["p99_latency_ms"]
+                assert recorder.sketch().count >= 0
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+        assert recorder.sketch("op").count == recorder.snapshot("op")["request_count"]
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            LatencyRecorder(window_seconds=5, bucket_seconds=10)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
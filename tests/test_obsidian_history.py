@@ -3,12 +3,14 @@
 옵시디언 히스토리 추적 테스트
 """
 
+import json
 import pytest
 import tempfile
 from pathlib import Path
 import time
 import sys
 import os
+from unittest.mock import patch
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -214,6 +216,114 @@ class TestObsidianHistory:
             assert "Most Updated Files" in report
             assert "Recent Updates" in report
 
+    def test_unchanged_note_uses_cached_hash(self):
+        """(mtime, size)가 같으면 문서를 다시 읽지 않음"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracker = ObsidianHistoryTracker(tmpdir)
+            test_file = Path(tmpdir) / "test.md"
+            test_file.write_text("# Test\n", encoding="utf-8")
+            tracker.track_update("test.md", action="create")
+
+            with patch.object(Path, "read_text", side_effect=AssertionError("note re-read")):
+                skipped = tracker.track_update("test.md", action="sync", skip_unchanged=True)
+
+            assert skipped["skipped"] is True
+            assert tracker.get_file_history("test.md")["update_count"] == 1
+
+    def test_history_section_does_not_count_as_change(self):
+        """히스토리 섹션 재작성은 본문 변경으로 보지 않음"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracker = ObsidianHistoryTracker(tmpdir)
+            test_file = Path(tmpdir) / "test.md"
+            test_file.write_text("# Test\n\nBody\n", encoding="utf-8")
+            first = tracker.track_update("test.md", action="create")
+
+            os.utime(test_file)  # stat 캐시 무효화 -> 본문 hash로 비교
+            record = tracker.track_update("test.md", action="sync", skip_unchanged=True)
+
+            assert record["skipped"] is True
+            assert record["hash"] == first["hash"]
+
+    def test_track_many_writes_index_once(self):
+        """대량 동기화는 인덱스를 한 번만 저장"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracker = ObsidianHistoryTracker(tmpdir)
+            for i in range(20):
+                (Path(tmpdir) / f"note{i}.md").write_text(f"# Note {i}\n", encoding="utf-8")
+
+            with patch.object(tracker, "_save_history_index", wraps=tracker._save_history_index) as save:
+                records = tracker.track_many([f"note{i}.md" for i in range(20)] + ["missing.md"])
+
+            assert len(records) == 20
+            assert save.call_count == 1
+            assert len(tracker.get_recent_updates(limit=50)) == 20
+
+            # 두 번째 동기화: 바뀐 문서만 기록
+            (Path(tmpdir) / "note3.md").write_text("# Note 3\n\nChanged\n", encoding="utf-8")
+            records = tracker.track_many([f"note{i}.md" for i in range(20)])
+            assert [r["update_number"] for r in records] == [2]
+
+    def test_history_log_retention(self):
+        """문서별 로그는 최근 MAX_HISTORY개만 유지"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracker = ObsidianHistoryTracker(tmpdir)
+            (Path(tmpdir) / "test.md").write_text("# Test", encoding="utf-8")
+
+            with patch("scripts.obsidian_history_tracker.MAX_HISTORY", 5):
+                for i in range(12):
+                    tracker.track_update("test.md", action=f"update_{i+1}")
+                history = tracker.get_file_history("test.md")
+
+            assert history["update_count"] == 12
+            assert [r["update_number"] for r in history["history"]] == [8, 9, 10, 11, 12]
+            log_lines = tracker._log_path("test.md").read_text(encoding="utf-8").splitlines()
+            assert len(log_lines) <= 10
+
+    def test_tail_section_rewritten_in_place(self):
+        """문서 끝의 히스토리 섹션만 교체하고 본문은 보존"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracker = ObsidianHistoryTracker(tmpdir)
+            test_file = Path(tmpdir) / "test.md"
+            test_file.write_text("# Test\n\n한글 본문\n", encoding="utf-8")
+
+            for i in range(3):
+                tracker.track_update("test.md", action=f"update_{i+1}")
+
+            content = test_file.read_text(encoding="utf-8")
+            assert content.startswith("# Test\n\n한글 본문\n")
+            assert content.count("<!-- HISTORY_START -->") == 1
+            assert "**Total Updates**: 3" in content
+
+    def test_legacy_index_migrated(self):
+        """기존 인덱스 (history 목록 포함)를 문서별 로그로 이전"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracker = ObsidianHistoryTracker(tmpdir)
+            record = {
+                "timestamp": "2025-01-01 00:00:00 UTC",
+                "timestamp_iso": "2025-01-01T00:00:00+00:00",
+                "action": "create",
+                "hash": "abcd1234",
+                "size": 6,
+                "lines": 1,
+                "metadata": {},
+                "update_number": 1,
+            }
+            legacy = {
+                "old.md": {
+                    "first_created": record["timestamp"],
+                    "last_updated": record["timestamp"],
+                    "update_count": 1,
+                    "history": [record],
+                }
+            }
+            tracker.history_index.write_text(json.dumps(legacy), encoding="utf-8")
+
+            history = tracker.get_file_history("old.md")
+
+            assert history["history"] == [record]
+            assert "history" not in json.loads(tracker.history_index.read_text(encoding="utf-8"))["old.md"]
+            assert tracker.get_recent_updates()[0]["file_path"] == "old.md"
+
     def test_no_emoji_in_python_code(self):
         """Python 코드에 이모지가 없는지 확인"""
         # obsidian_bridge.py 확인
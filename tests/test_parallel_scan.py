@@ -0,0 +1,85 @@
+"""
+Parallel scan tests - ordered chunked map over a process pool
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import parallel_scan  # noqa: E402
+from parallel_scan import PhaseTimer, chunked, map_chunks  # noqa: E402
+
+
+def square_chunk(chunk):
+    return [item * item for item in chunk]
+
+
+def test_chunked():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunked([], 3)) == []
+
+
+def test_pool_results_in_input_order():
+    items = list(range(40))
+    progress = []
+
+    results = list(map_chunks(square_chunk, items, workers=2, chunk_size=3, progress=lambda *p: progress.append(p)))
+
+    assert results == [item * item for item in items]
+    assert progress[-1] == (40, 40)
+    assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+
+
+def test_small_input_runs_inline():
+    calls = []
+
+    def inline(chunk):
+        calls.append(chunk)
+        return square_chunk(chunk)
+
+    results = list(map_chunks(square_chunk, [1, 2, 3], workers=4, chunk_size=2, inline_job=inline))
+
+    assert results == [1, 4, 9]
+    assert calls == [[1, 2], [3]]
+
+
+def test_pool_unavailable_falls_back_inline(monkeypatch):
+    def broken_pool(*args, **kwargs):
+        raise OSError("no semaphores")
+
+    monkeypatch.setattr(parallel_scan, "ProcessPoolExecutor", broken_pool)
+
+    assert list(map_chunks(square_chunk, list(range(20)), workers=4)) == [item * item for item in range(20)]
+
+
+def test_early_close_stops_scan():
+    stream = map_chunks(square_chunk, list(range(100)), workers=2, chunk_size=4)
+
+    assert [next(stream) for _ in range(3)] == [0, 1, 4]
+    stream.close()
+
+
+def test_phase_timer_accumulates():
+    timer = PhaseTimer()
+    with timer.phase("parse"):
+        pass
+    timer.merge({"parse": 1.0, "read": 0.5})
+
+    assert timer.totals["parse"] >= 1.0
+    assert timer.totals["read"] == 0.5
+
+
+def test_parallel_flag_overrides_size_threshold(monkeypatch):
+    attempts = []
+
+    def broken_pool(*args, **kwargs):
+        attempts.append(kwargs["max_workers"])
+        raise OSError("no semaphores")
+
+    monkeypatch.setattr(parallel_scan, "ProcessPoolExecutor", broken_pool)
+
+    assert list(map_chunks(square_chunk, list(range(40)), workers=4, parallel=False)) == [i * i for i in range(40)]
+    assert attempts == []
+    assert list(map_chunks(square_chunk, [1, 2, 3], workers=4, chunk_size=1, parallel=True)) == [1, 4, 9]
+    assert attempts == [3]
@@ -3,9 +3,11 @@
 Parallel Task Executor (enhanced_task_executor_v2) 테스트
 """
 
+import asyncio
 import pytest
 import sys
 import os
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -166,6 +168,224 @@ class TestParallelTaskExecutor:
         assert not should_continue
 
 
+class TestBoundedScheduler:
+    """max_workers 제한, asyncio subprocess, 타임아웃, 취소 전파 테스트"""
+
+    def test_concurrency_never_exceeds_max_workers(self, tmp_path):
+        """동시 실행 수가 max_workers를 넘지 않음"""
+        executor = ParallelTaskExecutor(tmp_path, max_workers=2)
+        running = {"now": 0, "peak": 0}
+
+        async def fake_single(task):
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            await asyncio.sleep(0.02)
+            running["now"] -= 1
+            return ExecutionResult(success=True, task_id=task.id, description=task.description, is_parallel=True)
+
+        tasks = [Task(f"T{i:03d}", f"Task {i}", "Setup", True, False) for i in range(8)]
+        with patch.object(executor, "_execute_single_task", side_effect=fake_single):
+            results = asyncio.run(executor._execute_parallel_tasks(tasks))
+
+        assert running["peak"] == 2
+        assert list(results) == [task.id for task in tasks]
+        assert all(res.success for res in results.values())
+
+    def test_blocking_failure_cancels_siblings(self, tmp_path):
+        """BLOCKING 페이즈 실패 시 실행 중/대기 중 태스크 취소"""
+        executor = ParallelTaskExecutor(tmp_path, max_workers=2)
+
+        async def fake_single(task):
+            if task.id == "T001":
+                await asyncio.sleep(0.01)
+                return ExecutionResult(success=False, task_id=task.id, error="boom", is_parallel=True)
+            await asyncio.sleep(5)
+            return ExecutionResult(success=True, task_id=task.id, is_parallel=True)
+
+        phase = Phase(
+            name="BLOCKING Build",
+            tasks=[Task(f"T00{i}", f"Task {i}", "Build", True, False) for i in range(1, 5)]
+            + [Task("T005", "After", "Build", False, False)],
+            blocking=True,
+        )
+        started = time.perf_counter()
+        with patch.object(executor, "_execute_single_task", side_effect=fake_single):
+            results = asyncio.run(executor._execute_phase(phase))
+
+        assert time.perf_counter() - started < 2
+        assert results["T001"].error == "boom"
+        for task_id in ("T002", "T003", "T004"):
+            assert not results[task_id].success
+            assert results[task_id].error.startswith("Cancelled")
+        assert "T005" not in results
+
+    def test_real_subprocess_streams_output(self, tmp_path):
+        """실제 subprocess 실행 및 출력 스트리밍"""
+        lines = []
+        executor = ParallelTaskExecutor(
+            tmp_path, output_callback=lambda tid, stream, line: lines.append((tid, stream, line))
+        )
+        task = Task(
+            "T001", "Echo", command=[sys.executable, "-c", "import sys; print('out'); print('err', file=sys.stderr)"]
+        )
+
+        ok, stdout, stderr = asyncio.run(executor._execute_command(task))
+
+        assert ok
+        assert stdout.strip() == "out"
+        assert stderr.strip() == "err"
+        assert ("T001", "stdout", stdout) in lines
+
+    def test_line_longer_than_stream_limit(self, tmp_path):
+        """64 KiB보다 긴 한 줄 출력도 예외 없이 수집"""
+        executor = ParallelTaskExecutor(tmp_path)
+        task = Task("T001", "Long line", command=[sys.executable, "-c", "print('x' * 200000); print('tail')"])
+
+        ok, stdout, _ = asyncio.run(executor._execute_command(task))
+
+        assert ok
+        assert stdout.splitlines() == ["x" * 200000, "tail"]
+
+    def test_output_without_newlines_is_bounded(self, tmp_path):
+        """줄바꿈 없는 출력(\\r 진행 표시)도 청크 단위로 흘려보내고 수집량 제한"""
+        executor = ParallelTaskExecutor(tmp_path)
+        executor.READ_CHUNK_BYTES = 64
+        executor.MAX_CAPTURE_BYTES = 1000
+        pieces = []
+        executor.output_callback = lambda task_id, stream, line: pieces.append(line)
+        script = "import sys; sys.stdout.write(''.join(f'\\r{i:6d}%' for i in range(20000)))"
+        task = Task("T001", "Progress", command=[sys.executable, "-c", script])
+
+        ok, stdout, _ = asyncio.run(executor._execute_command(task))
+
+        assert ok
+        assert "".join(pieces) == "".join(f"\r{i:6d}%" for i in range(20000))
+        assert max(len(piece) for piece in pieces) < 2 * executor.READ_CHUNK_BYTES
+        assert len(stdout) < executor.MAX_CAPTURE_BYTES + 2 * executor.READ_CHUNK_BYTES
+
+    def test_per_task_timeout(self, tmp_path):
+        """태스크별 타임아웃 초과 시 프로세스 종료 및 실패 처리"""
+        executor = ParallelTaskExecutor(tmp_path)
+        task = Task("T001", "Sleep", command=[sys.executable, "-c", "import time; time.sleep(10)"], timeout=0.3)
+
+        started = time.perf_counter()
+        ok, _, stderr = asyncio.run(executor._execute_command(task))
+
+        assert not ok
+        assert "timed out after 0.3s" in stderr
+        assert time.perf_counter() - started < 5
+
+    def test_timeout_parsed_from_task_spec(self, tmp_path):
+        """YAML/Markdown 태스크 정의에서 timeout 파싱"""
+        executor = ParallelTaskExecutor(tmp_path)
+        yaml_file = tmp_path / "tasks.yaml"
+        yaml_file.write_text(
+            "commands:\n  - id: T001\n    exec: ['echo', 'a']\n    timeout: 15\n  - id: T002\n    exec: ['echo', 'b']\n",
+            encoding="utf-8",
+        )
+
+        tasks = executor.parse_tasks_file(yaml_file)[0].tasks
+        md_task = executor._parse_task_line("- [ ] T003 [P] Slow build (timeout: 120s)")
+
+        assert tasks[0].timeout == 15.0
+        assert tasks[1].timeout is None
+        assert md_task.timeout == 120.0
+        assert md_task.description == "Slow build"
+
+
+class TestCrossPhaseExecution:
+    """태스크 의존성 그래프 기반 페이즈 간 실행 테스트"""
+
+    @staticmethod
+    def _fake_runner(log, durations=None, failing=()):
+        async def fake_single(task):
+            duration = (durations or {}).get(task.id, 0.01)
+            log.append(("start", task.id))
+            await asyncio.sleep(duration)
+            log.append(("end", task.id))
+            return ExecutionResult(
+                success=task.id not in failing, task_id=task.id, duration=duration, description=task.description
+            )
+
+        return fake_single
+
+    def test_task_starts_before_unrelated_phase_finishes(self, tmp_path):
+        """다른 페이즈의 무관한 태스크를 기다리지 않음"""
+        executor = ParallelTaskExecutor(tmp_path, cross_phase=True)
+        phases = [
+            Phase("Setup", [Task("T001", "Slow setup", "Setup")]),
+            Phase("US1", [Task("T002", "Independent story", "US1")]),
+        ]
+        log = []
+        with patch.object(executor, "_execute_single_task", side_effect=self._fake_runner(log, {"T001": 0.2})):
+            results = asyncio.run(executor.execute_phases(phases))
+
+        assert log.index(("end", "T002")) < log.index(("end", "T001"))
+        assert set(results) == {"Setup", "US1"}
+        assert executor.stats["completed_tasks"] == 2
+        assert executor.stats["critical_path_time"] > 0
+
+    def test_dependencies_respected(self, tmp_path):
+        """명시적 의존성과 파일 중첩 순서 준수"""
+        executor = ParallelTaskExecutor(tmp_path, cross_phase=True)
+        phases = [
+            Phase("Setup", [Task("T001", "Create model in src/models/user.py", "Setup", is_parallel=True)]),
+            Phase(
+                "US1",
+                [
+                    Task("T002", "Test model", "US1", is_parallel=True, dependencies=["T001"]),
+                    Task("T003", "Extend src/models/user.py", "US1", is_parallel=True, files=["src/models/user.py"]),
+                ],
+            ),
+        ]
+        phases[0].tasks[0].files = ["src/models/user.py"]
+        log = []
+        with patch.object(executor, "_execute_single_task", side_effect=self._fake_runner(log)):
+            asyncio.run(executor.execute_phases(phases))
+
+        for task_id in ("T002", "T003"):
+            assert log.index(("end", "T001")) < log.index(("start", task_id))
+
+    def test_failure_skips_dependents_only(self, tmp_path):
+        """실패한 태스크의 후속 태스크만 건너뜀"""
+        executor = ParallelTaskExecutor(tmp_path, cross_phase=True)
+        phases = [
+            Phase(
+                "Main",
+                [
+                    Task("T001", "Fails", "Main", is_parallel=True),
+                    Task("T002", "Needs T001", "Main", is_parallel=True, dependencies=["T001"]),
+                    Task("T003", "Unrelated", "Main", is_parallel=True),
+                ],
+            )
+        ]
+        with patch.object(executor, "_execute_single_task", side_effect=self._fake_runner([], failing={"T001"})):
+            results = asyncio.run(executor.execute_phases(phases))["Main"]
+
+        assert not results["T001"].success
+        assert results["T002"].error == "Skipped: dependency T001 failed"
+        assert results["T003"].success
+
+    def test_markdown_dependency_marker(self, tmp_path):
+        """tasks.md의 (depends: ...) 마커 파싱"""
+        executor = ParallelTaskExecutor(tmp_path)
+        task = executor._parse_task_line("- [ ] T005 [P] Add endpoint in src/api/users.py (depends: T001, T003)")
+
+        assert task.dependencies == ["T001", "T003"]
+        assert task.files == ["src/api/users.py"]
+        assert task.description == "Add endpoint in src/api/users.py"
+
+    def test_plan_report(self, tmp_path):
+        """크리티컬 패스 리포트 생성"""
+        executor = ParallelTaskExecutor(tmp_path)
+        phases = [Phase("Setup", [Task("T001", "A", "Setup"), Task("T002", "B", "Setup")])]
+
+        report = executor.plan_report(phases)
+
+        assert "Critical path:" in report
+        assert "T001 [Setup]" in report
+
+
 class TestIntegration:
     """통합 테스트"""
 
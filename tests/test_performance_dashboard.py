@@ -14,8 +14,11 @@ Tests:
 """
 
 import json
+import subprocess
+import sys
 import time
 from datetime import datetime, timedelta
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -145,6 +148,99 @@ class TestPerformanceProfiling:
         assert abs(profile.memory_delta_mb - 50.0) < 1.0  # ~50MB delta
 
 
+def _busy_loop(duration: float):
+    """Spin the CPU so the stack sampler has something to see"""
+    end = time.perf_counter() + duration
+    total = 0
+    while time.perf_counter() < end:
+        total += sum(range(100))
+    return total
+
+
+class TestSamplingProfiler:
+    """Test opt-in stack sampling, allocation tracing and buffered flush"""
+
+    def test_default_profile_has_no_samples(self, dashboard):
+        """Test sampling is off unless requested"""
+        with dashboard.profile_context("plain"):
+            pass
+
+        assert "stack_samples" not in dashboard.profiles[0].metadata
+
+    def test_sample_stacks_collapsed(self, dashboard):
+        """Test sampled stacks are collapsed outer;inner with counts"""
+        with dashboard.profile_context("busy", sample_stacks=True, sample_interval_ms=1):
+            _busy_loop(0.1)
+
+        metadata = dashboard.profiles[0].metadata
+        assert metadata["sample_count"] > 0
+        assert sum(metadata["stack_samples"].values()) == metadata["sample_count"]
+        assert any(stack.endswith("test_performance_dashboard.py:_busy_loop") for stack in metadata["stack_samples"])
+
+    def test_export_collapsed_stacks(self, dashboard, tmp_path):
+        """Test folded stack export merges profiles by name"""
+        for _ in range(2):
+            with dashboard.profile_context("busy", sample_stacks=True, sample_interval_ms=1):
+                _busy_loop(0.05)
+
+        output = tmp_path / "busy.folded"
+        written = dashboard.export_collapsed_stacks(output, "busy")
+
+        lines = output.read_text(encoding="utf-8").splitlines()
+        assert written == len(lines) > 0
+        total = sum(int(line.rsplit(" ", 1)[1]) for line in lines)
+        assert total == sum(p.metadata["sample_count"] for p in dashboard.profiles)
+
+    def test_trace_allocations(self, dashboard):
+        """Test top allocation sites are recorded"""
+        with dashboard.profile_context("alloc", trace_allocations=True, top_allocations=3):
+            blocks = [bytearray(10_000) for _ in range(100)]
+
+        allocations = dashboard.profiles[0].metadata["top_allocations"]
+        assert len(blocks) == 100
+        assert 0 < len(allocations) <= 3
+        assert allocations[0]["location"].startswith("test_performance_dashboard.py:")
+        assert allocations[0]["size_diff_kb"] > 900
+
+    def test_buffered_flush(self, temp_dashboard_dir):
+        """Test profile results are buffered until flush()"""
+        dashboard = PerformanceDashboard(data_dir=temp_dashboard_dir, profile_flush_interval=3600)
+        for i in range(5):
+            with dashboard.profile_context(f"step_{i}"):
+                pass
+
+        assert not (temp_dashboard_dir / "profiles.json").exists()
+
+        dashboard.flush()
+        reloaded = PerformanceDashboard(data_dir=temp_dashboard_dir)
+        assert len(reloaded.profiles) == 5
+
+    def test_context_manager_flushes(self, temp_dashboard_dir):
+        """Test close() via the context manager writes buffered results"""
+        with PerformanceDashboard(data_dir=temp_dashboard_dir, profile_flush_interval=3600) as dashboard:
+            with dashboard.profile_context("step"):
+                pass
+
+        assert len(PerformanceDashboard(data_dir=temp_dashboard_dir).profiles) == 1
+
+    def test_buffered_results_flushed_at_exit(self, temp_dashboard_dir):
+        """Test buffered results are not lost when the interpreter exits"""
+        code = "\n".join(
+            [
+                "import sys",
+                "from pathlib import Path",
+                "sys.path.insert(0, sys.argv[1])",
+                "from scripts.performance_dashboard import PerformanceDashboard",
+                "dashboard = PerformanceDashboard(data_dir=Path(sys.argv[2]), profile_flush_interval=3600)",
+                "with dashboard.profile_context('step'):",
+                "    pass",
+            ]
+        )
+        subprocess.run([sys.executable, "-c", code, str(Path(__file__).parent.parent), str(temp_dashboard_dir)], check=True)
+
+        assert len(PerformanceDashboard(data_dir=temp_dashboard_dir).profiles) == 1
+
+
 class TestTrendAnalysis:
     """Test trend analysis functionality"""
 
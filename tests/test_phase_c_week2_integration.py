@@ -15,9 +15,9 @@ from pathlib import Path
 import pytest
 
 from scripts.critical_file_detector import AnalysisMode, CriticalFileDetector
-from scripts.deep_analyzer import DeepAnalyzer
+from scripts.deep_analyzer import AnalysisCache, DeepAnalyzer, analysis_fingerprint
 from scripts.team_stats_aggregator import TeamStatsAggregator
-from scripts.verification_cache import VerificationCache
+from scripts.verification_cache import VerificationCache, VerificationResult
 from scripts.worker_pool import Priority, WorkerPool
 
 
@@ -480,6 +480,87 @@ def test_backward_compatibility_with_phase_c_week1(temp_workspace, sample_python
     assert dashboard_path.exists()  # Dashboard generated
 
 
+# ============================================================================
+# AnalysisCache (content-addressed DeepAnalysisResult cache)
+# ============================================================================
+
+
+class CountingRuffVerifier:
+    """Ruff 호출 횟수 기록용 verifier"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def verify_file(self, file_path: Path) -> VerificationResult:
+        self.calls += 1
+        return VerificationResult(file_path=file_path, passed=True, violations=[], duration_ms=1.0)
+
+
+def test_analysis_cache_reuses_full_result(temp_workspace, sample_python_files):
+    """동일 내용은 전체 DeepAnalysisResult를 캐시에서 재사용"""
+    ruff = CountingRuffVerifier()
+    cache = AnalysisCache(temp_workspace["cache"] / "analysis", fingerprint="test")
+    analyzer = DeepAnalyzer(mcp_enabled=False, ruff_verifier=ruff, result_cache=cache)
+    critical_file = sample_python_files["critical"]
+
+    first = analyzer.analyze(critical_file)
+    second = DeepAnalyzer(
+        mcp_enabled=False,
+        ruff_verifier=ruff,
+        result_cache=AnalysisCache(temp_workspace["cache"] / "analysis", fingerprint="test"),
+    ).analyze(critical_file)
+
+    assert ruff.calls == 1
+    assert second.solid_violations == first.solid_violations
+    assert second.security_issues == first.security_issues
+    assert second.hallucination_risks == first.hallucination_risks
+    assert second.overall_score == first.overall_score
+
+
+def test_analysis_cache_is_content_addressed(temp_workspace, sample_python_files):
+    """경로가 달라도 내용이 같으면 재분석 없음, 내용이 바뀌면 재분석"""
+    ruff = CountingRuffVerifier()
+    cache = AnalysisCache(temp_workspace["cache"] / "analysis", fingerprint="test")
+    analyzer = DeepAnalyzer(mcp_enabled=False, ruff_verifier=ruff, result_cache=cache)
+    original = sample_python_files["medium"]
+    copy = temp_workspace["base"] / "worktree_copy.py"
+    copy.write_bytes(original.read_bytes())
+
+    analyzer.analyze(original)
+    result = analyzer.analyze(copy)
+    assert ruff.calls == 1
+    assert result.file_path == copy
+    assert result.ruff_result.file_path == copy
+
+    copy.write_text("x = 1\n", encoding="utf-8")
+    analyzer.analyze(copy)
+    assert ruff.calls == 2
+
+
+def test_analysis_cache_fingerprint_namespaces(temp_workspace, sample_python_files):
+    """fingerprint(분석기/ruff 설정)가 바뀌면 이전 결과 무효, prune으로 정리"""
+    cache_dir = temp_workspace["cache"] / "analysis"
+    good_file = sample_python_files["good"]
+    ruff = CountingRuffVerifier()
+
+    DeepAnalyzer(ruff_verifier=ruff, result_cache=AnalysisCache(cache_dir, fingerprint="old")).analyze(good_file)
+    new_cache = AnalysisCache(cache_dir, fingerprint="new")
+    DeepAnalyzer(ruff_verifier=ruff, result_cache=new_cache).analyze(good_file)
+
+    assert ruff.calls == 2
+    assert new_cache.prune() == 1
+    assert sorted(p.name for p in cache_dir.iterdir()) == ["new"]
+
+
+def test_analysis_fingerprint_tracks_ruff_config(tmp_path):
+    """ruff 설정 변경 시 fingerprint 변경"""
+    before = analysis_fingerprint(tmp_path)
+    (tmp_path / "ruff.toml").write_text("line-length = 120\n", encoding="utf-8")
+
+    assert analysis_fingerprint(tmp_path) != before
+    assert analysis_fingerprint(tmp_path) == analysis_fingerprint(tmp_path)
+
+
 # ============================================================================
 # Summary Test
 # ============================================================================
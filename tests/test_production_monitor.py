@@ -17,12 +17,15 @@ from pathlib import Path
 
 import pytest
 
+from scripts.latency_recorder import LatencyRecorder
 from scripts.production_monitor import (
     AlertChannel,
     ExceptionStatus,
     ProductionMonitor,
     SLAReport,
     SLAThreshold,
+    normalize_frames,
+    normalize_message,
 )
 
 
@@ -316,6 +319,23 @@ class TestSLAMonitoring:
 
         assert len(report.violations) == 2  # p50 and uptime
 
+    def test_sla_from_latency_recorder(self, temp_monitor_dir):
+        """Test monitor_sla pulls metrics from the latency recorder"""
+        recorder = LatencyRecorder()
+        monitor = ProductionMonitor(data_dir=temp_monitor_dir, latency_recorder=recorder)
+        for _ in range(99):
+            recorder.record("api", 20)
+        recorder.record("api", 5000, success=False)
+
+        report = monitor.monitor_sla()
+        assert report.metrics["request_count"] == 100
+        assert report.metrics["error_rate_percent"] == 1.0
+        assert report.status == "healthy"
+
+        recorder.record("slow_api", 2000)
+        report = monitor.monitor_sla(operation="slow_api")
+        assert report.status == "critical"
+
     def test_sla_history_persistence(self, temp_monitor_dir):
         """Test SLA history is persisted"""
         monitor1 = ProductionMonitor(data_dir=temp_monitor_dir)
@@ -418,12 +438,102 @@ class TestRootCauseAnalysis:
         analysis = monitor.analyze_root_cause(exc_id2)
         assert exc_id1 in analysis.similar_cases
 
+    def test_analyze_similar_cases_excludes_unrelated(self, monitor):
+        """Test resolved exceptions from unrelated code are not similar"""
+        exc_id1 = monitor.track_exception(ValueError("disk quota"))
+        monitor.resolve_exception(exc_id1, "Fixed")
+
+        try:
+            raise ValueError("Invalid token 12")
+        except ValueError as e:
+            exc_id2 = monitor.track_exception(e)
+
+        analysis = monitor.analyze_root_cause(exc_id2)
+        assert exc_id1 not in analysis.similar_cases
+
     def test_analyze_nonexistent_exception(self, monitor):
         """Test analysis fails for nonexistent exception"""
         with pytest.raises(ValueError, match="Exception not found"):
             monitor.analyze_root_cause("nonexistent_id")
 
 
+class TestExceptionGrouping:
+    """Test fingerprint grouping and similarity index"""
+
+    def test_normalize_message(self):
+        """Test variable message parts become placeholders"""
+        assert normalize_message("User 42 not found") == "User <num> not found"
+        assert normalize_message("Cannot open /var/data/run_17.json") == "Cannot open <path>"
+        assert normalize_message("Missing key 'abc'") == "Missing key <str>"
+        assert normalize_message("Object at 0x7f3a2c") == "Object at <hex>"
+
+    def test_normalize_frames_drops_line_numbers(self):
+        """Test frames keep file basename and function only"""
+        trace = (
+            "Traceback (most recent call last):\n"
+            '  File "/home/a/repo/app/api.py", line 10, in handle\n'
+            '  File "C:\\work\\repo\\app\\db.py", line 99, in query\n'
+        )
+        assert normalize_frames(trace) == ["api.py:handle", "db.py:query"]
+
+    def test_varying_messages_share_group(self, monitor):
+        """Test messages differing only in data are grouped together"""
+        ids = set()
+        for i in range(20):
+            try:
+                raise ValueError(f"Order {i} failed for /tmp/orders/{i}.json")
+            except ValueError as e:
+                ids.add(monitor.track_exception(e))
+
+        groups = monitor.get_exception_groups()
+        assert len(ids) == 20
+        assert len(groups) == 1
+        assert groups[0].message_template == "Order <num> failed for <path>"
+        assert groups[0].occurrence_count == 20
+        assert set(groups[0].exception_ids) == ids
+
+    def test_groups_sorted_by_occurrences(self, monitor):
+        """Test groups are ordered by total occurrences"""
+        for _ in range(3):
+            try:
+                raise KeyError("user_1")
+            except KeyError as e:
+                monitor.track_exception(e)
+        try:
+            raise TypeError("bad type")
+        except TypeError as e:
+            monitor.track_exception(e)
+
+        groups = monitor.get_exception_groups(limit=1)
+        assert len(groups) == 1
+        assert groups[0].exception_type == "KeyError"
+
+    def test_fingerprint_persisted_and_rebuilt(self, temp_monitor_dir, sample_exception):
+        """Test fingerprints survive reload and index is rebuilt"""
+        monitor1 = ProductionMonitor(data_dir=temp_monitor_dir)
+        exc_id = monitor1.track_exception(sample_exception)
+        fingerprint = monitor1.exceptions[exc_id].fingerprint
+
+        monitor2 = ProductionMonitor(data_dir=temp_monitor_dir)
+        assert monitor2.exceptions[exc_id].fingerprint == fingerprint
+        assert monitor2.get_exception_groups()[0].exception_ids == [exc_id]
+
+    def test_find_similar_ranks_same_group_first(self, monitor):
+        """Test same-fingerprint exceptions rank above frame-only matches"""
+
+        def fail(message):
+            raise ValueError(message)
+
+        ids = []
+        for message in ("Unrelated wording", "Retry 1 exhausted", "Retry 2 exhausted"):
+            try:
+                fail(message)
+            except ValueError as e:
+                ids.append(monitor.track_exception(e))
+
+        assert monitor.find_similar_exceptions(ids[2]) == [ids[1], ids[0]]
+
+
 class TestDashboardData:
     """Test dashboard data generation"""
 
@@ -456,7 +566,7 @@ class TestDashboardData:
             raise ValueError("Active error")
         except ValueError as e:
             exc_id = monitor.track_exception(e)
-            monitor.exceptions[exc_id].status = ExceptionStatus.ACTIVE.value
+            monitor.set_exception_status(exc_id, ExceptionStatus.ACTIVE.value)
 
         data = monitor.get_dashboard_data()
         assert data.active_exceptions == 1
@@ -510,6 +620,68 @@ class TestDashboardData:
         assert len(data.error_trend) == 7
         assert all("date" in day and "count" in day for day in data.error_trend)
 
+    def test_get_dashboard_error_trend_counts_today(self, monitor):
+        """Test error trend counts new exceptions in today's bucket"""
+        for i in range(3):
+            try:
+                raise ValueError(f"Trend error {i}")
+            except ValueError as e:
+                monitor.track_exception(e)
+
+        data = monitor.get_dashboard_data()
+        assert data.error_trend[-1]["date"] == datetime.now().strftime("%Y-%m-%d")
+        assert data.error_trend[-1]["count"] == 3
+        assert sum(day["count"] for day in data.error_trend) == 3
+
+
+class TestDashboardAggregates:
+    """Test incrementally maintained dashboard aggregates"""
+
+    def test_top_errors_bounded(self, monitor):
+        """Test top errors keep only the 10 most frequent exceptions"""
+        for i in range(15):
+            for _ in range(i + 1):
+                try:
+                    raise ValueError(f"Error {i}")
+                except ValueError as e:
+                    monitor.track_exception(e, severity="low")
+
+        data = monitor.get_dashboard_data()
+        counts = [err["count"] for err in data.top_errors]
+        assert counts == list(range(15, 5, -1))
+        assert len(monitor._top_errors) == 10
+
+    def test_resolve_updates_active_count(self, monitor, sample_exception):
+        """Test status changes are reflected in active count"""
+        exc_id = monitor.track_exception(sample_exception)
+        monitor.set_exception_status(exc_id, ExceptionStatus.ACTIVE.value)
+        assert monitor.get_dashboard_data().active_exceptions == 1
+
+        monitor.resolve_exception(exc_id, "Fixed")
+        assert monitor.get_dashboard_data().active_exceptions == 0
+
+    def test_old_exceptions_outside_24h_window(self, temp_monitor_dir, sample_exception):
+        """Test aggregates rebuilt on load respect the 24h window"""
+        monitor1 = ProductionMonitor(data_dir=temp_monitor_dir)
+        exc_id = monitor1.track_exception(sample_exception)
+        old = (datetime.now() - timedelta(days=2)).isoformat()
+        monitor1.exceptions[exc_id].first_seen = old
+        monitor1.exceptions[exc_id].last_seen = old
+        monitor1._save_data()
+
+        monitor2 = ProductionMonitor(data_dir=temp_monitor_dir)
+        data = monitor2.get_dashboard_data()
+        assert data.total_exceptions_24h == 0
+        assert data.error_trend[-3]["count"] == 1
+        assert data.top_errors[0]["exception_id"] == exc_id
+
+    def test_repeat_occurrence_moves_last_seen_bucket(self, monitor, sample_exception):
+        """Test repeated occurrences are counted once in the 24h window"""
+        for _ in range(5):
+            monitor.track_exception(sample_exception)
+
+        assert monitor.get_dashboard_data().total_exceptions_24h == 1
+
 
 class TestExceptionResolution:
     """Test exception resolution"""
@@ -9,11 +9,16 @@ Constitutional Compliance:
 """
 
 from pathlib import Path
+import io
 import sys
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
+import prompt_compressor
 from prompt_compressor import (
+    PatternMatcher,
     PromptCompressor,
     compress_prompt,
 )
@@ -248,6 +253,130 @@ class TestLearning:
         assert pattern["success_count"] == 3
 
 
+class TestPatternMatcher:
+    """Test single-pass learned pattern + abbreviation matcher"""
+
+    def setup_method(self):
+        self.compressor = PromptCompressor(compression_level="medium")
+        self.compressor.learned_patterns = {}
+
+    def test_longest_phrase_wins(self):
+        """Longer phrases take priority over contained shorter ones"""
+        matcher = PatternMatcher([("for", "4", "short", True), ("for example", "e.g.", "long", True)])
+        result, labels = matcher.apply("For example, for you")
+        assert result == "e.g., 4 you"
+        assert labels == ["long", "short"]
+
+    def test_adjacent_space_bounded_words(self):
+        """Adjacent ' the '/' a ' style entries do not compete for the shared space"""
+        matcher = PatternMatcher([(" the ", " ", "the", True), (" a ", " ", "a", True)])
+        result, _ = matcher.apply("x the a b")
+        assert result == "x b"
+
+    def test_single_pass_does_not_rescan_output(self):
+        """Replacements are not matched again"""
+        matcher = PatternMatcher([("ab", "a", "x", False)])
+        assert matcher.apply("aab")[0] == "aa"
+
+    def test_learned_patterns_are_case_sensitive(self):
+        self.compressor.learn_from_success("Run the Widget suite", "widgets", success=True)
+        result, rules = self.compressor._apply_abbreviations_optimized("Run the Widget suite; run the widget suite")
+        assert result.startswith("widgets;")
+        assert any(rule.startswith("learned:") for rule in rules)
+
+    def test_rebuilt_only_when_pattern_set_changes(self, tmp_path):
+        self.compressor.learned_patterns_path = tmp_path / "patterns.json"
+        version = self.compressor.pattern_version
+
+        self.compressor.learn_from_success("Original phrase", "orig", success=True)
+        assert self.compressor.pattern_version == version + 1
+        matcher = self.compressor._compiled_abbrevs
+
+        self.compressor.learn_from_success("Original phrase", "orig", success=True)
+        assert self.compressor._compiled_abbrevs is matcher
+        assert self.compressor.pattern_version == version + 1
+
+    def test_matcher_size_counts_all_entries(self):
+        compressor = PromptCompressor()
+        expected = len(compressor.abbreviations) + len(compressor._proven_patterns())
+        assert len(compressor._compiled_abbrevs) == expected
+
+
+class TestBatchAndStreaming:
+    """Test compress_many() memoization/process pool and compress_iter() streaming"""
+
+    def setup_method(self):
+        self.compressor = PromptCompressor(compression_level="medium")
+        self.compressor.learned_patterns = {}
+
+    def test_compress_many_matches_compress(self):
+        prompts = ["Please implement the authentication feature", "Can you update the documentation", ""]
+        results = self.compressor.compress_many(prompts, workers=1)
+        assert [r.compressed for r in results] == [self.compressor.compress(p).compressed for p in prompts]
+
+    def test_compress_many_memoizes(self):
+        calls = []
+        original = self.compressor._compress_text
+
+        def counting(prompt, target_reduction=None):
+            calls.append(prompt)
+            return original(prompt, target_reduction)
+
+        self.compressor._compress_text = counting
+        prompt = "Please implement the authentication feature"
+        first = self.compressor.compress_many([prompt, prompt], workers=1)
+        second = self.compressor.compress_many([prompt], workers=1)
+
+        assert calls == [prompt]
+        assert first[0] is first[1] is second[0]
+
+    def test_cache_invalidated_by_pattern_version(self, tmp_path):
+        self.compressor.learned_patterns_path = tmp_path / "patterns.json"
+        prompt = "Deploy the widget service"
+        before = self.compressor.compress_many([prompt], workers=1)[0]
+
+        self.compressor.learn_from_success("widget service", "ws", success=True)
+        after = self.compressor.compress_many([prompt], workers=1)[0]
+
+        assert "ws" not in before.compressed
+        assert "ws" in after.compressed
+
+    def test_compress_many_oversize_input(self):
+        too_big = "x" * (prompt_compressor.MAX_INPUT_SIZE + 1)
+        results = self.compressor.compress_many(["ok prompt", too_big], workers=1, return_exceptions=True)
+        assert results[0].compressed
+        assert isinstance(results[1], ValueError)
+        with pytest.raises(ValueError):
+            self.compressor.compress_many([too_big], workers=1)
+
+    def test_compress_many_process_pool(self, monkeypatch):
+        monkeypatch.setattr(prompt_compressor, "PARALLEL_MIN_CHARS", 0)
+        prompts = [f"Please update the configuration for service {i}" for i in range(4)]
+        pooled = self.compressor.compress_many(prompts, workers=2)
+        inline = [self.compressor._compress_text(p) for p in prompts]
+        assert [r.compressed for r in pooled] == [r.compressed for r in inline]
+
+    def test_compress_iter_splits_at_sentence_boundaries(self):
+        text = " ".join(f"Please check the configuration number {i}." for i in range(40))
+        chunks = list(self.compressor.compress_iter(text, chunk_chars=200))
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert len(chunk.original) <= 200
+            assert chunk.original.rstrip().endswith(".")
+        assert "configuration" not in " ".join(c.compressed for c in chunks)
+
+    def test_compress_iter_accepts_streams_beyond_max_input(self):
+        sentence = "Please implement the authentication feature for the application. "
+        repeats = prompt_compressor.MAX_INPUT_SIZE // len(sentence) + 10
+        stream = io.StringIO(sentence * repeats)
+
+        results = list(self.compressor.compress_iter(stream))
+
+        assert sum(len(r.original) for r in results) == len(sentence) * repeats
+        assert all("authentication" not in r.compressed for r in results)
+
+
 class TestStatistics:
     """Test compressor statistics"""
 
@@ -0,0 +1,227 @@
+"""
+Unit tests for Safe Token Optimizer tiered cache
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from safe_token_optimizer import SafeTokenOptimizer
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Python source file with an mtime well outside the racy window"""
+    path = tmp_path / "module.py"
+    path.write_text("import os\n\n" + "".join(f"def func_{i}():\n    return {i}\n\n" for i in range(40)))
+    os.utime(path, (1_000.0, 1_000.0))
+    return path
+
+
+@pytest.fixture
+def optimizer(tmp_path, clock):
+    return SafeTokenOptimizer(project_root=tmp_path, clock=clock)
+
+
+class TestCacheValidation:
+    """Entries are reused only while the file is unchanged"""
+
+    def test_fresh_then_warm_then_hot(self, optimizer, source):
+        _, first = optimizer.optimize_file_read(source)
+        _, second = optimizer.optimize_file_read(source)
+        _, third = optimizer.optimize_file_read(source)
+
+        assert [first["source"], second["source"], third["source"]] == ["fresh_read", "warm_cache", "hot_cache"]
+        assert optimizer.stats["cache_hits"] == 2
+        assert optimizer.stats["cache_misses"] == 1
+
+    def test_modified_file_invalidates_entry(self, optimizer, source):
+        optimizer.optimize_file_read(source)
+        source.write_text("class Changed:\n    pass\n")
+        os.utime(source, (2_000.0, 2_000.0))
+
+        content, metrics = optimizer.optimize_file_read(source)
+
+        assert metrics["source"] == "fresh_read"
+        assert "class Changed" in content
+        assert optimizer.stats["stale_invalidations"] == 1
+
+    def test_touched_file_revalidated_by_hash(self, optimizer, source):
+        optimizer.optimize_file_read(source)
+        os.utime(source, (3_000.0, 3_000.0))
+
+        _, metrics = optimizer.optimize_file_read(source)
+
+        assert metrics["source"] == "warm_cache"
+        assert optimizer.stats["stale_invalidations"] == 0
+        assert optimizer.warm_cache.get(str(source)) is None
+        assert optimizer.hot_cache[str(source)]["mtime_ns"] == source.stat().st_mtime_ns
+
+    def test_racy_entry_settles_after_hash_check(self, optimizer, source, clock, monkeypatch):
+        os.utime(source, (clock.now, clock.now))  # cached right after an edit
+        optimizer.optimize_file_read(source)
+        hashes = []
+        original_sha256 = hashlib.sha256
+        monkeypatch.setattr(hashlib, "sha256", lambda data: hashes.append(1) or original_sha256(data))
+
+        clock.now += 10
+        optimizer.optimize_file_read(source)
+        optimizer.optimize_file_read(source)
+
+        assert len(hashes) == 1  # only the first hit after the racy window re-hashes
+        assert optimizer.hot_cache[str(source)]["cached_at"] == clock.now
+
+    def test_size_change_skips_hash(self, optimizer, source, monkeypatch):
+        optimizer.optimize_file_read(source)
+        source.write_text("x = 1\n")
+        os.utime(source, (1_000.0, 1_000.0))  # same mtime, different size
+        hashes = []
+        original_sha256 = hashlib.sha256
+        monkeypatch.setattr(hashlib, "sha256", lambda data: hashes.append(data) or original_sha256(data))
+
+        _, metrics = optimizer.optimize_file_read(source)
+
+        assert metrics["source"] == "fresh_read"
+        assert hashes == [b"x = 1\n"]  # hashed once for the new entry, never for the stale check
+
+    def test_deleted_file_drops_entry(self, optimizer, source):
+        optimizer.optimize_file_read(source)
+        source.unlink()
+
+        _, metrics = optimizer.optimize_file_read(source)
+
+        assert metrics["source"] == "not_found"
+        assert optimizer.cache_entries == 0
+
+
+class TestEvictionPolicy:
+    """TTL demotion and byte budget"""
+
+    def test_ttl_demotes_and_expires(self, optimizer, source, clock):
+        optimizer.optimize_file_read(source)
+        optimizer.optimize_file_read(source)
+        assert str(source) in optimizer.hot_cache
+
+        clock.now += 2 * 3600
+        optimizer._sweep(clock.now)
+        assert str(source) in optimizer.warm_cache
+
+        clock.now += 2 * 86400
+        optimizer._sweep(clock.now)
+        assert str(source) in optimizer.cold_cache
+
+        clock.now += 8 * 86400
+        optimizer._sweep(clock.now)
+        assert optimizer.cache_entries == 0
+        assert optimizer.stats["evictions"] == 1
+
+    def test_byte_budget_evicts_least_recently_used(self, tmp_path, clock):
+        files = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.txt"
+            path.write_text(name * 400)
+            os.utime(path, (1_000.0, 1_000.0))
+            files.append(path)
+
+        optimizer = SafeTokenOptimizer(project_root=tmp_path, max_cache_bytes=900, clock=clock)
+        for path in files:
+            clock.now += 1
+            optimizer.optimize_file_read(path)
+
+        assert optimizer.cache_bytes <= 900
+        assert optimizer.stats["evictions"] >= 1
+        assert optimizer._lookup(str(files[0])) is None
+        assert optimizer._lookup(str(files[-1])) is not None
+
+
+class TestPersistence:
+    """Incremental journal and legacy migration"""
+
+    def test_journal_survives_restart(self, tmp_path, source, clock):
+        SafeTokenOptimizer(project_root=tmp_path, clock=clock).optimize_file_read(source)
+
+        reloaded = SafeTokenOptimizer(project_root=tmp_path, clock=clock)
+        _, metrics = reloaded.optimize_file_read(source)
+
+        assert metrics["source"] == "hot_cache"
+
+    def test_journal_appends_only_changes(self, optimizer, source):
+        optimizer.optimize_file_read(source)
+        optimizer.optimize_file_read(source)
+        assert len(optimizer.journal_file.read_text(encoding="utf-8").splitlines()) == 1  # hit is not a write
+
+        optimizer.flush()
+        records = optimizer.journal_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["op"] for line in records] == ["put", "touch"]
+        assert "entry" not in json.loads(records[1])
+
+    def test_hits_survive_restart_for_ttl(self, tmp_path, source, clock):
+        optimizer = SafeTokenOptimizer(project_root=tmp_path, clock=clock)
+        optimizer.optimize_file_read(source)
+        clock.now += 5 * 86400
+        optimizer.optimize_file_read(source)
+        clock.now += 4 * 86400  # 9 days after put, 4 after the last hit
+        optimizer.close()
+
+        reloaded = SafeTokenOptimizer(project_root=tmp_path, clock=clock)
+
+        tier, entry = reloaded._lookup(str(source))
+        assert tier == "cold"
+        assert entry["access_count"] == 2
+
+    def test_save_cache_compacts_journal(self, optimizer, source):
+        optimizer.optimize_file_read(source)
+        source.write_text("changed\n")
+        os.utime(source, (2_000.0, 2_000.0))
+        optimizer.optimize_file_read(source)
+        assert len(optimizer.journal_file.read_text(encoding="utf-8").splitlines()) == 3
+
+        optimizer.save_cache()
+
+        assert len(optimizer.journal_file.read_text(encoding="utf-8").splitlines()) == 1
+
+    def test_legacy_cache_file_loaded(self, tmp_path):
+        cache_dir = tmp_path / ".smart_cache"
+        cache_dir.mkdir()
+        legacy = {"old.py": {"summary": "x", "timestamp": "2020-01-01T00:00:00", "tokens_saved": 1}}
+        (cache_dir / "smart_cache.json").write_text(json.dumps(legacy), encoding="utf-8")
+        legacy_time = 1_577_836_800.0  # 2020-01-01 UTC
+
+        optimizer = SafeTokenOptimizer(project_root=tmp_path, clock=lambda: legacy_time)
+
+        assert optimizer.cache_entries == 1
+
+
+class TestReport:
+    def test_report_includes_cache_efficiency(self, optimizer, source):
+        optimizer.optimize_file_read(source)
+        optimizer.optimize_file_read(source)
+
+        report = optimizer.get_optimization_report()
+
+        efficiency = report["cache_efficiency"]
+        assert efficiency["hits"] == 1
+        assert efficiency["misses"] == 1
+        assert efficiency["hit_rate"] == "50.0%"
+        assert efficiency["tier_hits"]["warm"] == 1
+        assert efficiency["bytes_saved"] >= 0
+        assert report["cache_status"]["cache_bytes"] == optimizer.cache_bytes
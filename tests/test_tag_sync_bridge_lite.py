@@ -287,6 +287,83 @@ class TestSynchronization:
         assert total_notes == 0
 
 
+class TestIncrementalSync:
+    """Test manifest-based idempotent and incremental sync."""
+
+    def test_second_sync_writes_nothing(self, temp_vault, temp_project):
+        """Test unchanged tags are not rewritten."""
+        bridge = TagSyncBridgeLite(vault_path=temp_vault, project_root=temp_project)
+        bridge.sync_all_tags()
+        assert bridge.last_sync_stats["notes_written"] == 3
+        note = temp_vault / "requirements" / "REQ-AUTH-001.md"
+        mtime = note.stat().st_mtime_ns
+
+        bridge.sync_all_tags()
+
+        assert bridge.last_sync_stats["notes_written"] == 0
+        assert bridge.last_sync_stats["notes_unchanged"] == 3
+        assert note.stat().st_mtime_ns == mtime
+
+    def test_new_location_merged_into_edited_note(self, temp_vault, temp_project):
+        """Test changed tags update the note without losing user edits."""
+        bridge = TagSyncBridgeLite(vault_path=temp_vault, project_root=temp_project)
+        bridge.sync_all_tags()
+        note = temp_vault / "implementations" / "IMPL-AUTH-001.md"
+        note.write_text(note.read_text(encoding="utf-8").replace("(Add implementation details)", "JWT check"))
+        (temp_project / "src" / "extra.py").write_text("# @TAG[CODE:auth-001]\n", encoding="utf-8")
+
+        bridge.sync_all_tags()
+
+        content = note.read_text(encoding="utf-8")
+        assert bridge.last_sync_stats["notes_written"] == 1
+        assert "JWT check" in content
+        assert "extra.py:1" in content
+
+    def test_since_scans_only_changed_files(self, temp_vault, temp_project):
+        """Test --since mode re-extracts only changed files."""
+        bridge = TagSyncBridgeLite(vault_path=temp_vault, project_root=temp_project)
+        bridge.sync_all_tags()
+        (temp_project / "docs.md").write_text("@TAG[DOC:auth-001]\n", encoding="utf-8")
+
+        created_notes = bridge.sync_all_tags(since_last_run=True)
+
+        assert bridge.last_sync_stats["files_scanned"] == 1
+        assert [note.name for note in created_notes["DOC"]] == ["DOC-AUTH-001.md"]
+        assert sum(len(notes) for notes in created_notes.values()) == 1
+        assert (temp_vault / "docs" / "DOC-AUTH-001.md").exists()
+
+    def test_since_without_changes(self, temp_vault, temp_project):
+        """Test --since mode with no changes touches no notes."""
+        bridge = TagSyncBridgeLite(vault_path=temp_vault, project_root=temp_project)
+        bridge.sync_all_tags()
+
+        created_notes = bridge.sync_all_tags(since_last_run=True)
+
+        assert bridge.last_sync_stats == {
+            "files_scanned": 0,
+            "tags_checked": 0,
+            "notes_written": 0,
+            "notes_unchanged": 0,
+        }
+        assert sum(len(notes) for notes in created_notes.values()) == 0
+
+    def test_filtered_sync_leaves_other_tags_for_since(self, temp_vault, temp_project):
+        """Test a tag_id run does not hide the file's other tags from --since mode."""
+        bridge = TagSyncBridgeLite(vault_path=temp_vault, project_root=temp_project)
+        bridge.sync_all_tags()
+        auth = temp_project / "src" / "auth.py"
+        auth.write_text(
+            auth.read_text(encoding="utf-8").replace("@TAG[SPEC:auth-001]", "@TAG[SPEC:auth-001] @TAG[SPEC:two]"),
+            encoding="utf-8",
+        )
+
+        bridge.sync_all_tags(tag_id="auth-001")
+        bridge.sync_all_tags(since_last_run=True)
+
+        assert (temp_vault / "requirements" / "REQ-TWO.md").exists()
+        assert bridge.last_sync_stats["tags_checked"] == 3
+
+
 class TestTraceabilityMap:
     """Test traceability map generation."""
 
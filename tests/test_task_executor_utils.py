@@ -57,3 +57,23 @@ def test_write_prompt_feedback_generates_summary(tmp_path):
     assert data["summary"]["total_original_tokens"] == 120
     assert data["top_prompt"]["command_id"] == "cmd1"
     assert len(data.get("errors", [])) == 1
+
+
+def test_estimate_contract_cost_prices_prompts_by_tokens():
+    from task_executor import estimate_contract_cost
+    from token_counter import get_token_counter
+
+    prompt = "Summarize the architecture of the payment service"
+    contract = {
+        "telemetry": {"cost_per_1k_tokens": 2.0},
+        "commands": [
+            {"id": "priced", "cost_estimate_usd": 0.5, "exec": {"args": ["--prompt", "ignored prompt text"]}},
+            {"id": "ai", "exec": {"args": ["--prompt", prompt]}},
+        ],
+    }
+
+    expected = 0.5 + get_token_counter().count(prompt) / 1000 * 2.0
+    assert estimate_contract_cost(contract) == expected
+
+    del contract["telemetry"]["cost_per_1k_tokens"]
+    assert estimate_contract_cost(contract) == 0.5
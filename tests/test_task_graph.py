@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Task Graph 테스트 - 태스크 의존성 그래프 및 크리티컬 패스
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.task_graph import (
+    TaskGraph,
+    TaskNode,
+    build_graph,
+    extract_dependencies,
+    extract_file_paths,
+    normalize_dependencies,
+)
+
+
+def node(task_id, parallel=False, deps=None, files=None):
+    return TaskNode(task_id, "", 0, 0, is_parallel=parallel, dependencies=deps or [], files=set(files or []))
+
+
+class TestExtraction:
+    """설명 문자열에서 의존성/파일 추출"""
+
+    def test_extract_dependencies(self):
+        deps, description = extract_dependencies("Add endpoint (depends: T001, T003) now")
+        assert deps == ["T001", "T003"]
+        assert description == "Add endpoint now"
+
+    def test_extract_dependencies_on_syntax(self):
+        deps, _ = extract_dependencies("Wire UI (depends on T010)")
+        assert deps == ["T010"]
+
+    def test_extract_file_paths(self):
+        files = extract_file_paths("Create User model in src/models/user.py and update README.md")
+        assert files == {"src/models/user.py", "README.md"}
+
+    def test_normalize_dependencies(self):
+        assert normalize_dependencies("T001, T002") == ["T001", "T002"]
+        assert normalize_dependencies(["T003"]) == ["T003"]
+        assert normalize_dependencies(None) == []
+
+
+class TestTaskGraph:
+    """의존성 추론 및 스케줄링 정보"""
+
+    def test_independent_phases_share_first_wave(self):
+        """비차단 페이즈 간에는 암묵적 대기 없음"""
+        graph = build_graph([("Setup", False, [node("T001")]), ("Stories", False, [node("T002")])])
+        assert graph.waves() == [["T001", "T002"]]
+
+    def test_sequential_tasks_follow_parallel_in_phase(self):
+        graph = build_graph([("Setup", False, [node("T001", True), node("T002", True), node("T003"), node("T004")])])
+        assert set(graph.dependencies_of("T003")) == {"T001", "T002"}
+        assert graph.dependencies_of("T004") == ["T003"]
+
+    def test_file_overlap_orders_tasks(self):
+        graph = build_graph(
+            [
+                ("Setup", False, [node("T001", True, files=["src/app.py"])]),
+                ("US1", False, [node("T002", True, files=["src/app.py"]), node("T003", True, files=["src/other.py"])]),
+            ]
+        )
+        assert graph.edges["T002"] == {"T001": "file:src/app.py"}
+        assert graph.dependencies_of("T003") == []
+
+    def test_blocking_phase_is_barrier(self):
+        graph = build_graph(
+            [
+                ("Setup", False, [node("T001", True)]),
+                ("Foundational", True, [node("T002", True)]),
+                ("US1", False, [node("T003", True)]),
+            ]
+        )
+        assert graph.edges["T002"] == {"T001": "blocking"}
+        assert graph.edges["T003"] == {"T002": "blocking"}
+
+    def test_explicit_and_unknown_dependencies(self):
+        graph = build_graph([("Main", False, [node("T001", True), node("T002", True, deps=["T001", "T999"])])])
+        assert graph.edges["T002"] == {"T001": "explicit"}
+        assert graph.unknown_dependencies == {"T002": ["T999"]}
+
+    def test_cycle_detection(self):
+        with pytest.raises(ValueError, match="cycle"):
+            build_graph([("Main", False, [node("T001", True, deps=["T002"]), node("T002", True, deps=["T001"])])])
+
+    def test_duplicate_ids_rejected(self):
+        with pytest.raises(ValueError, match="Duplicate"):
+            TaskGraph([node("T001"), node("T001")])
+
+    def test_critical_path_uses_durations(self):
+        graph = build_graph(
+            [
+                (
+                    "Main",
+                    False,
+                    [
+                        node("T001", True),
+                        node("T002", True),
+                        node("T003", True, deps=["T001"]),
+                        node("T004", True, deps=["T002"]),
+                    ],
+                )
+            ]
+        )
+        path = graph.critical_path({"T001": 1.0, "T002": 5.0, "T003": 1.0, "T004": 1.0})
+        assert path.task_ids == ["T002", "T004"]
+        assert path.length == 6.0
+
+    def test_descendants(self):
+        graph = build_graph([("Main", False, [node("T001"), node("T002"), node("T003")])])
+        assert graph.descendants("T001") == {"T002", "T003"}
+
+    def test_report_and_mermaid(self):
+        graph = build_graph([("Main", False, [node("T001"), node("T002")])])
+        report = graph.format_report({"T001": 2.0, "T002": 1.0})
+        assert "Critical path:   3.00s" in report
+        assert "T002 [Main] 1.00s <- order" in report
+        mermaid = graph.to_mermaid()
+        assert mermaid.startswith("graph LR")
+        assert "T001 ==> T002" in mermaid
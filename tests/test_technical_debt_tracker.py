@@ -306,6 +306,21 @@ class TestDebtDetection:
         debt_items = tracker.detect_debt(path=str(temp_debt_dir))
         assert isinstance(debt_items, list)
 
+    def test_parallel_detection_matches_inline(self, tracker, temp_debt_dir):
+        """Test that a process pool scan yields the same items in the same order."""
+        for i in range(20):
+            (temp_debt_dir / f"module_{i:02d}.py").write_text(f"# TODO: item {i}\ndef f{i}(a, b, c, d, e, f):\n    pass\n")
+        progress = []
+
+        inline = tracker.detect_debt(path=str(temp_debt_dir), workers=1)
+        parallel = tracker.detect_debt(path=str(temp_debt_dir), workers=2, progress=lambda *p: progress.append(p))
+
+        assert [item.id for item in parallel] == [item.id for item in inline]
+        assert len(inline) == 40
+        assert progress[-1] == (20, 20)
+        assert tracker.scan_stats["files"] == 20
+        assert {"discover", "todo", "complexity", "smells", "total"} <= set(tracker.scan_stats["timings"])
+
     def test_calculate_cyclomatic_complexity(self, tracker):
         """Test cyclomatic complexity calculation."""
         import ast
@@ -325,6 +340,26 @@ def complex_function(x):
         complexity = tracker._calculate_cyclomatic_complexity(func_node)
         assert complexity > 1
 
+    def test_unchanged_definitions_not_rewalked(self, tracker, temp_debt_dir, monkeypatch):
+        """Test that re-scans only recompute metrics of changed top-level definitions."""
+        branches = "\n".join(f"    if x == {i}:\n        return {i}" for i in range(12))
+        source = temp_debt_dir / "module.py"
+        source.write_text(f"def complex_a(x):\n{branches}\n\n\ndef complex_b(x):\n{branches}\n")
+        walked = []
+        original = tracker._calculate_cyclomatic_complexity
+        monkeypatch.setattr(
+            tracker, "_calculate_cyclomatic_complexity", lambda node: walked.append(node.name) or original(node)
+        )
+
+        first = tracker._detect_high_complexity(source)
+        tracker._detect_code_smells(source)
+        source.write_text("# moved\n" + source.read_text().replace("return 11", "return -1", 1))
+        second = tracker._detect_high_complexity(source)
+
+        assert walked == ["complex_a", "complex_b", "complex_a"]
+        assert [item.line_number for item in first] == [1, 28]
+        assert [item.line_number for item in second] == [2, 29]
+
 
 # ============================================================================
 # Test Debt Quantification
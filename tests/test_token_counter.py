@@ -0,0 +1,108 @@
+"""
+Unit tests for the shared token counter
+"""
+
+import base64
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import token_counter
+from token_counter import BPEEncoder, TokenCounter, estimate_tokens, load_ranks
+
+
+def write_vocab(path: Path, merges):
+    """Write a tiktoken-format vocab: all single bytes plus ``merges`` in rank order"""
+    tokens = [bytes([i]) for i in range(256)] + [m.encode() for m in merges]
+    path.write_text("".join(f"{base64.b64encode(t).decode()} {rank}\n" for rank, t in enumerate(tokens)))
+    return path
+
+
+@pytest.fixture
+def vocab(tmp_path):
+    return write_vocab(tmp_path / "mini.tiktoken", ["he", "ll", "hell", "hello", " w", " wor", " world", "or"])
+
+
+@pytest.fixture
+def no_tiktoken(monkeypatch):
+    monkeypatch.setattr(token_counter, "TIKTOKEN_AVAILABLE", False)
+
+
+class TestBPEEncoder:
+    """Merge semantics of the pure-Python encoder"""
+
+    def test_merges_by_rank(self, vocab):
+        encoder = BPEEncoder(load_ranks(vocab))
+        assert encoder.split("hello world") == [b"hello", b" world"]
+        assert encoder.split("help") == [b"he", b"l", b"p"]
+
+    def test_count_matches_split_and_caches_pieces(self, vocab):
+        encoder = BPEEncoder(load_ranks(vocab))
+        text = "hello world, hello world_1234"
+        assert encoder.count(text) == len(encoder.split(text))
+        assert "hello" in encoder._piece_cache
+
+    def test_all_bytes_are_covered(self, vocab):
+        encoder = BPEEncoder(load_ranks(vocab))
+        text = "snake_case -> 한국어\n\tdone"
+        assert b"".join(encoder.split(text)) == text.encode("utf-8")
+
+
+class TestTokenCounter:
+    """Backend selection, memoization and batching"""
+
+    def test_bpe_backend_from_vocab(self, vocab, no_tiktoken):
+        counter = TokenCounter(vocab_path=vocab)
+        assert counter.backend == "bpe"
+        assert counter.count("hello world") == 2
+
+    def test_heuristic_fallback_without_vocab(self, monkeypatch):
+        monkeypatch.delenv(token_counter.VOCAB_ENV_VAR, raising=False)
+        monkeypatch.setattr(token_counter, "DEFAULT_VOCAB_DIR", Path("/nonexistent"))
+        counter = TokenCounter()
+        assert counter.backend == "heuristic"
+        assert counter.count("Hello world") == estimate_tokens("Hello world")
+
+    def test_invalid_vocab_falls_back(self, tmp_path, capsys):
+        bad = tmp_path / "bad.tiktoken"
+        bad.write_text("not-a-valid-line\n")
+        counter = TokenCounter(vocab_path=bad)
+        assert counter.backend == "heuristic"
+        assert "[WARN]" in capsys.readouterr().out
+
+    def test_env_var_selects_vocab(self, vocab, monkeypatch, no_tiktoken):
+        monkeypatch.setenv(token_counter.VOCAB_ENV_VAR, str(vocab))
+        assert TokenCounter().vocab_path == vocab
+
+    def test_counts_are_memoized(self, vocab, no_tiktoken):
+        counter = TokenCounter(vocab_path=vocab)
+        counter.count("hello world")
+        counter.count("hello world")
+        assert counter.stats == {"calls": 2, "cache_hits": 1}
+
+    def test_count_many_dedupes_and_matches_count(self, vocab, no_tiktoken):
+        counter = TokenCounter(vocab_path=vocab)
+        texts = ["hello world", "", "hello", "hello world"]
+        assert counter.count_many(texts) == [counter.count(t) for t in texts]
+        assert counter.stats["calls"] == 2 + 3  # batch: 2 distinct non-empty, then 3 single counts
+
+    def test_cache_is_bounded(self, vocab, no_tiktoken):
+        counter = TokenCounter(vocab_path=vocab, cache_size=2)
+        counter.count_many(["a", "b", "c"])
+        assert len(counter._cache) == 2
+
+    def test_empty_text_is_zero(self):
+        assert TokenCounter(vocab_path=None).count("") == 0
+        assert estimate_tokens("") == 0
+
+    def test_heuristic_keeps_prose_estimate(self):
+        sentence = "Please implement the authentication feature for the application, and document the database settings."
+        assert estimate_tokens("Hello world") == 2
+        assert estimate_tokens(sentence) == 14  # 13 words + 2 punctuation marks * 0.5
+
+    def test_heuristic_floors_dense_text(self):
+        assert estimate_tokens("scripts/very/deeply/nested/module_name.py") == 11
+        assert estimate_tokens("토큰" * 20) == 10
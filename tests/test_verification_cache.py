@@ -462,6 +462,74 @@ class TestPersistence:
         assert cached.violations[0].code == "F401"
 
 
+class TestConfigFingerprint:
+    """Test invalidation by ruff version/config fingerprint"""
+
+    def test_fingerprint_mismatch_is_miss(self, temp_cache_dir, sample_result):
+        """Entries computed under another config are not served"""
+        VerificationCache(cache_dir=temp_cache_dir, fingerprint="old").put(sample_result.file_path, sample_result)
+
+        assert VerificationCache(cache_dir=temp_cache_dir, fingerprint="old").get(sample_result.file_path) is not None
+        assert VerificationCache(cache_dir=temp_cache_dir, fingerprint="new").get(sample_result.file_path) is None
+
+    def test_legacy_entries_without_fingerprint_are_misses(self, temp_cache_dir, sample_result):
+        """Entries written before fingerprints existed are revalidated"""
+        cache = VerificationCache(cache_dir=temp_cache_dir, fingerprint="current")
+        cache.put(sample_result.file_path, sample_result)
+        data = json.loads(cache.cache_file.read_text())
+        for entry in data.values():
+            del entry["fingerprint"]
+        cache.cache_file.write_text(json.dumps(data))
+
+        reloaded = VerificationCache(cache_dir=temp_cache_dir, fingerprint="current")
+
+        assert reloaded.size() == 1
+        assert reloaded.get(sample_result.file_path) is None
+
+    def test_ruff_config_change_invalidates(self, tmp_path, sample_result):
+        """Editing ruff.toml invalidates entries; unrelated pyproject edits do not"""
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / "ruff.toml").write_text("line-length = 120\n")
+        (project / "pyproject.toml").write_text('[tool.ruff]\nextend = "ruff.toml"\n\n[tool.other]\nx = 1\n')
+        cache = VerificationCache(cache_dir=tmp_path / ".cache", project_root=project)
+        cache._config_fingerprint.recheck_seconds = 0
+        cache.put(sample_result.file_path, sample_result)
+
+        (project / "pyproject.toml").write_text('[tool.ruff]\nextend = "ruff.toml"\n\n[tool.other]\nx = 2\n')
+        assert cache.get(sample_result.file_path) is not None
+
+        (project / "ruff.toml").write_text("line-length = 100\n")
+        assert cache.get(sample_result.file_path) is None
+
+    def test_extend_target_tracked(self, tmp_path):
+        """Configs reached through extend are part of the fingerprint"""
+        from scripts.verification_cache import ConfigFingerprint
+
+        (tmp_path / "shared").mkdir()
+        (tmp_path / "shared" / "base.toml").write_text("line-length = 120\n")
+        (tmp_path / "ruff.toml").write_text('extend = "shared/base.toml"\n')
+        fingerprint = ConfigFingerprint(tmp_path, recheck_seconds=0)
+        before = fingerprint.current()
+
+        (tmp_path / "shared" / "base.toml").write_text("line-length = 88\n")
+
+        assert fingerprint.current() != before
+
+    def test_fingerprint_rechecks_are_rate_limited(self, tmp_path):
+        """Within recheck_seconds the cached fingerprint is returned without stat calls"""
+        from scripts.verification_cache import ConfigFingerprint
+
+        now = [0.0]
+        fingerprint = ConfigFingerprint(tmp_path, recheck_seconds=1.0, clock=lambda: now[0])
+        before = fingerprint.current()
+        (tmp_path / "ruff.toml").write_text("line-length = 88\n")
+
+        assert fingerprint.current() == before
+        now[0] = 2.0
+        assert fingerprint.current() != before
+
+
 class TestHashComputation:
     """Test hash computation"""
 
@@ -643,6 +711,69 @@ class TestThreadSafety:
         assert cache.size() == 10
 
 
+class TestBatchLookup:
+    """Test get_many() and lookups that do not serialize on hashing"""
+
+    def test_get_many_mixed(self, cache, tmp_path, sample_result):
+        """Hits, misses and missing files in one batch"""
+        cache.put(sample_result.file_path, sample_result)
+        uncached = tmp_path / "uncached.py"
+        uncached.write_text("x = 1")
+        missing = tmp_path / "missing.py"
+
+        results = cache.get_many([sample_result.file_path, uncached, missing])
+
+        assert results[sample_result.file_path].passed is True
+        assert results[uncached] is None
+        assert results[missing] is None
+        assert cache.stats()["total_hits"] == 1
+
+    def test_get_many_detects_changes(self, cache, sample_result):
+        """Batch lookups apply the same hash validation as get()"""
+        cache.put(sample_result.file_path, sample_result)
+        sample_result.file_path.write_text("print('changed content')")
+
+        assert cache.get_many([sample_result.file_path])[sample_result.file_path] is None
+        assert cache.size() == 0
+
+    def test_lookup_not_blocked_by_slow_hash(self, cache, tmp_path, sample_result, monkeypatch):
+        """A file being hashed does not hold the cache lock"""
+        cache.put(sample_result.file_path, sample_result)
+        slow_file = tmp_path / "slow.py"
+        slow_file.write_text("x = 1")
+
+        hashing = threading.Event()
+        release = threading.Event()
+        original_read_bytes = Path.read_bytes
+
+        def slow_read_bytes(self):
+            if self.name == "slow.py":
+                hashing.set()
+                release.wait(5)
+            return original_read_bytes(self)
+
+        monkeypatch.setattr(Path, "read_bytes", slow_read_bytes)
+        slow_lookup = threading.Thread(target=cache.get, args=(slow_file,))
+        slow_lookup.start()
+        assert hashing.wait(5)
+
+        start = time.perf_counter()
+        result = cache.get(sample_result.file_path)
+        elapsed = time.perf_counter() - start
+
+        release.set()
+        slow_lookup.join(5)
+        assert result is not None
+        assert elapsed < 1.0
+
+    def test_resolve_memoized_for_absolute_paths(self, cache, sample_result):
+        """Path.resolve() runs once per absolute path"""
+        cache.put(sample_result.file_path, sample_result)
+        cache.get(sample_result.file_path)
+
+        assert cache._resolved[str(sample_result.file_path)] == str(sample_result.file_path.resolve())
+
+
 class TestEdgeCases:
     """Test edge cases and error handling"""
 
@@ -0,0 +1,144 @@
+"""
+Verification service tests - warm verify/cached/classify API and its client
+"""
+
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import cli_daemon  # noqa: E402
+import verification_service  # noqa: E402
+from critical_file_detector import CriticalFileDetector  # noqa: E402
+from verification_cache import RuffViolation, VerificationCache, VerificationResult  # noqa: E402
+from verification_service import VerificationService  # noqa: E402
+
+
+class FakeVerifier:
+    """Flags every file containing 'bad' and counts calls"""
+
+    def __init__(self):
+        self.calls = []
+
+    def verify_file(self, file_path: Path) -> VerificationResult:
+        self.calls.append(file_path)
+        violations = [RuffViolation("F401", "unused import", 1, 1)] if "bad" in file_path.read_text() else []
+        return VerificationResult(file_path, passed=not violations, violations=violations, duration_ms=1.0)
+
+
+@pytest.fixture
+def verifier():
+    return FakeVerifier()
+
+
+@pytest.fixture
+def service(tmp_path, verifier):
+    cache = VerificationCache(cache_dir=tmp_path / "cache")
+    service = VerificationService(verifier, cache, CriticalFileDetector(git_enabled=False))
+    yield service
+    service.close()
+
+
+@pytest.fixture
+def sources(tmp_path):
+    (tmp_path / "good.py").write_text("x = 1\n")
+    (tmp_path / "bad.py").write_text("bad = 1\n")
+    (tmp_path / "notes.md").write_text("# notes\n")
+    return tmp_path
+
+
+class TestVerificationService:
+    def test_verify_then_cached(self, service, verifier, sources):
+        request = {"command": "verify", "paths": ["good.py", "bad.py"], "cwd": str(sources)}
+
+        first = service.handle(request)
+        second = service.handle(request)
+
+        assert first["passed"] is False
+        assert [r["passed"] for r in first["results"]] == [True, False]
+        assert first["results"][1]["violations"][0]["code"] == "F401"
+        assert [r["from_cache"] for r in second["results"]] == [True, True]
+        assert len(verifier.calls) == 2
+        assert service.stats["cache_hits"] == 2
+
+    def test_changed_file_reverified(self, service, verifier, sources):
+        service.handle({"command": "verify", "paths": [str(sources / "good.py")]})
+        (sources / "good.py").write_text("bad = 2\n")
+
+        response = service.handle({"command": "verify", "paths": [str(sources / "good.py")]})
+
+        assert response["passed"] is False
+        assert len(verifier.calls) == 2
+
+    def test_non_code_files_skipped(self, service, verifier, sources):
+        response = service.handle({"command": "verify", "paths": ["notes.md"], "cwd": str(sources)})
+
+        assert response["passed"] is True
+        assert response["results"][0]["skipped"] is True
+        assert verifier.calls == []
+
+    def test_cached_and_classify(self, service, sources):
+        assert service.handle({"command": "cached", "paths": ["good.py"], "cwd": str(sources)})["results"] == [None]
+        service.handle({"command": "verify", "paths": ["good.py"], "cwd": str(sources)})
+
+        cached = service.handle({"command": "cached", "paths": ["good.py"], "cwd": str(sources)})["results"]
+        classified = service.handle({"command": "classify", "paths": ["notes.md"], "cwd": str(sources)})["results"]
+
+        assert cached[0]["passed"] is True
+        assert classified[0]["mode"] == "skip"
+
+
+@pytest.mark.skipif(not cli_daemon.daemon_available(), reason="Unix domain sockets required")
+class TestClient:
+    def test_request_round_trip(self, service, sources, tmp_path, monkeypatch):
+        sock = tmp_path / "v.sock"
+        monkeypatch.setattr(verification_service, "socket_path", lambda name: sock)
+        monkeypatch.chdir(sources)
+        thread = threading.Thread(target=cli_daemon.serve, args=(sock, service.handle), daemon=True)
+        thread.start()
+        for _ in range(200):
+            if sock.exists():
+                break
+            threading.Event().wait(0.01)
+
+        response = verification_service.request("verify", ["bad.py"])
+        verification_service.request("stop")
+        thread.join(timeout=5)
+
+        assert response["passed"] is False
+        assert response["results"][0]["file"] == str(sources / "bad.py")
+        assert not thread.is_alive()
+
+    def test_foreign_daemon_not_trusted(self, sources, tmp_path, monkeypatch):
+        sock = tmp_path / "v.sock"
+        monkeypatch.setattr(verification_service, "socket_path", lambda name: sock)
+        monkeypatch.chdir(sources)
+        thread = threading.Thread(
+            target=cli_daemon.serve,
+            args=(sock, lambda req: {"passed": True, "results": [], "shutdown": "stop" in req}),
+            daemon=True,
+        )
+        thread.start()
+        for _ in range(200):
+            if sock.exists():
+                break
+            threading.Event().wait(0.01)
+
+        with monkeypatch.context() as m:
+            client_module = sys.modules[verification_service.send_request.__module__]
+            m.setattr(client_module, "_uid", lambda: os.getuid() + 1)
+            assert verification_service._verify(["bad.py"], fallback=False) == 3
+
+        cli_daemon.send_request(sock, {"stop": True})
+        thread.join(timeout=5)
+
+    def test_no_daemon_without_fallback(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(verification_service, "socket_path", lambda name: tmp_path / "missing.sock")
+
+        assert verification_service.request("ping") is None
+        assert verification_service._verify(["a.py"], fallback=False) == 3
+        assert verification_service._verify(["notes.md"], fallback=False) == 0
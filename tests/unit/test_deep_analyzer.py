@@ -14,6 +14,7 @@ import ast
 from deep_analyzer import (
     DeepAnalysisResult,
     SimpleSolidChecker,
+    definition_units,
 )
 from verification_cache import VerificationResult
 
@@ -240,6 +241,68 @@ class TestClass:
         assert violations == []
 
 
+class TestIncrementalSolidCheck:
+    """Test per-definition caching of SRP/DIP/complexity findings"""
+
+    CODE = """
+import os
+
+
+class Service:
+    def __init__(self):
+        self.db = Database()
+
+
+def branchy(x):
+    if x and x > 1 or x < -1:
+        for i in range(x):
+            if i:
+                while i:
+                    i -= 1
+    elif x:
+        try:
+            pass
+        except ValueError:
+            pass
+    return [i for i in range(3) if i] or {1} or {}
+"""
+
+    def test_matches_full_tree_checks(self):
+        """Should report the same findings as walking the whole module"""
+        checker = SimpleSolidChecker()
+        checker.MAX_CYCLOMATIC_COMPLEXITY = 3
+        tree = ast.parse(self.CODE)
+
+        violations = checker.check_solid(self.CODE, Path("test.py"))
+        expected = checker._check_srp(tree) + checker._check_dip(tree) + checker._check_complexity(tree, self.CODE)
+
+        assert violations == expected
+        assert {v["principle"] for v in violations} == {"Dependency Inversion", "Complexity"}
+
+    def test_only_changed_definitions_reanalyzed(self):
+        """Should reuse findings of unchanged definitions and rebase their lines"""
+        checker = SimpleSolidChecker()
+        first = checker.check_solid(self.CODE, Path("test.py"))
+        assert checker.unit_stats == {"analyzed": 2, "reused": 0}
+
+        edited = "# header\n# moved\n" + self.CODE.replace("return [i", "return [i + 1")
+        second = checker.check_solid(edited, Path("test.py"))
+
+        assert checker.unit_stats == {"analyzed": 3, "reused": 1}
+        dip = [v for v in second if v["principle"] == "Dependency Inversion"]
+        assert dip[0]["line"] == first[0]["line"] + 2 == 9
+
+    def test_definition_units_include_decorators(self):
+        """Should fingerprint decorated definitions from the decorator line"""
+        code = "x = 1\n\n@decorator\ndef f():\n    pass\n"
+
+        units = definition_units(ast.parse(code), code)
+
+        assert [(node.name, start) for node, start, _ in units] == [("f", 3)]
+        changed = code.replace("@decorator", "@other")
+        assert definition_units(ast.parse(changed), changed)[0][2] != units[0][2]
+
+
 class TestCheckSecurity:
     """Test security issue detection"""
 